@@ -9,7 +9,7 @@ from pytgf.graphics.graphics import Camera, Texture, ShaderProgram, SpriteSet, T
 from pytgf.graphics.gui import GUIFont, GUIBorder, GUIComponent, GUILayout, GUIAbsoluteLayout, GUIListLayout, \
     GUIContainer, GUILabel, GUIImage, GUITextField, GUIEvent, GUIFocusedEvent, GUIUnfocusedEvent, GUIManager
 
-from pytgf.logic import AxisAlignedBoundingBox, LogicGame, QuadTree, WorldUpdater, World
+from pytgf.logic import AxisAlignedBoundingBox, LogicGame, QuadTree, SpatialHash, TileChunks, WorldUpdater, World
 
 import numpy
 
@@ -44,13 +44,22 @@ class Game(LogicGame):
         Renders the world and the GUI.
     run()
         Runs the game logic loop.
+    stop()
+        Stops the game logic loop and releases the workers of the world.
+    set_logic(function_logic)
+        Replaces the logic function called each tick by the game logic loop.
     reset()
         Resets the game.
-    change_world(tiles, background, logic_area, logic_tile, logic_entity, entity_per_thread, node_capacity, max_depth)
+    change_world(tiles, background, logic_area, logic_tile, logic_entity, entity_per_thread, node_capacity, max_depth,
+                 entity_store, broadphase, cell_tiles, sleep_ticks, track_tiles)
         Creates a new world.
+    snapshot(snapshot)
+        Captures the state of the world and the tick of the logic loop.
+    restore(snapshot)
+        Restores the state of the world and the tick of the logic loop.
     fire_event(event)
         Handles a new fired Event.
-    register_event_handler(event_type, handler)
+    register_event_handler(event_type, handler, once)
         Registers a new event handler.
     register_collision_event_handler(handler)
         Registers a new CollisionEvent handler.
@@ -96,7 +105,8 @@ class Game(LogicGame):
                  width: int = 800, height: int = 600, glsl_version: int = 330, shader_world: tuple = None,
                  shader_sprite: tuple = None, tick_per_second: float = 60, frame_per_second: float = 60,
                  multi_threading: bool = True, safe_mode: bool = True, default_tile_collision_handler: bool = True,
-                 default_entity_collision_handler: bool = True, default_gui_handler: bool = True):
+                 default_entity_collision_handler: bool = True, default_gui_handler: bool = True,
+                 multi_processing: bool = False):
         """
         Initializes the Game.
 
@@ -136,6 +146,8 @@ class Game(LogicGame):
             Registers the default entity collision event handler if set to True.
         default_gui_handler: bool: optional
             Registers the default GUI event handler if set to True.
+        multi_processing: bool, optional
+            Runs the collision detection in worker processes if set to True.
         """
 
         if not hasattr(self, "resources"):
@@ -156,7 +168,7 @@ class Game(LogicGame):
         LogicGame.__init__(
             self, tile_size, tick_per_second=tick_per_second, multi_threading=multi_threading, safe_mode=safe_mode,
             default_tile_collision_handler=default_tile_collision_handler,
-            default_entity_collision_handler=default_entity_collision_handler
+            default_entity_collision_handler=default_entity_collision_handler, multi_processing=multi_processing
         )
 
         if default_gui_handler:
@@ -191,11 +203,14 @@ class Game(LogicGame):
 
         self.gui.render()
 
-    def change_world(self, tiles: numpy.ndarray, background: str, logic_area: AxisAlignedBoundingBox = None,
-                     logic_tile: bool = True, logic_entity: bool = True,
+    def change_world(self, tiles: [numpy.ndarray, TileChunks], background: str,
+                     logic_area: AxisAlignedBoundingBox = None, logic_tile: bool = True, logic_entity: bool = True,
                      entity_per_thread: int = WorldUpdater.DEFAULT_ENTITY_PER_THREAD,
                      node_capacity: int = QuadTree.DEFAULT_NODE_CAPACITY,
-                     max_depth: int = QuadTree.DEFAULT_MAX_DEPTH) -> None:
+                     max_depth: int = QuadTree.DEFAULT_MAX_DEPTH, entity_store: bool = False,
+                     broadphase: int = WorldUpdater.BROADPHASE_QUAD_TREE,
+                     cell_tiles: int = SpatialHash.DEFAULT_CELL_TILES,
+                     sleep_ticks: int = World.DEFAULT_SLEEP_TICKS, track_tiles: bool = True) -> None:
         """
         Creates a new world.
 
@@ -203,8 +218,8 @@ class Game(LogicGame):
 
         Parameters
         ----------
-        tiles: numpy.ndarray
-            The tiles array of the level.
+        tiles: [numpy.ndarray, TileChunks]
+            The tiles array of the level, which can be memory-mapped, or the chunks of a streamed level.
         background: str
             The background name.
         logic_area: AxisAlignedBoundingBox, optional
@@ -214,16 +229,33 @@ class Game(LogicGame):
         logic_entity: bool, optional
             Enables the collision detection with the entities is set to True.
         entity_per_thread: int, optional
-            The number of entity in each thread.
+            The minimal number of entities processed by each worker task.
         node_capacity: int, optional
             The object capacity of the leaf before it divides into smaller leaves.
         max_depth: int, optional
             The maximum depth of the tree.
+        entity_store: bool, optional
+            Stores the entities in a columnar EntityStore if set to True, their bounding boxes then have to use an
+            integer format.
+        broadphase: int, optional
+            The spatial partitioning used to find the candidate collision pairs, either
+            WorldUpdater.BROADPHASE_QUAD_TREE, WorldUpdater.BROADPHASE_SWEEP_AND_PRUNE or
+            WorldUpdater.BROADPHASE_SPATIAL_HASH.
+        cell_tiles: int, optional
+            The size of the cells of the spatial hash expressed in tiles.
+        sleep_ticks: int, optional
+            The number of idle ticks after which an entity falls asleep, the entities never sleep if set to None.
+        track_tiles: bool, optional
+            Detects the modifications done in place on the tiles array at each tick if set to True. Otherwise, which is
+            meant for large or streamed levels, the tiles have to be modified with World.set_tiles or reported with
+            World.invalidate_tiles.
         """
 
         super().change_world(
             tiles, background, logic_area=logic_area, logic_tile=logic_tile, logic_entity=logic_entity,
-            entity_per_thread=entity_per_thread, node_capacity=node_capacity, max_depth=max_depth
+            entity_per_thread=entity_per_thread, node_capacity=node_capacity, max_depth=max_depth,
+            entity_store=entity_store, broadphase=broadphase, cell_tiles=cell_tiles, sleep_ticks=sleep_ticks,
+            track_tiles=track_tiles
         )
 
         self._world_renderer = WorldRenderer(self.resources, self.world)
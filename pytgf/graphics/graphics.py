@@ -2,7 +2,7 @@
 Contains every classes related to the graphics engine.
 """
 
-from pytgf.logic.physics import Renderable, TileManager, World, LogicLoop, array_format
+from pytgf.logic.physics import AxisAlignedBoundingBox, Renderable, TileManager, World, LogicLoop, array_format
 
 from time import sleep
 
@@ -448,6 +448,8 @@ class Texture:
     -------
     bind(texture)
         Binds the texture to an OpenGL sampler.
+    write(texture, position)
+        Writes an image array into a block of the texture.
     """
 
     SAMPLER_SPRITE = 0
@@ -470,34 +472,73 @@ class Texture:
 
         self._width = texture.shape[0]
         self._height = texture.shape[1]
+        self._scale = scale
+
+        self._texture = context.texture((self._height, self._width), 3 if scale else 4, Texture._format(texture, scale))
+
+        self._texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        self._texture.repeat_x = False
+        self._texture.repeat_y = False
+
+    def __del__(self) -> None:
+        """
+        Cleans up the GPU memory by releasing the texture buffer.
+        """
+
+        self._texture.release()
+
+    @staticmethod
+    def _format(texture: numpy.ndarray, scale: bool) -> bytes:
+        """
+        Converts an image array into the buffer of a texture.
+
+        Parameters
+        ----------
+        texture: numpy.ndarray
+            The image array in a RGBA unsigned byte format.
+        scale: bool
+            Treats the image as a gray scale if set to True (only used by the level renderer).
+
+        Returns
+        -------
+        buffer: bytes
+            The content of the texture.
+        """
+
+        width = texture.shape[0]
+        height = texture.shape[1]
 
         if scale:
             texture = numpy.flip(texture, axis=1)
 
-            transform = numpy.zeros((self._width, self._height, 3), dtype=numpy.int32)
+            transform = numpy.zeros((width, height, 3), dtype=numpy.int32)
             transform[:, :, 0] = (texture != 0).astype(numpy.int32) * 255
             transform[:, :, 1] = (texture - 1) % 256
             transform[:, :, 2] = (texture - 1) // 256 % 256
 
-            buffer = transform.reshape(self._width * self._height * 3).astype(numpy.ubyte)
+            return transform.reshape(width * height * 3).astype(numpy.ubyte).tobytes()
 
-            self._texture = context.texture((self._height, self._width), 3, buffer.tobytes())
+        return texture.reshape(width * height * 4).astype(numpy.ubyte).tobytes()
 
-        else:
-            buffer = texture.reshape(self._width * self._height * 4).astype(numpy.ubyte)
+    def write(self, texture: numpy.ndarray, position: [tuple, numpy.ndarray]) -> None:
+        """
+        Writes an image array into a block of the texture.
 
-            self._texture = context.texture((self._height, self._width), 4, buffer.tobytes())
+        Parameters
+        ----------
+        texture: numpy.ndarray
+            The image array of the block, in the format of the texture.
+        position: [tuple, numpy.ndarray]
+            The position of the first pixel of the block within the texture.
+        """
 
-        self._texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
-        self._texture.repeat_x = False
-        self._texture.repeat_y = False
+        width = texture.shape[0]
+        height = texture.shape[1]
 
-    def __del__(self) -> None:
-        """
-        Cleans up the GPU memory by releasing the texture buffer.
-        """
+        # The gray scale images are flipped along their second axis
+        y = self._height - int(position[1]) - height if self._scale else int(position[1])
 
-        self._texture.release()
+        self._texture.write(Texture._format(texture, self._scale), viewport=(y, int(position[0]), height, width))
 
     def bind(self, sampler: int) -> None:
         """
@@ -1329,17 +1370,21 @@ class LevelRenderer:
     The renderer used for level rendering.
 
     This class stores a texture of the tiles of the level. This allow to render the level faster than rendering the
-    tiles individually. Each time the level is modified, the texture of the level should be updated.
+    tiles individually. Each time the level is modified, the texture of the level should be updated. When the level is
+    streamed, the texture only holds the window of the level and is drawn at the origin of this window. The tiles array
+    is not copied, its changes are tracked by the tiles version of the world and only the modified blocks are written
+    into the texture when they are known.
 
     Methods
     -------
     render(camera)
         Renders the level.
-    update_tiles(tiles)
+    update_tiles(tiles, origin, version, blocks)
         Updates the tile level array.
     """
 
-    def __init__(self, resources: ResourceManager, tiles: numpy.ndarray, scale: int):
+    def __init__(self, resources: ResourceManager, tiles: numpy.ndarray, scale: int,
+                 origin: [tuple, numpy.ndarray] = (0, 0), version: int = 0):
         """
         Initializes the LevelRenderer.
 
@@ -1351,11 +1396,17 @@ class LevelRenderer:
             The tiles array of the level.
         scale: int
             The size of the tiles expressed in distance units.
+        origin: [tuple, numpy.ndarray], optional
+            The position of the first tile of the tiles array within the level, expressed in tiles.
+        version: int, optional
+            The version of the tiles array.
         """
 
         self._resources = resources
-        self._tiles = tiles.copy()
+        self._tiles = tiles
+        self._version = version
         self._scale = scale
+        self._origin = numpy.array(origin, dtype=numpy.int64)
 
         self._width = tiles.shape[0]
         self._height = tiles.shape[1]
@@ -1388,6 +1439,8 @@ class LevelRenderer:
             (0.5, 0.5)
         ).scale(
             (- self._scale * self._width, self._scale * self._height)
+        ).translate(
+            (- self._origin[0] * self._scale, self._origin[1] * self._scale)
         ).translate(
             (camera.position[0], - camera.position[1])
         ).scale(
@@ -1399,20 +1452,37 @@ class LevelRenderer:
 
         self._resources.render_model(self._resources.model_world)
 
-    def update_tiles(self, tiles: numpy.ndarray):
+    def update_tiles(self, tiles: numpy.ndarray, origin: [tuple, numpy.ndarray] = (0, 0), version: int = 0,
+                     blocks: list = None):
         """
         Updates the tile level array.
 
-        Updates the local copy of the level array. This will update the OpenGL object only if change occurred.
+        Updates the level array. This will update the OpenGL object only if the array is replaced or its version
+        changed. If the modified blocks of the array are known, only these blocks are written into the texture.
 
         Parameters
         ----------
         tiles: numpy.ndarray
             The tiles array of the level.
+        origin: [tuple, numpy.ndarray], optional
+            The position of the first tile of the tiles array within the level, expressed in tiles.
+        version: int, optional
+            The version of the tiles array.
+        blocks: list of tuple, optional
+            The positions of the first and the last tiles (included) of each block modified since the previous version,
+            None if they are unknown.
         """
 
-        if not numpy.array_equal(self._tiles, tiles):
-            self._tiles = tiles.copy()
+        self._origin[:] = origin
+
+        if tiles is self._tiles and version != self._version and blocks is not None:
+            for min_tile, max_tile in blocks:
+                self._texture.write(tiles[min_tile[0]:max_tile[0] + 1, min_tile[1]:max_tile[1] + 1], min_tile)
+
+            self._version = version
+        elif tiles is not self._tiles or version != self._version:
+            self._tiles = tiles
+            self._version = version
 
             self._texture = Texture(self._resources.context, self._tiles, scale=True)
 
@@ -1434,7 +1504,7 @@ class LevelRenderer:
             The string object description.
         """
 
-        return "LevelRenderer[texture=" + str(self._texture) + "]"
+        return "LevelRenderer[texture=" + str(self._texture) + ", origin=" + str(self._origin) + "]"
 
 
 class WorldRenderer:
@@ -1442,7 +1512,8 @@ class WorldRenderer:
     The renderer used for world rendering.
 
     This class allows to render the level and the entities of the world. It relies on a level renderer. The entities out
-    of the camera field are not displayed for better performance.
+    of the camera field are not displayed for better performance. The view of each camera used is registered as a
+    streaming area of the world, so that the chunks it shows stay loaded when the level is streamed.
 
     Methods
     -------
@@ -1465,7 +1536,35 @@ class WorldRenderer:
         self._resources = resources
         self._world = world
 
-        self._level_renderer = LevelRenderer(resources, self._world.tiles, self._resources.tile_size)
+        self._tiles_version = self._world.tiles_version
+
+        self._level_renderer = LevelRenderer(
+            resources, self._world.tiles, self._resources.tile_size, self._world.tiles_origin, self._tiles_version
+        )
+
+        self._views = {}
+
+    def _stream_view(self, camera: Camera) -> None:
+        """
+        Updates the streaming area of the world covering the view of the camera.
+
+        Parameters
+        ----------
+        camera: Camera
+            The camera used for the rendering.
+        """
+
+        view = self._views.get(camera)
+
+        if view is None:
+            view = self._views[camera] = AxisAlignedBoundingBox((0, 0), (0, 0))
+
+            self._world.streaming_areas.append(view)
+
+        extent = camera.viewport / self._resources.scale
+
+        view.position = numpy.floor(camera.position - extent)
+        view.bounds = numpy.ceil(2 * extent) + 1
 
     def render(self, camera: Camera) -> None:
         """
@@ -1480,12 +1579,20 @@ class WorldRenderer:
             The camera used for the rendering.
         """
 
+        self._stream_view(camera)
+
         self._resources.shader_sprite.set_uniform(ShaderProgram.UNIFORM_PROJECTION, ProjectionMatrix().matrix)
 
         if self._world.background is not None:
             self._resources.render_background(self._world.background, camera)
 
-        self._level_renderer.update_tiles(self._world.tiles)
+        version = self._world.tiles_version
+
+        self._level_renderer.update_tiles(
+            self._world.tiles, self._world.tiles_origin, version, self._world.changed_tiles(self._tiles_version)
+        )
+
+        self._tiles_version = version
         self._level_renderer.render(camera)
 
         self._resources.shader_sprite.set_uniform(ShaderProgram.UNIFORM_PROJECTION, camera.projection_matrix.matrix)
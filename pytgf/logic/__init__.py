@@ -5,11 +5,13 @@ every project based on the library since they contains the core logic functions.
 
 from pytgf.logic.event import Event, CancelableEvent, EventQueue, Key, MouseButton, InputEvent, KeyEvent, \
     KeyPressedEvent, KeyReleasedEvent, KeyTypedEvent, KeyHeldEvent, MouseEvent, MouseMovedEvent, MouseButtonEvent, \
-    MouseButtonPressedEvent, MouseButtonReleasedEvent, MouseButtonClickedEvent, MouseDraggedEvent, InputHandler
+    MouseButtonPressedEvent, MouseButtonReleasedEvent, MouseButtonClickedEvent, MouseDraggedEvent, InputHandler, \
+    InputReplay, InputRecorder
 
 from pytgf.logic.physics import AxisAlignedBoundingBox, WorldObject, PhysicsObject, Renderable, Particle, Entity, \
-    CollisionMap, TileManager, Direction, CollisionEvent, CollisionWithTileEvent, CollisionWithEntityEvent, QuadTree, \
-    WorldUpdater, World, LogicLoop
+    EntityStore, CollisionMap, TileManager, TileOccupancy, TileChunks, Direction, CollisionEvent, \
+    CollisionWithTileEvent, CollisionWithEntityEvent, QuadTree, Broadphase, SweepAndPrune, SpatialHash, WorldUpdater, \
+    WorldObjects, World, WorldSnapshot, SnapshotRing, WorldBatch, LogicLoop
 
 import numpy
 
@@ -40,13 +42,22 @@ class LogicGame(EventQueue):
         Updates the world and fires the input events.
     run()
         Runs the game logic loop.
+    stop()
+        Stops the game logic loop and releases the workers of the world.
+    set_logic(function_logic)
+        Replaces the logic function called each tick by the game logic loop.
     reset()
         Resets the game.
-    change_world(tiles, background, logic_area, logic_tile, logic_entity, entity_per_thread, node_capacity, max_depth)
+    change_world(tiles, background, logic_area, logic_tile, logic_entity, entity_per_thread, node_capacity, max_depth,
+                 entity_store, broadphase, cell_tiles, sleep_ticks, track_tiles)
         Creates a new world.
+    snapshot(snapshot)
+        Captures the state of the world and the tick of the logic loop.
+    restore(snapshot)
+        Restores the state of the world and the tick of the logic loop.
     fire_event(event)
         Handles a new fired Event.
-    register_event_handler(event_type, handler)
+    register_event_handler(event_type, handler, once)
         Registers a new event handler.
     register_collision_event_handler(handler)
         Registers a new CollisionEvent handler.
@@ -84,7 +95,7 @@ class LogicGame(EventQueue):
 
     def __init__(self, tile_size: int, tick_per_second: float = 60.0, multi_threading: bool = True,
                  safe_mode: bool = True, default_tile_collision_handler: bool = True,
-                 default_entity_collision_handler: bool = True):
+                 default_entity_collision_handler: bool = True, multi_processing: bool = False):
         """
         Initializes the LogicGame.
 
@@ -102,6 +113,9 @@ class LogicGame(EventQueue):
             Registers the default tile collision event handler if set to True.
         default_entity_collision_handler: bool, optional
             Registers the default entity collision event handler if set to True.
+        multi_processing: bool, optional
+            Runs the collision detection in worker processes if set to True, this takes precedence over the
+            multi-threading mode.
         """
 
         EventQueue.__init__(self)
@@ -116,6 +130,7 @@ class LogicGame(EventQueue):
             self._loop = LogicLoop(tick_per_second, self.update)
 
         self._multi_threading = multi_threading
+        self._multi_processing = multi_processing
         self._safe_mode = safe_mode
 
         if default_tile_collision_handler:
@@ -158,21 +173,39 @@ class LogicGame(EventQueue):
 
     def stop(self) -> None:
         """
-        Stops the game logic loop.
+        Stops the game logic loop and releases the workers of the world.
         """
 
         self._loop.stop()
 
+        if self.world is not None:
+            self.world.close()
+
+    def set_logic(self, function_logic: callable = None) -> None:
+        """
+        Replaces the logic function called each tick by the game logic loop.
+
+        Parameters
+        ----------
+        function_logic: callable, optional
+            The logic function called with the current tick, the update method is used again if it is not set.
+        """
+
+        self._loop.function_logic = function_logic if function_logic is not None else self.update
+
     def reset(self) -> None:
         """
         Resets the game (this function is called on the initialization).
         """
 
-    def change_world(self, tiles: numpy.ndarray, background: str, logic_area: AxisAlignedBoundingBox = None,
-                     logic_tile: bool = True, logic_entity: bool = True,
+    def change_world(self, tiles: [numpy.ndarray, TileChunks], background: str,
+                     logic_area: AxisAlignedBoundingBox = None, logic_tile: bool = True, logic_entity: bool = True,
                      entity_per_thread: int = WorldUpdater.DEFAULT_ENTITY_PER_THREAD,
                      node_capacity: int = QuadTree.DEFAULT_NODE_CAPACITY,
-                     max_depth: int = QuadTree.DEFAULT_MAX_DEPTH) -> None:
+                     max_depth: int = QuadTree.DEFAULT_MAX_DEPTH, entity_store: bool = False,
+                     broadphase: int = WorldUpdater.BROADPHASE_QUAD_TREE,
+                     cell_tiles: int = SpatialHash.DEFAULT_CELL_TILES,
+                     sleep_ticks: int = World.DEFAULT_SLEEP_TICKS, track_tiles: bool = True) -> None:
         """
         Creates a new world.
 
@@ -180,8 +213,8 @@ class LogicGame(EventQueue):
 
         Parameters
         ----------
-        tiles: numpy.ndarray
-            The tiles array of the level.
+        tiles: [numpy.ndarray, TileChunks]
+            The tiles array of the level, which can be memory-mapped, or the chunks of a streamed level.
         background: str
             The background name.
         logic_area: AxisAlignedBoundingBox, optional
@@ -191,19 +224,76 @@ class LogicGame(EventQueue):
         logic_entity: bool, optional
             Enables the collision detection with the entities is set to True.
         entity_per_thread: int, optional
-            The number of entity in each thread.
+            The minimal number of entities processed by each worker task.
         node_capacity: int, optional
             The object capacity of the leaf before it divides into smaller leaves.
         max_depth: int, optional
             The maximum depth of the tree.
+        entity_store: bool, optional
+            Stores the entities in a columnar EntityStore if set to True, their bounding boxes then have to use an
+            integer format.
+        broadphase: int, optional
+            The spatial partitioning used to find the candidate collision pairs, either
+            WorldUpdater.BROADPHASE_QUAD_TREE, WorldUpdater.BROADPHASE_SWEEP_AND_PRUNE or
+            WorldUpdater.BROADPHASE_SPATIAL_HASH.
+        cell_tiles: int, optional
+            The size of the cells of the spatial hash expressed in tiles.
+        sleep_ticks: int, optional
+            The number of idle ticks after which an entity falls asleep, the entities never sleep if set to None.
+        track_tiles: bool, optional
+            Detects the modifications done in place on the tiles array at each tick if set to True. Otherwise, which is
+            meant for large or streamed levels, the tiles have to be modified with World.set_tiles or reported with
+            World.invalidate_tiles.
         """
 
+        if self.world is not None:
+            self.world.close()
+
         self.world = World(
             self.resources, self, tiles, background, logic_area=logic_area, logic_tile=logic_tile,
             logic_entity=logic_entity, multi_threading=self._multi_threading, safe_mode=self._safe_mode,
-            entity_per_thread=entity_per_thread, node_capacity=node_capacity, max_depth=max_depth
+            entity_per_thread=entity_per_thread, node_capacity=node_capacity, max_depth=max_depth,
+            entity_store=entity_store, broadphase=broadphase, cell_tiles=cell_tiles,
+            multi_processing=self._multi_processing, sleep_ticks=sleep_ticks, track_tiles=track_tiles
         )
 
+    def snapshot(self, snapshot: WorldSnapshot = None) -> WorldSnapshot:
+        """
+        Captures the state of the world and the tick of the logic loop.
+
+        Parameters
+        ----------
+        snapshot: WorldSnapshot, optional
+            The snapshot whose buffers are reused, a new one is created if not set.
+
+        Returns
+        -------
+        snapshot: WorldSnapshot
+            The snapshot holding the state, its tick being the next tick of the loop.
+        """
+
+        if snapshot is None:
+            snapshot = WorldSnapshot()
+
+        snapshot.capture(self.world, self._loop.tick)
+
+        return snapshot
+
+    def restore(self, snapshot: WorldSnapshot) -> None:
+        """
+        Restores the state of the world and the tick of the logic loop.
+
+        Parameters
+        ----------
+        snapshot: WorldSnapshot
+            The snapshot captured from the world.
+        """
+
+        snapshot.restore(self.world)
+
+        if snapshot.tick is not None:
+            self._loop.tick = snapshot.tick
+
     def register_collision_event_handler(self, handler: callable) -> None:
         """
         Registers a new CollisionEvent handler.
@@ -455,3 +545,303 @@ class LogicGame(EventQueue):
         return "LogicGame[input_handler=" + str(self.input_handler) + ", resources=" + str(self.resources) + ", " + \
                "world=" + str(self.world) + ", multi_threading=" + str(self._multi_threading) + ", " + \
                "safe_mode=" + str(self._safe_mode) + "]"
+
+
+class RollbackDriver:
+    """
+    Rollback and resimulation driver of a game.
+
+    The driver takes over the logic function of the game loop. Before each tick, it captures the state of the world and
+    of the input handler into a SnapshotRing, plays the inputs of the tick through the input handler and updates the
+    game. The inputs are added with their tick, either from the local player or from the remote ones: when an input
+    arrives for a tick already simulated, the next update restores the latest snapshot captured at or before this tick
+    and simulates the following ticks again at maximum speed with the corrected inputs, before simulating the current
+    tick. While resimulating, the event queue of the game is flagged so that the handlers registered with once set to
+    True are not called again for the events already fired.
+
+    Attributes
+    ----------
+    inputs: dict
+        The inputs of each tick, in the format of InputReplay.
+    late_inputs: int
+        The number of inputs added for a tick already simulated.
+    rollbacks: int
+        The number of rollbacks done.
+    resimulated_ticks: int
+        The total number of ticks simulated again.
+    max_rollback: int
+        The largest number of ticks simulated again by a single rollback.
+
+    Methods
+    -------
+    update(tick)
+        Simulates a tick, rolling back first if late inputs were added.
+    key_press(tick, key_code)
+        Adds a key press input.
+    key_release(tick, key_code)
+        Adds a key release input.
+    mouse_button_press(tick, mouse_button)
+        Adds a mouse button press input.
+    mouse_button_release(tick, mouse_button)
+        Adds a mouse button release input.
+    move_mouse(tick, position)
+        Adds a mouse move input.
+    reset_stats()
+        Resets the rollback statistics.
+    """
+
+    def __init__(self, game: LogicGame, capacity: int = SnapshotRing.DEFAULT_CAPACITY):
+        """
+        Initializes the RollbackDriver.
+
+        Parameters
+        ----------
+        game: LogicGame
+            The game to drive, its world has to use an entity store.
+        capacity: int, optional
+            The number of snapshots kept, that is the largest number of ticks which can be rolled back.
+        """
+
+        self._game = game
+        self._update = game.update
+
+        self._ring = SnapshotRing(capacity)
+        self._input_states = {}
+        self._world = None
+
+        self._recorder = InputRecorder()
+        self._replay = InputReplay(self._recorder.inputs)
+
+        self.inputs = self._recorder.inputs
+
+        self._tick = None
+        self._rollback = None
+
+        self.reset_stats()
+
+        game.set_logic(self.update)
+
+    def update(self, tick: int) -> None:
+        """
+        Simulates a tick, rolling back first if late inputs were added.
+
+        Parameters
+        ----------
+        tick: int
+            The current logic tick.
+        """
+
+        if self._rollback is not None:
+            self._resimulate(self._rollback, tick)
+
+            self._rollback = None
+
+        self._step(tick)
+
+        self._tick = tick + 1
+
+    def _step(self, tick: int) -> None:
+        """
+        Captures the state of the game, plays the inputs of a tick and updates the game.
+
+        Parameters
+        ----------
+        tick: int
+            The simulated tick.
+        """
+
+        game = self._game
+
+        if game.world is not self._world:
+            self._ring.clear()
+            self._world = game.world
+
+        if game.world is not None:
+            self._ring.capture(game.world, tick)
+            self._input_states[tick] = game.input_handler.snapshot()
+
+            for held in [held for held in self._input_states if held not in self._ring]:
+                del self._input_states[held]
+
+        self._replay.play(tick, game.input_handler)
+        self._update(tick)
+
+    def _resimulate(self, start: int, tick: int) -> None:
+        """
+        Restores the latest snapshot captured at or before a tick and simulates again the ticks until the current one.
+
+        Parameters
+        ----------
+        start: int
+            The earliest tick whose inputs changed.
+        tick: int
+            The current logic tick, which is not simulated.
+        """
+
+        snapshot = self._ring.latest(start)
+
+        if snapshot is None:
+            return
+
+        snapshot.restore(self._game.world)
+        self._game.input_handler.restore(self._input_states[snapshot.tick])
+
+        self._game.resimulating = True
+
+        try:
+            for past_tick in range(snapshot.tick, tick):
+                self._step(past_tick)
+        finally:
+            self._game.resimulating = False
+
+        self.rollbacks += 1
+        self.resimulated_ticks += tick - snapshot.tick
+        self.max_rollback = max(self.max_rollback, tick - snapshot.tick)
+
+    def _schedule(self, tick: int) -> None:
+        """
+        Schedules a rollback if an input is added for a tick already simulated.
+
+        Parameters
+        ----------
+        tick: int
+            The tick of the input.
+
+        Raises
+        ------
+        ValueError
+            If the tick is older than every snapshot held.
+        """
+
+        if self._tick is None or tick >= self._tick:
+            return
+
+        if self._ring.latest(tick) is None:
+            raise ValueError("The tick " + str(tick) + " is older than the snapshots held.")
+
+        self.late_inputs += 1
+        self._rollback = tick if self._rollback is None else min(self._rollback, tick)
+
+    def key_press(self, tick: int, key_code: int) -> None:
+        """
+        Adds a key press input.
+
+        Parameters
+        ----------
+        tick: int
+            The tick at which the key is pressed.
+        key_code: int
+            The code of the key pressed.
+
+        Raises
+        ------
+        ValueError
+            If the tick is older than every snapshot held.
+        """
+
+        self._schedule(tick)
+        self._recorder.key_press(tick, key_code)
+
+    def key_release(self, tick: int, key_code: int) -> None:
+        """
+        Adds a key release input.
+
+        Parameters
+        ----------
+        tick: int
+            The tick at which the key is released.
+        key_code: int
+            The code of the key released.
+
+        Raises
+        ------
+        ValueError
+            If the tick is older than every snapshot held.
+        """
+
+        self._schedule(tick)
+        self._recorder.key_release(tick, key_code)
+
+    def mouse_button_press(self, tick: int, mouse_button: int) -> None:
+        """
+        Adds a mouse button press input.
+
+        Parameters
+        ----------
+        tick: int
+            The tick at which the mouse button is pressed.
+        mouse_button: int
+            The code of the mouse button pressed.
+
+        Raises
+        ------
+        ValueError
+            If the tick is older than every snapshot held.
+        """
+
+        self._schedule(tick)
+        self._recorder.mouse_button_press(tick, mouse_button)
+
+    def mouse_button_release(self, tick: int, mouse_button: int) -> None:
+        """
+        Adds a mouse button release input.
+
+        Parameters
+        ----------
+        tick: int
+            The tick at which the mouse button is released.
+        mouse_button: int
+            The code of the mouse button released.
+
+        Raises
+        ------
+        ValueError
+            If the tick is older than every snapshot held.
+        """
+
+        self._schedule(tick)
+        self._recorder.mouse_button_release(tick, mouse_button)
+
+    def move_mouse(self, tick: int, position: numpy.ndarray) -> None:
+        """
+        Adds a mouse move input.
+
+        Parameters
+        ----------
+        tick: int
+            The tick at which the mouse pointer moves.
+        position: numpy.ndarray
+            The position of the mouse pointer on the screen.
+
+        Raises
+        ------
+        ValueError
+            If the tick is older than every snapshot held.
+        """
+
+        self._schedule(tick)
+        self._recorder.move_mouse(tick, position)
+
+    def reset_stats(self) -> None:
+        """
+        Resets the rollback statistics.
+        """
+
+        self.late_inputs = 0
+        self.rollbacks = 0
+        self.resimulated_ticks = 0
+        self.max_rollback = 0
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "RollbackDriver[tick=" + str(self._tick) + ", late_inputs=" + str(self.late_inputs) + ", " + \
+               "rollbacks=" + str(self.rollbacks) + ", resimulated_ticks=" + str(self.resimulated_ticks) + ", " + \
+               "max_rollback=" + str(self.max_rollback) + "]"
@@ -120,14 +120,22 @@ class EventQueue:
     When an event is created, it should be processed by the event queue. The event queue contains the list of different
     user-defined handlers in which the new Event will be passed as argument.
 
+    While past ticks are simulated again (after a rollback), the same events are usually fired a second time. The
+    handlers registered with once set to True (sounds, network messages...) are then only called for the events which
+    were not already fired during the same tick. The events are compared by type and attributes, the objects they
+    refer to (such as the entities) being compared by identity. The fired events are kept for the last history_length
+    ticks.
+
     Attributes
     ---------
     history: list of Event
         The list of fired events.
+    resimulating: bool
+        Whether past ticks are being simulated again.
 
     Methods
     -------
-    register_event_handler(event_type, handler)
+    register_event_handler(event_type, handler, once)
         Registers a new event handler.
     fire_event(event)
         Handles a new fired Event.
@@ -150,6 +158,9 @@ class EventQueue:
         self._handlers = []
         self.history = []
 
+        self.resimulating = False
+        self._fired = {}
+
     def __len__(self) -> int:
         """
         Returns the length of the event history.
@@ -162,7 +173,7 @@ class EventQueue:
 
         return len(self.history)
 
-    def register_event_handler(self, event_type: type, handler: callable) -> None:
+    def register_event_handler(self, event_type: type, handler: callable, once: bool = False) -> None:
         """
         Registers a new event handler.
 
@@ -176,9 +187,39 @@ class EventQueue:
             The type of event which will be passed to the handler when fired.
         handler: callable
             The handler function. This function should only take the event passed as argument.
+        once: bool, optional
+            Does not call the handler again for the events fired again while resimulating past ticks if set to True.
+        """
+
+        self._handlers.append((event_type, handler, once))
+
+    @staticmethod
+    def _event_key(event: Event) -> tuple:
+        """
+        Returns the key identifying an event within its tick.
+
+        Parameters
+        ----------
+        event: Event
+            The event to identify.
+
+        Returns
+        -------
+        key: tuple
+            The type of the event and its attributes, the objects being replaced by their identity.
         """
 
-        self._handlers.append((event_type, handler))
+        values = []
+
+        for value in vars(event).values():
+            if isinstance(value, numpy.ndarray):
+                values.append(tuple(value.tolist()))
+            elif value is None or isinstance(value, (bool, int, float, str, tuple)):
+                values.append(value)
+            else:
+                values.append(id(value))
+
+        return (type(event),) + tuple(values)
 
     def fire_event(self, event: Event) -> None:
         """
@@ -198,14 +239,54 @@ class EventQueue:
 
         self.history.append(event)
 
-        for event_type, handler in self._handlers:
+        fired = None
+
+        for event_type, handler, once in self._handlers:
             if isinstance(event, event_type):
+                if once:
+                    if fired is None:
+                        fired = self._fire_once(event)
+
+                    if not fired:
+                        continue
+
                 if isinstance(event, CancelableEvent):
                     if not event.is_canceled():
                         handler(event)
                 else:
                     handler(event)
 
+    def _fire_once(self, event: Event) -> bool:
+        """
+        Records an event for the handlers called once and tells whether they have to be called.
+
+        Parameters
+        ----------
+        event: Event
+            The fired event.
+
+        Returns
+        -------
+        first: bool
+            False if the same event was already fired during its tick and past ticks are being simulated again.
+        """
+
+        if event.tick not in self._fired:
+            self._fired[event.tick] = set()
+
+            if len(self._fired) > self._history_length:
+                del self._fired[min(self._fired)]
+
+        keys = self._fired[event.tick]
+        key = EventQueue._event_key(event)
+
+        if self.resimulating and key in keys:
+            return False
+
+        keys.add(key)
+
+        return True
+
     def __str__(self) -> str:
         """
         Returns a description string of the object.
@@ -1050,6 +1131,10 @@ class InputHandler:
         Exports the record into a replay file.
     load_replay(path)
         Loads a replay and plays it.
+    snapshot()
+        Returns a copy of the state of the inputs.
+    restore(state)
+        Restores the state of the inputs.
     key_press(key_code)
         Sets the state of the specified key as pressed.
     key_release(key_code)
@@ -1208,6 +1293,38 @@ class InputHandler:
 
             self._replay = InputReplay(inputs, replay_tick=replay_tick)
 
+    def snapshot(self) -> tuple:
+        """
+        Returns a copy of the state of the inputs.
+
+        Returns
+        -------
+        state: tuple
+            The held keys and mouse buttons with their durations, and the current and previous mouse positions.
+        """
+
+        return {key: list(duration) for key, duration in self._key_durations.items()}, \
+            {button: list(duration) for button, duration in self._mouse_button_durations.items()}, \
+            numpy.array(self.mouse_position), numpy.array(self._mouse_previous_position)
+
+    def restore(self, state: tuple) -> None:
+        """
+        Restores the state of the inputs.
+
+        Parameters
+        ----------
+        state: tuple
+            The state returned by snapshot.
+        """
+
+        key_durations, mouse_button_durations, mouse_position, mouse_previous_position = state
+
+        self._key_durations = {key: list(duration) for key, duration in key_durations.items()}
+        self._mouse_button_durations = {button: list(duration) for button, duration in mouse_button_durations.items()}
+
+        self.mouse_position = numpy.array(mouse_position)
+        self._mouse_previous_position = numpy.array(mouse_previous_position)
+
     def fire_events(self, tick: int) -> None:
         """
         Fires the key and mouse events.
@@ -1299,6 +1416,9 @@ class InputReplay:
     """
     A simple way of queueing a sequence of inputs.
 
+    The inputs are indexed by their local tick, either as integers (as recorded by an InputRecorder) or as strings (as
+    loaded from a replay file).
+
     Methods
     -------
     play(tick, input_handler)
@@ -1338,11 +1458,11 @@ class InputReplay:
             The main input handler controlled by the replay.
         """
 
-        local_tick = str(tick - self._tick)
+        local_tick = tick - self._tick
 
-        if local_tick in self._inputs:
-            events = self._inputs[local_tick]
+        events = self._inputs.get(local_tick, self._inputs.get(str(local_tick)))
 
+        if events is not None:
             for event in events:
                 if event[0] == InputReplay.EVENT_KEY_PRESS:
                     input_handler.key_press(key_code=event[1])
@@ -1353,7 +1473,7 @@ class InputReplay:
                 elif event[0] == InputReplay.EVENT_MOUSE_BUTTON_RELEASE:
                     input_handler.mouse_button_release(mouse_button=event[1])
                 elif event[0] == InputReplay.EVENT_MOUSE_MOVE:
-                    input_handler.move_mouse(position=numpy.ndarray(event[1]))
+                    input_handler.move_mouse(position=numpy.array(event[1]))
 
     def __str__(self) -> str:
         """
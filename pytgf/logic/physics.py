@@ -4,8 +4,14 @@ Contains every classes related to the logic engine.
 
 from pytgf.logic.event import Event, EventQueue
 
-from multiprocessing.pool import ThreadPool
+from multiprocessing.pool import ThreadPool, Pool, AsyncResult
+from collections.abc import MutableSequence
 from itertools import repeat
+from functools import partial
+from operator import is_not
+from threading import Lock
+from mmap import mmap
+from os import cpu_count
 from time import sleep
 
 import numpy
@@ -69,6 +75,8 @@ class AxisAlignedBoundingBox:
         Creates a copy of the AABB and casts it to the specified type.
     """
 
+    _view = False
+
     def __init__(self, position: [tuple, numpy.ndarray], bounds: [tuple, numpy.ndarray], dtype: type = numpy.int32):
         """
         Initializes the AxisAlignedBoundingBox.
@@ -107,7 +115,10 @@ class AxisAlignedBoundingBox:
             The position of the bottom-left corner of the rectangle.
         """
 
-        self._position = array_format(position, dtype=self._dtype)
+        if self._view:
+            self._position[...] = position
+        else:
+            self._position = array_format(position, dtype=self._dtype)
 
     @property
     def bounds(self) -> numpy.ndarray:
@@ -128,7 +139,90 @@ class AxisAlignedBoundingBox:
             The width and the height of the rectangle.
         """
 
-        self._bounds = array_format(bounds, dtype=self._dtype)
+        if self._view:
+            self._bounds[...] = bounds
+        else:
+            self._bounds = array_format(bounds, dtype=self._dtype)
+
+    @staticmethod
+    def _from_views(position: numpy.ndarray, bounds: numpy.ndarray, dtype: type) -> "AxisAlignedBoundingBox":
+        """
+        Creates an AABB over existing arrays without copying them.
+
+        Parameters
+        ----------
+        position: numpy.ndarray
+            The array holding the position of the bottom-left corner of the rectangle.
+        bounds: numpy.ndarray
+            The array holding the width and the height of the rectangle.
+        dtype: type
+            The data format of the arrays.
+
+        Returns
+        -------
+        aabb: AxisAlignedBoundingBox
+            The AABB using the arrays as storage.
+        """
+
+        aabb = AxisAlignedBoundingBox.__new__(AxisAlignedBoundingBox)
+        aabb._bind(position, bounds, dtype)
+
+        return aabb
+
+    def _bind(self, position: numpy.ndarray, bounds: numpy.ndarray, dtype: type) -> None:
+        """
+        Makes the AABB use the specified arrays as storage.
+
+        Once bound, the setters write the new values into the arrays instead of replacing them, so that the AABB stays a
+        view over the external storage (for instance a row of an EntityStore).
+
+        Parameters
+        ----------
+        position: numpy.ndarray
+            The array holding the position of the bottom-left corner of the rectangle.
+        bounds: numpy.ndarray
+            The array holding the width and the height of the rectangle.
+        dtype: type
+            The data format of the arrays.
+        """
+
+        self._dtype = dtype
+
+        self._position = position
+        self._bounds = bounds
+
+        self._view = True
+
+    def _unbind(self) -> None:
+        """
+        Detaches the AABB from its external storage by copying the arrays.
+        """
+
+        self._position = self._position.copy()
+        self._bounds = self._bounds.copy()
+
+        self._view = False
+
+    def _assign(self, other: "AxisAlignedBoundingBox") -> None:
+        """
+        Copies the position and the bounds of another AABB into the arrays of this one.
+
+        The arrays are only replaced if the AABB is not a view and the other one uses another data format.
+
+        Parameters
+        ----------
+        other: AxisAlignedBoundingBox
+            The AABB from which the values are copied.
+        """
+
+        if self._view or self._dtype == other._dtype:
+            self._position[...] = other.position
+            self._bounds[...] = other.bounds
+        else:
+            self._dtype = other._dtype
+
+            self._position = other.position.copy()
+            self._bounds = other.bounds.copy()
 
     def __contains__(self, other: "AxisAlignedBoundingBox") -> bool:
         """
@@ -274,8 +368,15 @@ class WorldObject:
         The position of the bottom-left corner of the rectangle.
     bounds: numpy.ndarray
         The width and the height of the rectangle.
+
+    Methods
+    -------
+    reset(bounding_box)
+        Initializes the object again, reusing its arrays.
     """
 
+    _pooled = False
+
     def __init__(self, bounding_box: AxisAlignedBoundingBox):
         """
         Initializes the WorldObject.
@@ -290,6 +391,24 @@ class WorldObject:
 
         self.should_be_destroyed = False
 
+    def reset(self, bounding_box: AxisAlignedBoundingBox) -> None:
+        """
+        Initializes the object again, reusing its arrays.
+
+        This takes the same arguments as the __init__ function, the values of the given bounding boxes being copied into
+        the ones of the object. It is used to recycle the destroyed world objects (see World.spawn_pooled), hence the
+        subclasses overriding the __init__ function should override it as well, to initialize their own state again.
+
+        Parameters
+        ----------
+        bounding_box: AxisAlignedBoundingBox
+            The bounding box of the object.
+        """
+
+        self.bounding_box._assign(bounding_box)
+
+        self.should_be_destroyed = False
+
     @property
     def position(self) -> numpy.ndarray:
         """
@@ -345,348 +464,290 @@ class WorldObject:
         return "WorldObject[position=" + str(self.position) + ", bounds=" + str(self.bounds) + "]"
 
 
-class PhysicsObject(WorldObject):
+class ColliderList(list):
     """
-    A generic type of world object used for collision detection.
+    The list of colliders returned by the colliders property of a physics object.
 
-    An object that collides with tiles either and / or other objects should extends from this class. Note that theses
-    objects are not supposed to move, extend from Entity instead.
+    The list can be modified in place with the usual list methods: every change is assigned back to the colliders of its
+    owner, so that its collision mask (and its column in the entity store) stays up to date. A new list is returned each
+    time the colliders property is read.
 
     Attributes
     ----------
-    bounding_box: AxisAlignedBoundingBox
-        The bounding box of the object.
-    position: numpy.ndarray
-        The position of the bottom-left corner of the rectangle.
-    bounds: numpy.ndarray
-        The width and the height of the rectangle.
-    collides_with_tiles: bool
-        Enables the collision detection with tiles.
-    colliders: list of types
-        The list of types of object with which the object collides.
+    owner: PhysicsObject
+        The physics object whose colliders are held by the list.
 
     Methods
     -------
-    add_collider(collider)
-        Adds a new collider.
-    remove_collider(collider)
-        Removes a collider.
-    clear_colliders()
-        Removes every existing collider.
+    append(collider)
+        Adds a collider at the end of the list.
+    extend(colliders)
+        Adds several colliders at the end of the list.
+    insert(index, collider)
+        Adds a collider before the specified index.
+    remove(collider)
+        Removes the first occurrence of a collider.
+    pop(index)
+        Removes the collider at the specified index and returns it.
+    clear()
+        Removes every collider.
+    sort(key, reverse)
+        Sorts the colliders in place.
+    reverse()
+        Reverses the order of the colliders in place.
     """
 
-    def __init__(self, bounding_box: AxisAlignedBoundingBox, collides_with_tiles: bool = True,
-                 colliders: [type, list] = None):
+    def __init__(self, owner: "PhysicsObject", colliders: tuple):
         """
-        Initializes the PhysicsObject.
+        Initializes the ColliderList.
 
         Parameters
         ----------
-        bounding_box: AxisAlignedBoundingBox
-            The bounding box of the object.
-        collides_with_tiles: bool, optional
-            Enables the collision detection with tiles.
-        colliders: [type, list], optional
-            The list of types of object with which the object collides.
+        owner: PhysicsObject
+            The physics object whose colliders are held by the list.
+        colliders: tuple of types
+            The current colliders of the physics object.
         """
 
-        WorldObject.__init__(self, bounding_box)
-
-        self.collides_with_tiles = collides_with_tiles
+        list.__init__(self, colliders)
 
-        self.colliders = colliders if colliders is not None else []
+        self.owner = owner
 
-    @property
-    def colliders(self) -> list:
+    def _modify(self, method, *args):
         """
-        The colliders property containing the list of types of object with which the object collides.
+        Applies a list method to a copy of the colliders, assigns the result to the owner and updates the list.
+
+        Parameters
+        ----------
+        method: function
+            The list method to apply.
+        args: tuple
+            The arguments of the method.
+
+        Returns
+        -------
+        result: object
+            The value returned by the method.
         """
 
-        return self._colliders
+        colliders = list(self)
+        result = method(colliders, *args)
 
-    @colliders.setter
-    def colliders(self, colliders: [type, list]) -> None:
+        self.owner.colliders = colliders
+        list.__setitem__(self, slice(None), colliders)
+
+        return result
+
+    def append(self, collider: type) -> None:
         """
-        Setter function for the colliders list.
+        Adds a collider at the end of the list.
 
         Parameters
         ----------
-        colliders: [type, list]
-             The list of types of object with which the object collides.
+        collider: type
+            The type of object with which the owner will collide.
 
         Raises
         ------
         TypeError
-            If the colliders list contains classes that are not extending from PhysicsObject
+            If the collider is not a subclass of PhysicsObject.
         """
 
-        if type(colliders) == type and issubclass(colliders, PhysicsObject):
-            self._colliders = [colliders]
-
-        elif type(colliders) == list:
-            for collider in colliders:
-                if type(collider) != type or not issubclass(collider, PhysicsObject):
-                    raise TypeError("The collider {0} is not a subclass of PhysicsObjects.".format(str(collider)))
+        self._modify(list.append, collider)
 
-            self._colliders = colliders
+    def extend(self, colliders: [list, tuple]) -> None:
+        """
+        Adds several colliders at the end of the list.
 
-        else:
-            raise TypeError("The colliders must be a list of subclass of PhysicsObjects.")
+        Parameters
+        ----------
+        colliders: [list, tuple]
+            The types of object with which the owner will collide.
 
-    def add_collider(self, collider: type) -> None:
+        Raises
+        ------
+        TypeError
+            If a collider is not a subclass of PhysicsObject.
         """
-        Adds a new collider.
 
-        Adds a new type of object with which the object will collide. Note that the type must be a subclass of
-        PhysicsObject.
+        self._modify(list.extend, colliders)
+
+    def insert(self, index: int, collider: type) -> None:
+        """
+        Adds a collider before the specified index.
 
         Parameters
         ----------
+        index: int
+            The index before which the collider is inserted.
         collider: type
-            The type of object with which the object will collide.
+            The type of object with which the owner will collide.
 
         Raises
         ------
         TypeError
-            If the colliders list contains classes that are not extending from PhysicsObject
+            If the collider is not a subclass of PhysicsObject.
         """
 
-        if type(collider) != type or not issubclass(collider, PhysicsObject):
-            raise TypeError("The collider {0} is not a subclass of PhysicsObjects.".format(str(collider)))
+        self._modify(list.insert, index, collider)
 
-        if collider not in self.colliders:
-            self.colliders.append(collider)
-
-    def remove_collider(self, collider: type) -> None:
+    def remove(self, collider: type) -> None:
         """
-        Removes a collider.
-
-        Removes a type of object with which the world object used to collide.
+        Removes the first occurrence of a collider.
 
         Parameters
         ----------
         collider: type
-            The type of object with which the object will not collide anymore.
+            The type of object with which the owner will not collide anymore.
+
+        Raises
+        ------
+        ValueError
+            If the collider is not in the list.
         """
 
-        if collider in self.colliders:
-            self.colliders.remove(collider)
+        self._modify(list.remove, collider)
 
-    def clear_colliders(self) -> None:
-        """
-        Removes every existing collider.
+    def pop(self, index: int = -1) -> type:
         """
+        Removes the collider at the specified index and returns it.
 
-        self.colliders.clear()
+        Parameters
+        ----------
+        index: int, optional
+            The index of the collider, the last one by default.
 
-    def __str__(self) -> str:
-        """
-        Returns a description string of the object.
+        Raises
+        ------
+        IndexError
+            If the list is empty or the index is out of range.
 
         Returns
         -------
-        string: str
-            The string object description.
+        collider: type
+            The removed collider.
         """
 
-        return "PhysicsObject[position=" + str(self.position) + ", bounds=" + self.bounds + ", " + \
-               "collides_with_tiles=" + str(self.collides_with_tiles) + ", colliders=" + str(self.colliders) + "]"
-
-
-class Renderable(WorldObject):
-    """
-    A generic type of world object used for rendering.
-
-    An object that is supposed to be rendered by drawing a texture should extends from this class. For object that need
-    to have a physics (collision detection and movement), see Entity.
+        return self._modify(list.pop, index)
 
-    Attributes
-    ----------
-    bounding_box: AxisAlignedBoundingBox
-        The bounding box of the object.
-    position: numpy.ndarray
-        The position of the bottom-left corner of the rectangle.
-    bounds: numpy.ndarray
-        The width and the height of the rectangle.
-    texture_bounds: AxisAlignedBoundingBox
-        The bounding box of the displayed texture. Note that the position of the sprite is relative to the position of
-        the world object (a position of (0, 0) means that the sprite will be drawn at the same position of the object).
-    sprite_set: str
-        The name of the sprite set used.
-    id_animation: int
-        The index of the animation played within the sprite set.
-    id_animation_transition: int
-        The index of the animation played as a transition within the sprite set.
-    angle: float
-        The angle between the sprite and the
-    visible: bool
-        Renders the object if set to True.
-    flip_horizontally: bool
-        Flips the texture horizontally if set to True.
-    flip_vertically: bool
-        Flips the texture vertically if set to True.
+    def clear(self) -> None:
+        """
+        Removes every collider.
+        """
 
-    Methods
-    -------
-    transition(id_animation_transition, id_animation=-1)
-        Plays a transition animation once.
-    cancel_transition(id_animation=-1)
-        Cancels the transition animation immediately.
-    is_transiting()
-        Returns whether or not a transition animation is playing.
-    """
+        self._modify(list.clear)
 
-    def __init__(self, bounding_box: AxisAlignedBoundingBox, texture_bounds: AxisAlignedBoundingBox, sprite_set: str,
-                 id_animation: int, angle: float = 0, visible: bool = True, flip_horizontally: bool = False,
-                 flip_vertically: bool = False):
+    def sort(self, *, key: callable = None, reverse: bool = False) -> None:
         """
-        Initializes the Renderable.
+        Sorts the colliders in place.
 
         Parameters
         ----------
-        bounding_box: AxisAlignedBoundingBox
-            The bounding box of the object.
-        texture_bounds: AxisAlignedBoundingBox
-            The bounding box of the displayed texture. Note that the position of the sprite is relative to the position
-            of the world object.
-        sprite_set: str
-            The name of the sprite set used.
-        id_animation: int
-            The index of the animation played within the specified sprite set.
-        angle: float, optional
-            The angle between the sprite and the
-        visible: bool, optional
-            Renders the object if set to True.
-        flip_horizontally: bool, optional
-            Flips the texture horizontally if set to True.
-        flip_vertically: bool, optional
-            Flips the texture vertically if set to True.
+        key: callable, optional
+            The function giving the comparison key of each collider.
+        reverse: bool, optional
+            Sorts the colliders in descending order if set to True.
         """
 
-        WorldObject.__init__(self, bounding_box)
-
-        self.texture_bounds = texture_bounds
+        self._modify(partial(list.sort, key=key, reverse=reverse))
 
-        self.sprite_set = sprite_set
-        self.id_animation = id_animation
-        self.id_animation_transition = -1
+    def reverse(self) -> None:
+        """
+        Reverses the order of the colliders in place.
+        """
 
-        self.animation_pointer = 0
+        self._modify(list.reverse)
 
-        self.angle = angle
-        self.visible = visible
+    def __setitem__(self, index: [int, slice], value: [type, list]) -> None:
+        """
+        Replaces the collider at an index, or the colliders of a slice.
 
-        self.flip_horizontally = flip_horizontally
-        self.flip_vertically = flip_vertically
+        Parameters
+        ----------
+        index: [int, slice]
+            The index of the collider or the slice of the colliders to replace.
+        value: [type, list]
+            The new collider, or the new colliders for a slice.
 
-    @property
-    def animation_pointer(self) -> int:
-        """
-        The animation pointer property containing the current frame index of the played animation.
+        Raises
+        ------
+        TypeError
+            If a new collider is not a subclass of PhysicsObject.
         """
 
-        return self._animation_pointer
+        self._modify(list.__setitem__, index, value)
 
-    @animation_pointer.setter
-    def animation_pointer(self, animation_pointer: int) -> None:
+    def __delitem__(self, index: [int, slice]) -> None:
         """
-        Setter function for the animation pointer.
+        Removes the collider at an index, or the colliders of a slice.
 
         Parameters
         ----------
-        animation_pointer: int
-             The new index of the frame to draw.
+        index: [int, slice]
+            The index of the collider or the slice of the colliders to remove.
         """
 
-        if self.id_animation_transition != -1 and animation_pointer == 0:
-            self.id_animation_transition = -1
-
-        self._animation_pointer = animation_pointer
+        self._modify(list.__delitem__, index)
 
-    def transition(self, id_animation_transition: int, id_animation: int = -1) -> None:
+    def __iadd__(self, colliders: [list, tuple]) -> "ColliderList":
         """
-        Plays a transition animation once.
-
-        Plays a transition animation which will go through a the full animation once before switching back to the main
-        animation.
+        Adds several colliders at the end of the list.
 
         Parameters
         ----------
-        id_animation_transition: int
-            The index of the transition animation played once.
-        id_animation: int, optional
-            The index of the animation played after the transition.
+        colliders: [list, tuple]
+            The types of object with which the owner will collide.
+
+        Raises
+        ------
+        TypeError
+            If a collider is not a subclass of PhysicsObject.
+
+        Returns
+        -------
+        colliders: ColliderList
+            The list itself.
         """
 
-        if id_animation != -1:
-            self.id_animation = id_animation
+        self._modify(list.extend, colliders)
 
-        self.animation_pointer = 0
-        self.id_animation_transition = id_animation_transition
+        return self
 
-    def cancel_transition(self, id_animation: int = -1) -> None:
+    def __imul__(self, count: int) -> "ColliderList":
         """
-        Cancels the transition animation immediately.
-
-        Cancels the transition animation before it ends. If a new animation is not specified, the transition cancels
-        into the animation stated at the start of the transition.
+        Repeats the colliders in place.
 
         Parameters
         ----------
-        id_animation: int, optional
-            The index of the new animation played.
-        """
-
-        if id_animation != -1:
-            self.id_animation = id_animation
-
-        self.id_animation_transition = -1
-        self.animation_pointer = 0
-
-    def is_transiting(self) -> bool:
-        """
-        Returns whether or not a transition animation is playing.
+        count: int
+            The number of repetitions.
 
         Returns
         -------
-        transiting: bool
-            True is a transition animation is currently played and False otherwise.
+        colliders: ColliderList
+            The list itself.
         """
 
-        return self.id_animation_transition != -1
+        self._modify(list.__imul__, count)
 
-    def __str__(self) -> str:
-        """
-        Returns a description string of the object.
+        return self
 
-        Returns
-        -------
-        string: str
-            The string object description.
-        """
 
-        if self.is_transiting():
-            return "RenderableObject[position=" + str(self.position) + ", bounds=" + str(self.bounds) + ", " + \
-                   "texture_bounds=" + str(self.texture_bounds) + ", sprite_set=" + self.sprite_set + ", " + \
-                   "id_animation=" + str(self.id_animation) + ", " + \
-                   "id_animation_transition=" + str(self.id_animation_transition) + ", " + \
-                   "animation_pointer=" + str(self.animation_pointer) + ", angle=" + str(self.angle) + ", " + \
-                   "visible=" + str(self.visible) + ", flip_horizontally=" + str(self.flip_horizontally) + ", " + \
-                   "flip_vertically=" + str(self.flip_vertically) + "]"
-        else:
-            return "RenderableObject[position=" + str(self.position) + ", bounds=" + str(self.bounds) + ", " + \
-                   "texture_bounds=" + str(self.texture_bounds) + ", sprite_set=" + self.sprite_set + ", " + \
-                   "id_animation=" + str(self.id_animation) + ", " + \
-                   "animation_pointer=" + str(self.animation_pointer) + ", angle=" + str(self.angle) + ", " + \
-                   "visible=" + str(self.visible) + ", flip_horizontally=" + str(self.flip_horizontally) + ", " + \
-                   "flip_vertically=" + str(self.flip_vertically) + "]"
+class PhysicsObject(WorldObject):
+    """
+    A generic type of world object used for collision detection.
 
+    An object that collides with tiles either and / or other objects should extends from this class. Note that theses
+    objects are not supposed to move, extend from Entity instead.
 
-class Particle(Renderable):
-    """
-    This type of world object is used to render particles.
+    The colliders are turned into collision layers: each type used as a collider is given a bit, the layer of an object
+    is made of the bits of the types it is an instance of and its mask is made of the bits of its colliders. Two objects
+    then collide if the mask of each one intersects the layer of the other one. The colliders property returns a
+    ColliderList: modifying it in place, assigning it or using the methods below keeps the mask up to date.
 
-    A particle is an animation played once. When the animation cycle is completed, the object destroys itself.
+    The masks and the layers are stored in columns of MAX_COLLISION_LAYERS bits. Once more types are used as colliders,
+    the types beyond the last bit but one share the last bit (OVERFLOW_LAYER): the pairs which only match through this
+    bit are then checked against the full bitmasks of the objects.
 
     Attributes
     ----------
@@ -696,216 +757,5932 @@ class Particle(Renderable):
         The position of the bottom-left corner of the rectangle.
     bounds: numpy.ndarray
         The width and the height of the rectangle.
-    texture_bounds: AxisAlignedBoundingBox
-        The bounding box of the displayed texture. Note that the position of the sprite is relative to the position of
-        the world object (a position of (0, 0) means that the sprite will be drawn at the same position of the object).
-    sprite_set: str
-        The name of the sprite set used.
-    id_animation: int
-        The index of the animation played within the specified sprite set.
-    id_animation_transition: int
-        The index of the animation played as a transition within the sprite set.
-    angle: float
-        The angle between the sprite and the
-    visible: bool
-        Renders the object if set to True.
-    flip_horizontally: bool
-        Flips the texture horizontally if set to True.
-    flip_vertically: bool
-        Flips the texture vertically if set to True.
+    collides_with_tiles: bool
+        Enables the collision detection with tiles.
+    colliders: list of types
+        The list of types of object with which the object collides.
+    static: bool
+        Whether the object is a static body, which never moves by itself and only collides with the moving objects.
+    collision_layer: int
+        The bitmask of the collision layers of the object.
+    collision_mask: int
+        The bitmask of the collision layers with which the object collides.
 
     Methods
     -------
-    transition(id_animation_transition, id_animation=-1)
-        Plays a transition animation once.
-    cancel_transition(id_animation=-1)
-        Cancels the transition animation immediately.
-    is_transiting()
-        Returns whether or not a transition animation is playing.
+    reset(bounding_box, collides_with_tiles, colliders, static)
+        Initializes the object again, reusing its arrays.
+    add_collider(collider)
+        Adds a new collider.
+    remove_collider(collider)
+        Removes a collider.
+    clear_colliders()
+        Removes every existing collider.
+    register_layer(collider)
+        Returns the bit of the collision layer of a type, the layer is created if needed.
+    layer_of(cls)
+        Returns the bitmask of the collision layers of the instances of a type.
+    fold_layers(bits)
+        Folds a bitmask of collision layers into MAX_COLLISION_LAYERS bits.
+    layers_overflow()
+        Tells whether more than MAX_COLLISION_LAYERS types are used as colliders.
     """
 
-    def __init__(self, bounding_box: AxisAlignedBoundingBox, texture_bounds: AxisAlignedBoundingBox, sprite_set: str,
-                 id_animation: int, angle: float = 0, visible: bool = True, flip_horizontally: bool = False,
-                 flip_vertically: bool = False):
+    MAX_COLLISION_LAYERS = 64
+    OVERFLOW_LAYER = 1 << (MAX_COLLISION_LAYERS - 1)
+
+    _layer_bits = {}
+    _type_layers = {}
+
+    def __init__(self, bounding_box: AxisAlignedBoundingBox, collides_with_tiles: bool = True,
+                 colliders: [type, list] = None, static: bool = False):
         """
-        Initializes the Particle.
+        Initializes the PhysicsObject.
 
         Parameters
         ----------
         bounding_box: AxisAlignedBoundingBox
             The bounding box of the object.
-        texture_bounds: AxisAlignedBoundingBox
-            The bounding box of the displayed texture. Note that the position of the sprite is relative to the position
-            of the world object.
-        sprite_set: str
-            The name of the sprite set used.
-        id_animation: int
-            The index of the animation played within the specified sprite set.
-        angle: float, optional
-            The angle between the sprite and the
-        visible: bool, optional
-            Renders the object if set to True.
-        flip_horizontally: bool, optional
-            Flips the texture horizontally if set to True.
-        flip_vertically: bool, optional
-            Flips the texture vertically if set to True.
+        collides_with_tiles: bool, optional
+            Enables the collision detection with tiles.
+        colliders: [type, list, tuple], optional
+            The type or the types of object with which the object collides.
+        static: bool, optional
+            Makes the object a static body if set to True. This cannot be changed afterwards.
         """
 
-        self._spawned = False
+        WorldObject.__init__(self, bounding_box)
 
-        Renderable.__init__(
-            self, bounding_box, texture_bounds, sprite_set, id_animation, angle=angle, visible=visible,
-            flip_horizontally=flip_horizontally, flip_vertically=flip_vertically
-        )
+        self._static = static
 
-    @property
-    def animation_pointer(self) -> int:
-        """
-        The animation pointer property containing the current frame index of the played animation.
-        """
+        self.collides_with_tiles = collides_with_tiles
 
-        return self._animation_pointer
+        self.colliders = colliders if colliders is not None else []
 
-    @animation_pointer.setter
-    def animation_pointer(self, animation_pointer: int) -> None:
+    def reset(self, bounding_box: AxisAlignedBoundingBox, collides_with_tiles: bool = True,
+              colliders: [type, list] = None, static: bool = False) -> None:
         """
-        Setter function for the animation pointer.
+        Initializes the object again, reusing its arrays.
 
         Parameters
         ----------
-        animation_pointer: int
-             The new index of the frame to draw.
+        bounding_box: AxisAlignedBoundingBox
+            The bounding box of the object.
+        collides_with_tiles: bool, optional
+            Enables the collision detection with tiles.
+        colliders: [type, list, tuple], optional
+            The type or the types of object with which the object collides.
+        static: bool, optional
+            Makes the object a static body if set to True.
         """
 
-        if self.id_animation_transition != -1 and animation_pointer == 0:
-            self.id_animation_transition = -1
+        WorldObject.reset(self, bounding_box)
 
-        if self._spawned and animation_pointer == 0:
-            self.visible = False
-            self.should_be_destroyed = True
+        self._static = static
 
-        self._animation_pointer = animation_pointer
-        self._spawned = True
+        self.collides_with_tiles = collides_with_tiles
 
+        self.colliders = colliders if colliders is not None else []
 
-class Entity(PhysicsObject, Renderable):
-    """
-    This type of world object for renderable objects with collision detection.
+    @property
+    def static(self) -> bool:
+        """
+        The static property telling whether the object is a static body.
+        """
 
-    This is the main world object type used. An entity can be rendered, it can moves and it can collides with tiles and
-    other entities.
+        return self._static
 
-    Attributes
-    ----------
-    bounding_box: AxisAlignedBoundingBox
-        The bounding box of the object.
-    position: numpy.ndarray
-        The position of the bottom-left corner of the rectangle.
-    bounds: numpy.ndarray
-        The width and the height of the rectangle.
-    speed: numpy.ndarray
-        The speed vector of the entity expressed in unit per tick.
-    texture_bounds: AxisAlignedBoundingBox
-        The bounding box of the displayed texture. Note that the position of the sprite is relative to the position of
-        the world object (a position of (0, 0) means that the sprite will be drawn at the same position of the object).
-    sprite_set: str
-        The name of the sprite set used.
-    id_animation: int
-        The index of the animation played within the specified sprite set.
-    id_animation_transition: int
-        The index of the animation played as a transition within the sprite set.
-    angle: float
-        The angle between the sprite and the
-    visible: bool
-        Renders the object if set to True.
-    flip_horizontally: bool
-        Flips the texture horizontally if set to True.
-    flip_vertically: bool
-        Flips the texture vertically if set to True.
-    collides_with_tiles: bool
-        Enables the collision detection with tiles.
-    colliders: list of types
-        The list of types of object with which the object collides.
+    @property
+    def collision_layer(self) -> int:
+        """
+        The collision layer property containing the bitmask of the collision layers of the object.
+        """
 
-    Methods
-    -------
-    transition(id_animation_transition, id_animation=-1)
-        Plays a transition animation once.
-    cancel_transition(id_animation=-1)
-        Cancels the transition animation immediately.
-    is_transiting()
-        Returns whether or not a transition animation is playing.
-    add_collider(collider)
-        Adds a new collider.
-    remove_collider(collider)
-        Removes a collider.
-    clear_colliders()
-        Removes every existing collider.
-    """
+        return PhysicsObject.layer_of(type(self))
 
-    def __init__(self, bounding_box: AxisAlignedBoundingBox, speed: [tuple, numpy.ndarray],
-                 texture_bounds: AxisAlignedBoundingBox, sprite_set: str, id_animation: int, angle: float = 0,
-                 visible: bool = True, flip_horizontally: bool = False, flip_vertically: bool = False,
-                 collides_with_tiles: bool = True, colliders: [type, list] = None):
+    @property
+    def collision_mask(self) -> int:
         """
-        Initializes the Entity.
+        The collision mask property containing the bitmask of the collision layers with which the object collides.
+        """
+
+        return self._collision_mask
+
+    @property
+    def colliders(self) -> list:
+        """
+        The colliders property containing the list of types of object with which the object collides.
+
+        A new ColliderList is built at each read, hence two reads never return the same list (object.colliders is not
+        object.colliders). Its changes are assigned back to the object: keep a reference to the returned list to
+        modify it several times.
+        """
+
+        return ColliderList(self, self._colliders)
+
+    @colliders.setter
+    def colliders(self, colliders: [type, list, tuple]) -> None:
+        """
+        Setter function for the colliders.
 
         Parameters
         ----------
-        bounding_box: AxisAlignedBoundingBox
-            The bounding box of the object.
-        speed: [tuple, numpy.ndarray]
-            The speed vector of the entity expressed in unit per tick.
-        texture_bounds: AxisAlignedBoundingBox
-            The bounding box of the displayed texture. Note that the position of the sprite is relative to the position
-            of the world object.
-        sprite_set: str
-            The name of the sprite set used.
-        id_animation: int
-            The index of the animation played within the specified sprite set.
-        angle: float, optional
-            The angle between the sprite and the
-        visible: bool, optional
-            Renders the object if set to True.
-        flip_horizontally: bool, optional
-            Flips the texture horizontally if set to True.
-        flip_vertically: bool, optional
-            Flips the texture vertically if set to True.
-        collides_with_tiles: bool, optional
-            Enables the collision detection with tiles.
-        colliders: [type, list], optional
-            The list of types of object with which the object collides.
+        colliders: [type, list, tuple]
+             The type or the types of object with which the object collides.
+
+        Raises
+        ------
+        TypeError
+            If the colliders list contains classes that are not extending from PhysicsObject
+        """
+
+        if type(colliders) == type and issubclass(colliders, PhysicsObject):
+            colliders = (colliders,)
+
+        elif isinstance(colliders, (list, tuple)):
+            for collider in colliders:
+                if type(collider) != type or not issubclass(collider, PhysicsObject):
+                    raise TypeError("The collider {0} is not a subclass of PhysicsObjects.".format(str(collider)))
+
+        else:
+            raise TypeError("The colliders must be a list or a tuple of subclass of PhysicsObjects.")
+
+        collision_mask = 0
+
+        for collider in colliders:
+            collision_mask |= PhysicsObject.register_layer(collider)
+
+        self._colliders = tuple(colliders)
+        self._collision_mask = collision_mask
+
+    def add_collider(self, collider: type) -> None:
+        """
+        Adds a new collider.
+
+        Adds a new type of object with which the object will collide. Note that the type must be a subclass of
+        PhysicsObject.
+
+        Parameters
+        ----------
+        collider: type
+            The type of object with which the object will collide.
+
+        Raises
+        ------
+        TypeError
+            If the colliders list contains classes that are not extending from PhysicsObject
+        """
+
+        if type(collider) != type or not issubclass(collider, PhysicsObject):
+            raise TypeError("The collider {0} is not a subclass of PhysicsObjects.".format(str(collider)))
+
+        if collider not in self._colliders:
+            self.colliders = self._colliders + (collider,)
+
+    def remove_collider(self, collider: type) -> None:
+        """
+        Removes a collider.
+
+        Removes a type of object with which the world object used to collide.
+
+        Parameters
+        ----------
+        collider: type
+            The type of object with which the object will not collide anymore.
+        """
+
+        if collider in self._colliders:
+            self.colliders = tuple(other for other in self._colliders if other != collider)
+
+    def clear_colliders(self) -> None:
+        """
+        Removes every existing collider.
+        """
+
+        self.colliders = ()
+
+    @staticmethod
+    def register_layer(collider: type) -> int:
+        """
+        Returns the bit of the collision layer of a type, the layer is created if needed.
+
+        Parameters
+        ----------
+        collider: type
+            The type used as collider.
+
+        Returns
+        -------
+        bit: int
+            The bit of the collision layer of the type.
+        """
+
+        bit = PhysicsObject._layer_bits.get(collider)
+
+        if bit is None:
+            bit = PhysicsObject._layer_bits[collider] = 1 << len(PhysicsObject._layer_bits)
+
+        return bit
+
+    @staticmethod
+    def layer_of(cls: type) -> int:
+        """
+        Returns the bitmask of the collision layers of the instances of a type.
+
+        The layers of a type are made of the bits of the registered types it derives from. They are cached, and only
+        computed again once new layers are registered.
+
+        Parameters
+        ----------
+        cls: type
+            The type of the objects.
+
+        Returns
+        -------
+        layer: int
+            The bitmask of the collision layers of the type.
+        """
+
+        version, layer = PhysicsObject._type_layers.get(cls, (-1, 0))
+
+        if version != len(PhysicsObject._layer_bits):
+            layer = 0
+
+            for base in cls.__mro__:
+                layer |= PhysicsObject._layer_bits.get(base, 0)
+
+            PhysicsObject._type_layers[cls] = (len(PhysicsObject._layer_bits), layer)
+
+        return layer
+
+    @staticmethod
+    def fold_layers(bits: int) -> int:
+        """
+        Folds a bitmask of collision layers into MAX_COLLISION_LAYERS bits.
+
+        The layers beyond the last bit but one are merged into OVERFLOW_LAYER, so that the bitmask fits in the columns.
+
+        Parameters
+        ----------
+        bits: int
+            The bitmask of collision layers.
+
+        Returns
+        -------
+        folded: int
+            The bitmask folded into MAX_COLLISION_LAYERS bits.
+        """
+
+        if bits >= PhysicsObject.OVERFLOW_LAYER:
+            return (bits & (PhysicsObject.OVERFLOW_LAYER - 1)) | PhysicsObject.OVERFLOW_LAYER
+
+        return bits
+
+    @staticmethod
+    def layers_overflow() -> bool:
+        """
+        Tells whether more than MAX_COLLISION_LAYERS types are used as colliders.
+
+        Returns
+        -------
+        overflow: bool
+            True if several types share OVERFLOW_LAYER.
+        """
+
+        return len(PhysicsObject._layer_bits) > PhysicsObject.MAX_COLLISION_LAYERS
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "PhysicsObject[position=" + str(self.position) + ", bounds=" + self.bounds + ", " + \
+               "collides_with_tiles=" + str(self.collides_with_tiles) + ", colliders=" + str(self.colliders) + ", " + \
+               "static=" + str(self.static) + "]"
+
+
+class Renderable(WorldObject):
+    """
+    A generic type of world object used for rendering.
+
+    An object that is supposed to be rendered by drawing a texture should extends from this class. For object that need
+    to have a physics (collision detection and movement), see Entity.
+
+    Attributes
+    ----------
+    bounding_box: AxisAlignedBoundingBox
+        The bounding box of the object.
+    position: numpy.ndarray
+        The position of the bottom-left corner of the rectangle.
+    bounds: numpy.ndarray
+        The width and the height of the rectangle.
+    texture_bounds: AxisAlignedBoundingBox
+        The bounding box of the displayed texture. Note that the position of the sprite is relative to the position of
+        the world object (a position of (0, 0) means that the sprite will be drawn at the same position of the object).
+    sprite_set: str
+        The name of the sprite set used.
+    id_animation: int
+        The index of the animation played within the sprite set.
+    id_animation_transition: int
+        The index of the animation played as a transition within the sprite set.
+    angle: float
+        The angle between the sprite and the
+    visible: bool
+        Renders the object if set to True.
+    flip_horizontally: bool
+        Flips the texture horizontally if set to True.
+    flip_vertically: bool
+        Flips the texture vertically if set to True.
+
+    Methods
+    -------
+    reset(bounding_box, texture_bounds, sprite_set, id_animation, angle, visible, flip_horizontally, flip_vertically)
+        Initializes the object again, reusing its arrays.
+    transition(id_animation_transition, id_animation=-1)
+        Plays a transition animation once.
+    cancel_transition(id_animation=-1)
+        Cancels the transition animation immediately.
+    is_transiting()
+        Returns whether or not a transition animation is playing.
+    """
+
+    def __init__(self, bounding_box: AxisAlignedBoundingBox, texture_bounds: AxisAlignedBoundingBox, sprite_set: str,
+                 id_animation: int, angle: float = 0, visible: bool = True, flip_horizontally: bool = False,
+                 flip_vertically: bool = False):
+        """
+        Initializes the Renderable.
+
+        Parameters
+        ----------
+        bounding_box: AxisAlignedBoundingBox
+            The bounding box of the object.
+        texture_bounds: AxisAlignedBoundingBox
+            The bounding box of the displayed texture. Note that the position of the sprite is relative to the position
+            of the world object.
+        sprite_set: str
+            The name of the sprite set used.
+        id_animation: int
+            The index of the animation played within the specified sprite set.
+        angle: float, optional
+            The angle between the sprite and the
+        visible: bool, optional
+            Renders the object if set to True.
+        flip_horizontally: bool, optional
+            Flips the texture horizontally if set to True.
+        flip_vertically: bool, optional
+            Flips the texture vertically if set to True.
+        """
+
+        WorldObject.__init__(self, bounding_box)
+
+        self.texture_bounds = texture_bounds
+
+        self.sprite_set = sprite_set
+        self.id_animation = id_animation
+        self.id_animation_transition = -1
+
+        self.animation_pointer = 0
+
+        self.angle = angle
+        self.visible = visible
+
+        self.flip_horizontally = flip_horizontally
+        self.flip_vertically = flip_vertically
+
+    def reset(self, bounding_box: AxisAlignedBoundingBox, texture_bounds: AxisAlignedBoundingBox, sprite_set: str,
+              id_animation: int, angle: float = 0, visible: bool = True, flip_horizontally: bool = False,
+              flip_vertically: bool = False) -> None:
+        """
+        Initializes the object again, reusing its arrays.
+
+        Parameters
+        ----------
+        bounding_box: AxisAlignedBoundingBox
+            The bounding box of the object.
+        texture_bounds: AxisAlignedBoundingBox
+            The bounding box of the displayed texture. Note that the position of the sprite is relative to the position
+            of the world object.
+        sprite_set: str
+            The name of the sprite set used.
+        id_animation: int
+            The index of the animation played within the specified sprite set.
+        angle: float, optional
+            The angle between the sprite and the
+        visible: bool, optional
+            Renders the object if set to True.
+        flip_horizontally: bool, optional
+            Flips the texture horizontally if set to True.
+        flip_vertically: bool, optional
+            Flips the texture vertically if set to True.
+        """
+
+        WorldObject.reset(self, bounding_box)
+
+        self.texture_bounds._assign(texture_bounds)
+
+        self.sprite_set = sprite_set
+        self.id_animation = id_animation
+        self.id_animation_transition = -1
+
+        self.animation_pointer = 0
+
+        self.angle = angle
+        self.visible = visible
+
+        self.flip_horizontally = flip_horizontally
+        self.flip_vertically = flip_vertically
+
+    @property
+    def animation_pointer(self) -> int:
+        """
+        The animation pointer property containing the current frame index of the played animation.
+        """
+
+        return self._animation_pointer
+
+    @animation_pointer.setter
+    def animation_pointer(self, animation_pointer: int) -> None:
+        """
+        Setter function for the animation pointer.
+
+        Parameters
+        ----------
+        animation_pointer: int
+             The new index of the frame to draw.
+        """
+
+        if self.id_animation_transition != -1 and animation_pointer == 0:
+            self.id_animation_transition = -1
+
+        self._animation_pointer = animation_pointer
+
+    def transition(self, id_animation_transition: int, id_animation: int = -1) -> None:
+        """
+        Plays a transition animation once.
+
+        Plays a transition animation which will go through a the full animation once before switching back to the main
+        animation.
+
+        Parameters
+        ----------
+        id_animation_transition: int
+            The index of the transition animation played once.
+        id_animation: int, optional
+            The index of the animation played after the transition.
+        """
+
+        if id_animation != -1:
+            self.id_animation = id_animation
+
+        self.animation_pointer = 0
+        self.id_animation_transition = id_animation_transition
+
+    def cancel_transition(self, id_animation: int = -1) -> None:
+        """
+        Cancels the transition animation immediately.
+
+        Cancels the transition animation before it ends. If a new animation is not specified, the transition cancels
+        into the animation stated at the start of the transition.
+
+        Parameters
+        ----------
+        id_animation: int, optional
+            The index of the new animation played.
+        """
+
+        if id_animation != -1:
+            self.id_animation = id_animation
+
+        self.id_animation_transition = -1
+        self.animation_pointer = 0
+
+    def is_transiting(self) -> bool:
+        """
+        Returns whether or not a transition animation is playing.
+
+        Returns
+        -------
+        transiting: bool
+            True is a transition animation is currently played and False otherwise.
+        """
+
+        return self.id_animation_transition != -1
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        if self.is_transiting():
+            return "RenderableObject[position=" + str(self.position) + ", bounds=" + str(self.bounds) + ", " + \
+                   "texture_bounds=" + str(self.texture_bounds) + ", sprite_set=" + self.sprite_set + ", " + \
+                   "id_animation=" + str(self.id_animation) + ", " + \
+                   "id_animation_transition=" + str(self.id_animation_transition) + ", " + \
+                   "animation_pointer=" + str(self.animation_pointer) + ", angle=" + str(self.angle) + ", " + \
+                   "visible=" + str(self.visible) + ", flip_horizontally=" + str(self.flip_horizontally) + ", " + \
+                   "flip_vertically=" + str(self.flip_vertically) + "]"
+        else:
+            return "RenderableObject[position=" + str(self.position) + ", bounds=" + str(self.bounds) + ", " + \
+                   "texture_bounds=" + str(self.texture_bounds) + ", sprite_set=" + self.sprite_set + ", " + \
+                   "id_animation=" + str(self.id_animation) + ", " + \
+                   "animation_pointer=" + str(self.animation_pointer) + ", angle=" + str(self.angle) + ", " + \
+                   "visible=" + str(self.visible) + ", flip_horizontally=" + str(self.flip_horizontally) + ", " + \
+                   "flip_vertically=" + str(self.flip_vertically) + "]"
+
+
+class Particle(Renderable):
+    """
+    This type of world object is used to render particles.
+
+    A particle is an animation played once. When the animation cycle is completed, the object destroys itself.
+
+    Attributes
+    ----------
+    bounding_box: AxisAlignedBoundingBox
+        The bounding box of the object.
+    position: numpy.ndarray
+        The position of the bottom-left corner of the rectangle.
+    bounds: numpy.ndarray
+        The width and the height of the rectangle.
+    texture_bounds: AxisAlignedBoundingBox
+        The bounding box of the displayed texture. Note that the position of the sprite is relative to the position of
+        the world object (a position of (0, 0) means that the sprite will be drawn at the same position of the object).
+    sprite_set: str
+        The name of the sprite set used.
+    id_animation: int
+        The index of the animation played within the specified sprite set.
+    id_animation_transition: int
+        The index of the animation played as a transition within the sprite set.
+    angle: float
+        The angle between the sprite and the
+    visible: bool
+        Renders the object if set to True.
+    flip_horizontally: bool
+        Flips the texture horizontally if set to True.
+    flip_vertically: bool
+        Flips the texture vertically if set to True.
+
+    Methods
+    -------
+    reset(bounding_box, texture_bounds, sprite_set, id_animation, angle, visible, flip_horizontally, flip_vertically)
+        Initializes the object again, reusing its arrays.
+    transition(id_animation_transition, id_animation=-1)
+        Plays a transition animation once.
+    cancel_transition(id_animation=-1)
+        Cancels the transition animation immediately.
+    is_transiting()
+        Returns whether or not a transition animation is playing.
+    """
+
+    def __init__(self, bounding_box: AxisAlignedBoundingBox, texture_bounds: AxisAlignedBoundingBox, sprite_set: str,
+                 id_animation: int, angle: float = 0, visible: bool = True, flip_horizontally: bool = False,
+                 flip_vertically: bool = False):
+        """
+        Initializes the Particle.
+
+        Parameters
+        ----------
+        bounding_box: AxisAlignedBoundingBox
+            The bounding box of the object.
+        texture_bounds: AxisAlignedBoundingBox
+            The bounding box of the displayed texture. Note that the position of the sprite is relative to the position
+            of the world object.
+        sprite_set: str
+            The name of the sprite set used.
+        id_animation: int
+            The index of the animation played within the specified sprite set.
+        angle: float, optional
+            The angle between the sprite and the
+        visible: bool, optional
+            Renders the object if set to True.
+        flip_horizontally: bool, optional
+            Flips the texture horizontally if set to True.
+        flip_vertically: bool, optional
+            Flips the texture vertically if set to True.
+        """
+
+        self._spawned = False
+
+        Renderable.__init__(
+            self, bounding_box, texture_bounds, sprite_set, id_animation, angle=angle, visible=visible,
+            flip_horizontally=flip_horizontally, flip_vertically=flip_vertically
+        )
+
+    def reset(self, bounding_box: AxisAlignedBoundingBox, texture_bounds: AxisAlignedBoundingBox, sprite_set: str,
+              id_animation: int, angle: float = 0, visible: bool = True, flip_horizontally: bool = False,
+              flip_vertically: bool = False) -> None:
+        """
+        Initializes the particle again, reusing its arrays.
+
+        Parameters
+        ----------
+        bounding_box: AxisAlignedBoundingBox
+            The bounding box of the object.
+        texture_bounds: AxisAlignedBoundingBox
+            The bounding box of the displayed texture. Note that the position of the sprite is relative to the position
+            of the world object.
+        sprite_set: str
+            The name of the sprite set used.
+        id_animation: int
+            The index of the animation played within the specified sprite set.
+        angle: float, optional
+            The angle between the sprite and the
+        visible: bool, optional
+            Renders the object if set to True.
+        flip_horizontally: bool, optional
+            Flips the texture horizontally if set to True.
+        flip_vertically: bool, optional
+            Flips the texture vertically if set to True.
+        """
+
+        self._spawned = False
+
+        Renderable.reset(
+            self, bounding_box, texture_bounds, sprite_set, id_animation, angle=angle, visible=visible,
+            flip_horizontally=flip_horizontally, flip_vertically=flip_vertically
+        )
+
+    @property
+    def animation_pointer(self) -> int:
+        """
+        The animation pointer property containing the current frame index of the played animation.
+        """
+
+        return self._animation_pointer
+
+    @animation_pointer.setter
+    def animation_pointer(self, animation_pointer: int) -> None:
+        """
+        Setter function for the animation pointer.
+
+        Parameters
+        ----------
+        animation_pointer: int
+             The new index of the frame to draw.
+        """
+
+        if self.id_animation_transition != -1 and animation_pointer == 0:
+            self.id_animation_transition = -1
+
+        if self._spawned and animation_pointer == 0:
+            self.visible = False
+            self.should_be_destroyed = True
+
+        self._animation_pointer = animation_pointer
+        self._spawned = True
+
+
+class Entity(PhysicsObject, Renderable):
+    """
+    This type of world object for renderable objects with collision detection.
+
+    This is the main world object type used. An entity can be rendered, it can moves and it can collides with tiles and
+    other entities.
+
+    Attributes
+    ----------
+    bounding_box: AxisAlignedBoundingBox
+        The bounding box of the object.
+    position: numpy.ndarray
+        The position of the bottom-left corner of the rectangle.
+    bounds: numpy.ndarray
+        The width and the height of the rectangle.
+    speed: numpy.ndarray
+        The speed vector of the entity expressed in unit per tick.
+    texture_bounds: AxisAlignedBoundingBox
+        The bounding box of the displayed texture. Note that the position of the sprite is relative to the position of
+        the world object (a position of (0, 0) means that the sprite will be drawn at the same position of the object).
+    sprite_set: str
+        The name of the sprite set used.
+    id_animation: int
+        The index of the animation played within the specified sprite set.
+    id_animation_transition: int
+        The index of the animation played as a transition within the sprite set.
+    angle: float
+        The angle between the sprite and the
+    visible: bool
+        Renders the object if set to True.
+    flip_horizontally: bool
+        Flips the texture horizontally if set to True.
+    flip_vertically: bool
+        Flips the texture vertically if set to True.
+    collides_with_tiles: bool
+        Enables the collision detection with tiles.
+    colliders: list of types
+        The list of types of object with which the object collides.
+    static: bool
+        Whether the entity is a static body, see World for the static bodies.
+    collision_layer: int
+        The bitmask of the collision layers of the entity.
+    collision_mask: int
+        The bitmask of the collision layers with which the entity collides.
+    asleep: bool
+        Whether the entity is sleeping, see World for the sleep detection.
+
+    Methods
+    -------
+    reset(bounding_box, speed, texture_bounds, sprite_set, id_animation, angle, visible, flip_horizontally,
+          flip_vertically, collides_with_tiles, colliders, static)
+        Initializes the entity again, reusing its arrays.
+    transition(id_animation_transition, id_animation=-1)
+        Plays a transition animation once.
+    cancel_transition(id_animation=-1)
+        Cancels the transition animation immediately.
+    is_transiting()
+        Returns whether or not a transition animation is playing.
+    add_collider(collider)
+        Adds a new collider.
+    remove_collider(collider)
+        Removes a collider.
+    clear_colliders()
+        Removes every existing collider.
+    wake()
+        Wakes the entity up.
+    """
+
+    _store = None
+    _row = -1
+
+    def __init__(self, bounding_box: AxisAlignedBoundingBox, speed: [tuple, numpy.ndarray],
+                 texture_bounds: AxisAlignedBoundingBox, sprite_set: str, id_animation: int, angle: float = 0,
+                 visible: bool = True, flip_horizontally: bool = False, flip_vertically: bool = False,
+                 collides_with_tiles: bool = True, colliders: [type, list] = None, static: bool = False):
+        """
+        Initializes the Entity.
+
+        Parameters
+        ----------
+        bounding_box: AxisAlignedBoundingBox
+            The bounding box of the object.
+        speed: [tuple, numpy.ndarray]
+            The speed vector of the entity expressed in unit per tick.
+        texture_bounds: AxisAlignedBoundingBox
+            The bounding box of the displayed texture. Note that the position of the sprite is relative to the position
+            of the world object.
+        sprite_set: str
+            The name of the sprite set used.
+        id_animation: int
+            The index of the animation played within the specified sprite set.
+        angle: float, optional
+            The angle between the sprite and the
+        visible: bool, optional
+            Renders the object if set to True.
+        flip_horizontally: bool, optional
+            Flips the texture horizontally if set to True.
+        flip_vertically: bool, optional
+            Flips the texture vertically if set to True.
+        collides_with_tiles: bool, optional
+            Enables the collision detection with tiles.
+        colliders: [type, list, tuple], optional
+            The type or the types of object with which the object collides.
+        static: bool, optional
+            Makes the entity a static body if set to True, its speed then has to stay zero. This cannot be changed
+            afterwards.
+        """
+
+        PhysicsObject.__init__(
+            self, bounding_box, collides_with_tiles=collides_with_tiles, colliders=colliders, static=static
+        )
+
+        Renderable.__init__(
+            self, bounding_box, texture_bounds, sprite_set, id_animation, angle=angle, visible=visible,
+            flip_horizontally=flip_horizontally, flip_vertically=flip_vertically
+        )
+
+        self.speed = speed
+
+    def reset(self, bounding_box: AxisAlignedBoundingBox, speed: [tuple, numpy.ndarray],
+              texture_bounds: AxisAlignedBoundingBox, sprite_set: str, id_animation: int, angle: float = 0,
+              visible: bool = True, flip_horizontally: bool = False, flip_vertically: bool = False,
+              collides_with_tiles: bool = True, colliders: [type, list] = None, static: bool = False) -> None:
+        """
+        Initializes the entity again, reusing its arrays.
+
+        If the entity is held by an EntityStore, the values are written into its row through the views of the entity.
+
+        Parameters
+        ----------
+        bounding_box: AxisAlignedBoundingBox
+            The bounding box of the object.
+        speed: [tuple, numpy.ndarray]
+            The speed vector of the entity expressed in unit per tick.
+        texture_bounds: AxisAlignedBoundingBox
+            The bounding box of the displayed texture. Note that the position of the sprite is relative to the position
+            of the world object.
+        sprite_set: str
+            The name of the sprite set used.
+        id_animation: int
+            The index of the animation played within the specified sprite set.
+        angle: float, optional
+            The angle between the sprite and the
+        visible: bool, optional
+            Renders the object if set to True.
+        flip_horizontally: bool, optional
+            Flips the texture horizontally if set to True.
+        flip_vertically: bool, optional
+            Flips the texture vertically if set to True.
+        collides_with_tiles: bool, optional
+            Enables the collision detection with tiles.
+        colliders: [type, list, tuple], optional
+            The type or the types of object with which the object collides.
+        static: bool, optional
+            Makes the entity a static body if set to True, its speed then has to stay zero.
+
+        Raises
+        ------
+        ValueError
+            If a non-zero speed is given to a static entity, or if the entity is held by an EntityStore and the
+            bounding box does not use an integer format.
+        """
+
+        if static and numpy.any(speed):
+            raise ValueError("A static entity cannot move.")
+
+        if self._store is not None:
+            EntityStore._check_bounding_box(bounding_box)
+
+        PhysicsObject.reset(
+            self, bounding_box, collides_with_tiles=collides_with_tiles, colliders=colliders, static=static
+        )
+
+        Renderable.reset(
+            self, bounding_box, texture_bounds, sprite_set, id_animation, angle=angle, visible=visible,
+            flip_horizontally=flip_horizontally, flip_vertically=flip_vertically
+        )
+
+        self._speed[...] = speed
+
+    @property
+    def bounding_box(self) -> AxisAlignedBoundingBox:
+        """
+        The bounding box property of the entity.
+        """
+
+        return self._bounding_box
+
+    @bounding_box.setter
+    def bounding_box(self, bounding_box: AxisAlignedBoundingBox) -> None:
+        """
+        Setter function for the bounding box.
+
+        If the entity is held by an EntityStore, the new bounding box is copied into the store and becomes a view over
+        the row of the entity.
+
+        Parameters
+        ----------
+        bounding_box: AxisAlignedBoundingBox
+            The bounding box of the object.
+
+        Raises
+        ------
+        ValueError
+            If the entity is held by an EntityStore and the bounding box does not use an integer format.
+        """
+
+        if self._store is not None:
+            EntityStore._check_bounding_box(bounding_box)
+
+        self._bounding_box = bounding_box
+
+        if self._store is not None:
+            self._store.bind(self)
+
+    @property
+    def speed(self) -> numpy.ndarray:
+        """
+        The speed property representing the speed vector of the entity expressed in unit per tick.
+        """
+
+        return self._speed
+
+    @speed.setter
+    def speed(self, speed: [tuple, numpy.ndarray]) -> None:
+        """
+        Setter function for the speed vector.
+
+        Parameters
+        ----------
+        speed: [tuple, numpy.ndarray]
+             The speed vector of the entity expressed in unit per tick.
+
+        Raises
+        ------
+        ValueError
+            If a non-zero speed is given to a static entity.
+        """
+
+        if self._static and numpy.any(speed):
+            raise ValueError("A static entity cannot move.")
+
+        if self._store is not None:
+            self._speed[...] = speed
+        else:
+            self._speed = array_format(speed)
+
+    @property
+    def collides_with_tiles(self) -> bool:
+        """
+        The collides with tiles property enabling the collision detection with tiles.
+        """
+
+        return self._collides_with_tiles
+
+    @collides_with_tiles.setter
+    def collides_with_tiles(self, collides_with_tiles: bool) -> None:
+        """
+        Setter function for the tile collision flag.
+
+        Parameters
+        ----------
+        collides_with_tiles: bool
+            Enables the collision detection with tiles.
+        """
+
+        self._collides_with_tiles = collides_with_tiles
+
+        if self._store is not None:
+            self._store.collides_with_tiles[self._row] = collides_with_tiles
+
+    @property
+    def colliders(self) -> list:
+        """
+        The colliders property containing the list of types of object with which the entity collides.
+
+        A new ColliderList is built at each read, hence two reads never return the same list (entity.colliders is not
+        entity.colliders). Its changes are assigned back to the entity: keep a reference to the returned list to
+        modify it several times.
+        """
+
+        return ColliderList(self, self._colliders)
+
+    @colliders.setter
+    def colliders(self, colliders: [type, list, tuple]) -> None:
+        """
+        Setter function for the colliders.
+
+        Parameters
+        ----------
+        colliders: [type, list, tuple]
+             The type or the types of object with which the entity collides.
+
+        Raises
+        ------
+        TypeError
+            If the colliders list contains classes that are not extending from PhysicsObject
+        """
+
+        PhysicsObject.colliders.fset(self, colliders)
+
+        if self._store is not None:
+            self._store.collision_masks[self._row] = PhysicsObject.fold_layers(self._collision_mask)
+
+    @property
+    def asleep(self) -> bool:
+        """
+        The asleep property telling whether the entity is sleeping.
+
+        Only the entities held by an EntityStore can fall asleep.
+        """
+
+        return self._store is not None and bool(self._store.sleeping[self._row])
+
+    def wake(self) -> None:
+        """
+        Wakes the entity up.
+
+        The entity will only fall asleep again after staying idle for the sleep delay of the world.
+        """
+
+        if self._store is not None:
+            self._store.sleeping[self._row] = False
+            self._store.idle_ticks[self._row] = 0
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state of the entity used for copies and pickling.
+
+        The copy is detached from the EntityStore holding the entity, if any.
+
+        Returns
+        -------
+        state: dict
+            The attributes of the entity.
+        """
+
+        state = self.__dict__.copy()
+
+        state.pop("_store", None)
+        state.pop("_row", None)
+
+        return state
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        if self.is_transiting():
+            return "Entity[position=" + str(self.position) + ", bounds=" + str(self.bounds) + ", " + \
+                   "texture_bounds=" + str(self.texture_bounds) + ", sprite_set=" + self.sprite_set + ", " + \
+                   "id_animation=" + str(self.id_animation) + ", " + \
+                   "id_animation_transition=" + str(self.id_animation_transition) + ", " + \
+                   "animation_pointer=" + str(self.animation_pointer) + ", angle=" + str(self.angle) + ", " + \
+                   "visible=" + str(self.visible) + ", flip_horizontally=" + str(self.flip_horizontally) + ", " + \
+                   "flip_vertically=" + str(self.flip_vertically) + ", " + \
+                   "collides_with_tiles=" + str(self.collides_with_tiles) + ", colliders=" + str(self.colliders) + \
+                   ", static=" + str(self.static) + "]"
+        else:
+            return "Entity[position=" + str(self.position) + ", bounds=" + str(self.bounds) + ", " + \
+                   "texture_bounds=" + str(self.texture_bounds) + ", sprite_set=" + self.sprite_set + ", " + \
+                   "id_animation=" + str(self.id_animation) + ", " + \
+                   "animation_pointer=" + str(self.animation_pointer) + ", angle=" + str(self.angle) + ", " + \
+                   "visible=" + str(self.visible) + ", flip_horizontally=" + str(self.flip_horizontally) + ", " + \
+                   "flip_vertically=" + str(self.flip_vertically) + ", " + \
+                   "collides_with_tiles=" + str(self.collides_with_tiles) + ", colliders=" + str(self.colliders) + \
+                   ", static=" + str(self.static) + "]"
+
+
+class EntityStore:
+    """
+    Columnar storage of the physics data of the entities.
+
+    The store keeps the positions, bounds, speeds, local times and tile collision flags of the entities in contiguous
+    arrays, one row per entity. Once inserted, the bounding box and the speed of an entity become views over its row, so
+    the world updater can work directly on the columns instead of allocating small arrays for each entity. Note that
+    the bounding boxes of the stored entities use the int32 format: an entity whose bounding box uses a non-integer
+    format is rejected instead of being truncated, such entities have to be kept out of any store (see the entity_store
+    parameter of World). The rows of removed entities are recycled by the later insertions.
+
+    Attributes
+    ----------
+    positions: numpy.ndarray
+        The positions of the bottom-left corner of the entities.
+    bounds: numpy.ndarray
+        The widths and the heights of the entities.
+    speeds: numpy.ndarray
+        The speed vectors of the entities expressed in unit per tick.
+    local_times: numpy.ndarray
+        The local times of the entities within the current tick.
+    collides_with_tiles: numpy.ndarray
+        The tile collision flags of the entities.
+    static: numpy.ndarray
+        The static body flags of the entities.
+    collision_masks: numpy.ndarray
+        The bitmasks of the collision layers with which the entities collide.
+    sleeping: numpy.ndarray
+        The sleep flags of the entities, a sleeping entity with a zero speed is skipped by the collision detection.
+    idle_ticks: numpy.ndarray
+        The number of consecutive ticks during which the entities did not move.
+    entities: list of Entity
+        The entity held by each row, None if the row is free.
+    version: int
+        A counter incremented each time an entity is inserted or removed.
+
+    Methods
+    -------
+    insert(entity, bind=True)
+        Inserts an entity in the store.
+    remove(entity)
+        Removes an entity from the store.
+    bind(entity)
+        Copies the data of the entity into its row and makes it a view over the row.
+    reset(entity)
+        Copies the data of the entity into its row and clears its local time and its sleep state.
+    rows()
+        Returns the indexes of the occupied rows.
+    gather(entities, local_times=None)
+        Creates a store holding a copy of the data of the entities.
+    """
+
+    DEFAULT_CAPACITY = 64
+
+    COLUMNS = (
+        "positions", "bounds", "speeds", "local_times", "collides_with_tiles", "static", "collision_masks", "sleeping",
+        "idle_ticks"
+    )
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initializes the EntityStore.
+
+        Parameters
+        ----------
+        capacity: int, optional
+            The initial number of rows of the store. The store grows automatically when it is full.
+        """
+
+        self._capacity = max(capacity, 1)
+
+        self.positions = numpy.zeros((self._capacity, 2), dtype=numpy.int32)
+        self.bounds = numpy.zeros((self._capacity, 2), dtype=numpy.int32)
+        self.speeds = numpy.zeros((self._capacity, 2), dtype=numpy.int32)
+        self.local_times = numpy.zeros(self._capacity, dtype=numpy.float64)
+        self.collides_with_tiles = numpy.zeros(self._capacity, dtype=bool)
+        self.static = numpy.zeros(self._capacity, dtype=bool)
+        self.collision_masks = numpy.zeros(self._capacity, dtype=numpy.uint64)
+        self.sleeping = numpy.zeros(self._capacity, dtype=bool)
+        self.idle_ticks = numpy.zeros(self._capacity, dtype=numpy.int32)
+
+        self.entities = [None] * self._capacity
+
+        self._size = 0
+        self._free = []
+
+        self.version = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entities in the store.
+
+        Returns
+        -------
+        length: int
+            The number of entities in the store.
+        """
+
+        return self._size - len(self._free)
+
+    def _grow(self) -> None:
+        """
+        Doubles the capacity of the store.
+
+        The columns are reallocated, hence the entities bound to the store are bound again to their new rows.
+        """
+
+        capacity = self._capacity * 2
+
+        for name in EntityStore.COLUMNS:
+            column = getattr(self, name)
+
+            resized = numpy.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            resized[:self._capacity] = column
+
+            setattr(self, name, resized)
+
+        self.entities.extend([None] * (capacity - self._capacity))
+        self._capacity = capacity
+
+        for entity in self.entities[:self._size]:
+            if entity is not None and entity._store is self:
+                self._bind_views(entity, entity._row)
+
+    def _bind_views(self, entity: Entity, row: int) -> None:
+        """
+        Makes the bounding box and the speed of the entity views over the specified row.
+
+        Parameters
+        ----------
+        entity: Entity
+            The entity to bind.
+        row: int
+            The row of the entity.
+        """
+
+        entity.bounding_box._bind(self.positions[row], self.bounds[row], numpy.int32)
+        entity._speed = self.speeds[row]
+
+    def _write(self, entity: Entity, row: int) -> None:
+        """
+        Copies the data of the entity into the specified row.
+
+        Parameters
+        ----------
+        entity: Entity
+            The entity to copy.
+        row: int
+            The row in which the data is written.
+        """
+
+        self.positions[row] = entity.bounding_box.position
+        self.bounds[row] = entity.bounding_box.bounds
+        self.speeds[row] = entity.speed
+        self.collides_with_tiles[row] = entity.collides_with_tiles
+        self.static[row] = entity.static
+        self.collision_masks[row] = PhysicsObject.fold_layers(entity.collision_mask)
+
+    def insert(self, entity: Entity, bind: bool = True) -> int:
+        """
+        Inserts an entity in the store.
+
+        Parameters
+        ----------
+        entity: Entity
+            The entity to insert.
+        bind: bool, optional
+            Makes the bounding box and the speed of the entity views over its row if set to True. Otherwise, the row
+            only holds a copy of the data of the entity.
+
+        Raises
+        ------
+        ValueError
+            If the entity is already held by a store, or if its bounding box does not use an integer format.
+
+        Returns
+        -------
+        row: int
+            The index of the row of the entity.
+        """
+
+        if entity._store is not None:
+            raise ValueError("The entity is already held by an EntityStore.")
+
+        EntityStore._check_bounding_box(entity.bounding_box)
+
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._size == self._capacity:
+                self._grow()
+
+            row = self._size
+            self._size += 1
+
+        self.entities[row] = entity
+        self.version += 1
+
+        self._write(entity, row)
+        self.local_times[row] = 0.0
+        self.sleeping[row] = False
+        self.idle_ticks[row] = 0
+
+        if bind:
+            entity._store = self
+            entity._row = row
+
+            self._bind_views(entity, row)
+
+        return row
+
+    def remove(self, entity: Entity) -> None:
+        """
+        Removes an entity from the store.
+
+        The bounding box and the speed of the entity are detached from the store and keep their current values.
+
+        Parameters
+        ----------
+        entity: Entity
+            The entity to remove.
+
+        Raises
+        ------
+        ValueError
+            If the entity is not held by the store.
+        """
+
+        if entity._store is not self:
+            raise ValueError("The entity is not held by this EntityStore.")
+
+        row = entity._row
+
+        entity.bounding_box._unbind()
+        entity._speed = entity._speed.copy()
+
+        entity._store = None
+        entity._row = -1
+
+        self.entities[row] = None
+        self._free.append(row)
+
+        self.version += 1
+
+    def bind(self, entity: Entity) -> None:
+        """
+        Copies the data of the entity into its row and makes it a view over the row.
+
+        This is called whenever the bounding box of a stored entity is replaced.
+
+        Parameters
+        ----------
+        entity: Entity
+            The entity held by the store.
+
+        Raises
+        ------
+        ValueError
+            If the bounding box of the entity does not use an integer format.
+        """
+
+        EntityStore._check_bounding_box(entity.bounding_box)
+
+        self._write(entity, entity._row)
+        self._bind_views(entity, entity._row)
+
+    def reset(self, entity: Entity) -> None:
+        """
+        Copies the data of the entity into its row and clears its local time and its sleep state.
+
+        The row is set up as for a newly inserted entity, but the bounding box and the speed of the entity are not bound
+        again: they keep their views over the row. This is called when a destroyed entity which kept its row is spawned
+        again.
+
+        Parameters
+        ----------
+        entity: Entity
+            The entity held by the store.
+
+        Raises
+        ------
+        ValueError
+            If the entity is not held by the store.
+        """
+
+        if entity._store is not self:
+            raise ValueError("The entity is not held by this EntityStore.")
+
+        row = entity._row
+
+        self._write(entity, row)
+        self.local_times[row] = 0.0
+        self.sleeping[row] = False
+        self.idle_ticks[row] = 0
+
+        self.version += 1
+
+    @staticmethod
+    def _check_bounding_box(bounding_box: AxisAlignedBoundingBox) -> None:
+        """
+        Checks that a bounding box can be bound to the int32 columns of a store without losing its precision.
+
+        Parameters
+        ----------
+        bounding_box: AxisAlignedBoundingBox
+            The bounding box to check.
+
+        Raises
+        ------
+        ValueError
+            If the bounding box does not use an integer format.
+        """
+
+        if not numpy.issubdtype(bounding_box._dtype, numpy.integer):
+            raise ValueError(
+                "The entity store only holds integer bounding boxes, the bounding box " + str(bounding_box) + " uses " +
+                "the " + numpy.dtype(bounding_box._dtype).name + " format. Convert it with as_type(numpy.int32), or " +
+                "disable the entity store of the world to keep the non-integer positions."
+            )
+
+    def rows(self) -> numpy.ndarray:
+        """
+        Returns the indexes of the occupied rows.
+
+        Returns
+        -------
+        rows: numpy.ndarray
+            The indexes of the rows holding an entity.
+        """
+
+        return numpy.array([row for row in range(self._size) if self.entities[row] is not None], dtype=numpy.int64)
+
+    @staticmethod
+    def gather(entities: list, local_times: list = None) -> "EntityStore":
+        """
+        Creates a store holding a copy of the data of the entities.
+
+        The entities are not bound to the created store, the row of each entity is its index in the list. The positions
+        and the bounds are copied in the float64 format, so that the non-integer bounding boxes are not truncated.
+
+        Parameters
+        ----------
+        entities: list of Entity
+            The entities to copy.
+        local_times: list of float, optional
+            The corresponding local time of each entity.
+
+        Returns
+        -------
+        store: EntityStore
+            The store holding the data of the entities.
+        """
+
+        store = EntityStore(len(entities))
+
+        size = len(entities)
+
+        store.positions = store.positions.astype(numpy.float64)
+        store.bounds = store.bounds.astype(numpy.float64)
+
+        if size > 0:
+            store.positions[:size] = [entity.bounding_box.position for entity in entities]
+            store.bounds[:size] = [entity.bounding_box.bounds for entity in entities]
+            store.speeds[:size] = [entity.speed for entity in entities]
+            store.collides_with_tiles[:size] = [entity.collides_with_tiles for entity in entities]
+            store.static[:size] = [entity.static for entity in entities]
+            store.collision_masks[:size] = [PhysicsObject.fold_layers(entity.collision_mask) for entity in entities]
+
+            if local_times is not None:
+                store.local_times[:size] = local_times
+
+        store.entities[:size] = entities
+        store._size = size
+
+        return store
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "EntityStore[size=" + str(len(self)) + ", capacity=" + str(self._capacity) + "]"
+
+
+class CollisionMap:
+    """
+    Simple way of defining the behavior of a tile.
+
+    Collisions are only considered on the edges of the tiles. The collision map allows to define how the entities will
+    interact with each of the edge (either collide or go through).
+
+    Attributes
+    ----------
+    collide_north: bool
+        Enables the collision detection with the top edge of the tile if set to True.
+    collide_east: bool
+        Enables the collision detection with the right edge of the tile if set to True.
+    collide_south: bool
+        Enables the collision detection with the bottom edge of the tile if set to True.
+    collide_west: bool
+        Enables the collision detection with the left edge of the tile if set to True.
+    """
+
+    def __init__(self, collide_north: bool, collide_east: bool, collide_south: bool, collide_west: bool):
+        """
+        Initializes the CollisionMap.
+
+        Parameters
+        ----------
+        collide_north: bool
+            Enables the collision detection with the top edge of the tile if set to True.
+        collide_east: bool
+            Enables the collision detection with the right edge of the tile if set to True.
+        collide_south: bool
+            Enables the collision detection with the bottom edge of the tile if set to True.
+        collide_west: bool
+            Enables the collision detection with the left edge of the tile if set to True.
+        """
+
+        self.collide_north = collide_north
+        self.collide_east = collide_east
+        self.collide_south = collide_south
+        self.collide_west = collide_west
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "CollisionMap[collide_north=" + str(self.collide_north) + ", " + \
+               "collide_east=" + str(self.collide_east) + ", collide_south=" + str(self.collide_south) + ", " + \
+               "collide_west=" + str(self.collide_west) + "]"
+
+
+class TileManager:
+    """
+    The tile physics manager.
+
+    A tile manager must be created to registers tiles. A tile is a couple of an texture and a collision map. This object
+    should be fully initialized before creating a world. To add the rendering, see the ResourceManager class. Note that
+    the scale used here expresses the size of a tile in term of game distance unit.
+
+    Attributes
+    ----------
+    tile_size: int
+        The size of the tiles expressed in distance units.
+    version: int
+        A counter incremented each time a collision map or a tile is registered.
+
+    Methods
+    -------
+    register_collision_map(collide_north, collide_east, collide_south, collide_west)
+        Registers a new collision map.
+    register_tile(id_collision_map, id_texture)
+        Registers a new tile.
+    get_collision_map(id_tile)
+        Returns the collision map associated to the tile.
+    get_id_texture(id_tile)
+        Returns the texture associated to the tile.
+    solidity(tiles)
+        Returns the per-direction solidity of the tiles.
+    """
+
+    def __init__(self, tile_size: int):
+        """
+        Initializes the TileManager.
+
+        Parameters
+        ----------
+        tile_size: int
+            The size of the tiles expressed in distance units.
+        """
+
+        self.tile_size = tile_size
+
+        self._collision_maps = []
+        self._tiles = []
+
+        self.version = 0
+
+        self._solidity_table = None
+        self._solidity_version = -1
+
+    def register_collision_map(self, collide_north: bool, collide_east: bool, collide_south: bool,
+                               collide_west: bool) -> None:
+        """
+        Registers a new collision map.
+
+        Registers a new collision map and gives it the first index available.
+
+        Parameters
+        ----------
+        collide_north: bool
+            Enables the collision detection with the top edge of the tile if set to True.
+        collide_east: bool
+            Enables the collision detection with the right edge of the tile if set to True.
+        collide_south: bool
+            Enables the collision detection with the bottom edge of the tile if set to True.
+        collide_west: bool
+            Enables the collision detection with the left edge of the tile if set to True.
+        """
+
+        self._collision_maps.append(CollisionMap(collide_north, collide_east, collide_south, collide_west))
+
+        self.version += 1
+
+    def register_tile(self, id_collision_map: int, id_texture: int) -> None:
+        """
+        Registers a new tile.
+
+        Registers a new tile with the specified texture and collision map indexes and gives the first index available.
+        Note that the index 0 corresponds to the empty tile (no rendering nor collision).
+
+        Parameters
+        ----------
+        id_collision_map: int
+            The index of the collision map used for the collision behavior.
+        id_texture: int
+            The index of the texture used (see ResourcesManagers)
+        """
+
+        self._tiles.append((id_collision_map, id_texture))
+
+        self.version += 1
+
+    def get_collision_map(self, id_tile: int) -> CollisionMap:
+        """
+        Returns the collision map associated to the tile.
+
+        Returns the collision map associated to the tile registered at the specified index. Note that the index 0 is
+        forbidden since it corresponds to the empty tile, nothing should collide with it.
+
+        Parameters
+        ----------
+        id_tile: int
+            The index of the tile.
+
+        Returns
+        -------
+        collision_map: CollisionMap
+            The collision map associated to the tile.
+        """
+
+        if not 0 < id_tile <= len(self._tiles):
+            raise ValueError("The tile with ID " + str(id_tile) + " is not registered.")
+
+        return self._collision_maps[self._tiles[id_tile - 1][0]]
+
+    def get_id_texture(self, id_tile: int) -> int:
+        """
+        Returns the texture associated to the tile.
+
+        Returns the index of the texture associated to the tile registered at the specified index. Note that the index 0
+        is forbidden since it corresponds to the empty tile, it should not be rendered.
+
+        Parameters
+        ----------
+        id_tile: int
+            The index of the tile.
+
+        Raises
+        ------
+        ValueError
+            If the tile index is invalid.
+
+        Returns
+        -------
+        id_texture: int
+            The index of the texture to render.
+        """
+
+        if not 0 < id_tile <= len(self._tiles):
+            raise ValueError("The tile with ID " + str(id_tile) + " is not registered.")
+
+        return self._tiles[id_tile - 1][1]
+
+    def solidity(self, tiles: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns the per-direction solidity of the tiles.
+
+        The solidity of a tile in a direction tells whether the edge of the tile facing this direction collides with the
+        entities, as defined by its collision map. The empty tile, the tiles which are not registered and any negative
+        index never collide.
+
+        Parameters
+        ----------
+        tiles: numpy.ndarray
+            The array of tile indexes.
+
+        Returns
+        -------
+        solidity: numpy.ndarray
+            The boolean array of shape (4,) + tiles.shape, indexed first by the directions north, east, south and west
+            (see Direction).
+        """
+
+        if self._solidity_version != self.version:
+            table = numpy.zeros((len(self._tiles) + 1, 4), dtype=bool)
+
+            for id_tile, (id_collision_map, _) in enumerate(self._tiles, start=1):
+                collision_map = self._collision_maps[id_collision_map]
+
+                table[id_tile] = collision_map.collide_north, collision_map.collide_east, \
+                    collision_map.collide_south, collision_map.collide_west
+
+            self._solidity_table = table
+            self._solidity_version = self.version
+
+        ids = numpy.maximum(tiles, 0)
+
+        if tiles.size > 0 and tiles.max() > len(self._tiles):
+            # The unregistered tiles are looked up as the empty tile
+            ids = numpy.where(ids > len(self._tiles), 0, ids)
+
+        return numpy.moveaxis(self._solidity_table[ids], -1, 0)
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "TileManager[tile_size=" + str(self.tile_size) + "]"
+
+
+class Direction:
+    """
+    An enumeration containing the different directions.
+
+    The collisions directions are represented using theses direction codes.
+
+    Methods
+    -------
+    next_right(direction)
+        Gives the direction obtained by a 90 degrees rotation clockwise.
+    next_left(direction)
+        Gives the direction obtained by a 90 degrees rotation counterclockwise.
+    opposite(direction)
+        Gives the direction obtained by a 180 degrees rotation.
+    get_name(direction)
+        Returns the name string of the direction.
+    """
+
+    DIRECTION_NONE = -1
+    DIRECTION_NORTH = 0
+    DIRECTION_EAST = 1
+    DIRECTION_SOUTH = 2
+    DIRECTION_WEST = 3
+
+    @staticmethod
+    def next_right(direction: int) -> int:
+        """
+        Gives the direction obtained by a 90 degrees rotation clockwise.
+
+        Parameters
+        ----------
+        direction: int
+            The initial direction code.
+
+        Returns
+        -------
+        direction: int
+            The direction obtained after the rotation.
+        """
+
+        if direction == Direction.DIRECTION_NONE:
+            return Direction.DIRECTION_NONE
+
+        return (direction + 1) % 4
+
+    @staticmethod
+    def next_left(direction: int) -> int:
+        """
+        Gives the direction obtained by a 90 degrees rotation counterclockwise.
+
+        Parameters
+        ----------
+        direction: int
+            The initial direction code.
+
+        Returns
+        -------
+        direction: int
+            The direction obtained after the rotation.
+        """
+
+        if direction == Direction.DIRECTION_NONE:
+            return Direction.DIRECTION_NONE
+
+        return (direction + 3) % 4
+
+    @staticmethod
+    def opposite(direction: int) -> int:
+        """
+        Gives the direction obtained by a 180 degrees rotation.
+
+        Parameters
+        ----------
+        direction: int
+            The initial direction code.
+
+        Returns
+        -------
+        direction: int
+            The direction obtained after the rotation.
+        """
+
+        if direction == Direction.DIRECTION_NONE:
+            return Direction.DIRECTION_NONE
+
+        return (direction + 2) % 4
+
+    @staticmethod
+    def get_name(direction: int) -> str:
+        """
+        Returns the name string of the direction.
+
+        Parameters
+        ----------
+        direction: int
+            The direction.
+
+        Returns
+        -------
+        name: str
+            The direction name string.
+        """
+
+        if direction == Direction.DIRECTION_NONE:
+            return "NONE"
+        elif direction == Direction.DIRECTION_NORTH:
+            return "NORTH"
+        elif direction == Direction.DIRECTION_EAST:
+            return "EAST"
+        elif direction == Direction.DIRECTION_SOUTH:
+            return "SOUTH"
+        elif direction == Direction.DIRECTION_WEST:
+            return "WEST"
+
+
+class TileOccupancy:
+    """
+    A multi-resolution occupancy pyramid of the solid tiles of a level.
+
+    Each level of the pyramid halves the resolution of the previous one: a cell of the level k tells, for each
+    direction, whether any tile of the corresponding block of 2^k x 2^k tiles is solid. The level 0 is the solidity
+    bitmap of the level itself. Region queries read a coarse level first, which allows to skip large empty areas in a
+    single step.
+
+    Attributes
+    ----------
+    levels: list of numpy.ndarray
+        The levels of the pyramid, the level k has a shape of (4, ceil(width / 2^k), ceil(height / 2^k)).
+
+    Methods
+    -------
+    update(x, y)
+        Updates the pyramid after the solidity of some tiles changed.
+    update_block(min_tile, max_tile)
+        Updates the pyramid after the solidity of a block of tiles changed.
+    any(direction, min_tile, max_tile)
+        Tells whether there is a solid tile within a block of tiles.
+    shapes(shape)
+        Returns the shapes of the levels above the level 0 for a level of the specified shape.
+    attach(levels)
+        Creates a pyramid over existing levels.
+    """
+
+    QUERY_CELLS = 1024
+
+    def __init__(self, solidity: numpy.ndarray):
+        """
+        Initializes the TileOccupancy.
+
+        Parameters
+        ----------
+        solidity: numpy.ndarray
+            The per-direction solidity bitmap of the level, of shape (4, width, height). It is used as the level 0 of
+            the pyramid without any copy.
+        """
+
+        self.levels = [solidity]
+
+        for shape in TileOccupancy.shapes(solidity.shape[1:]):
+            level = numpy.zeros((4,) + shape, dtype=bool)
+
+            TileOccupancy._reduce(self.levels[-1], level, (0, 0), (shape[0] - 1, shape[1] - 1))
+
+            self.levels.append(level)
+
+    @staticmethod
+    def _reduce(previous: numpy.ndarray, level: numpy.ndarray, min_cell: tuple, max_cell: tuple) -> None:
+        """
+        Recomputes a block of cells of a level from the cells of the previous level.
+
+        Parameters
+        ----------
+        previous: numpy.ndarray
+            The previous (finer) level of the pyramid.
+        level: numpy.ndarray
+            The level of the pyramid to update.
+        min_cell: tuple of int
+            The position of the first cell of the block.
+        max_cell: tuple of int
+            The position of the last cell of the block (included).
+        """
+
+        min_x, min_y = min_cell
+        max_x, max_y = max_cell
+
+        cells = level[:, min_x:max_x + 1, min_y:max_y + 1]
+        cells[...] = False
+
+        # Each cell covers the cells 2i and 2i + 1 of the previous level, the last one being missing on odd sizes
+        for offset_x in (0, 1):
+            for offset_y in (0, 1):
+                children = previous[:, 2 * min_x + offset_x:2 * max_x + 2:2, 2 * min_y + offset_y:2 * max_y + 2:2]
+                cells[:, :children.shape[1], :children.shape[2]] |= children
+
+    def update(self, x: numpy.ndarray, y: numpy.ndarray) -> None:
+        """
+        Updates the pyramid after the solidity of some tiles changed.
+
+        The level 0 is expected to be already up to date, only the cells covering the changed tiles are recomputed.
+
+        Parameters
+        ----------
+        x: numpy.ndarray
+            The positions of the changed tiles along the x axis.
+        y: numpy.ndarray
+            The positions of the changed tiles along the y axis.
+        """
+
+        for previous, level in zip(self.levels, self.levels[1:]):
+            cells = numpy.unique(numpy.stack((x // 2, y // 2)), axis=1)
+            x, y = cells[0], cells[1]
+
+            low_x = x * 2
+            low_y = y * 2
+            high_x = numpy.minimum(low_x + 1, previous.shape[1] - 1)
+            high_y = numpy.minimum(low_y + 1, previous.shape[2] - 1)
+
+            level[:, x, y] = previous[:, low_x, low_y] | previous[:, high_x, low_y] | previous[:, low_x, high_y] | \
+                previous[:, high_x, high_y]
+
+    def update_block(self, min_tile: tuple, max_tile: tuple) -> None:
+        """
+        Updates the pyramid after the solidity of a block of tiles changed.
+
+        The level 0 is expected to be already up to date, only the cells covering the block are recomputed.
+
+        Parameters
+        ----------
+        min_tile: tuple of int
+            The position of the first tile of the block.
+        max_tile: tuple of int
+            The position of the last tile of the block (included).
+        """
+
+        min_x, min_y = int(min_tile[0]), int(min_tile[1])
+        max_x, max_y = int(max_tile[0]), int(max_tile[1])
+
+        for previous, level in zip(self.levels, self.levels[1:]):
+            min_x, min_y, max_x, max_y = min_x // 2, min_y // 2, max_x // 2, max_y // 2
+
+            TileOccupancy._reduce(previous, level, (min_x, min_y), (max_x, max_y))
+
+    def any(self, direction: int, min_tile: tuple, max_tile: tuple) -> bool:
+        """
+        Tells whether there is a solid tile within a block of tiles.
+
+        The query is done on the finest level over which the block covers at most QUERY_CELLS cells. If none of these
+        cells is solid, the block is empty. Otherwise, the cells fully covered by the block are checked, then the
+        border strips of the block which are thinner than a cell are checked on the level 0.
+
+        Parameters
+        ----------
+        direction: int
+            The direction in which the tiles have to be solid, any direction if set to Direction.DIRECTION_NONE.
+        min_tile: tuple of int
+            The position of the first tile of the block.
+        max_tile: tuple of int
+            The position of the last tile of the block (included).
+
+        Returns
+        -------
+        solid: bool
+            True if any tile of the block is solid in the direction.
+        """
+
+        width, height = self.levels[0].shape[1:]
+
+        min_x, min_y = max(int(min_tile[0]), 0), max(int(min_tile[1]), 0)
+        max_x, max_y = min(int(max_tile[0]), width - 1), min(int(max_tile[1]), height - 1)
+
+        if min_x > max_x or min_y > max_y:
+            return False
+
+        planes = slice(None) if direction == Direction.DIRECTION_NONE else direction
+        level = 0
+
+        while level < len(self.levels) - 1 and \
+                ((max_x >> level) - (min_x >> level) + 1) * ((max_y >> level) - (min_y >> level) + 1) > \
+                TileOccupancy.QUERY_CELLS:
+            level += 1
+
+        cells = self.levels[level]
+
+        if not cells[planes, min_x >> level:(max_x >> level) + 1, min_y >> level:(max_y >> level) + 1].any():
+            return False
+
+        if level == 0:
+            return True
+
+        # The cells fully covered by the block, the last cell of the level is covered if the block reaches its end
+        inner_min_x = -(-min_x >> level)
+        inner_min_y = -(-min_y >> level)
+        inner_max_x = (max_x >> level) if max_x == width - 1 else ((max_x + 1) >> level) - 1
+        inner_max_y = (max_y >> level) if max_y == height - 1 else ((max_y + 1) >> level) - 1
+
+        if inner_min_x > inner_max_x or inner_min_y > inner_max_y:
+            return bool(self.levels[0][planes, min_x:max_x + 1, min_y:max_y + 1].any())
+
+        if cells[planes, inner_min_x:inner_max_x + 1, inner_min_y:inner_max_y + 1].any():
+            return True
+
+        low_x, high_x = inner_min_x << level, min(((inner_max_x + 1) << level) - 1, max_x)
+        low_y, high_y = inner_min_y << level, min(((inner_max_y + 1) << level) - 1, max_y)
+
+        solidity = self.levels[0]
+
+        return bool(
+            solidity[planes, min_x:low_x, min_y:max_y + 1].any() or
+            solidity[planes, high_x + 1:max_x + 1, min_y:max_y + 1].any() or
+            solidity[planes, low_x:high_x + 1, min_y:low_y].any() or
+            solidity[planes, low_x:high_x + 1, high_y + 1:max_y + 1].any()
+        )
+
+    @staticmethod
+    def shapes(shape: tuple) -> list:
+        """
+        Returns the shapes of the levels above the level 0 for a level of the specified shape.
+
+        Parameters
+        ----------
+        shape: tuple of int
+            The shape of the tiles array of the level.
+
+        Returns
+        -------
+        shapes: list of tuple
+            The shapes (without the direction axis) of the levels 1 and above of the pyramid.
+        """
+
+        shapes = []
+        width, height = shape
+
+        while width > 1 or height > 1:
+            width, height = (width + 1) // 2, (height + 1) // 2
+            shapes.append((width, height))
+
+        return shapes
+
+    @staticmethod
+    def attach(levels: list) -> "TileOccupancy":
+        """
+        Creates a pyramid over existing levels.
+
+        This is used by the worker processes to read a pyramid stored in shared memory.
+
+        Parameters
+        ----------
+        levels: list of numpy.ndarray
+            The levels of the pyramid, starting from the solidity bitmap of the level.
+
+        Returns
+        -------
+        occupancy: TileOccupancy
+            The attached pyramid.
+        """
+
+        occupancy = TileOccupancy.__new__(TileOccupancy)
+        occupancy.levels = list(levels)
+
+        return occupancy
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "TileOccupancy[shape=" + str(self.levels[0].shape[1:]) + ", levels=" + str(len(self.levels)) + "]"
+
+
+class TileChunks:
+    """
+    Chunked storage of the tiles of a streamed level.
+
+    The level is divided in square chunks of chunk_size tiles. The chunks are loaded on demand by a loader function and
+    only kept in memory around the areas in use, hence the level can be far larger than the memory. The loads and the
+    saves run in a single background thread, in the order of their requests, so a chunk is never loaded again before
+    its previous save is done. A World created from chunks works on a dense window of chunks covering its logic area and
+    its streaming areas.
+
+    Attributes
+    ----------
+    chunk_size: int
+        The width and the height of the chunks expressed in tiles.
+    margin: int
+        The number of chunks kept around the logic area and the streaming areas in the window of a world.
+    dtype: type
+        The data type of the tiles.
+
+    Methods
+    -------
+    request(min_chunk, max_chunk)
+        Loads the chunks of a range in the background.
+    window(min_chunk, max_chunk)
+        Returns a dense copy of the tiles of a range of chunks.
+    store(min_chunk, tiles)
+        Writes a dense block of tiles back into the chunks.
+    release(min_chunk, max_chunk)
+        Unloads the chunks out of a range.
+    loaded()
+        Returns the positions of the chunks held in memory.
+    flush()
+        Saves every modified chunk and waits for the background operations.
+    close()
+        Flushes the chunks and stops the background thread.
+    """
+
+    DEFAULT_CHUNK_SIZE = 64
+    DEFAULT_MARGIN = 1
+
+    def __init__(self, loader: callable, saver: callable = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 margin: int = DEFAULT_MARGIN, dtype: type = numpy.int32):
+        """
+        Initializes the TileChunks.
+
+        Parameters
+        ----------
+        loader: callable
+            The function loading a chunk. It takes the coordinates x and y of the chunk expressed in chunks and returns
+            the tiles array of the chunk, or None if the chunk is empty.
+        saver: callable, optional
+            The function saving a modified chunk. It takes the coordinates x and y of the chunk and its tiles array. If
+            left to None, the modifications of a chunk are lost once it is unloaded.
+        chunk_size: int, optional
+            The width and the height of the chunks expressed in tiles.
+        margin: int, optional
+            The number of chunks kept around the logic area and the streaming areas in the window of a world.
+        dtype: type, optional
+            The data type of the tiles.
+
+        Raises
+        ------
+        ValueError
+            If the chunk size is lesser than 1 or the margin is negative.
+        """
+
+        if chunk_size < 1:
+            raise ValueError("The chunks must have a size of at least 1.")
+
+        if margin < 0:
+            raise ValueError("The margin cannot be negative.")
+
+        self._loader = loader
+        self._saver = saver
+
+        self.chunk_size = chunk_size
+        self.margin = margin
+        self.dtype = dtype
+
+        self._chunks = {}
+        self._modified = set()
+
+        self._loads = {}
+        self._saves = []
+
+        self._pool = None
+
+    def _submit(self, function: callable, arguments: tuple) -> AsyncResult:
+        """
+        Runs a function in the background thread.
+
+        Parameters
+        ----------
+        function: callable
+            The function to run.
+        arguments: tuple
+            The arguments of the function.
+
+        Returns
+        -------
+        result: AsyncResult
+            The pending result of the function.
+        """
+
+        if self._pool is None:
+            self._pool = ThreadPool(processes=1)
+
+        return self._pool.apply_async(function, arguments)
+
+    def _load(self, position: tuple) -> numpy.ndarray:
+        """
+        Loads a chunk from the background thread.
+
+        Parameters
+        ----------
+        position: tuple of int
+            The position of the chunk.
+
+        Raises
+        ------
+        ValueError
+            If the loaded array does not have the shape of a chunk.
+
+        Returns
+        -------
+        tiles: numpy.ndarray
+            The tiles array of the chunk.
+        """
+
+        tiles = self._loader(*position)
+
+        if tiles is None:
+            return numpy.zeros((self.chunk_size, self.chunk_size), dtype=self.dtype)
+
+        tiles = numpy.array(tiles, dtype=self.dtype)
+
+        if tiles.shape != (self.chunk_size, self.chunk_size):
+            raise ValueError("The chunk " + str(position) + " has the shape " + str(tiles.shape) + ".")
+
+        return tiles
+
+    def _get(self, position: tuple) -> numpy.ndarray:
+        """
+        Returns the tiles of a chunk, waiting for it to be loaded if needed.
+
+        Parameters
+        ----------
+        position: tuple of int
+            The position of the chunk.
+
+        Returns
+        -------
+        tiles: numpy.ndarray
+            The tiles array of the chunk.
+        """
+
+        tiles = self._chunks.get(position)
+
+        if tiles is None:
+            if position not in self._loads:
+                self._loads[position] = self._submit(self._load, (position,))
+
+            tiles = self._chunks[position] = self._loads.pop(position).get()
+
+        return tiles
+
+    def _collect_saves(self) -> None:
+        """
+        Forgets the finished saves, raising the errors of the failed ones.
+        """
+
+        pending = []
+
+        for result in self._saves:
+            if result.ready():
+                result.get()
+            else:
+                pending.append(result)
+
+        self._saves = pending
+
+    def request(self, min_chunk: tuple, max_chunk: tuple) -> None:
+        """
+        Loads the chunks of a range in the background.
+
+        Parameters
+        ----------
+        min_chunk: tuple of int
+            The position of the first chunk of the range.
+        max_chunk: tuple of int
+            The position of the last chunk of the range (included).
+        """
+
+        for x in range(int(min_chunk[0]), int(max_chunk[0]) + 1):
+            for y in range(int(min_chunk[1]), int(max_chunk[1]) + 1):
+                if (x, y) not in self._chunks and (x, y) not in self._loads:
+                    self._loads[(x, y)] = self._submit(self._load, ((x, y),))
+
+    def window(self, min_chunk: tuple, max_chunk: tuple) -> numpy.ndarray:
+        """
+        Returns a dense copy of the tiles of a range of chunks.
+
+        The chunks which are not loaded yet are waited for.
+
+        Parameters
+        ----------
+        min_chunk: tuple of int
+            The position of the first chunk of the range.
+        max_chunk: tuple of int
+            The position of the last chunk of the range (included).
+
+        Returns
+        -------
+        tiles: numpy.ndarray
+            The tiles of the range, the first tile being the first tile of the first chunk.
+        """
+
+        self.request(min_chunk, max_chunk)
+
+        min_x, min_y = int(min_chunk[0]), int(min_chunk[1])
+        max_x, max_y = int(max_chunk[0]), int(max_chunk[1])
+
+        size = self.chunk_size
+
+        tiles = numpy.empty(((max_x - min_x + 1) * size, (max_y - min_y + 1) * size), dtype=self.dtype)
+
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                tiles[(x - min_x) * size:(x - min_x + 1) * size, (y - min_y) * size:(y - min_y + 1) * size] = \
+                    self._get((x, y))
+
+        return tiles
+
+    def store(self, min_chunk: tuple, tiles: numpy.ndarray) -> None:
+        """
+        Writes a dense block of tiles back into the chunks.
+
+        Only the chunks whose tiles changed are marked as modified.
+
+        Parameters
+        ----------
+        min_chunk: tuple of int
+            The position of the chunk of the first tile of the block.
+        tiles: numpy.ndarray
+            The block of tiles, whose shape has to be a multiple of the chunk size.
+        """
+
+        size = self.chunk_size
+
+        for x in range(tiles.shape[0] // size):
+            for y in range(tiles.shape[1] // size):
+                position = (int(min_chunk[0]) + x, int(min_chunk[1]) + y)
+                block = tiles[x * size:(x + 1) * size, y * size:(y + 1) * size]
+
+                chunk = self._get(position)
+
+                if not numpy.array_equal(chunk, block):
+                    chunk[...] = block
+
+                    self._modified.add(position)
+
+    def release(self, min_chunk: tuple, max_chunk: tuple) -> None:
+        """
+        Unloads the chunks out of a range.
+
+        The modified chunks are saved in the background, the pending loads out of the range are dropped.
+
+        Parameters
+        ----------
+        min_chunk: tuple of int
+            The position of the first chunk of the range.
+        max_chunk: tuple of int
+            The position of the last chunk of the range (included).
+        """
+
+        unloaded = [position for position in self._chunks if not TileChunks._within(position, min_chunk, max_chunk)]
+        dropped = [position for position in self._loads if not TileChunks._within(position, min_chunk, max_chunk)]
+
+        for position in unloaded:
+            tiles = self._chunks.pop(position)
+
+            if position in self._modified:
+                self._modified.discard(position)
+
+                if self._saver is not None:
+                    self._saves.append(self._submit(self._saver, position + (tiles,)))
+
+        for position in dropped:
+            del self._loads[position]
+
+        self._collect_saves()
+
+    @staticmethod
+    def _within(position: tuple, min_chunk: tuple, max_chunk: tuple) -> bool:
+        """
+        Tells whether a chunk lies within a range.
+
+        Parameters
+        ----------
+        position: tuple of int
+            The position of the chunk.
+        min_chunk: tuple of int
+            The position of the first chunk of the range.
+        max_chunk: tuple of int
+            The position of the last chunk of the range (included).
+
+        Returns
+        -------
+        within: bool
+            True if the chunk lies within the range.
+        """
+
+        return min_chunk[0] <= position[0] <= max_chunk[0] and min_chunk[1] <= position[1] <= max_chunk[1]
+
+    def loaded(self) -> list:
+        """
+        Returns the positions of the chunks held in memory.
+
+        Returns
+        -------
+        positions: list of (int, int)
+            The sorted positions of the loaded chunks.
+        """
+
+        return sorted(self._chunks)
+
+    def flush(self) -> None:
+        """
+        Saves every modified chunk and waits for the background operations.
+
+        This has no effect on the modified chunks if there is no saver.
+        """
+
+        if self._saver is not None:
+            for position in sorted(self._modified):
+                self._saves.append(self._submit(self._saver, position + (self._chunks[position].copy(),)))
+
+        self._modified.clear()
+
+        for result in self._saves:
+            result.get()
+
+        self._saves = []
+
+    def close(self) -> None:
+        """
+        Flushes the chunks and stops the background thread.
+
+        The chunks can still be used afterwards, the background thread is created again when needed.
+        """
+
+        self.flush()
+
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+
+            self._pool = None
+
+        self._loads.clear()
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "TileChunks[chunk_size=" + str(self.chunk_size) + ", margin=" + str(self.margin) + ", " + \
+               "loaded=" + str(len(self._chunks)) + "]"
+
+
+class CollisionEvent(Event):
+    """
+    A generic type of event used for collision.
+
+    This type of event is used for any event related to a collision between an entity with either a tile or another
+    entity. Theses events are not cancelable.
+
+    Attributes
+    ----------
+    tick: int
+        The tick at which the event got fired.
+    entity: Entity
+        The entity which collided.
+    direction: int
+        The direction of the collision relative to the entity.
+    """
+    
+    def __init__(self, tick: int, entity: Entity, direction: int):
+        """
+        Initializes the CollisionEvent.
+
+        Parameters
+        ----------
+        tick: int
+            The tick at which the event got fired.
+        entity: Entity
+            The entity which collided.
+        direction: int
+            The direction of the collision relative to the entity.
+        """
+        
+        Event.__init__(self, tick)
+        
+        self.entity = entity
+        self.direction = direction
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "CollisionEvent[tick=" + str(self.tick) + ", entity=" + str(self.entity) + ", " + \
+               "direction=" + Direction.get_name(self.direction) + "]"
+
+
+class CollisionWithTileEvent(CollisionEvent):
+    """
+    The type of CollisionEvent used for collisions between an entity and a tile.
+
+    This kind of event is fired whenever an entity collides with a tile. Note that after being handled, the speed of the
+    entity who collided must have changed to avoid colliding again with the tile (or else you are likely to be stuck in
+    an infinite loop).
+
+    Attributes
+    ----------
+    tick: int
+        The tick at which the event got fired.
+    entity: Entity
+        The entity which collided.
+    tile: int
+        The index of the tile with which the collision happened.
+    position: tuple of int
+            The position of the tile with which the collision happened.
+    direction: int
+        The direction of the collision relative to the entity.
+
+    Methods
+    -------
+    default_handler_collision_tile(event)
+        The default collision handler.
+    """
+
+    def __init__(self, tick: int, entity: Entity, tile: int, position: tuple, direction: int):
+        """
+        Initializes the CollisionWithTileEvent.
+
+        Parameters
+        ----------
+        tick: int
+            The tick at which the event got fired.
+        entity: Entity
+            The entity which collided.
+        tile: int
+            The index of the tile with which the collision happened.
+        position: tuple of int
+            The position of the tile with which the collision happened.
+        direction: int
+            The direction of the collision relative to the entity.
+        """
+
+        CollisionEvent.__init__(self, tick, entity, direction)
+
+        self.tile = tile
+        self.position = position
+
+    @staticmethod
+    def default_handler_collision_tile(event: "CollisionWithTileEvent") -> None:
+        """
+        The default collision handler.
+
+        This handler is a default collision handler. It simply sets the speed of the entity to 0 along the event
+        direction.
+
+        Parameters
+        ----------
+        event: CollisionWithTileEvent
+            The collision event fired.
+        """
+
+        direction = event.direction
+
+        if direction == Direction.DIRECTION_EAST or direction == Direction.DIRECTION_WEST:
+            event.entity.speed[0] = 0
+        elif direction == Direction.DIRECTION_NORTH or direction == Direction.DIRECTION_SOUTH:
+            event.entity.speed[1] = 0
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "CollisionWithTileEntityEvent[tick=" + str(self.tick) + ", entity=" + str(self.entity) + ", " + \
+               "direction=" + Direction.get_name(self.direction) + ", tile=" + str(self.tile) + ", " + \
+               "position=[" + str(self.position[0]) + " " + str(self.position[1]) + "]]"
+
+
+class CollisionWithEntityEvent(CollisionEvent):
+    """
+    The type of CollisionEvent used for collisions between two entities.
+
+    This kind of event is fired whenever two entities collide. Note that after being handled, the speed of the entities
+    who collided must have changed to avoid colliding again (or else you are likely to be stuck in an infinite loop).
+    This event can be reversed, meaning that both entities can swap their role.
+
+    Attributes
+    ----------
+    tick: int
+        The tick at which the event got fired.
+    entity: Entity
+        The entity which collided.
+    other: entity
+        The other entity with which the collision happened.
+    direction: int
+        The direction of the collision relative to the first entity.
+
+    Methods
+    -------
+    reverse()
+        Reverses the event by swapping the role of the entities.
+    default_handler_collision_entity(event)
+        The default collision handler.
+    """
+
+    def __init__(self, tick: int, entity: Entity, other: Entity, direction: int):
+        """
+        Initializes the CollisionWithEntityEvent.
+
+        Parameters
+        ----------
+        tick: int
+            The tick at which the event got fired.
+        entity: Entity
+            The entity which collided.
+        other: entity
+            The other entity with which the collision happened.
+        direction: int
+            The direction of the collision relative to the first entity.
+        """
+
+        CollisionEvent.__init__(self, tick, entity, direction)
+
+        self.other = other
+
+    def reverse(self) -> None:
+        """
+        Reverses the event by swapping the role of the entities.
+        """
+
+        self.entity, self.other = self.other, self.entity
+        self.direction = Direction.opposite(self.direction)
+
+    @staticmethod
+    def default_handler_collision_entity(event: "CollisionWithEntityEvent") -> None:
+        """
+        The default collision handler.
+
+        This handler is a default collision handler. It simply sets the speed of both entities to 0 along the event
+        direction.
+
+        Parameters
+        ----------
+        event: CollisionWithEntityEvent
+            The collision event fired.
+        """
+
+        direction = event.direction
+
+        axis = 0
+
+        if direction == Direction.DIRECTION_NORTH or direction == Direction.DIRECTION_SOUTH:
+            axis = 1
+
+        if event.entity.speed[axis] * event.other.speed[axis] <= 0:
+            event.entity.speed[axis] = 0
+            event.other.speed[axis] = 0
+        elif abs(event.entity.speed[axis]) >= abs(event.other.speed[axis]):
+            event.entity.speed[axis] = 0
+        else:
+            event.other.speed[axis] = 0
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "CollisionWithEntityEvent[tick=" + str(self.tick) + ", entity=" + str(self.entity) + ", " + \
+               "other=" + str(self.other) + ", direction=" + Direction.get_name(self.direction) + "]"
+
+
+class MovableSegment:
+    """
+    SAT util object used for 1D collisions.
+
+    This class is used to apply the Separating Axis Theorem. A moving AABB should have its bounds projected on both
+    plane axis as a movable segment. It allows to compute the time of impact or the time of separation of two objects.
+
+    Attributes
+    ----------
+    low: float
+        The lowest position of the segment.
+    high: float
+        The highest position of the segment.
+    speed: float
+        The speed of the segment.
+
+    Methods
+    -------
+    should_impact(other)
+        Returns whether or not the segments will impact.
+    should_separate(other)
+        Returns whether or not the segments will separate.
+    time_of_impact(other)
+        Computes the time at which the two segments will collide.
+    time_of_separation(other)
+        Computes the time at which the two segments will separate.
+    """
+
+    def __init__(self, low: float, high: float, speed: float = 0.0):
+        """
+        Initializes the MovableSegment.
+
+        Parameters
+        ----------
+        low: float
+            The lowest position of the segment.
+        high: float
+            The highest position of the segment.
+        speed: float, optional
+            The speed of the segment.
+        """
+
+        self.low = low
+        self.high = high
+        self.speed = speed
+
+    def __contains__(self, other: "MovableSegment") -> bool:
+        """
+        Returns the inner point test.
+
+        Tests if the specified segment is completely embedded in the main one.
+
+        Parameters
+        ----------
+        other: MovableSegment
+            The other movable segment with which the test is performed.
+
+        Returns
+        -------
+        result: bool
+            True if the tested segment is in the main segment and False otherwise.
+        """
+
+        return self.high >= other.low and self.low <= other.high
+
+    def __eq__(self, other: "MovableSegment") -> bool:
+        """
+        Returns the equality test.
+
+        Tests if the specified segment is strictly equals to the main one in terms of position and size.
+
+        Parameters
+        ----------
+        other: MovableSegment
+            The other movable segment with which the test is performed.
+
+        Returns
+        -------
+        result: bool
+            True if the tested segment is equal to the main segment and False otherwise.
+        """
+
+        return self.high == other.low or self.low == other.high
+
+    def should_impact(self, other: "MovableSegment") -> bool:
+        """
+        Returns whether or not the segments will impact.
+
+        Parameters
+        ----------
+        other: MovableSegment
+            The other segment with which the test is performed.
+
+        Returns
+        -------
+        result: bool
+            True if the tested segment should impact with the main one and False otherwise.
+        """
+
+        return self.high < other.low and self.speed > other.speed or self.low > other.high and self.speed < other.speed
+
+    def should_separate(self, other: "MovableSegment") -> bool:
+        """
+        Returns whether or not the segments will separate.
+
+        Parameters
+        ----------
+        other: MovableSegment
+            The other segment with which the test is performed.
+
+        Returns
+        -------
+        result: bool
+            True if the tested segment should separate from the main one and False otherwise.
+        """
+
+        return self.speed != other.speed
+
+    def time_of_impact(self, other: "MovableSegment") -> float:
+        """
+        Computes the time at which the two segments will collide.
+
+        This function should be called only if the segments will impact. It expresses the time of impact (TOI) between
+        the two segment in fraction of tick.
+
+        Parameters
+        ----------
+        other: MovableSegment
+            The other segment.
+
+        Returns
+        -------
+        time_of_impact: float
+            The time of impact expressed in a fraction of tick.
+        """
+
+        if self.speed == other.speed:
+            return -1
+
+        if self.high < other.low:
+            return (other.low - self.high) / (self.speed - other.speed)
+
+        return (self.low - other.high) / (other.speed - self.speed)
+
+    def time_of_separation(self, other: "MovableSegment") -> float:
+        """
+        Computes the time at which the two segments will separate.
+
+        This function should be called only if the segments will separate. It expresses the time of separation (TOS)
+        between the two segment in fraction of tick.
+
+        Parameters
+        ----------
+        other: MovableSegment
+            The other segment.
+
+        Returns
+        -------
+        time_of_impact: float
+            The time of separation expressed in a fraction of tick.
+        """
+
+        if self.speed > other.speed:
+            return (other.high - self.low) / (self.speed - other.speed)
+
+        return (self.high - other.low) / (other.speed - self.speed)
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "MovableSegment[low=" + str(self.low) + ", high=" + str(self.high) + ", speed=" + str(self.speed) + "]"
+
+
+class CollisionObject:
+    """
+    Standard collision object representation.
+
+    This object is used to create an abstract and logic pure representation of an entity. It uses the float
+    representation of the bounding boxes for better precision when the local time is non-zero. It is useful when the
+    entity are overridden by the user with inadequate data such as ctypes that cannot be used for parallelization. It
+    also holds the index of the entity for simpler list usage.
+
+    Attributes
+    ----------
+    index: int
+        The index of the object corresponding to the entity from the world object list.
+    bounding_box: AxisAlignedBoundingBox
+        The AABB of the entity in float representation.
+    bounding_box_expanded: AxisAlignedBoundingBox
+        The minimal AABB covering the amount space in which the object moves.
+    speed: numpy.ndarray
+        The speed vector of the entity expressed in unit per tick.
+    entity_type: type
+        The type of the entity used as collider type.
+    collides_with_tiles: bool
+        Enables the collision detection with tiles.
+    local_time: float
+        The local time of the object within the current tick. This should be between 0 and 1.
+
+    Methods
+    -------
+    should_collide_with(other)
+        Returns whether or not the collision object should collide with the other.
+    """
+
+    def __init__(self, index: int, entity: Entity, local_time: float):
+        """
+        Initializes the CollisionObject.
+
+        Parameters
+        ----------
+        index: int
+            The index of the object corresponding to the entity from the world object list.
+        entity: Entity
+            The entity from which the collision object representation is created.
+        local_time: float
+            The local time of the object within the current tick. This should be between 0 and 1.
+        """
+
+        self.index = index
+
+        self.bounding_box = entity.bounding_box.as_type(numpy.float32)
+        self.bounding_box_expanded = self.bounding_box.expand(entity.speed * (1 - local_time))
+        self.speed = entity.speed
+
+        self.entity_type = type(entity)
+        self._entity = entity
+
+        self.collides_with_tiles = entity.collides_with_tiles
+
+        self.local_time = local_time
+
+    def should_collide_with(self, other: "CollisionObject") -> bool:
+        """
+        Returns whether or not the collision object should collide with the other.
+
+        Parameters
+        ----------
+        other: CollisionObject
+            The other collision object with which the test is performed.
+        Returns
+        -------
+        result: bool
+            True if the object should collide with the other and False otherwise.
+        """
+
+        return self._entity.collision_mask & PhysicsObject.layer_of(other.entity_type) != 0
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "CollisionObject[index=" + str(self.index) + ", bounding_box=" + str(self.bounding_box) + ", " + \
+               "bounding_box_expanded=" + str(self.bounding_box_expanded) + ", speed=" + str(self.speed) + ", " + \
+               "entity_type=" + str(self.entity_type) + ", " + \
+               "collides_with_tiles=" + str(self.collides_with_tiles) + ", " + \
+               "colliders=" + str(self._entity.colliders) + ", local_time=" + str(self.local_time) + "]"
+
+
+class SharedBuffer:
+    """
+    Group of arrays stored in a single shared memory block.
+
+    The buffer is created by the main process and attached by name from the worker processes, which then read and write
+    the very same memory without any copy. The layout of the arrays has to be known by both sides.
+
+    The shared memory blocks require Python 3.8 or later.
+
+    Attributes
+    ----------
+    name: str
+        The name of the shared memory block.
+    arrays: list of numpy.ndarray
+        The arrays stored in the block, in the order of the layout.
+
+    Methods
+    -------
+    close()
+        Releases the arrays and detaches the block, the block is destroyed if it was created by this buffer.
+    """
+
+    ALIGNMENT = 8
+
+    def __init__(self, layout: tuple, name: str = None):
+        """
+        Initializes the SharedBuffer.
+
+        Parameters
+        ----------
+        layout: tuple of (tuple, str)
+            The shape and the data type of each array.
+        name: str, optional
+            The name of an existing block to attach. A new block is created if left to None.
+        """
+
+        offsets = []
+        size = 0
+
+        for shape, dtype in layout:
+            offsets.append(size)
+            size += -(-int(numpy.prod(shape)) * numpy.dtype(dtype).itemsize // SharedBuffer.ALIGNMENT) * \
+                SharedBuffer.ALIGNMENT
+
+        # The shared memory is only available from Python 3.8, it is imported here so that the package still loads on
+        # the older versions, where the multi-processing mode cannot be used
+        from multiprocessing.shared_memory import SharedMemory
+
+        self._owner = name is None
+
+        if self._owner:
+            self._shared_memory = SharedMemory(create=True, size=max(size, 1))
+        else:
+            self._shared_memory = SharedMemory(name=name)
+
+        self.name = self._shared_memory.name
+
+        self.arrays = [
+            numpy.ndarray(shape, dtype=dtype, buffer=self._shared_memory.buf, offset=offset)
+            for (shape, dtype), offset in zip(layout, offsets)
+        ]
+
+    def close(self) -> None:
+        """
+        Releases the arrays and detaches the block, the block is destroyed if it was created by this buffer.
+        """
+
+        if self._shared_memory is None:
+            return
+
+        self.arrays = []
+
+        try:
+            self._shared_memory.close()
+        except BufferError:
+            # Some views over the block are still alive, the mapping will be released along with them.
+            pass
+
+        if self._owner:
+            self._shared_memory.unlink()
+
+        self._shared_memory = None
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "SharedBuffer[name=" + str(self.name) + ", owner=" + str(self._owner) + "]"
+
+
+class CollisionFrame:
+    """
+    Column representation of the collision objects.
+
+    This object holds the float bounding boxes, the expanded bounding boxes, the speeds and the local times of a set of
+    entities as arrays indexed by the index of their collision object. The bounding boxes of the collision objects are
+    views over these arrays, hence the narrow phase can work on many pairs of objects at once. The frame keeps a copy of
+    the store data it was computed from, so that only the objects whose entity changed have to be updated. The arrays
+    can be allocated in a SharedBuffer, in which case worker processes can attach the frame by its name.
+
+    Attributes
+    ----------
+    positions: numpy.ndarray
+        The positions of the bounding boxes in float representation.
+    bounds: numpy.ndarray
+        The bounds of the bounding boxes in float representation.
+    positions_expanded: numpy.ndarray
+        The positions of the expanded bounding boxes.
+    bounds_expanded: numpy.ndarray
+        The bounds of the expanded bounding boxes.
+    speeds: numpy.ndarray
+        The speed vectors of the entities expressed in unit per tick.
+    local_times: numpy.ndarray
+        The local times of the entities within the current tick.
+    layers: numpy.ndarray
+        The bitmask of the collision layers of each entity, folded into PhysicsObject.MAX_COLLISION_LAYERS bits.
+    masks: numpy.ndarray
+        The bitmask of the collision layers with which each entity collides, folded the same way.
+    exact: tuple
+        The full masks and layers of the entities, given to the frames of the worker processes when the collision layers
+        overflow. None otherwise.
+    sleeping: numpy.ndarray
+        Whether each entity is sleeping with a zero speed, in which case it does not issue any event by itself.
+    static: numpy.ndarray
+        Whether each entity is a static body, in which case it does not issue any event by itself.
+    collision_objects: list of CollisionObject
+        The collision objects, the index of each object being its position in the list.
+    name: str
+        The name of the shared buffer holding the arrays, None if the frame is not shared.
+
+    Methods
+    -------
+    changed(store, rows)
+        Returns the indexes of the collision objects whose entity changed.
+    update(store, rows, indexes)
+        Updates the specified collision objects from the store.
+    classify()
+        Computes the collision layers of the entities and returns the indexes of those whose layer changed.
+    should_collide(colliders, collided)
+        Tells whether the entities of each pair should collide with each other.
+    exact_layers()
+        Returns the full masks and layers of the entities if the collision layers overflow.
+    attach(name, size)
+        Attaches a shared frame from a worker process.
+    close()
+        Releases the shared buffer of the frame.
+    """
+
+    def __init__(self, store: EntityStore, rows: numpy.ndarray, shared: bool = False):
+        """
+        Initializes the CollisionFrame.
+
+        Parameters
+        ----------
+        store: EntityStore
+            The store holding the entities.
+        rows: numpy.ndarray
+            The rows of the entities from which the collision objects are created.
+        shared: bool, optional
+            Allocates the arrays in a SharedBuffer if set to True.
+        """
+
+        layout = CollisionFrame._layout(len(rows))
+
+        if shared:
+            self._buffer = SharedBuffer(layout)
+            self._bind(self._buffer.arrays)
+        else:
+            self._buffer = None
+            self._bind([numpy.zeros(shape, dtype=dtype) for shape, dtype in layout])
+
+        self._layers_version = -1
+
+        self.exact = None
+
+        self._create_objects([store.entities[row] for row in rows])
+
+        self.update(store, rows, numpy.arange(len(rows)))
+        self.classify()
+
+    @staticmethod
+    def _layout(size: int) -> tuple:
+        """
+        Returns the layout of the arrays of a frame.
+
+        Parameters
+        ----------
+        size: int
+            The number of collision objects.
+
+        Returns
+        -------
+        layout: tuple of (tuple, str)
+            The shape and the data type of each array.
+        """
+
+        return (
+            ((size, 2), "float32"), ((size, 2), "float32"), ((size, 2), "float32"), ((size, 2), "float32"),
+            ((size, 2), "int32"), ((size,), "float64"), ((size,), "uint64"), ((size,), "uint64"), ((size,), "bool"),
+            ((size,), "bool"), ((size, 2), "int32"), ((size, 2), "int32"), ((size,), "bool")
+        )
+
+    def _bind(self, arrays: list) -> None:
+        """
+        Sets the arrays of the frame.
+
+        Parameters
+        ----------
+        arrays: list of numpy.ndarray
+            The arrays, in the order of the layout.
+        """
+
+        self.positions, self.bounds, self.positions_expanded, self.bounds_expanded, self.speeds, self.local_times, \
+            self.layers, self.masks, self.sleeping, self.static, self._positions, self._bounds, \
+            self._collides_with_tiles = arrays
+
+    def _create_objects(self, entities: list) -> None:
+        """
+        Creates the collision objects over the arrays of the frame.
+
+        Parameters
+        ----------
+        entities: list of Entity
+            The entity of each collision object, None in the worker processes.
+        """
+
+        self.collision_objects = []
+
+        for index, entity in enumerate(entities):
+            collision_object = CollisionObject.__new__(CollisionObject)
+
+            collision_object.index = index
+
+            collision_object.bounding_box = AxisAlignedBoundingBox._from_views(
+                self.positions[index], self.bounds[index], numpy.float32
+            )
+            collision_object.bounding_box_expanded = AxisAlignedBoundingBox._from_views(
+                self.positions_expanded[index], self.bounds_expanded[index], numpy.float32
+            )
+            collision_object.speed = self.speeds[index]
+
+            collision_object.entity_type = type(entity)
+            collision_object._entity = entity
+
+            self.collision_objects.append(collision_object)
+
+    def _synchronize(self, indexes: numpy.ndarray) -> None:
+        """
+        Copies the local times and the tile collision flags of the arrays into the collision objects.
+
+        Parameters
+        ----------
+        indexes: numpy.ndarray
+            The indexes of the collision objects to synchronize.
+        """
+
+        for index in indexes:
+            collision_object = self.collision_objects[index]
+
+            collision_object.collides_with_tiles = bool(self._collides_with_tiles[index])
+            collision_object.local_time = float(self.local_times[index])
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the shared buffer holding the arrays, None if the frame is not shared.
+        """
+
+        return self._buffer.name if self._buffer is not None else None
+
+    def changed(self, store: EntityStore, rows: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns the indexes of the collision objects whose entity changed.
+
+        An entity is considered as changed if its position, bounds, speed, local time, tile collision flag, collision
+        mask or sleep state differs from the one used to compute its collision object.
+
+        Parameters
+        ----------
+        store: EntityStore
+            The store holding the entities.
+        rows: numpy.ndarray
+            The rows of the entities, in the order used to create the frame.
+
+        Returns
+        -------
+        indexes: numpy.ndarray
+            The indexes of the collision objects to update.
+        """
+
+        changed = numpy.any(store.positions[rows] != self._positions, axis=1)
+        changed |= numpy.any(store.bounds[rows] != self._bounds, axis=1)
+        changed |= numpy.any(store.speeds[rows] != self.speeds, axis=1)
+        changed |= store.local_times[rows] != self.local_times
+        changed |= store.collides_with_tiles[rows] != self._collides_with_tiles
+        changed |= store.collision_masks[rows] != self.masks
+        changed |= (store.sleeping[rows] & ~numpy.any(store.speeds[rows], axis=1)) != self.sleeping
+
+        return numpy.flatnonzero(changed)
+
+    def update(self, store: EntityStore, rows: numpy.ndarray, indexes: numpy.ndarray) -> None:
+        """
+        Updates the specified collision objects from the store.
+
+        The arrays are updated in place, hence the bounding boxes of the collision objects stay valid views.
+
+        Parameters
+        ----------
+        store: EntityStore
+            The store holding the entities.
+        rows: numpy.ndarray
+            The rows of the entities, in the order used to create the frame.
+        indexes: numpy.ndarray
+            The indexes of the collision objects to update.
+        """
+
+        selected = rows[indexes]
+
+        self._positions[indexes] = store.positions[selected]
+        self._bounds[indexes] = store.bounds[selected]
+        self._collides_with_tiles[indexes] = store.collides_with_tiles[selected]
+
+        self.speeds[indexes] = store.speeds[selected]
+        self.local_times[indexes] = store.local_times[selected]
+        self.sleeping[indexes] = store.sleeping[selected] & ~numpy.any(self.speeds[indexes], axis=1)
+        self.static[indexes] = store.static[selected]
+        self.masks[indexes] = store.collision_masks[selected]
+
+        positions = self._positions[indexes].astype(numpy.float32)
+        bounds = self._bounds[indexes].astype(numpy.float32)
+
+        displacements = (self.speeds[indexes] * (1 - self.local_times[indexes])[:, None]).astype(numpy.float32)
+
+        self.positions[indexes] = positions
+        self.bounds[indexes] = bounds
+        self.positions_expanded[indexes] = positions + numpy.clip(displacements, a_min=None, a_max=0)
+        self.bounds_expanded[indexes] = bounds + numpy.abs(displacements)
+
+        self._synchronize(indexes)
+
+    def classify(self) -> numpy.ndarray:
+        """
+        Computes the collision layers of the entities.
+
+        The layers of an entity only depend on its type and on the registered layers, hence they are only computed when
+        the frame is created and after new layers were registered.
+
+        Returns
+        -------
+        indexes: numpy.ndarray
+            The indexes of the collision objects whose layer changed.
+        """
+
+        version = len(PhysicsObject._layer_bits)
+
+        if version == self._layers_version:
+            return numpy.zeros(0, dtype=numpy.int64)
+
+        self._layers_version = version
+
+        layers = numpy.array([
+            PhysicsObject.fold_layers(PhysicsObject.layer_of(collision_object.entity_type))
+            for collision_object in self.collision_objects
+        ], dtype=numpy.uint64)
+
+        indexes = numpy.flatnonzero(layers != self.layers)
+
+        self.layers[:] = layers
+
+        return indexes
+
+    def should_collide(self, colliders: numpy.ndarray, collided: numpy.ndarray) -> numpy.ndarray:
+        """
+        Tells whether the entities of each pair should collide with each other.
+
+        Both entities of a pair have to collide with the other one, that is the mask of each entity has to intersect
+        the layer of the other one. When the collision layers overflow, the pairs which only match through
+        PhysicsObject.OVERFLOW_LAYER are checked against the full masks and layers of the entities.
+
+        Parameters
+        ----------
+        colliders: numpy.ndarray
+            The indexes of the first collision object of each pair.
+        collided: numpy.ndarray
+            The indexes of the second collision object of each pair.
+
+        Returns
+        -------
+        valid: numpy.ndarray
+            Whether the entities of each pair should collide with each other.
+        """
+
+        forward = self.masks[colliders] & self.layers[collided]
+        backward = self.masks[collided] & self.layers[colliders]
+
+        valid = (forward != 0) & (backward != 0)
+
+        if self.exact is None and not PhysicsObject.layers_overflow():
+            return valid
+
+        overflow = numpy.uint64(PhysicsObject.OVERFLOW_LAYER)
+
+        ambiguous = numpy.flatnonzero(valid & ((forward == overflow) | (backward == overflow)))
+
+        if len(ambiguous) > 0:
+            masks, layers = self.exact if self.exact is not None else self.exact_layers()
+
+            for index in ambiguous:
+                collider, other = colliders[index], collided[index]
+
+                valid[index] = masks[collider] & layers[other] != 0 and masks[other] & layers[collider] != 0
+
+        return valid
+
+    def exact_layers(self) -> tuple:
+        """
+        Returns the full masks and layers of the entities if the collision layers overflow.
+
+        Returns
+        -------
+        exact: tuple of list
+            The full mask and the full layer of each entity, None if the collision layers do not overflow or if the
+            frame is attached from a worker process.
+        """
+
+        if self.exact is not None or not PhysicsObject.layers_overflow():
+            return self.exact
+
+        masks = [collision_object._entity.collision_mask for collision_object in self.collision_objects]
+        layers = [PhysicsObject.layer_of(collision_object.entity_type) for collision_object in self.collision_objects]
+
+        return masks, layers
+
+    @staticmethod
+    def attach(name: str, size: int) -> "CollisionFrame":
+        """
+        Attaches a shared frame from a worker process.
+
+        The collision objects of the attached frame are not linked to any entity, the layers and the masks have to be
+        used instead of the colliders of the entities.
+
+        Parameters
+        ----------
+        name: str
+            The name of the shared buffer of the frame.
+        size: int
+            The number of collision objects of the frame.
+
+        Returns
+        -------
+        frame: CollisionFrame
+            The attached frame.
+        """
+
+        frame = CollisionFrame.__new__(CollisionFrame)
+
+        frame._buffer = SharedBuffer(CollisionFrame._layout(size), name=name)
+        frame._bind(frame._buffer.arrays)
+
+        frame._layers_version = -1
+
+        frame.exact = None
+
+        frame._create_objects([None] * size)
+
+        return frame
+
+    def close(self) -> None:
+        """
+        Releases the shared buffer of the frame.
+
+        The frame should not be used anymore once closed. This has no effect if the frame is not shared.
+        """
+
+        if self._buffer is not None:
+            self.collision_objects = []
+            self._bind([None] * len(CollisionFrame._layout(0)))
+
+            self._buffer.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of collision objects.
+
+        Returns
+        -------
+        length: int
+            The number of collision objects.
+        """
+
+        return len(self.collision_objects)
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "CollisionFrame[size=" + str(len(self)) + ", name=" + str(self.name) + "]"
+
+
+class QuadTree:
+    """
+    Spatial partitioning for collision detection optimization.
+
+    This class holds the current object of the world with associated to the amount of space they move in. This is based
+    on a structure of quad tree for 2D space partitioning adapted for AABBs, and speeds up the detection of potential
+    collision pairs.
+
+    Methods
+    -------
+    insert(collision_object)
+        Inserts a new collision object in the tree.
+    remove(collision_object)
+        Removes a collision object from the tree.
+    intersect(bounds, results=None, unique=None)
+        Returns the list of object intersecting with the bounds.
+    """
+
+    DEFAULT_NODE_CAPACITY = 32
+    DEFAULT_MAX_DEPTH = 5
+
+    def __init__(self, bounds: AxisAlignedBoundingBox, node_capacity: int = DEFAULT_NODE_CAPACITY,
+                 max_depth: int = DEFAULT_MAX_DEPTH):
+        """
+        Initializes the QuadTree.
+
+        Parameters
+        ----------
+        bounds: AxisAlignedBoundingBox
+            The bounds of the leaf.
+        node_capacity: int, optional
+            The object capacity of the leaf before it divides into smaller leaves.
+        max_depth: int, optional
+            The maximum depth of the tree.
+        """
+
+        self._nodes = []
+        self._children = []
+
+        self._bounds = bounds
+        self._center = self._bounds.position + self._bounds.bounds / 2
+
+        self._max_items = node_capacity
+        self._max_depth = max_depth
+
+    def _split(self) -> None:
+        """
+        Divides the leaf into four sub leaves.
+
+        The leaf is divided in four other leaves of the same size (one for each corner). Each object of the leaf is
+        placed into the sub leaves if it is possible.
+        """
+
+        width_low = self._bounds.bounds[0] // 2
+        width_high = self._bounds.bounds[0] - width_low
+
+        height_low = self._bounds.bounds[1] // 2
+        height_high = self._bounds.bounds[1] - height_low
+
+        self._children.append(QuadTree(AxisAlignedBoundingBox(
+            self._bounds.position, (width_low, height_low)
+        ), node_capacity=self._max_items, max_depth=self._max_depth - 1))
+
+        self._children.append(QuadTree(AxisAlignedBoundingBox(
+            self._bounds.position + (0, height_low), (width_low, height_high)
+        ), node_capacity=self._max_items, max_depth=self._max_depth - 1))
+
+        self._children.append(QuadTree(AxisAlignedBoundingBox(
+            self._bounds.position + (width_low, height_low), (width_high, height_high)
+        ), node_capacity=self._max_items, max_depth=self._max_depth - 1))
+
+        self._children.append(QuadTree(AxisAlignedBoundingBox(
+            self._bounds.position + (width_low, 0), (width_high, height_low)
+        ), node_capacity=self._max_items, max_depth=self._max_depth - 1))
+
+        nodes = self._nodes
+
+        self._nodes = []
+
+        for node in nodes:
+            self._insert_into_children(node)
+
+    def _insert_into_children(self, collision_object: CollisionObject) -> None:
+        """
+        Inserts the node into one of the children.
+
+        Parameters
+        ----------
+        collision_object: CollisionObject
+            The object to insert in the tree.
+        """
+
+        if collision_object.bounding_box_expanded.inner_point(self._center):
+            self._nodes.append(collision_object)
+        else:
+            if collision_object.bounding_box_expanded.position[0] <= self._center[0]:
+                if collision_object.bounding_box_expanded.position[1] <= self._center[1]:
+                    self._children[0].insert(collision_object)
+                if collision_object.bounding_box_expanded.position[1] + \
+                        collision_object.bounding_box_expanded.bounds[1] >= self._center[1]:
+                    self._children[1].insert(collision_object)
+            if collision_object.bounding_box_expanded.position[0] + \
+                    collision_object.bounding_box_expanded.bounds[0] > self._center[0]:
+                if collision_object.bounding_box_expanded.position[1] <= self._center[1]:
+                    self._children[2].insert(collision_object)
+                if collision_object.bounding_box_expanded.position[1] + \
+                        collision_object.bounding_box_expanded.bounds[1] >= self._center[1]:
+                    self._children[3].insert(collision_object)
+
+    def insert(self, collision_object: CollisionObject) -> None:
+        """
+        Inserts a new collision object in the tree.
+
+        Tries to insert a new collision object. If the leaf is already split, the object will be inserted in the sub
+        leaves if it is possible.
+
+        Parameters
+        ----------
+        collision_object: CollisionObject
+            The object to insert in the tree.
+        """
+
+        if len(self._children) == 0:
+            self._nodes.append(collision_object)
+
+            if len(self._nodes) > self._max_items and self._max_depth > 0:
+                self._split()
+        else:
+            self._insert_into_children(collision_object)
+
+    def remove(self, collision_object: CollisionObject) -> None:
+        """
+        Removes a collision object from the tree.
+
+        The object is looked for in the leaves it was inserted into, hence its expanded bounding box should not have
+        been modified since its insertion. The leaves are not merged back after a removal.
+
+        Parameters
+        ----------
+        collision_object: CollisionObject
+            The object to remove from the tree.
+        """
+
+        bounding_box = collision_object.bounding_box_expanded
+
+        if len(self._children) == 0 or bounding_box.inner_point(self._center):
+            self._nodes = [node for node in self._nodes if node is not collision_object]
+        else:
+            if bounding_box.position[0] <= self._center[0]:
+                if bounding_box.position[1] <= self._center[1]:
+                    self._children[0].remove(collision_object)
+                if bounding_box.position[1] + bounding_box.bounds[1] >= self._center[1]:
+                    self._children[1].remove(collision_object)
+            if bounding_box.position[0] + bounding_box.bounds[0] > self._center[0]:
+                if bounding_box.position[1] <= self._center[1]:
+                    self._children[2].remove(collision_object)
+                if bounding_box.position[1] + bounding_box.bounds[1] >= self._center[1]:
+                    self._children[3].remove(collision_object)
+
+    def intersect(self, bounds: AxisAlignedBoundingBox, results: list = None, unique: set = None) -> list:
+        """
+        Returns the list of object intersecting with the bounds.
+
+        Parameters
+        ----------
+        bounds: AxisAlignedBoundingBox
+            The AABB of research.
+        results: list of CollisionObject, optional
+            The current result list. Leave it to None by default.
+        unique: set of indexes, optional
+            The current set of indexes of object in the result list.
+
+        Returns
+        -------
+        results: list of CollisionObject
+            The list of collision objects intersecting with the AABB.
+        """
+
+        if results is None:
+            results = []
+            unique = set()
+
+        if self._children:
+            if bounds.position[0] <= self._center[0]:
+                if bounds.position[1] <= self._center[1]:
+                    self._children[0].intersect(bounds, results, unique)
+                if bounds.position[1] + bounds.bounds[1] >= self._center[1]:
+                    self._children[1].intersect(bounds, results, unique)
+            if bounds.position[0] + bounds.bounds[0] >= self._center[0]:
+                if bounds.position[1] <= self._center[1]:
+                    self._children[2].intersect(bounds, results, unique)
+                if bounds.position[1] + bounds.bounds[1] >= self._center[1]:
+                    self._children[3].intersect(bounds, results, unique)
+
+        for node in self._nodes:
+            _id = node.index
+
+            if _id not in unique and bounds.intersects(node.bounding_box_expanded):
+                results.append(node)
+                unique.add(_id)
+
+        return results
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "QuadTree[bounding_box=" + str(self._bounds) + "]"
+
+
+class Broadphase:
+    """
+    Base class of the array based spatial partitionings.
+
+    The expanded bounding boxes of the collision objects are stored as lower and upper corners in flat arrays, indexed
+    by the index of the objects. The derived structures only have to select the candidate objects of a query, which
+    are then tested exactly against the searched bounds. The internal data are rebuilt lazily on the first query
+    following a modification.
+
+    Methods
+    -------
+    insert(collision_object)
+        Inserts a new collision object in the structure.
+    remove(collision_object)
+        Removes a collision object from the structure.
+    intersect(bounds)
+        Returns the list of object intersecting with the bounds.
+    """
+
+    DEFAULT_CAPACITY = 64
+
+    def __init__(self, bounds: AxisAlignedBoundingBox, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initializes the Broadphase.
+
+        Parameters
+        ----------
+        bounds: AxisAlignedBoundingBox
+            The area covered by the structure.
+        capacity: int, optional
+            The initial number of object slots. The structure grows automatically when it is full.
+        """
+
+        self._bounds = bounds
+
+        self._objects = []
+        self._lower = numpy.zeros((0, 2), dtype=numpy.float32)
+        self._upper = numpy.zeros((0, 2), dtype=numpy.float32)
+
+        self._grow(max(capacity, 1))
+
+        self._dirty = False
+        self._lock = Lock()
+
+    def _grow(self, capacity: int) -> None:
+        """
+        Extends the object slots to the specified capacity.
+
+        The slots that do not hold any object have infinite corners, so that they never match a query.
+
+        Parameters
+        ----------
+        capacity: int
+            The new number of object slots.
+        """
+
+        extension = capacity - len(self._objects)
+
+        self._objects.extend([None] * extension)
+
+        self._lower = numpy.concatenate((self._lower, numpy.full((extension, 2), numpy.inf, dtype=numpy.float32)))
+        self._upper = numpy.concatenate((self._upper, numpy.full((extension, 2), -numpy.inf, dtype=numpy.float32)))
+
+    def _rebuild(self) -> None:
+        """
+        Rebuilds the internal data of the structure after a modification.
+        """
+
+        raise NotImplementedError
+
+    def _candidates(self, lower: numpy.ndarray, upper: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns the indexes of the objects that may intersect with the searched bounds.
+
+        Parameters
+        ----------
+        lower: numpy.ndarray
+            The lower corner of the searched bounds.
+        upper: numpy.ndarray
+            The upper corner of the searched bounds.
+
+        Returns
+        -------
+        candidates: numpy.ndarray
+            The indexes of the candidate objects, without duplicates.
+        """
+
+        raise NotImplementedError
+
+    def insert(self, collision_object: CollisionObject) -> None:
+        """
+        Inserts a new collision object in the structure.
+
+        The objects are identified by their index, the expanded bounding box of the object is read at insertion.
+
+        Parameters
+        ----------
+        collision_object: CollisionObject
+            The object to insert in the structure.
+        """
+
+        index = collision_object.index
+
+        if index >= len(self._objects):
+            self._grow(max(2 * len(self._objects), index + 1))
+
+        self._objects[index] = collision_object
+
+        self._lower[index] = collision_object.bounding_box_expanded.position
+        self._upper[index] = collision_object.bounding_box_expanded.position + \
+            collision_object.bounding_box_expanded.bounds
+
+        self._dirty = True
+
+    def remove(self, collision_object: CollisionObject) -> None:
+        """
+        Removes a collision object from the structure.
+
+        Parameters
+        ----------
+        collision_object: CollisionObject
+            The object to remove from the structure.
+        """
+
+        index = collision_object.index
+
+        if index < len(self._objects) and self._objects[index] is collision_object:
+            self._objects[index] = None
+
+            self._lower[index] = numpy.inf
+            self._upper[index] = -numpy.inf
+
+            self._dirty = True
+
+    def intersect(self, bounds: AxisAlignedBoundingBox) -> list:
+        """
+        Returns the list of object intersecting with the bounds.
+
+        This function can safely be called from several threads at once.
+
+        Parameters
+        ----------
+        bounds: AxisAlignedBoundingBox
+            The AABB of research.
+
+        Returns
+        -------
+        results: list of CollisionObject
+            The list of collision objects intersecting with the AABB.
+        """
+
+        if self._dirty:
+            with self._lock:
+                if self._dirty:
+                    self._rebuild()
+                    self._dirty = False
+
+        lower = bounds.position
+        upper = bounds.position + bounds.bounds
+
+        candidates = self._candidates(lower, upper)
+
+        mask = numpy.all(self._upper[candidates] > lower, axis=1)
+        mask &= numpy.all(self._lower[candidates] < upper, axis=1)
+
+        return [self._objects[index] for index in candidates[mask]]
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "Broadphase[bounding_box=" + str(self._bounds) + "]"
+
+
+class SweepAndPrune(Broadphase):
+    """
+    Sort-based spatial partitioning for collision detection optimization.
+
+    This class is an alternative to the QuadTree, better suited for long and thin levels where the objects are gathered
+    along one axis. The expanded bounding boxes of the objects are sorted by their lower endpoint along the longest axis
+    of the bounds. A query only has to test the objects whose lower endpoint is below the upper endpoint of the searched
+    bounds. The sorted order is kept between the updates, since the objects only move a little from a tick to another
+    the order is nearly sorted and restoring it is close to linear.
+
+    Methods
+    -------
+    insert(collision_object)
+        Inserts a new collision object in the structure.
+    remove(collision_object)
+        Removes a collision object from the structure.
+    intersect(bounds)
+        Returns the list of object intersecting with the bounds.
+    """
+
+    def __init__(self, bounds: AxisAlignedBoundingBox, capacity: int = Broadphase.DEFAULT_CAPACITY):
+        """
+        Initializes the SweepAndPrune.
+
+        Parameters
+        ----------
+        bounds: AxisAlignedBoundingBox
+            The area covered by the structure, its longest axis is used as sweep axis.
+        capacity: int, optional
+            The initial number of object slots. The structure grows automatically when it is full.
+        """
+
+        self._axis = 0 if bounds.bounds[0] >= bounds.bounds[1] else 1
+
+        self._order = numpy.zeros(0, dtype=numpy.int64)
+        self._sorted_lower = numpy.zeros(0, dtype=numpy.float32)
+
+        super().__init__(bounds, capacity=capacity)
+
+    def _rebuild(self) -> None:
+        """
+        Restores the order of the objects along the sweep axis.
+
+        The previous order is used as starting point, the stable sort of numpy (timsort) runs in near linear time on
+        such nearly sorted data, just like an insertion sort would.
+        """
+
+        if len(self._order) < len(self._objects):
+            self._order = numpy.concatenate((self._order, numpy.arange(len(self._order), len(self._objects))))
+
+        keys = self._lower[self._order, self._axis]
+        permutation = numpy.argsort(keys, kind="stable")
+
+        self._order = self._order[permutation]
+        self._sorted_lower = keys[permutation]
+
+    def _candidates(self, lower: numpy.ndarray, upper: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns the indexes of the objects whose lower endpoint is below the upper endpoint of the searched bounds.
+
+        Parameters
+        ----------
+        lower: numpy.ndarray
+            The lower corner of the searched bounds.
+        upper: numpy.ndarray
+            The upper corner of the searched bounds.
+
+        Returns
+        -------
+        candidates: numpy.ndarray
+            The indexes of the candidate objects, without duplicates.
+        """
+
+        return self._order[:numpy.searchsorted(self._sorted_lower, upper[self._axis], side="left")]
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "SweepAndPrune[bounding_box=" + str(self._bounds) + ", axis=" + str(self._axis) + "]"
+
+
+class SpatialHash(Broadphase):
+    """
+    Uniform grid spatial partitioning for collision detection optimization.
+
+    The bounds are divided in square cells whose size is a multiple of the tile size. Each object is bucketed in every
+    cell covered by its expanded bounding box, the buckets being stored as flat arrays (the object indexes sorted by
+    cell and the offset of each cell). This is well suited for small objects moving a few units per tick, since a query
+    only reads the few cells covered by the searched bounds. The objects lying outside of the bounds are bucketed in the
+    border cells.
+
+    Methods
+    -------
+    insert(collision_object)
+        Inserts a new collision object in the structure.
+    remove(collision_object)
+        Removes a collision object from the structure.
+    intersect(bounds)
+        Returns the list of object intersecting with the bounds.
+    """
+
+    DEFAULT_CELL_TILES = 2
+
+    def __init__(self, bounds: AxisAlignedBoundingBox, cell_size: int, capacity: int = Broadphase.DEFAULT_CAPACITY):
+        """
+        Initializes the SpatialHash.
+
+        Parameters
+        ----------
+        bounds: AxisAlignedBoundingBox
+            The area covered by the grid.
+        cell_size: int
+            The size of the cells expressed in distance units.
+        capacity: int, optional
+            The initial number of object slots. The structure grows automatically when it is full.
+        """
+
+        self._cell_size = cell_size
+
+        self._origin = bounds.position.astype(numpy.float32)
+        self._shape = numpy.maximum(numpy.ceil(bounds.bounds / cell_size).astype(numpy.int64), 1)
+
+        self._cell_offsets = numpy.zeros(int(numpy.prod(self._shape)) + 1, dtype=numpy.int64)
+        self._cell_objects = numpy.zeros(0, dtype=numpy.int64)
+
+        super().__init__(bounds, capacity=capacity)
+
+    def _cells(self, corner: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns the coordinates of the cells containing the corners.
+
+        Parameters
+        ----------
+        corner: numpy.ndarray
+            The corners, either a single one or an array of corners.
+
+        Returns
+        -------
+        cells: numpy.ndarray
+            The coordinates of the cells, clipped to the grid.
+        """
+
+        return numpy.clip(
+            numpy.floor((corner - self._origin) / self._cell_size).astype(numpy.int64), 0, self._shape - 1
+        )
+
+    def _rebuild(self) -> None:
+        """
+        Buckets every object in the cells covered by its expanded bounding box.
+        """
+
+        indexes = numpy.flatnonzero(numpy.isfinite(self._lower[:, 0]))
+
+        lower = self._cells(self._lower[indexes])
+        upper = self._cells(self._upper[indexes])
+
+        heights = upper[:, 1] - lower[:, 1] + 1
+        counts = (upper[:, 0] - lower[:, 0] + 1) * heights
+
+        owners = numpy.repeat(numpy.arange(len(indexes)), counts)
+        offsets = numpy.arange(len(owners)) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+
+        cells_x = lower[owners, 0] + offsets // heights[owners]
+        cells_y = lower[owners, 1] + offsets % heights[owners]
+
+        keys = cells_x * self._shape[1] + cells_y
+        order = numpy.argsort(keys, kind="stable")
+
+        self._cell_objects = indexes[owners[order]]
+
+        self._cell_offsets[0] = 0
+        self._cell_offsets[1:] = numpy.cumsum(numpy.bincount(keys, minlength=len(self._cell_offsets) - 1))
+
+    def _candidates(self, lower: numpy.ndarray, upper: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns the indexes of the objects bucketed in the cells covered by the searched bounds.
+
+        Parameters
+        ----------
+        lower: numpy.ndarray
+            The lower corner of the searched bounds.
+        upper: numpy.ndarray
+            The upper corner of the searched bounds.
+
+        Returns
+        -------
+        candidates: numpy.ndarray
+            The indexes of the candidate objects, without duplicates.
+        """
+
+        cell_lower = self._cells(lower)
+        cell_upper = self._cells(upper)
+
+        columns = numpy.arange(cell_lower[0], cell_upper[0] + 1) * self._shape[1]
+
+        starts = self._cell_offsets[columns + cell_lower[1]]
+        stops = self._cell_offsets[columns + cell_upper[1] + 1]
+
+        if len(columns) == 1:
+            candidates = self._cell_objects[starts[0]:stops[0]]
+        else:
+            candidates = numpy.concatenate([self._cell_objects[x:y] for x, y in zip(starts, stops)])
+
+        return numpy.unique(candidates)
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        return "SpatialHash[bounding_box=" + str(self._bounds) + ", cell_size=" + str(self._cell_size) + "]"
+
+
+class CollisionPseudoEvent:
+    """
+    A generic object to represent the collision events.
+
+    Note that this object is not event, it merely serves as a placeholder. When multiple collision events occurs in the
+    same tick, the set of pseudo event can be reduced by order of importance and independence. Two event are independent
+    if their colliders set is disjoint. A event is more important than an other one if they are dependent and the time
+    of impact of the first event is lesser than the one of the latter. After being sorted and separated, the pseudo
+    events can be converted into standard collision event and being processed by the event queue.
+
+    Attributes
+    ----------
+    time_of_impact: float
+        The time of impact of the collision within the tick (between 0 and 1).
+    colliders: list of int
+        The indexes of the colliders, either the collision object index or the tile data.
+    collision_type: int
+        The type of collision, either collision vs tile or collision vs entity.
+    collision_direction: int
+        The direction of the collision relative to the first collider.
+    """
+
+    COLLISION_NONE = 0
+    COLLISION_TILE = 1
+    COLLISION_ENTITY = 2
+
+    def __init__(self, time_of_impact: float, colliders: tuple, collision_type: int, collision_direction: int):
+        """
+        Initializes the CollisionPseudoEvent.
+
+        Parameters
+        ----------
+        time_of_impact: float
+            The time of impact of the collision within the tick (between 0 and 1).
+        colliders: tuple of int
+            The indexes of the colliders, either the collision object index or the tile data.
+        collision_type: int
+            The type of collision, either collision vs tile or collision vs entity.
+        collision_direction: int
+            The direction of the collision relative to the first collider.
+        """
+
+        self.time_of_impact = time_of_impact
+        self.colliders = colliders
+        self.collision_type = collision_type
+        self.collision_direction = collision_direction
+
+    def __contains__(self, other: "CollisionPseudoEvent") -> bool:
+        """
+        Returns if the other event is less important and dependent.
+
+        Tests if the specified event is less important than the main while being dependent. It means that both events
+        have at least a common collider and that the time of impact of the tested event is greater than the one of the
+        latter.
+
+        Parameters
+        ----------
+        other: CollisionPseudoEvent
+            The other event with which the test is performed.
+
+        Returns
+        -------
+        result: bool
+            True if the tested event is less important and dependent and False otherwise.
+        """
+
+        if self.time_of_impact < other.time_of_impact:
+            if self.collision_type == CollisionPseudoEvent.COLLISION_TILE:
+                if other.collision_type == CollisionPseudoEvent.COLLISION_TILE:
+                    if self.colliders[0] == other.colliders[0]:
+                        return True
+                elif other.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
+                    if self.colliders[0] in other.colliders:
+                        return True
+            elif self.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
+                if other.collision_type == CollisionPseudoEvent.COLLISION_TILE:
+                    if other.colliders[0] in self.colliders:
+                        return True
+                elif other.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
+                    if self.colliders[0] in other.colliders or self.colliders[1] in other.colliders:
+                        return True
+
+        return False
+
+    def __eq__(self, other: "CollisionPseudoEvent") -> bool:
+        """
+        Returns if the events are equally important.
+
+        Tests if the specified event is as important as the main one while being dependent. It means that both events
+        have at least one common collider and their times of impact are equal.
+
+        Parameters
+        ----------
+        other: any
+            The other event with which the test is performed.
+
+        Returns
+        -------
+        result: bool
+            True if the tested event is as important and dependent and False otherwise.
+        """
+
+        if self.time_of_impact == other.time_of_impact:
+            if self.collision_type == CollisionPseudoEvent.COLLISION_TILE:
+                if other.collision_type == CollisionPseudoEvent.COLLISION_TILE:
+                    if self.colliders[0] == other.colliders[0]:
+                        return True
+                elif other.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
+                    if self.colliders[0] in other.colliders:
+                        return True
+            elif self.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
+                if other.collision_type == CollisionPseudoEvent.COLLISION_TILE:
+                    if other.colliders[0] in self.colliders:
+                        return True
+                elif other.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
+                    if self.colliders[0] in other.colliders or self.colliders[1] in other.colliders:
+                        return True
+
+        return False
+
+    def __hash__(self) -> int:
+        """
+        Returns the hash associated to the event.
+
+        Returns
+        -------
+        hash: int
+            The event hash.
+        """
+
+        return hash(self.colliders + (self.time_of_impact, self.collision_type, self.collision_type))
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
+
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
+
+        if self.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
+            return "CollisionPseudoEvent[time_of_impact=" + str(self.time_of_impact) + ", type=ENTITY, " + \
+                   "collider=" + str(self.colliders[0]) + ", collided=" + str(self.colliders[1]) + ", " + \
+                   "direction=" + Direction.get_name(self.collision_direction) + "]"
+        elif self.collision_type == CollisionPseudoEvent.COLLISION_TILE:
+            return "CollisionPseudoEvent[time_of_impact=" + str(self.time_of_impact) + ", type=TILE, " + \
+                   "collider=" + str(self.colliders[0]) + ", tile=" + str(self.colliders[1]) + ", " + \
+                   "position=[" + str(self.colliders[2]) + " " + str(self.colliders[3]) + "], " + \
+                   "direction=" + Direction.get_name(self.collision_direction) + "]"
+
+
+class WorldUpdater:
+    """
+    The collision processing core.
+
+    The world logic is done here. It contains the necessary functions to find the next collision events within the
+    current tick. Theses functions can be paralleled for better performance.
+
+    The tiles array can be memory-mapped (numpy.memmap), in which case it is never copied nor read as a whole after the
+    solidity bitmaps are built: only the pages of the tiles touched by the collision detection are loaded. Since it is
+    not compared to a snapshot, its modifications have to be reported with invalidate_tiles. When it maps its file
+    directly, the worker processes map the same file instead of receiving a copy.
+
+    The blocks of tiles modified by each version of the tiles are kept for the last TILES_HISTORY versions. Only the
+    entities overlapping the modified blocks are processed again, and the other consumers of the tiles (such as the
+    renderer) can fetch them with changed_tiles to update their own copies partially.
+
+    Attributes
+    ----------
+    tiles: numpy.ndarray
+        The tiles array of the level.
+    logic_area: AxisAlignedBoundingBox
+        The area over which the logic is performed.
+    logic_tile: bool
+        Enables the collision detection with tiles if set to True.
+    logic_entity: bool
+        Enables the collision detection with entities if set to True.
+    tiles_version: int
+        A counter incremented each time a change of the tiles is detected.
+    tiles_origin: numpy.ndarray
+        The position of the first tile of the tiles array within the level, expressed in tiles. The tile positions of
+        the events are expressed in the level.
+
+    Methods
+    -------
+    fetch_next_events(entities, local_times)
+        Returns the next collision events to fire.
+    fetch_next_store_events(store, rows)
+        Returns the next collision events to fire among the specified rows of an entity store.
+    has_solid_tile(area, direction)
+        Tells whether there is a solid tile within an area.
+    refresh_tiles()
+        Updates the solidity bitmaps of the tiles and their occupancy pyramid.
+    detect_tiles()
+        Finds the tiles modified in place since the previous detection, if the tiles are tracked.
+    invalidate_tiles(min_tile, max_tile)
+        Reports that the tiles of a block were modified.
+    changed_tiles(version)
+        Returns the blocks of tiles modified since a version of the tiles.
+    touches_tiles(positions, bounds, blocks)
+        Tells which boxes touch a block of tiles.
+    close()
+        Stops the worker threads and processes and releases the shared memory.
+    """
+
+    DEFAULT_ENTITY_PER_THREAD = 32
+    TASKS_PER_WORKER = 4
+    TILES_PER_STRIP = 1 << 20
+    TILES_HISTORY = 64
+
+    BROADPHASE_QUAD_TREE = 0
+    BROADPHASE_SWEEP_AND_PRUNE = 1
+    BROADPHASE_SPATIAL_HASH = 2
+
+    _worker_cache = {}
+
+    def __init__(self, tile_manager: TileManager, tiles: numpy.ndarray, logic_area: AxisAlignedBoundingBox = None,
+                 logic_tile: bool = True, logic_entity: bool = True, multi_threading: bool = True,
+                 entity_per_thread: int = DEFAULT_ENTITY_PER_THREAD,
+                 node_capacity: int = QuadTree.DEFAULT_NODE_CAPACITY, max_depth: int = QuadTree.DEFAULT_MAX_DEPTH,
+                 broadphase: int = BROADPHASE_QUAD_TREE, cell_tiles: int = SpatialHash.DEFAULT_CELL_TILES,
+                 multi_processing: bool = False, track_tiles: bool = True):
+        """
+        Initializes the WorldUpdater.
+
+        Parameters
+        ----------
+        tile_manager: TileManager
+            The tile manager containing the tile data.
+        tiles: numpy.ndarray
+            The tiles array of the level.
+        logic_area: AxisAlignedBoundingBox, optional
+            The area over which the logic is performed.
+        logic_tile: bool, optional
+            Enables the collision detection with the tiles if set to True.
+        logic_entity: bool, optional
+            Enables the collision detection with the entities is set to True.
+        multi_threading: bool, optional
+            Enables the multi-threading mode if set to True.
+        entity_per_thread: int, optional
+            The minimal number of entities processed by each worker task. The entities are split in more tasks than
+            workers for load balancing, but never in smaller tasks than this.
+        node_capacity: int, optional
+            The object capacity of the leaf before it divides into smaller leaves.
+        max_depth: int, optional
+            The maximum depth of the tree.
+        broadphase: int, optional
+            The spatial partitioning used to find the candidate pairs, either BROADPHASE_QUAD_TREE,
+            BROADPHASE_SWEEP_AND_PRUNE or BROADPHASE_SPATIAL_HASH.
+        cell_tiles: int, optional
+            The size of the cells of the spatial hash expressed in tiles.
+        multi_processing: bool, optional
+            Runs the collision detection in worker processes sharing the entity data through shared memory if set to
+            True (requires Python 3.8). This takes precedence over the multi-threading mode.
+        track_tiles: bool, optional
+            Keeps a snapshot of the tiles, compared to the tiles array by detect_tiles to find the modifications done in
+            place, if set to True. Otherwise, which is meant for large or streamed levels, the modifications have to be
+            reported with invalidate_tiles. A memory-mapped tiles array is never compared to a snapshot.
+
+        Raises
+        ------
+        ValueError
+            If the broadphase is unknown.
+        """
+
+        if broadphase not in (WorldUpdater.BROADPHASE_QUAD_TREE, WorldUpdater.BROADPHASE_SWEEP_AND_PRUNE,
+                              WorldUpdater.BROADPHASE_SPATIAL_HASH):
+            raise ValueError("Unknown broadphase: " + str(broadphase) + ".")
+
+        self._tile_manager = tile_manager
+        self.tiles = tiles
+
+        if logic_area is None:
+            logic_area = AxisAlignedBoundingBox((0, 0), numpy.array(tiles.shape) * tile_manager.tile_size)
+
+        self.logic_area = logic_area
+
+        self.logic_tile = logic_tile
+        self.logic_entity = logic_entity
+
+        self._multi_threading = multi_threading
+        self._entity_per_thread = entity_per_thread
+
+        self._node_capacity = node_capacity
+        self._max_depth = max_depth
+
+        self._broadphase = broadphase
+        self._cell_tiles = cell_tiles
+
+        self._multi_processing = multi_processing
+
+        self._frame = None
+        self._tree = None
+        self._frame_key = None
+        self._frame_rows = None
+
+        self._static_tree = None
+        self._static_objects = {}
+        self._static_key = None
+        self._static_version = 0
+
+        self._workers = cpu_count() or 1
+
+        self._events = []
+        self._events_key = None
+
+        self._solidity = None
+        self._solidity_source = None
+        self._solidity_origin = None
+        self._occupancy = None
+        self._invalid_tiles = []
+        self._tiles_snapshot = None
+        self._detected_tiles = []
+        self._track_tiles = track_tiles
+        self._tiles_changes = []
+        self._events_tiles_version = None
+
+        self.tiles_version = 0
+        self._solidity_version = -1
+
+        self.tiles_origin = numpy.zeros(2, dtype=numpy.int64)
+
+        self._thread_pool = None
+        self._pool = None
+        self._round = 0
+        self._shared_tiles = None
+        self._shared_tiles_key = None
+        self._shared_tiles_stale = True
+
+    def fetch_next_events(self, entities: list, local_times: list) -> list:
+        """
+        Returns the next collision events to fire.
+
+        Finds the next maximal independent events to fire. It means that multiple collision events can be solved in a
+        single tick as long as they are independent from each other. This functions uses multiple threads if the
+        multi-threading mode is enabled.
+
+        Parameters
+        ----------
+        entities: list of Entity
+            The list of entities of the world.
+        local_times: list of float
+            The corresponding of local time for each entities.
+
+        Returns
+        -------
+        events: list of CollisionPseudoEvent
+            The list of independent events to fire.
+        """
+
+        store = EntityStore.gather(entities, local_times)
+
+        return self.fetch_next_store_events(store, numpy.arange(len(entities)))
+
+    def fetch_next_store_events(self, store: EntityStore, rows: numpy.ndarray) -> list:
+        """
+        Returns the next collision events to fire among the specified rows of an entity store.
+
+        This works as fetch_next_events, but reads the entity data directly from the columns of the store, using the
+        local times stored in the store. The colliders of the returned events are positions in the rows array. The
+        potential event of each entity is cached between the calls: only the entities whose data changed since the
+        previous call, and the entities overlapping them, are processed again. The sleeping and the static entities are
+        never processed, their pairs with the moving entities belong to the latter.
+
+        Parameters
+        ----------
+        store: EntityStore
+            The store holding the entities of the world.
+        rows: numpy.ndarray
+            The rows of the entities over which the collision detection is done.
+
+        Returns
+        -------
+        events: list of CollisionPseudoEvent
+            The list of independent events to fire.
+        """
+
+        frame, tree, static_tree, dirty = self._fetch_broadphase(store, rows)
+
+        self.refresh_tiles()
+
+        key = (self.logic_tile, self.logic_entity)
+        blocks = self.changed_tiles(self._events_tiles_version)
+
+        self._events_tiles_version = self.tiles_version
+
+        if key != self._events_key or blocks is None:
+            self._events_key = key
+
+            dirty = None
+        elif dirty is not None and len(blocks) > 0:
+            touching = self.touches_tiles(frame.positions_expanded, frame.bounds_expanded, blocks)
+
+            dirty = numpy.union1d(dirty, numpy.flatnonzero(touching))
+
+        if dirty is None:
+            self._events = [None] * len(frame)
+            dirty = numpy.arange(len(frame))
+
+        passive = frame.sleeping[dirty] | frame.static[dirty]
+
+        for index in dirty[passive]:
+            self._events[index] = None
+
+        targets = dirty[~passive]
+
+        collision_objects = [frame.collision_objects[index] for index in targets]
+
+        chunks = self._split(len(collision_objects)) if self._multi_processing or self._multi_threading else []
+
+        if len(chunks) <= 1:
+            results = self._process_collision_events(collision_objects, tree, static_tree, frame)
+        elif self._multi_processing:
+            results = self._process_in_workers(frame, [targets[start:stop] for start, stop in chunks])
+        else:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPool(processes=self._workers)
+
+            splits = [collision_objects[start:stop] for start, stop in chunks]
+
+            results = self._thread_pool.starmap(
+                self._process_collision_events, zip(splits, repeat(tree), repeat(static_tree), repeat(frame))
+            )
+
+            results = [y for x in results for y in x]
+
+        for index, event in zip(targets, results):
+            self._events[index] = event
+
+        return WorldUpdater._select_independent_events([event for event in self._events if event is not None])
+
+    def has_solid_tile(self, area: AxisAlignedBoundingBox, direction: int = Direction.DIRECTION_NONE) -> bool:
+        """
+        Tells whether there is a solid tile within an area.
+
+        The query goes through the occupancy pyramid of the level, so large empty areas are skipped at once.
+
+        Parameters
+        ----------
+        area: AxisAlignedBoundingBox
+            The area to check, expressed in distance units.
+        direction: int, optional
+            The direction in which the tiles have to be solid, any direction if set to Direction.DIRECTION_NONE.
+
+        Returns
+        -------
+        solid: bool
+            True if any tile overlapped by the area is solid in the direction.
+        """
+
+        self.refresh_tiles()
+
+        tile_size = self._tile_manager.tile_size
+
+        min_tile = numpy.floor(area.position / tile_size).astype(numpy.int64) - self.tiles_origin
+        max_tile = numpy.ceil((area.position + area.bounds) / tile_size).astype(numpy.int64) - 1 - self.tiles_origin
+
+        return self._occupancy.any(direction, min_tile, max_tile)
+
+    @staticmethod
+    def _select_independent_events(events: list) -> list:
+        """
+        Selects the maximal independent events.
+
+        An event is kept if no other event sharing one of its entities happens strictly before it. Among the kept events
+        sharing an entity (which then have the same time of impact), only the first one of the list is selected. The
+        smallest time of impact of each entity is indexed first, then the entities of the selected events are claimed,
+        hence the selection runs in linear time.
+
+        Parameters
+        ----------
+        events: list of CollisionPseudoEvent
+            The list of potential events.
+
+        Returns
+        -------
+        events: list of CollisionPseudoEvent
+            The list of independent events to fire, in the order of the potential events.
+        """
+
+        keys = [event.colliders[:2] if event.collision_type == CollisionPseudoEvent.COLLISION_ENTITY else
+                event.colliders[:1] for event in events]
+
+        times_of_impact = {}
+
+        for event, colliders in zip(events, keys):
+            for collider in colliders:
+                if collider not in times_of_impact or event.time_of_impact < times_of_impact[collider]:
+                    times_of_impact[collider] = event.time_of_impact
+
+        claimed = set()
+        next_events = []
+
+        for event, colliders in zip(events, keys):
+            if any(event.time_of_impact > times_of_impact[collider] or collider in claimed for collider in colliders):
+                continue
+
+            claimed.update(colliders)
+            next_events.append(event)
+
+        return next_events
+
+    def _fetch_broadphase(self, store: EntityStore, rows: numpy.ndarray) -> \
+            (CollisionFrame, [QuadTree, Broadphase], [QuadTree, Broadphase], numpy.ndarray):
+        """
+        Returns the collision frame and the spatial partitionings of the entities.
+
+        The frame and the trees are kept between the calls. As long as the same rows of the same store are used, only
+        the collision objects whose entity moved, changed its speed, colliders or advanced in time are updated and moved
+        in the trees. Otherwise, the frame and the tree of the dynamic entities are rebuilt from scratch, while the tree
+        of the static entities is only rebuilt if they changed. The potential events of the updated objects, and of the
+        dynamic objects overlapping them before or after the update, have to be computed again. This includes the
+        objects whose collision mask or layer changed.
+
+        Parameters
+        ----------
+        store: EntityStore
+            The store holding the entities of the world.
+        rows: numpy.ndarray
+            The rows of the entities over which the collision detection is done.
+
+        Returns
+        -------
+        frame: CollisionFrame
+            The collision frame of the entities.
+        tree: [QuadTree, Broadphase]
+            The spatial partitioning holding the dynamic collision objects of the frame.
+        static_tree: [QuadTree, Broadphase]
+            The spatial partitioning holding the static collision objects of the frame.
+        dirty: numpy.ndarray
+            The sorted indexes of the collision objects whose potential event may have changed, None if the structures
+            were rebuilt.
+        """
+
+        key = (store, store.version, tuple(self.logic_area.position), tuple(self.logic_area.bounds))
+
+        if self._frame is None or key != self._frame_key or not numpy.array_equal(rows, self._frame_rows):
+            self._release_frame()
+
+            self._frame = CollisionFrame(store, rows, shared=self._multi_processing)
+            self._tree = self._create_tree(
+                [self._frame.collision_objects[index] for index in numpy.flatnonzero(~self._frame.static)]
+            )
+
+            self._index_static_objects(self._frame, rows)
+
+            self._frame_key = key
+            self._frame_rows = rows.copy()
+
+            return self._frame, self._tree, self._static_tree, None
+
+        indexes = self._frame.changed(store, rows)
+
+        static = self._frame.static[indexes]
+        dynamic = indexes[~static]
+
+        dirty = set(dynamic.tolist())
+
+        for index in dynamic:
+            collision_object = self._frame.collision_objects[index]
+
+            dirty.update(other.index for other in self._tree.intersect(collision_object.bounding_box_expanded))
+
+            self._tree.remove(collision_object)
+
+        self._frame.update(store, rows, indexes)
+
+        for index in dynamic:
+            collision_object = self._frame.collision_objects[index]
+
+            self._tree.insert(collision_object)
+
+            dirty.update(other.index for other in self._tree.intersect(collision_object.bounding_box_expanded))
+
+        moved = False
+
+        # A static object never issues any event by itself, only the events of the dynamic objects overlapping it may
+        # have changed, and it only has to be moved in its tree if its bounding box changed
+        for index in indexes[static]:
+            collision_object = self._frame.collision_objects[index]
+            detached = self._static_objects[index]
+
+            dirty.update(other.index for other in self._tree.intersect(detached.bounding_box_expanded))
+
+            if numpy.array_equal(collision_object.bounding_box.position, detached.bounding_box_expanded.position) and \
+                    numpy.array_equal(collision_object.bounding_box.bounds, detached.bounding_box_expanded.bounds):
+                continue
+
+            self._static_tree.remove(detached)
+
+            detached = self._static_objects[index] = WorldUpdater._detach(collision_object)
+
+            self._static_tree.insert(detached)
+
+            dirty.update(other.index for other in self._tree.intersect(detached.bounding_box_expanded))
+
+            moved = True
+
+        if moved:
+            self._static_key = self._static_objects_key(self._frame, rows)
+            self._static_version += 1
+
+        for index in self._frame.classify():
+            collision_object = self._frame.collision_objects[index]
+
+            dirty.add(int(index))
+            dirty.update(other.index for other in self._tree.intersect(collision_object.bounding_box_expanded))
+
+        return self._frame, self._tree, self._static_tree, numpy.array(sorted(dirty), dtype=numpy.int64)
+
+    def _index_static_objects(self, frame: CollisionFrame, rows: numpy.ndarray) -> None:
+        """
+        Builds the spatial partitioning of the static collision objects of a new frame.
+
+        The static objects are detached from the frame, so the tree survives the rebuilds of the frame. It is only
+        rebuilt if the static objects, their indexes or the logic area changed since it was built.
+
+        Parameters
+        ----------
+        frame: CollisionFrame
+            The new collision frame.
+        rows: numpy.ndarray
+            The rows of the entities, in the order used to create the frame.
+        """
+
+        key = self._static_objects_key(frame, rows)
+
+        if self._static_key is not None and all(
+            numpy.array_equal(array, other) for array, other in zip(key, self._static_key)
+        ):
+            return
+
+        self._static_objects = {
+            int(index): WorldUpdater._detach(frame.collision_objects[index])
+            for index in numpy.flatnonzero(frame.static)
+        }
+
+        self._static_tree = self._create_tree(list(self._static_objects.values()))
+
+        self._static_key = key
+        self._static_version += 1
+
+    def _static_objects_key(self, frame: CollisionFrame, rows: numpy.ndarray) -> tuple:
+        """
+        Returns the data identifying the static collision objects of a frame.
+
+        Parameters
+        ----------
+        frame: CollisionFrame
+            The collision frame.
+        rows: numpy.ndarray
+            The rows of the entities, in the order used to create the frame.
+
+        Returns
+        -------
+        key: tuple of numpy.ndarray
+            The logic area, the indexes, the rows and the bounding boxes of the static objects.
+        """
+
+        indexes = numpy.flatnonzero(frame.static)
+
+        return (
+            numpy.concatenate((self.logic_area.position, self.logic_area.bounds)), indexes, rows[indexes],
+            frame.positions[indexes], frame.bounds[indexes]
+        )
+
+    @staticmethod
+    def _detach(collision_object: CollisionObject) -> CollisionObject:
+        """
+        Returns a copy of a collision object which does not depend on the arrays of its frame.
+
+        Only the index and the expanded bounding box are copied, which is all the spatial partitionings need.
+
+        Parameters
+        ----------
+        collision_object: CollisionObject
+            The collision object to copy.
+
+        Returns
+        -------
+        copy: CollisionObject
+            The detached collision object.
+        """
+
+        copy = CollisionObject.__new__(CollisionObject)
+
+        copy.index = collision_object.index
+        copy.bounding_box_expanded = collision_object.bounding_box_expanded.copy()
+
+        return copy
+
+    def _split(self, size: int) -> list:
+        """
+        Splits the collision objects into the ranges processed by the worker tasks.
+
+        The number of tasks adapts to the number of objects: a few tasks per worker for load balancing, as long as each
+        task holds at least entity_per_thread objects.
+
+        Parameters
+        ----------
+        size: int
+            The number of collision objects.
+
+        Returns
+        -------
+        chunks: list of (int, int)
+            The first and the last index (excluded) of each range.
+        """
+
+        chunk = max(self._entity_per_thread, -(-size // (self._workers * WorldUpdater.TASKS_PER_WORKER)), 1)
+
+        return [(start, min(start + chunk, size)) for start in range(0, size, chunk)]
+
+    def _create_tree(self, collision_objects: list) -> [QuadTree, Broadphase]:
+        """
+        Creates a spatial partitioning holding collision objects.
+
+        Parameters
+        ----------
+        collision_objects: list of CollisionObject
+            The collision objects to insert.
+
+        Returns
+        -------
+        tree: [QuadTree, Broadphase]
+            The spatial partitioning selected by the broadphase option.
+        """
+
+        capacity = max((collision_object.index for collision_object in collision_objects), default=0) + 1
+
+        if self._broadphase == WorldUpdater.BROADPHASE_SWEEP_AND_PRUNE:
+            tree = SweepAndPrune(self.logic_area, capacity=capacity)
+        elif self._broadphase == WorldUpdater.BROADPHASE_SPATIAL_HASH:
+            tree = SpatialHash(self.logic_area, self._cell_tiles * self._tile_manager.tile_size, capacity=capacity)
+        else:
+            tree = QuadTree(self.logic_area, node_capacity=self._node_capacity, max_depth=self._max_depth)
+
+        for collision_object in collision_objects:
+            tree.insert(collision_object)
+
+        return tree
+
+    def _release_frame(self) -> None:
+        """
+        Drops the current collision frame and its spatial partitioning.
+        """
+
+        if self._frame is not None:
+            self._tree = None
+            self._frame.close()
+
+        self._frame = None
+        self._frame_key = None
+        self._frame_rows = None
+
+    def refresh_tiles(self) -> bool:
+        """
+        Updates the solidity bitmaps of the tiles and their occupancy pyramid.
+
+        The bitmaps are fully rebuilt when the tiles array is replaced, or when its origin or the registered tiles
+        change. Otherwise, only the blocks reported by invalidate_tiles and the tiles found by detect_tiles are updated,
+        hence this never reads the whole tiles array unless it is rebuilt.
+
+        Returns
+        -------
+        changed: bool
+            True if the tiles changed since the previous call.
+        """
+
+        if self.tiles is not self._solidity_source or self._solidity_version != self._tile_manager.version or \
+                not numpy.array_equal(self._solidity_origin, self.tiles_origin):
+            self._build_solidity()
+
+            blocks = None
+        else:
+            blocks = self._invalid_tiles
+
+            for min_tile, max_tile in self._invalid_tiles:
+                range_x = slice(min_tile[0], max_tile[0] + 1)
+                range_y = slice(min_tile[1], max_tile[1] + 1)
+
+                self._solidity[:, range_x, range_y] = self._tile_manager.solidity(self.tiles[range_x, range_y])
+                self._occupancy.update_block(min_tile, max_tile)
+
+                if self._tiles_snapshot is not None:
+                    self._tiles_snapshot[range_x, range_y] = self.tiles[range_x, range_y]
+
+            self._invalid_tiles = []
+
+            for x, y in self._detected_tiles:
+                self._solidity[:, x, y] = self._tile_manager.solidity(self.tiles[x, y])
+                self._occupancy.update(x, y)
+
+                blocks.append(((int(x.min()), int(y.min())), (int(x.max()), int(y.max()))))
+
+            self._detected_tiles = []
+
+            if len(blocks) == 0:
+                return False
+
+        self.tiles_version += 1
+        self._shared_tiles_stale = True
+
+        self._tiles_changes.append((self.tiles_version, blocks))
+        del self._tiles_changes[:-WorldUpdater.TILES_HISTORY]
+
+        return True
+
+    def detect_tiles(self) -> None:
+        """
+        Finds the tiles modified in place since the previous detection, if the tiles are tracked.
+
+        The tiles array is compared to a snapshot, and the changed tiles are updated by the next refresh. This reads the
+        whole tiles array, hence it is meant to be called once per tick. Nothing is done if the tiles are not tracked or
+        if the tiles array is about to be rebuilt.
+        """
+
+        if self._tiles_snapshot is None or self.tiles is not self._solidity_source:
+            return
+
+        changed = self._tiles_snapshot != self.tiles
+
+        # Only the rows holding a change are scanned for the positions of the changed tiles
+        rows = numpy.flatnonzero(changed.any(axis=1))
+
+        if len(rows) == 0:
+            return
+
+        x, y = numpy.nonzero(changed[rows])
+        x = rows[x]
+
+        self._tiles_snapshot[x, y] = self.tiles[x, y]
+        self._detected_tiles.append((x, y))
+
+    def _build_solidity(self) -> None:
+        """
+        Builds the solidity bitmaps of the whole tiles array and their occupancy pyramid.
+
+        The tiles are read by strips of TILES_PER_STRIP tiles, so that no temporary array as large as the level is
+        allocated. The tiles array is only copied as a snapshot if its modifications are tracked, a memory-mapped one
+        never is.
+        """
+
+        tiles = self.tiles
+
+        self._solidity = numpy.empty((4,) + tiles.shape, dtype=bool)
+
+        step = max(WorldUpdater.TILES_PER_STRIP // max(tiles.shape[1], 1), 1)
+
+        for start in range(0, tiles.shape[0], step):
+            self._solidity[:, start:start + step] = self._tile_manager.solidity(tiles[start:start + step])
+
+        self._solidity_source = tiles
+        self._tiles_snapshot = tiles.copy() if self._track_tiles and not isinstance(tiles, numpy.memmap) else None
+        self._solidity_origin = self.tiles_origin.copy()
+        self._solidity_version = self._tile_manager.version
+        self._occupancy = TileOccupancy(self._solidity)
+        self._invalid_tiles = []
+        self._detected_tiles = []
+
+    def invalidate_tiles(self, min_tile: tuple, max_tile: tuple) -> None:
+        """
+        Reports that the tiles of a block were modified.
+
+        The solidity bitmaps of the block are updated by the next refresh. This is required for the modifications done
+        in place on a memory-mapped tiles array, which is not compared to a snapshot.
+
+        Parameters
+        ----------
+        min_tile: tuple of int
+            The position of the first tile of the block within the tiles array.
+        max_tile: tuple of int
+            The position of the last tile of the block within the tiles array (included).
+        """
+
+        min_x, min_y = max(int(min_tile[0]), 0), max(int(min_tile[1]), 0)
+        max_x, max_y = min(int(max_tile[0]), self.tiles.shape[0] - 1), min(int(max_tile[1]), self.tiles.shape[1] - 1)
+
+        if min_x <= max_x and min_y <= max_y:
+            self._invalid_tiles.append(((min_x, min_y), (max_x, max_y)))
+
+    def changed_tiles(self, version: int) -> list:
+        """
+        Returns the blocks of tiles modified since a version of the tiles.
+
+        Parameters
+        ----------
+        version: int
+            The version of the tiles, as read from tiles_version.
+
+        Returns
+        -------
+        blocks: list of tuple
+            The positions of the first and the last tiles (included) of each modified block, within the tiles array.
+            None if the tiles have been fully rebuilt since the version, or if the version is too old.
+        """
+
+        if version == self.tiles_version:
+            return []
+
+        if version is None or not self._tiles_changes or self._tiles_changes[0][0] > version + 1:
+            return None
+
+        blocks = []
+
+        for change_version, change in self._tiles_changes:
+            if change_version > version:
+                if change is None:
+                    return None
+
+                blocks.extend(change)
+
+        return blocks
+
+    def touches_tiles(self, positions: numpy.ndarray, bounds: numpy.ndarray, blocks: list) -> numpy.ndarray:
+        """
+        Tells which boxes touch a block of tiles.
+
+        A box touches a block if it overlaps it or the tiles bordering it, so that the boxes resting against a block are
+        included.
+
+        Parameters
+        ----------
+        positions: numpy.ndarray
+            The positions of the boxes, of shape (n, 2).
+        bounds: numpy.ndarray
+            The sizes of the boxes, of shape (n, 2).
+        blocks: list of tuple
+            The positions of the first and the last tiles (included) of each block, within the tiles array.
+
+        Returns
+        -------
+        touching: numpy.ndarray
+            Whether each box touches any of the blocks.
+        """
+
+        tile_size = self._tile_manager.tile_size
+
+        touching = numpy.zeros(len(positions), dtype=bool)
+
+        for min_tile, max_tile in blocks:
+            lower = (numpy.array(min_tile) + self.tiles_origin - 1) * tile_size
+            upper = (numpy.array(max_tile) + self.tiles_origin + 2) * tile_size
+
+            touching |= numpy.all((positions <= upper) & (positions + bounds >= lower), axis=1)
+
+        return touching
+
+    def _tiles_file(self) -> tuple:
+        """
+        Returns the description of the file mapped by the tiles array, if the worker processes can map it as well.
+
+        The tiles array has to map its file directly and share its modifications with the file. A view of a mapping or
+        a copy-on-write mapping is copied into the shared memory instead.
+
+        Returns
+        -------
+        file: tuple
+            The file name, the offset, the shape, the data type and the order of the tiles array, None if the workers
+            cannot map it.
+        """
+
+        tiles = self.tiles
+
+        if not isinstance(tiles, numpy.memmap) or not isinstance(tiles.base, mmap) or tiles.filename is None or \
+                tiles.mode == "c":
+            return None
+
+        order = "F" if tiles.flags.f_contiguous and not tiles.flags.c_contiguous else "C"
+
+        return tiles.filename, tiles.offset, tiles.shape, tiles.dtype.str, order
+
+    def _share_tiles(self) -> str:
+        """
+        Copies the tiles, their solidity bitmaps and their occupancy pyramid into a shared buffer readable by the worker
+        processes.
+
+        The tiles are not copied if the workers can map their file.
+
+        Returns
+        -------
+        name: str
+            The name of the shared buffer.
+        """
+
+        key = (self.tiles.shape, self.tiles.dtype.str, self._tiles_file())
+
+        if self._shared_tiles is None or self._shared_tiles_key != key:
+            if self._shared_tiles is not None:
+                self._shared_tiles.close()
+
+            self._shared_tiles = SharedBuffer(
+                WorldUpdater._tiles_layout(self.tiles.shape, self.tiles.dtype.str, key[2] is None)
+            )
+            self._shared_tiles_key = key
+            self._shared_tiles_stale = True
+
+        if self._shared_tiles_stale:
+            if key[2] is None:
+                self._shared_tiles.arrays[0][...] = self.tiles
+
+            for shared, level in zip(self._shared_tiles.arrays[1:], self._occupancy.levels):
+                shared[...] = level
+
+            self._shared_tiles_stale = False
+
+        return self._shared_tiles.name
+
+    @staticmethod
+    def _tiles_layout(shape: tuple, dtype: str, stored: bool = True) -> tuple:
+        """
+        Returns the layout of the shared buffer of the tiles.
+
+        Parameters
+        ----------
+        shape: tuple of int
+            The shape of the tiles array.
+        dtype: str
+            The data type of the tiles array.
+        stored: bool, optional
+            Stores the tiles array in the buffer if set to True, an empty array takes its place otherwise.
+
+        Returns
+        -------
+        layout: tuple
+            The shape and data type of the tiles array, followed by those of every level of the occupancy pyramid.
+        """
+
+        return ((tuple(shape) if stored else (0, 0), dtype), ((4,) + tuple(shape), "|b1")) + \
+            tuple(((4,) + level, "|b1") for level in TileOccupancy.shapes(shape))
+
+    def _process_in_workers(self, frame: CollisionFrame, chunks: list) -> list:
+        """
+        Finds every next possible events using the worker processes.
+
+        The frame and the tiles are shared with the workers through shared memory, only their names and the tile manager
+        are sent with the tasks. Each worker builds its own spatial partitioning once per round and processes a range of
+        collision objects, the spatial partitioning of the static entities being kept as long as they do not change.
+
+        Parameters
+        ----------
+        frame: CollisionFrame
+            The shared collision frame of the entities.
+        chunks: list of numpy.ndarray
+            The indexes of the collision objects processed by each task.
+
+        Returns
+        -------
+        events: list of CollisionPseudoEvent
+            The potential event of each processed collision object, None if there is not any.
+        """
+
+        if self._pool is None:
+            self._pool = Pool(processes=self._workers)
+
+        self._round += 1
+
+        state = {
+            "round": self._round, "frame": frame.name, "size": len(frame), "tiles": self._share_tiles(),
+            "tiles_shape": self.tiles.shape, "tiles_dtype": self.tiles.dtype.str, "tile_manager": self._tile_manager,
+            "logic_area": (self.logic_area.position, self.logic_area.bounds), "logic_tile": self.logic_tile,
+            "logic_entity": self.logic_entity, "broadphase": self._broadphase, "node_capacity": self._node_capacity,
+            "max_depth": self._max_depth, "cell_tiles": self._cell_tiles, "static_version": self._static_version,
+            "tiles_origin": self.tiles_origin, "tiles_file": self._shared_tiles_key[2], "exact": frame.exact_layers()
+        }
+
+        tasks = [(state, indexes) for indexes in chunks]
+
+        results = self._pool.map(WorldUpdater._process_collision_chunk, tasks, chunksize=1)
+
+        return [y for x in results for y in x]
+
+    @staticmethod
+    def _process_collision_chunk(task: tuple) -> list:
+        """
+        Finds every next possible events of a subset of collision objects from a worker process.
+
+        The shared buffers, the worker updater and the spatial partitionings are cached in the worker process, and only
+        rebuilt when a task of a new round is received. The spatial partitioning of the static entities is only rebuilt
+        with the frame or when the static entities change.
+
+        Parameters
+        ----------
+        task: tuple
+            The state of the round and the indexes of the collision objects to process.
+
+        Returns
+        -------
+        events: list of CollisionPseudoEvent
+            The potential event of each processed collision object, None if there is not any.
+        """
+
+        state, indexes = task
+        cache = WorldUpdater._worker_cache
+
+        if cache.get("round") != state["round"]:
+            cache["tree"] = None
+
+            if cache.get("frame_name") != state["frame"]:
+                if "frame" in cache:
+                    cache["frame"].close()
+
+                cache["frame"] = CollisionFrame.attach(state["frame"], state["size"])
+                cache["frame_name"] = state["frame"]
+
+            if cache.get("tiles_name") != state["tiles"]:
+                if "tiles" in cache:
+                    cache["tiles"].close()
+
+                cache["tiles"] = SharedBuffer(
+                    WorldUpdater._tiles_layout(state["tiles_shape"], state["tiles_dtype"], state["tiles_file"] is None),
+                    name=state["tiles"]
+                )
+                cache["tiles_name"] = state["tiles"]
+
+                if state["tiles_file"] is None:
+                    cache["tiles_array"] = cache["tiles"].arrays[0]
+                else:
+                    filename, offset, shape, dtype, order = state["tiles_file"]
+
+                    cache["tiles_array"] = numpy.memmap(
+                        filename, dtype=dtype, mode="r", offset=offset, shape=shape, order=order
+                    )
+
+            cache["updater"] = WorldUpdater(
+                state["tile_manager"], cache["tiles_array"], AxisAlignedBoundingBox(*state["logic_area"]),
+                state["logic_tile"], state["logic_entity"], multi_threading=False,
+                node_capacity=state["node_capacity"], max_depth=state["max_depth"], broadphase=state["broadphase"],
+                cell_tiles=state["cell_tiles"]
+            )
+
+            cache["updater"].tiles_origin = state["tiles_origin"]
+            cache["updater"]._solidity = cache["tiles"].arrays[1]
+            cache["updater"]._occupancy = TileOccupancy.attach(cache["tiles"].arrays[1:])
+
+            frame = cache["frame"]
+
+            cache["tree"] = cache["updater"]._create_tree(
+                [frame.collision_objects[index] for index in numpy.flatnonzero(~frame.static)]
+            )
+
+            if cache.get("static_key") != (state["frame"], state["static_version"]):
+                cache["static_tree"] = cache["updater"]._create_tree(
+                    [WorldUpdater._detach(frame.collision_objects[index]) for index in numpy.flatnonzero(frame.static)]
+                )
+                cache["static_key"] = (state["frame"], state["static_version"])
+
+            cache["frame"].exact = state["exact"]
+
+            cache["round"] = state["round"]
+
+        frame = cache["frame"]
+        frame._synchronize(indexes)
+
+        return cache["updater"]._process_collision_events(
+            [frame.collision_objects[index] for index in indexes], cache["tree"], cache["static_tree"], frame
+        )
+
+    def _process_collision_events(self, entities_colliding: list, tree: [QuadTree, Broadphase],
+                                  static_tree: [QuadTree, Broadphase], frame: CollisionFrame) -> list:
+        """
+        Finds every next possible events.
+
+        This function should be called on a subset of entities. Note that it returns the potential event of each
+        entity, some may not be independent and thus have to be sorted by size before being solved. For instance a
+        single object can issue several events with other objects, thus the order of resolution is important. The
+        candidate pairs of the whole subset are gathered first and solved at once by the batched SAT.
+
+        Parameters
+        ----------
+        entities_colliding: list of CollisionObject
+            The subset of collision objects over which the events will be searched.
+        tree: [QuadTree, Broadphase]
+            The spatial partitioning containing the other dynamic collision objects.
+        static_tree: [QuadTree, Broadphase]
+            The spatial partitioning containing the static collision objects.
+        frame: CollisionFrame
+            The column representation of the collision objects.
+
+        Returns
+        -------
+        events: list of CollisionPseudoEvent
+            The potential event of each collision object of the subset, None if there is not any.
+        """
+
+        owners = []
+        colliders = []
+        collided = []
+
+        if self.logic_entity:
+            sleeping = frame.sleeping
+
+            for owner, entity_colliding in enumerate(entities_colliding):
+                for other in tree.intersect(entity_colliding.bounding_box_expanded):
+                    if entity_colliding.index < other.index:
+                        owners.append(owner)
+                        colliders.append(entity_colliding.index)
+                        collided.append(other.index)
+                    elif sleeping[other.index]:
+                        # The sleeping entities are not processed, the moving entity owns the pair which keeps the
+                        # lowest index as collider
+                        owners.append(owner)
+                        colliders.append(other.index)
+                        collided.append(entity_colliding.index)
+
+                # The static entities are not processed either, and never tested against each other
+                for other in static_tree.intersect(entity_colliding.bounding_box_expanded):
+                    owners.append(owner)
+                    colliders.append(min(entity_colliding.index, other.index))
+                    collided.append(max(entity_colliding.index, other.index))
+
+        owners = numpy.array(owners, dtype=numpy.int64)
+        colliders = numpy.array(colliders, dtype=numpy.int64)
+        collided = numpy.array(collided, dtype=numpy.int64)
+
+        valid = frame.should_collide(colliders, collided)
+
+        owners = owners[valid]
+        colliders = colliders[valid]
+        collided = collided[valid]
+
+        best_pairs = [-1] * len(entities_colliding)
+
+        if len(owners) > 0:
+            times_of_impact, directions = WorldUpdater._apply_sat_batch(frame, colliders, collided)
+
+            times_of_impact = numpy.where(
+                (directions != Direction.DIRECTION_NONE) & (times_of_impact < 1.0), times_of_impact, numpy.inf
+            )
+
+            # Each pair holds its lowest index as collider and its highest index as collided, whichever entity owns
+            # it. Ties between equal times of impact are broken by the lowest pair in this order, so that the selected
+            # pair does not depend on the order in which the broadphase returns the candidates. The pairs with a
+            # sleeping entity are owned by the moving entity rather than by the lowest index, hence when events tie,
+            # the event fired may still depend on which entities are asleep.
+            order = numpy.lexsort((collided, colliders, times_of_impact, owners))
+            first = order[numpy.concatenate(([True], owners[order][1:] != owners[order][:-1]))]
+
+            for pair in first[times_of_impact[first] < numpy.inf]:
+                best_pairs[owners[pair]] = pair
+
+        events = []
+
+        for owner, entity_colliding in enumerate(entities_colliding):
+            time_of_impact = 1.0
+
+            colliders_event = []
+            collision_type = CollisionPseudoEvent.COLLISION_NONE
+            collision_direction = Direction.DIRECTION_NONE
+
+            event_found = False
+
+            pair = best_pairs[owner]
+
+            if pair != -1:
+                time_of_impact = float(times_of_impact[pair])
+                colliders_event = (int(colliders[pair]), int(collided[pair]))
+                collision_type = CollisionPseudoEvent.COLLISION_ENTITY
+                collision_direction = int(directions[pair])
+
+                event_found = True
+
+            if self.logic_tile and entity_colliding.collides_with_tiles:
+                potential_time_of_impact, tile, x, y, direction = self._tile_collision_detection(entity_colliding)
+
+                if direction != Direction.DIRECTION_NONE and potential_time_of_impact < time_of_impact:
+                    time_of_impact = potential_time_of_impact
+                    colliders_event = (entity_colliding.index, tile, x, y)
+                    collision_type = CollisionPseudoEvent.COLLISION_TILE
+                    collision_direction = direction
+
+                    event_found = True
+
+            if event_found:
+                events.append(CollisionPseudoEvent(
+                    time_of_impact, colliders_event, collision_type, collision_direction
+                ))
+            else:
+                events.append(None)
+
+        return events
+
+    def close(self) -> None:
+        """
+        Stops the worker threads and processes and releases the shared memory.
+
+        The updater can still be used afterwards, the workers and the shared buffers are created again when needed.
+        """
+
+        if self._thread_pool is not None:
+            self._thread_pool.terminate()
+            self._thread_pool.join()
+
+            self._thread_pool = None
+
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+
+            self._pool = None
+
+        self._release_frame()
+
+        if self._shared_tiles is not None:
+            self._shared_tiles.close()
+
+            self._shared_tiles = None
+
+    @staticmethod
+    def _apply_sat_batch(frame: CollisionFrame, colliders: numpy.ndarray, collided: numpy.ndarray) -> \
+            (numpy.ndarray, numpy.ndarray):
+        """
+        Applies the SAT to many pairs of collision objects at once.
+
+        This is the vectorized version of _apply_sat and gives the same results for each pair. The collision objects
+        are read from the columns of the frame, the two axis being processed one after the other over every pair.
+
+        Parameters
+        ----------
+        frame: CollisionFrame
+            The column representation of the collision objects.
+        colliders: numpy.ndarray
+            The indexes of the collision objects associated to the colliders.
+        collided: numpy.ndarray
+            The indexes of the collision objects associated to the collided.
+
+        Returns
+        -------
+        times_of_impact, directions: numpy.ndarray, numpy.ndarray
+            The time of impact and the direction of the collision of each pair.
+        """
+
+        swapped = frame.local_times[colliders] < frame.local_times[collided]
+
+        first = numpy.where(swapped, collided, colliders)
+        second = numpy.where(swapped, colliders, collided)
+
+        collider_local_times = frame.local_times[first]
+
+        collider_positions = frame.positions[first]
+        collider_bounds = frame.bounds[first]
+        collider_speeds = frame.speeds[first]
+
+        collided_positions = (frame.positions[second] + frame.speeds[second] * (
+            collider_local_times - frame.local_times[second]
+        )[:, None]).astype(numpy.float32)
+        collided_bounds = frame.bounds[second]
+        collided_speeds = frame.speeds[second]
+
+        maximum_times_of_impact = numpy.zeros(len(first), dtype=numpy.float64)
+        minimum_times_of_separation = 1 - collider_local_times
+
+        directions = numpy.full(len(first), Direction.DIRECTION_NONE, dtype=numpy.int32)
+
+        valid = numpy.ones(len(first), dtype=bool)
+
+        relative_speeds = collider_speeds - collided_speeds
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            for axis in range(2):
+                collider_low = collider_positions[:, axis]
+                collider_high = collider_positions[:, axis] + collider_bounds[:, axis]
+                collided_low = collided_positions[:, axis]
+                collided_high = collided_positions[:, axis] + collided_bounds[:, axis]
+
+                collider_speed = collider_speeds[:, axis]
+                collided_speed = collided_speeds[:, axis]
+
+                if axis == 0:
+                    axis_directions = numpy.where(
+                        relative_speeds[:, axis] > 0, Direction.DIRECTION_EAST, Direction.DIRECTION_WEST
+                    )
+                else:
+                    axis_directions = numpy.where(
+                        relative_speeds[:, axis] > 0, Direction.DIRECTION_NORTH, Direction.DIRECTION_SOUTH
+                    )
+
+                below = collider_high < collided_low
+
+                times_of_impact = numpy.where(
+                    below,
+                    (collided_low - collider_high) / (collider_speed - collided_speed),
+                    (collider_low - collided_high) / (collided_speed - collider_speed)
+                )
+
+                times_of_separation = numpy.where(
+                    collider_speed > collided_speed,
+                    (collided_high - collider_low) / (collider_speed - collided_speed),
+                    (collider_high - collided_low) / (collided_speed - collider_speed)
+                )
+
+                overlapping = (collided_high >= collider_low) & (collided_low <= collider_high)
+
+                impacting = ~overlapping & (
+                    below & (collider_speed > collided_speed) |
+                    (collider_low > collided_high) & (collider_speed < collided_speed)
+                )
+
+                valid &= overlapping | impacting
+                impacting &= valid
+
+                increasing = impacting & (times_of_impact > maximum_times_of_impact)
+
+                maximum_times_of_impact = numpy.where(increasing, times_of_impact, maximum_times_of_impact)
+                directions = numpy.where(increasing, axis_directions, directions)
+
+                separating = impacting & (collider_speed != collided_speed) & \
+                    (times_of_separation < minimum_times_of_separation)
+
+                minimum_times_of_separation = numpy.where(
+                    separating, times_of_separation, minimum_times_of_separation
+                )
+
+                touching = valid & ((collider_high == collided_low) | (collider_low == collided_high)) & \
+                    (collider_speed != collided_speed) & (maximum_times_of_impact == 0)
+
+                directions = numpy.where(touching, axis_directions, directions)
+
+                minimum_times_of_separation = numpy.where(
+                    touching & (times_of_separation < minimum_times_of_separation),
+                    times_of_separation, minimum_times_of_separation
+                )
+
+        colliding = valid & (minimum_times_of_separation > maximum_times_of_impact) & \
+            (maximum_times_of_impact < 1 - collider_local_times)
+
+        times_of_impact = numpy.where(colliding, collider_local_times + maximum_times_of_impact, 1.0)
+        directions = numpy.where(colliding, directions, Direction.DIRECTION_NONE)
+
+        directions = numpy.where(
+            swapped & (directions != Direction.DIRECTION_NONE), (directions + 2) % 4, directions
+        )
+
+        return times_of_impact, directions
+
+    @staticmethod
+    def _apply_sat(collider: CollisionObject, collided: CollisionObject) -> (float, int):
+        """
+        Applies the SAT to two collision objects.
+
+        Applies the Separation Axis Theorem to two collision objects and determines whether or not they will collide and
+        if so, it will compute the time of impact between both object within the current tick. It uses the float
+        representation of the AABBs for better precision.
+
+        Parameters
+        ----------
+        collider: CollisionObject
+            The collision object associated to the collider.
+        collided: CollisionObject
+            The collision object associated to the collided.
+
+        Returns
+        -------
+        time_of_impact, direction: float, int
+            The time of impact and the direction of the collision if there is any.
+        """
+
+        if collider.local_time < collided.local_time:
+            time_of_impact, direction = WorldUpdater._apply_sat(collided, collider)
+
+            return time_of_impact, Direction.opposite(direction)
+
+        collider_bounds = collider.bounding_box.copy()
+        collided_bounds = collided.bounding_box.copy()
+
+        collided_bounds.position += collided.speed * (collider.local_time - collided.local_time)
+
+        maximum_time_of_impact = 0
+        minimum_time_of_separation = 1 - collider.local_time
+
+        collision_direction = Direction.DIRECTION_NONE
+
+        relative_speed = collider.speed - collided.speed
+
+        for axis in range(2):
+            collider_segment = MovableSegment(
+                collider_bounds.position[axis],
+                collider_bounds.position[axis] + collider_bounds.bounds[axis],
+                collider.speed[axis]
+            )
+
+            collided_segment = MovableSegment(
+                collided_bounds.position[axis],
+                collided_bounds.position[axis] + collided_bounds.bounds[axis],
+                collided.speed[axis]
+            )
+
+            if collider_segment not in collided_segment:
+                if collider_segment.should_impact(collided_segment):
+                    time_of_impact = collider_segment.time_of_impact(collided_segment)
+
+                    if time_of_impact > maximum_time_of_impact:
+                        maximum_time_of_impact = time_of_impact
+
+                        if relative_speed[axis] > 0:
+                            collision_direction = Direction.DIRECTION_EAST
+                        elif relative_speed[axis] < 0:
+                            collision_direction = Direction.DIRECTION_WEST
+                        else:
+                            continue
+
+                        if axis != 0:
+                            collision_direction = Direction.next_left(collision_direction)
+
+                    if collider_segment.should_separate(collided_segment):
+                        time_of_separation = collider_segment.time_of_separation(collided_segment)
+
+                        if time_of_separation < minimum_time_of_separation:
+                            minimum_time_of_separation = time_of_separation
+
+                else:
+                    return 1.0, Direction.DIRECTION_NONE
+
+            if collider_segment == collided_segment:
+                if collider_segment.should_separate(collided_segment):
+                    if maximum_time_of_impact == 0:
+                        if relative_speed[axis] > 0:
+                            collision_direction = Direction.DIRECTION_EAST
+                        elif relative_speed[axis] < 0:
+                            collision_direction = Direction.DIRECTION_WEST
+                        else:
+                            continue
+
+                        if axis != 0:
+                            collision_direction = Direction.next_left(collision_direction)
+
+                        time_of_separation = collider_segment.time_of_separation(collided_segment)
+
+                        if time_of_separation < minimum_time_of_separation:
+                            minimum_time_of_separation = time_of_separation
+
+        if minimum_time_of_separation > maximum_time_of_impact and maximum_time_of_impact < 1 - collider.local_time:
+            return collider.local_time + maximum_time_of_impact, collision_direction
+
+        return 1.0, Direction.DIRECTION_NONE
+
+    def _tile_collision_detection(self, collider: CollisionObject) -> (float, int, int, int, int):
+        """
+        Applies the SAT between a collision object and the tiles.
+
+        Applies a modified version of the Separation Axis Theorem for static objects. This determines whether or not the
+        collision object will collide with a tile from the terrain and if so, it will compute the time of impact between
+        the object and the tile within the current tick. The solidity of the tiles is read from the per-direction
+        bitmaps of the level. The tiles crossed by a diagonal move are visited exactly, in time of impact order, and the
+        traversal stops at the first solid tile. The computations are done relatively to the origin of the tiles array,
+        which is a multiple of the tile size, so they do not depend on it.
+
+        Parameters
+        ----------
+        collider: CollisionObject
+            The collision object associated to the collider.
+
+        Returns
+        -------
+        time_of_impact, tile, direction: float, int, int, int, int
+            The time of impact, the tile index and its position and the direction of the collision if there is any.
+        """
+
+        bounds = collider.bounding_box
+
+        speed = collider.speed
+        local_time = collider.local_time
+
+        pre_min = bounds.position.astype(numpy.int32)
+        pre_max = (bounds.position + bounds.bounds).astype(numpy.int32)
+        post_min = (pre_min + speed * (1 - local_time)).astype(numpy.int32)
+        post_max = (pre_max + speed * (1 - local_time)).astype(numpy.int32)
+
+        origin_x, origin_y = self.tiles_origin.tolist()
+        offset = self.tiles_origin * self._tile_manager.tile_size
+
+        pre_min, pre_max, post_min, post_max = pre_min - offset, pre_max - offset, post_min - offset, post_max - offset
+
+        pre_min_tile = pre_min // self._tile_manager.tile_size
+        pre_max_tile = pre_max // self._tile_manager.tile_size
+        post_min_tile = post_min // self._tile_manager.tile_size
+        post_max_tile = post_max // self._tile_manager.tile_size
+
+        if pre_max[0] % self._tile_manager.tile_size == 0:
+            pre_max_tile[0] -= 1
+
+        if pre_max[1] % self._tile_manager.tile_size == 0:
+            pre_max_tile[1] -= 1
+
+        if post_max[0] % self._tile_manager.tile_size == 0:
+            post_max_tile[0] -= 1
+
+        if post_max[1] % self._tile_manager.tile_size == 0:
+            post_max_tile[1] -= 1
+
+        if pre_min_tile[0] == post_min_tile[0] and pre_min_tile[1] == post_min_tile[1] and \
+                pre_max_tile[0] == post_max_tile[0] and pre_max_tile[1] == post_max_tile[1]:
+            return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+
+        if post_min_tile[1] == pre_min_tile[1] and post_max_tile[1] == pre_max_tile[1]:
+            if post_max_tile[0] > pre_max_tile[0]:
+                tile = self._find_solid_tile(
+                    Direction.DIRECTION_WEST, range(pre_max_tile[0] + 1, post_max_tile[0] + 1),
+                    range(pre_min_tile[1], pre_max_tile[1] + 1), True
+                )
+
+                if tile is not None:
+                    x, y = tile
+
+                    return (x * self._tile_manager.tile_size - pre_max[0]) / speed[0] + local_time, \
+                        self.tiles[x, y], x + origin_x, y + origin_y, Direction.DIRECTION_EAST
+                return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+
+            elif post_min_tile[0] < pre_min_tile[0]:
+                tile = self._find_solid_tile(
+                    Direction.DIRECTION_EAST, range(pre_min_tile[0] - 1, post_min_tile[0] - 1, -1),
+                    range(pre_min_tile[1], pre_max_tile[1] + 1), True
+                )
+
+                if tile is not None:
+                    x, y = tile
+
+                    return ((x + 1) * self._tile_manager.tile_size - pre_min[0]) / speed[0] + local_time, \
+                        self.tiles[x, y], x + origin_x, y + origin_y, Direction.DIRECTION_WEST
+                return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+
+        elif post_min_tile[0] == pre_min_tile[0] and post_max_tile[0] == pre_max_tile[0]:
+            if post_max_tile[1] > pre_max_tile[1]:
+                tile = self._find_solid_tile(
+                    Direction.DIRECTION_SOUTH, range(pre_min_tile[0], pre_max_tile[0] + 1),
+                    range(pre_max_tile[1] + 1, post_max_tile[1] + 1), False
+                )
+
+                if tile is not None:
+                    x, y = tile
+
+                    return (y * self._tile_manager.tile_size - pre_max[1]) / speed[1] + local_time, \
+                        self.tiles[x, y], x + origin_x, y + origin_y, Direction.DIRECTION_NORTH
+                return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+
+            elif post_min_tile[1] < pre_min_tile[1]:
+                tile = self._find_solid_tile(
+                    Direction.DIRECTION_NORTH, range(pre_min_tile[0], pre_max_tile[0] + 1),
+                    range(pre_min_tile[1] - 1, post_min_tile[1] - 1, -1), False
+                )
+
+                if tile is not None:
+                    x, y = tile
+
+                    return ((y + 1) * self._tile_manager.tile_size - pre_min[1]) / speed[1] + local_time, \
+                        self.tiles[x, y], x + origin_x, y + origin_y, Direction.DIRECTION_SOUTH
+                return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+
+        # The sweep is traversed as in the Amanatides-Woo algorithm, extended to a bounding box: the leading edges of
+        # the box cross the tile columns and rows in time of impact order, and each crossing enters a strip of tiles.
+        # The times are kept as numerators over the absolute speed, so they are compared exactly. On a tie, the column
+        # is crossed first but only the rows strictly overlapped by the box are checked: the tile at the corner, which
+        # the box only touches at a single point, is left to the row crossed at the same time.
+        tile_size = self._tile_manager.tile_size
+
+        pre_min_x, pre_min_y = pre_min.tolist()
+        pre_max_x, pre_max_y = pre_max.tolist()
+        speed_x, speed_y = int(speed[0]), int(speed[1])
+
+        min_tile = numpy.min((pre_min_tile, post_min_tile), axis=0)
+        max_tile = numpy.max((pre_max_tile, post_max_tile), axis=0)
+
+        if speed_x > 0:
+            columns = range(pre_max_tile[0] + 1, post_max_tile[0] + 1)
+            direction_x = Direction.DIRECTION_WEST
+        else:
+            columns = range(pre_min_tile[0] - 1, post_min_tile[0] - 1, -1)
+            direction_x = Direction.DIRECTION_EAST
+
+        if speed_y > 0:
+            rows = range(pre_max_tile[1] + 1, post_max_tile[1] + 1)
+            direction_y = Direction.DIRECTION_SOUTH
+        else:
+            rows = range(pre_min_tile[1] - 1, post_min_tile[1] - 1, -1)
+            direction_y = Direction.DIRECTION_NORTH
+
+        # The whole swept block is empty in the facing directions in most cases, this is checked at once from the
+        # occupancy pyramid
+        if not self._occupancy.any(direction_x, min_tile, max_tile) and \
+                not self._occupancy.any(direction_y, min_tile, max_tile):
+            return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+
+        column_index = 0
+        row_index = 0
+
+        numerator_x = 0
+        numerator_y = 0
+
+        while column_index < len(columns) or row_index < len(rows):
+            if column_index < len(columns):
+                if speed_x > 0:
+                    numerator_x = columns[column_index] * tile_size - pre_max_x
+                else:
+                    numerator_x = pre_min_x - (columns[column_index] + 1) * tile_size
+
+            if row_index < len(rows):
+                if speed_y > 0:
+                    numerator_y = rows[row_index] * tile_size - pre_max_y
+                else:
+                    numerator_y = pre_min_y - (rows[row_index] + 1) * tile_size
+
+            if row_index == len(rows) or \
+                    column_index < len(columns) and numerator_x * abs(speed_y) <= numerator_y * abs(speed_x):
+                column = columns[column_index]
+                column_index += 1
+
+                # The rows strictly overlapped by the box when it enters the column
+                low = pre_min_y * abs(speed_x) + speed_y * numerator_x
+                high = pre_max_y * abs(speed_x) + speed_y * numerator_x
+                divisor = abs(speed_x) * tile_size
+
+                low, high = low // divisor, -(-high // divisor) - 1
+
+                low, high = max(low, min_tile[1]), min(high, max_tile[1])
+                strip = range(low, high + 1) if speed_y >= 0 else range(high, low - 1, -1)
+
+                tile = self._find_solid_tile(direction_x, range(column, column + 1), strip, True)
+
+                if tile is not None:
+                    x, y = tile
+
+                    return numerator_x / abs(speed_x) + local_time, self.tiles[x, y], x + origin_x, y + origin_y, \
+                        Direction.opposite(direction_x)
+            else:
+                row = rows[row_index]
+                row_index += 1
+
+                # The columns overlapped by the box when it enters the row, including the column its leading edge
+                # reaches at the same time
+                low = pre_min_x * abs(speed_y) + speed_x * numerator_y
+                high = pre_max_x * abs(speed_y) + speed_x * numerator_y
+                divisor = abs(speed_y) * tile_size
+
+                if speed_x > 0:
+                    low, high = low // divisor, high // divisor
+                else:
+                    low, high = -(-low // divisor) - 1, -(-high // divisor) - 1
+
+                low, high = max(low, min_tile[0]), min(high, max_tile[0])
+                strip = range(low, high + 1) if speed_x >= 0 else range(high, low - 1, -1)
+
+                tile = self._find_solid_tile(direction_y, strip, range(row, row + 1), False)
+
+                if tile is not None:
+                    x, y = tile
+
+                    return numerator_y / abs(speed_y) + local_time, self.tiles[x, y], x + origin_x, y + origin_y, \
+                        Direction.opposite(direction_y)
+
+        return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+
+    def _find_solid_tile(self, direction: int, range_x: range, range_y: range, x_major: bool) -> (int, int):
         """
+        Returns the first solid tile in the specified direction within the ranges.
 
-        PhysicsObject.__init__(self, bounding_box, collides_with_tiles=collides_with_tiles, colliders=colliders)
+        The ranges are clipped to the level, since the tiles outside of it are never solid. The strip of the solidity
+        bitmap is sliced without any copy, the first blocking line is found with a single reduction and the tile is
+        then searched within this line.
 
-        Renderable.__init__(
-            self, bounding_box, texture_bounds, sprite_set, id_animation, angle=angle, visible=visible,
-            flip_horizontally=flip_horizontally, flip_vertically=flip_vertically
-        )
+        Parameters
+        ----------
+        direction: int
+            The direction of the solidity bitmap.
+        range_x: range
+            The positions of the tiles along the x axis, in the order of the search (with a step of 1 or -1).
+        range_y: range
+            The positions of the tiles along the y axis, in the order of the search (with a step of 1 or -1).
+        x_major: bool
+            Goes through the tiles column by column if set to True, row by row otherwise.
 
-        self.speed = speed
+        Returns
+        -------
+        position: (int, int)
+            The position of the first solid tile, None if there is not any.
+        """
 
-    @property
-    def speed(self) -> numpy.ndarray:
+        range_x = WorldUpdater._clip_range(range_x, self.tiles.shape[0])
+        range_y = WorldUpdater._clip_range(range_y, self.tiles.shape[1])
+
+        if len(range_x) == 0 or len(range_y) == 0:
+            return None
+
+        block = self._solidity[direction, WorldUpdater._range_slice(range_x), WorldUpdater._range_slice(range_y)]
+
+        if not x_major:
+            block = block.T
+
+        lines = block.any(axis=1)
+        major = int(lines.argmax())
+
+        if not lines[major]:
+            return None
+
+        minor = int(block[major].argmax())
+
+        return (range_x[major], range_y[minor]) if x_major else (range_x[minor], range_y[major])
+
+    @staticmethod
+    def _clip_range(positions: range, size: int) -> range:
         """
-        The speed property representing the speed vector of the entity expressed in unit per tick.
+        Clips a range of tile positions to the level.
+
+        Parameters
+        ----------
+        positions: range
+            The range of positions, with a step of 1 or -1.
+        size: int
+            The size of the level along the axis of the range.
+
+        Returns
+        -------
+        positions: range
+            The range of positions within [0, size), in the same order.
         """
 
-        return self._speed
+        if positions.step > 0:
+            return range(max(positions.start, 0), min(positions.stop, size))
 
-    @speed.setter
-    def speed(self, speed: [tuple, numpy.ndarray]) -> None:
+        return range(min(positions.start, size - 1), max(positions.stop, -1), -1)
+
+    @staticmethod
+    def _range_slice(positions: range) -> slice:
         """
-        Setter function for the speed vector.
+        Returns the slice corresponding to a non-empty range of positions.
 
         Parameters
         ----------
-        speed: [tuple, numpy.ndarray]
-             The speed vector of the entity expressed in unit per tick.
+        positions: range
+            The range of positions, with a step of 1 or -1.
+
+        Returns
+        -------
+        positions: slice
+            The slice selecting the same positions in the same order.
         """
 
-        self._speed = array_format(speed)
+        return slice(positions[0], positions[-1] + positions.step if positions[-1] + positions.step >= 0 else None,
+                     positions.step)
 
     def __str__(self) -> str:
         """
@@ -917,372 +6694,478 @@ class Entity(PhysicsObject, Renderable):
             The string object description.
         """
 
-        if self.is_transiting():
-            return "Entity[position=" + str(self.position) + ", bounds=" + str(self.bounds) + ", " + \
-                   "texture_bounds=" + str(self.texture_bounds) + ", sprite_set=" + self.sprite_set + ", " + \
-                   "id_animation=" + str(self.id_animation) + ", " + \
-                   "id_animation_transition=" + str(self.id_animation_transition) + ", " + \
-                   "animation_pointer=" + str(self.animation_pointer) + ", angle=" + str(self.angle) + ", " + \
-                   "visible=" + str(self.visible) + ", flip_horizontally=" + str(self.flip_horizontally) + ", " + \
-                   "flip_vertically=" + str(self.flip_vertically) + ", " + \
-                   "collides_with_tiles=" + str(self.collides_with_tiles) + ", colliders=" + str(self.colliders) + "]"
-        else:
-            return "Entity[position=" + str(self.position) + ", bounds=" + str(self.bounds) + ", " + \
-                   "texture_bounds=" + str(self.texture_bounds) + ", sprite_set=" + self.sprite_set + ", " + \
-                   "id_animation=" + str(self.id_animation) + ", " + \
-                   "animation_pointer=" + str(self.animation_pointer) + ", angle=" + str(self.angle) + ", " + \
-                   "visible=" + str(self.visible) + ", flip_horizontally=" + str(self.flip_horizontally) + ", " + \
-                   "flip_vertically=" + str(self.flip_vertically) + ", " + \
-                   "collides_with_tiles=" + str(self.collides_with_tiles) + ", colliders=" + str(self.colliders) + "]"
+        return "WorldUpdater[logic_area=" + str(self.logic_area) + ", logic_tile=" + str(self.logic_tile) + ", " + \
+               "logic_entity=" + str(self.logic_entity) + "]"
 
 
-class CollisionMap:
+class UnsolvedCollisionError(Exception):
     """
-    Simple way of defining the behavior of a tile.
+    An error raised when a collision is not solved.
 
-    Collisions are only considered on the edges of the tiles. The collision map allows to define how the entities will
-    interact with each of the edge (either collide or go through).
+    This kind of error is raised when a collision event is not solved, in other words when the same event occurs twice
+    in the loop. This means that the event will be reprocessed indefinitely by the handlers. Note that the event
+    handlers have to be deterministic regarding the update of the object, for instance, the speed vector of the
+    colliding object should always be modified in a way that it does not instantly collides with the same other object.
+    """
+
+    def __init__(self, event: CollisionPseudoEvent):
+        message = \
+            "The following event got fired twice in a single tick.\n\n\t" + str(event) + "\n\n" + \
+            "This probably means that this event will be reprocessed indefinitely by the handlers.\n" + \
+            "To avoid this kind of error, the collision event handlers should have to be deterministic regarding\n" + \
+            "the some properties of the speed vector; the colliding object should always be modified in a way it\n" + \
+            "does not instantly collide with the same object.\n" + \
+            "If you are sure of what you are doing and you think that this is error is not supposed to be raised,\n" + \
+            "you can disable the check of unsolved collision by setting the safe_mode to False."
+
+        Exception.__init__(self, message)
+
+
+class WorldObjects(MutableSequence):
+    """
+    Storage of the world objects of a world.
+
+    The world objects are kept in their order of spawn. Removing a world object leaves a tombstone in its slot instead
+    of shifting the following objects, so that it is done in constant time. The tombstones are compacted away once they
+    fill half of the slots. Each added world object is given a handle, an integer which is never reused: it keeps
+    resolving to the object as long as the object is not removed, whatever the compactions done in between. The handles
+    and the slots are held by the storage, a world object can be held by several storages (for instance when it is kept
+    across a change of world).
+
+    The storage is a mutable sequence and can be edited as the list of world objects it replaces. Appending and
+    removing are done in constant time, the other edits (insertions, assignments, sorts...) rebuild the storage. Unlike
+    a list, a world object can only be held once: adding a world object already held raises a ValueError.
 
     Attributes
     ----------
-    collide_north: bool
-        Enables the collision detection with the top edge of the tile if set to True.
-    collide_east: bool
-        Enables the collision detection with the right edge of the tile if set to True.
-    collide_south: bool
-        Enables the collision detection with the bottom edge of the tile if set to True.
-    collide_west: bool
-        Enables the collision detection with the left edge of the tile if set to True.
+    version: int
+        A counter incremented each time a world object is added or removed.
+
+    Methods
+    -------
+    append(world_object)
+        Adds a world object.
+    insert(index, world_object)
+        Inserts a world object before an index.
+    remove(world_object)
+        Removes a world object.
+    index(world_object, start, stop)
+        Returns the index of a world object.
+    count(world_object)
+        Returns the number of occurrences of a world object.
+    sort(key, reverse)
+        Sorts the world objects in place.
+    reverse()
+        Reverses the order of the world objects in place.
+    clear()
+        Removes every world object.
+    replace(world_objects)
+        Replaces the world objects.
+    get(handle)
+        Returns the world object of a handle.
+    handle(world_object)
+        Returns the handle of a world object.
+    compact()
+        Removes the tombstones left by the removed world objects.
     """
 
-    def __init__(self, collide_north: bool, collide_east: bool, collide_south: bool, collide_west: bool):
+    def __init__(self, world_objects: list = ()):
         """
-        Initializes the CollisionMap.
+        Initializes the WorldObjects.
 
         Parameters
         ----------
-        collide_north: bool
-            Enables the collision detection with the top edge of the tile if set to True.
-        collide_east: bool
-            Enables the collision detection with the right edge of the tile if set to True.
-        collide_south: bool
-            Enables the collision detection with the bottom edge of the tile if set to True.
-        collide_west: bool
-            Enables the collision detection with the left edge of the tile if set to True.
+        world_objects: list of WorldObject, optional
+            The initial world objects.
         """
 
-        self.collide_north = collide_north
-        self.collide_east = collide_east
-        self.collide_south = collide_south
-        self.collide_west = collide_west
+        self._objects = []
+        self._handles = {}
+        self._entries = {}
 
-    def __str__(self) -> str:
+        self._tombstones = 0
+        self._next_handle = 0
+
+        self.version = 0
+
+        for world_object in world_objects:
+            self.append(world_object)
+
+    def __len__(self) -> int:
         """
-        Returns a description string of the object.
+        Returns the number of world objects.
 
         Returns
         -------
-        string: str
-            The string object description.
+        length: int
+            The number of world objects.
         """
 
-        return "CollisionMap[collide_north=" + str(self.collide_north) + ", " + \
-               "collide_east=" + str(self.collide_east) + ", collide_south=" + str(self.collide_south) + ", " + \
-               "collide_west=" + str(self.collide_west) + "]"
+        return len(self._handles)
+
+    def __iter__(self) -> iter:
+        """
+        Returns an iterator over the world objects, in their order of spawn.
 
+        Returns
+        -------
+        iterator: iter
+            The iterator over the world objects.
+        """
 
-class TileManager:
-    """
-    The tile physics manager.
+        return filter(partial(is_not, None), self._objects)
 
-    A tile manager must be created to registers tiles. A tile is a couple of an texture and a collision map. This object
-    should be fully initialized before creating a world. To add the rendering, see the ResourceManager class. Note that
-    the scale used here expresses the size of a tile in term of game distance unit.
+    def __getitem__(self, index: [int, slice]) -> [WorldObject, list]:
+        """
+        Returns the world objects at an index or a slice, the storage being compacted first.
 
-    Attributes
-    ----------
-    tile_size: int
-        The size of the tiles expressed in distance units.
+        Parameters
+        ----------
+        index: [int, slice]
+            The index or the slice of the world objects, in their order of spawn.
 
-    Methods
-    -------
-    register_collision_map(collide_north, collide_east, collide_south, collide_west)
-        Registers a new collision map.
-    register_tile(id_collision_map, id_texture)
-        Registers a new tile.
-    get_collision_map(id_tile)
-        Returns the collision map associated to the tile.
-    get_id_texture(id_tile)
-        Returns the texture associated to the tile.
-    """
+        Returns
+        -------
+        world_objects: [WorldObject, list]
+            The world object at the index, or the list of the world objects in the slice.
+        """
 
-    def __init__(self, tile_size: int):
+        self.compact()
+
+        return self._objects[index]
+
+    def __setitem__(self, index: [int, slice], world_objects: [WorldObject, list]) -> None:
         """
-        Initializes the TileManager.
+        Replaces the world objects at an index or a slice.
 
         Parameters
         ----------
-        tile_size: int
-            The size of the tiles expressed in distance units.
+        index: [int, slice]
+            The index or the slice of the world objects, in their order of spawn.
+        world_objects: [WorldObject, list]
+            The new world object, or the new world objects of the slice.
+
+        Raises
+        ------
+        ValueError
+            If a world object would be held twice.
         """
 
-        self.tile_size = tile_size
+        objects = list(self)
+        objects[index] = world_objects
 
-        self._collision_maps = []
-        self._tiles = []
+        self.replace(objects)
 
-    def register_collision_map(self, collide_north: bool, collide_east: bool, collide_south: bool,
-                               collide_west: bool) -> None:
+    def __delitem__(self, index: [int, slice]) -> None:
         """
-        Registers a new collision map.
-
-        Registers a new collision map and gives it the first index available.
+        Removes the world objects at an index or a slice.
 
         Parameters
         ----------
-        collide_north: bool
-            Enables the collision detection with the top edge of the tile if set to True.
-        collide_east: bool
-            Enables the collision detection with the right edge of the tile if set to True.
-        collide_south: bool
-            Enables the collision detection with the bottom edge of the tile if set to True.
-        collide_west: bool
-            Enables the collision detection with the left edge of the tile if set to True.
+        index: [int, slice]
+            The index or the slice of the world objects, in their order of spawn.
         """
 
-        self._collision_maps.append(CollisionMap(collide_north, collide_east, collide_south, collide_west))
+        if isinstance(index, slice):
+            objects = list(self)
+            del objects[index]
 
-    def register_tile(self, id_collision_map: int, id_texture: int) -> None:
-        """
-        Registers a new tile.
+            self.replace(objects)
+        else:
+            self.remove(self[index])
 
-        Registers a new tile with the specified texture and collision map indexes and gives the first index available.
-        Note that the index 0 corresponds to the empty tile (no rendering nor collision).
+    def __contains__(self, world_object: WorldObject) -> bool:
+        """
+        Returns whether a world object is held.
 
         Parameters
         ----------
-        id_collision_map: int
-            The index of the collision map used for the collision behavior.
-        id_texture: int
-            The index of the texture used (see ResourcesManagers)
+        world_object: WorldObject
+            The world object to look for.
+
+        Returns
+        -------
+        result: bool
+            True if the world object is held.
         """
 
-        self._tiles.append((id_collision_map, id_texture))
+        return id(world_object) in self._entries
 
-    def get_collision_map(self, id_tile: int) -> CollisionMap:
+    def append(self, world_object: WorldObject) -> int:
         """
-        Returns the collision map associated to the tile.
-
-        Returns the collision map associated to the tile registered at the specified index. Note that the index 0 is
-        forbidden since it corresponds to the empty tile, nothing should collide with it.
+        Adds a world object.
 
         Parameters
         ----------
-        id_tile: int
-            The index of the tile.
+        world_object: WorldObject
+            The world object to add.
+
+        Raises
+        ------
+        ValueError
+            If the world object is already held by this storage.
 
         Returns
         -------
-        collision_map: CollisionMap
-            The collision map associated to the tile.
+        handle: int
+            The handle of the world object.
         """
 
-        if not 0 < id_tile <= len(self._tiles):
-            raise ValueError("The tile with ID " + str(id_tile) + " is not registered.")
+        if world_object in self:
+            raise ValueError("The world object is already spawned in this world.")
 
-        return self._collision_maps[self._tiles[id_tile - 1][0]]
+        handle = self._next_handle
+
+        self._entries[id(world_object)] = (handle, len(self._objects))
+        self._handles[handle] = world_object
+        self._objects.append(world_object)
+
+        self._next_handle += 1
+        self.version += 1
+
+        return handle
+
+    def insert(self, index: int, world_object: WorldObject) -> None:
+        """
+        Inserts a world object before an index.
+
+        Inserting at the end is done as append, in constant time.
+
+        Parameters
+        ----------
+        index: int
+            The index before which the world object is inserted.
+        world_object: WorldObject
+            The world object to insert.
+
+        Raises
+        ------
+        ValueError
+            If the world object is already held by this storage.
+        """
+
+        if index >= len(self):
+            self.append(world_object)
+        else:
+            if world_object in self:
+                raise ValueError("The world object is already spawned in this world.")
+
+            objects = list(self)
+            objects.insert(index, world_object)
+
+            self.replace(objects)
+
+    def remove(self, world_object: WorldObject) -> None:
+        """
+        Removes a world object.
+
+        Parameters
+        ----------
+        world_object: WorldObject
+            The world object to remove.
+
+        Raises
+        ------
+        ValueError
+            If the world object is not held.
+        """
+
+        if world_object not in self:
+            raise ValueError("The world object is not spawned in this world.")
+
+        handle, slot = self._entries.pop(id(world_object))
+
+        self._objects[slot] = None
+        del self._handles[handle]
+
+        self._tombstones += 1
+        self.version += 1
+
+        if 2 * self._tombstones > len(self._objects):
+            self.compact()
 
-    def get_id_texture(self, id_tile: int) -> int:
+    def index(self, world_object: WorldObject, start: int = 0, stop: int = None) -> int:
         """
-        Returns the texture associated to the tile.
-
-        Returns the index of the texture associated to the tile registered at the specified index. Note that the index 0
-        is forbidden since it corresponds to the empty tile, it should not be rendered.
+        Returns the index of a world object, the storage being compacted first.
 
         Parameters
         ----------
-        id_tile: int
-            The index of the tile.
+        world_object: WorldObject
+            The world object to look for.
+        start: int, optional
+            The first index to look at.
+        stop: int, optional
+            The index at which to stop looking (excluded).
 
         Raises
         ------
         ValueError
-            If the tile index is invalid.
+            If the world object is not held within the range of indexes.
 
         Returns
         -------
-        id_texture: int
-            The index of the texture to render.
+        index: int
+            The index of the world object, in their order of spawn.
         """
 
-        if not 0 < id_tile <= len(self._tiles):
-            raise ValueError("The tile with ID " + str(id_tile) + " is not registered.")
+        if world_object not in self:
+            raise ValueError("The world object is not spawned in this world.")
 
-        return self._tiles[id_tile - 1][1]
+        self.compact()
 
-    def __str__(self) -> str:
+        index = self._entries[id(world_object)][1]
+
+        if index not in range(len(self))[start:stop]:
+            raise ValueError("The world object is not within the range of indexes.")
+
+        return index
+
+    def count(self, world_object: WorldObject) -> int:
         """
-        Returns a description string of the object.
+        Returns the number of occurrences of a world object.
+
+        Parameters
+        ----------
+        world_object: WorldObject
+            The world object to count.
 
         Returns
         -------
-        string: str
-            The string object description.
+        count: int
+            1 if the world object is held, 0 otherwise.
         """
 
-        return "TileManager[tile_size=" + str(self.tile_size) + "]"
+        return int(world_object in self)
 
+    def sort(self, key: callable = None, reverse: bool = False) -> None:
+        """
+        Sorts the world objects in place, the world objects keeping their handle.
 
-class Direction:
-    """
-    An enumeration containing the different directions.
+        Parameters
+        ----------
+        key: callable, optional
+            The function returning the comparison key of a world object.
+        reverse: bool, optional
+            Sorts in descending order if set to True.
+        """
 
-    The collisions directions are represented using theses direction codes.
+        self.replace(sorted(self, key=key, reverse=reverse))
 
-    Methods
-    -------
-    next_right(direction)
-        Gives the direction obtained by a 90 degrees rotation clockwise.
-    next_left(direction)
-        Gives the direction obtained by a 90 degrees rotation counterclockwise.
-    opposite(direction)
-        Gives the direction obtained by a 180 degrees rotation.
-    get_name(direction)
-        Returns the name string of the direction.
-    """
+    def reverse(self) -> None:
+        """
+        Reverses the order of the world objects in place, the world objects keeping their handle.
+        """
 
-    DIRECTION_NONE = -1
-    DIRECTION_NORTH = 0
-    DIRECTION_EAST = 1
-    DIRECTION_SOUTH = 2
-    DIRECTION_WEST = 3
+        self.replace(list(self)[::-1])
 
-    @staticmethod
-    def next_right(direction: int) -> int:
+    def clear(self) -> None:
         """
-        Gives the direction obtained by a 90 degrees rotation clockwise.
+        Removes every world object.
+        """
+
+        self.replace([])
+
+    def replace(self, world_objects: list) -> None:
+        """
+        Replaces the world objects.
+
+        The world objects already held keep their handle, the other ones are given a new one.
 
         Parameters
         ----------
-        direction: int
-            The initial direction code.
+        world_objects: list of WorldObject
+            The new world objects, in their order of spawn.
 
-        Returns
-        -------
-        direction: int
-            The direction obtained after the rotation.
+        Raises
+        ------
+        ValueError
+            If a world object is given twice.
         """
 
-        if direction == Direction.DIRECTION_NONE:
-            return Direction.DIRECTION_NONE
+        objects = []
+        handles = {}
+        entries = {}
 
-        return (direction + 1) % 4
+        for world_object in world_objects:
+            if id(world_object) in entries:
+                raise ValueError("The world object is given twice.")
 
-    @staticmethod
-    def next_left(direction: int) -> int:
-        """
-        Gives the direction obtained by a 90 degrees rotation counterclockwise.
+            entry = self._entries.get(id(world_object))
 
-        Parameters
-        ----------
-        direction: int
-            The initial direction code.
+            if entry is not None:
+                handle = entry[0]
+            else:
+                handle = self._next_handle
+                self._next_handle += 1
 
-        Returns
-        -------
-        direction: int
-            The direction obtained after the rotation.
-        """
+            entries[id(world_object)] = (handle, len(objects))
+            handles[handle] = world_object
+            objects.append(world_object)
 
-        if direction == Direction.DIRECTION_NONE:
-            return Direction.DIRECTION_NONE
+        self._objects = objects
+        self._handles = handles
+        self._entries = entries
+        self._tombstones = 0
 
-        return (direction + 3) % 4
+        self.version += 1
 
-    @staticmethod
-    def opposite(direction: int) -> int:
+    def get(self, handle: int) -> [WorldObject, None]:
         """
-        Gives the direction obtained by a 180 degrees rotation.
+        Returns the world object of a handle.
 
         Parameters
         ----------
-        direction: int
-            The initial direction code.
+        handle: int
+            The handle of the world object, as returned when it was added.
 
         Returns
         -------
-        direction: int
-            The direction obtained after the rotation.
+        world_object: [WorldObject, None]
+            The world object of the handle, None if it was removed.
         """
 
-        if direction == Direction.DIRECTION_NONE:
-            return Direction.DIRECTION_NONE
-
-        return (direction + 2) % 4
+        return self._handles.get(handle)
 
-    @staticmethod
-    def get_name(direction: int) -> str:
+    def handle(self, world_object: WorldObject) -> int:
         """
-        Returns the name string of the direction.
+        Returns the handle of a world object.
 
         Parameters
         ----------
-        direction: int
-            The direction.
+        world_object: WorldObject
+            The world object held.
+
+        Raises
+        ------
+        ValueError
+            If the world object is not held.
 
         Returns
         -------
-        name: str
-            The direction name string.
+        handle: int
+            The handle of the world object.
         """
 
-        if direction == Direction.DIRECTION_NONE:
-            return "NONE"
-        elif direction == Direction.DIRECTION_NORTH:
-            return "NORTH"
-        elif direction == Direction.DIRECTION_EAST:
-            return "EAST"
-        elif direction == Direction.DIRECTION_SOUTH:
-            return "SOUTH"
-        elif direction == Direction.DIRECTION_WEST:
-            return "WEST"
-
-
-class CollisionEvent(Event):
-    """
-    A generic type of event used for collision.
+        if world_object not in self:
+            raise ValueError("The world object is not spawned in this world.")
 
-    This type of event is used for any event related to a collision between an entity with either a tile or another
-    entity. Theses events are not cancelable.
+        return self._entries[id(world_object)][0]
 
-    Attributes
-    ----------
-    tick: int
-        The tick at which the event got fired.
-    entity: Entity
-        The entity which collided.
-    direction: int
-        The direction of the collision relative to the entity.
-    """
-    
-    def __init__(self, tick: int, entity: Entity, direction: int):
+    def compact(self) -> None:
         """
-        Initializes the CollisionEvent.
+        Removes the tombstones left by the removed world objects.
 
-        Parameters
-        ----------
-        tick: int
-            The tick at which the event got fired.
-        entity: Entity
-            The entity which collided.
-        direction: int
-            The direction of the collision relative to the entity.
+        The slots of the world objects change, but not their handles.
         """
-        
-        Event.__init__(self, tick)
-        
-        self.entity = entity
-        self.direction = direction
+
+        if self._tombstones == 0:
+            return
+
+        self._objects = list(self)
+        self._tombstones = 0
+
+        for slot, world_object in enumerate(self._objects):
+            self._entries[id(world_object)] = (self._entries[id(world_object)][0], slot)
 
     def __str__(self) -> str:
         """
@@ -1294,788 +7177,913 @@ class CollisionEvent(Event):
             The string object description.
         """
 
-        return "CollisionEvent[tick=" + str(self.tick) + ", entity=" + str(self.entity) + ", " + \
-               "direction=" + Direction.get_name(self.direction) + "]"
+        return "WorldObjects[size=" + str(len(self)) + ", tombstones=" + str(self._tombstones) + "]"
 
 
-class CollisionWithTileEvent(CollisionEvent):
+class World:
     """
-    The type of CollisionEvent used for collisions between an entity and a tile.
+    The main game data holder.
 
-    This kind of event is fired whenever an entity collides with a tile. Note that after being handled, the speed of the
-    entity who collided must have changed to avoid colliding again with the tile (or else you are likely to be stuck in
-    an infinite loop).
+    This object contains the current played level with the tiles and the world objects. At each tick, the update
+    function should be called to move the entities and fire the collision events.
+
+    When the entities are held by an EntityStore, an entity which did not move and kept a zero speed during sleep_ticks
+    consecutive ticks falls asleep: it is skipped by the collision detection and the integration, the moving entities
+    still collide with it. It wakes up as soon as its speed changes, when it is involved in a collision event or when
+    the tiles it touches change.
+
+    The static entities (doors, crates, platforms...) keep a zero speed and never issue any collision event by
+    themselves: they are stored in their own spatial partitioning, which is only updated when a static entity is
+    spawned, destroyed or moved, and they are never tested against each other. They can still be moved by setting their
+    position.
+
+    A level far larger than the memory can be streamed from TileChunks. The world then only holds a dense window of
+    chunks covering its logic area, its streaming areas and the margin chunks around them, the tiles array being this
+    window and tiles_origin its position within the level. The streaming areas are the other areas in which the tiles
+    have to be resident, such as the views of the cameras (the WorldRenderer registers the view of its camera). The
+    window follows these areas: the chunks around it are loaded in the background and the chunks further away are
+    unloaded, the modified ones being saved. Since the window is a single array, it spans the chunks between the areas
+    as well. A logic area has to be given in this case.
+
+    The tiles are best modified with set_tiles: the modified block is recorded and the collision detection and the
+    renderer only update this block. The modifications done in place on the tiles array are detected by comparing it to
+    a snapshot once per tick, which costs a copy of the tiles array and a full comparison at each tick. The tracking of
+    the tiles can be disabled for large or streamed levels, the modifications done in place then have to be reported
+    with invalidate_tiles.
+
+    The tiles array can also be memory-mapped (numpy.memmap), for instance to share a large read-only level between
+    several processes. It is used as is, hence the modifications are written through to the mapped file and only the
+    pages of the tiles in use are loaded. Such a tiles array is never tracked.
 
     Attributes
     ----------
-    tick: int
-        The tick at which the event got fired.
-    entity: Entity
-        The entity which collided.
-    tile: int
-        The index of the tile with which the collision happened.
-    position: tuple of int
-            The position of the tile with which the collision happened.
-    direction: int
-        The direction of the collision relative to the entity.
+    tiles: numpy.ndarray
+        The tiles array of the level, or the window of the level if it is streamed.
+    tiles_origin: numpy.ndarray
+        The position of the first tile of the tiles array within the level, expressed in tiles.
+    tiles_version: int
+        A counter incremented each time a change of the tiles is detected.
+    world_objects: WorldObjects
+        The world objects spawned, in their order of spawn.
+    background: str
+        The background name.
+    logic_area: AxisAlignedBoundingBox, optional
+        The area over which the logic is performed.
+    logic_tile: bool, optional
+        Enables the collision detection with the tiles if set to True.
+    logic_entity: bool, optional
+        Enables the collision detection with the entities is set to True.
+    entity_store: EntityStore
+        The columnar storage of the entities of the world, None if it is disabled.
+    streaming_areas: list of AxisAlignedBoundingBox
+        The areas around which the chunks of a streamed level are kept loaded along with the logic area, expressed in
+        distance units.
 
     Methods
     -------
-    default_handler_collision_tile(event)
-        The default collision handler.
+    update(tick)
+        Updates the world objects.
+    spawn(world_object)
+        Spawns a new world object.
+    spawn_pooled(cls, *args, **kwargs)
+        Spawns a world object recycled from the destroyed ones of the same type.
+    clear_pools()
+        Releases the destroyed world objects kept for recycling.
+    has_solid_tile(area, direction)
+        Tells whether there is a solid tile within an area.
+    set_tiles(region, values)
+        Modifies the tiles of a block.
+    invalidate_tiles(min_tile, max_tile)
+        Reports that the tiles of a block were modified in place.
+    changed_tiles(version)
+        Returns the blocks of tiles modified since a version of the tiles.
+    settle_tiles()
+        Marks the changes of the tiles up to the current version as not waking the sleeping entities up.
+    close()
+        Releases the worker threads, processes and the shared memory used by the collision detection.
     """
 
-    def __init__(self, tick: int, entity: Entity, tile: int, position: tuple, direction: int):
+    DEFAULT_SLEEP_TICKS = 30
+
+    def __init__(self, tile_manager: TileManager, event_queue: EventQueue, tiles: [numpy.ndarray, TileChunks],
+                 background: str, logic_area: AxisAlignedBoundingBox = None, logic_tile: bool = True,
+                 logic_entity: bool = True, safe_mode: bool = True, multi_threading: bool = True,
+                 entity_per_thread: int = WorldUpdater.DEFAULT_ENTITY_PER_THREAD,
+                 node_capacity: int = QuadTree.DEFAULT_NODE_CAPACITY, max_depth: int = QuadTree.DEFAULT_MAX_DEPTH,
+                 entity_store: bool = False, broadphase: int = WorldUpdater.BROADPHASE_QUAD_TREE,
+                 cell_tiles: int = SpatialHash.DEFAULT_CELL_TILES, multi_processing: bool = False,
+                 sleep_ticks: int = DEFAULT_SLEEP_TICKS, track_tiles: bool = True):
         """
-        Initializes the CollisionWithTileEvent.
+        Initializes the World.
 
         Parameters
         ----------
-        tick: int
-            The tick at which the event got fired.
-        entity: Entity
-            The entity which collided.
-        tile: int
-            The index of the tile with which the collision happened.
-        position: tuple of int
-            The position of the tile with which the collision happened.
-        direction: int
-            The direction of the collision relative to the entity.
+        tile_manager: TileManager
+            The tile manager containing the tile data.
+        event_queue: EventQueue
+            The main event queue used to handle events.
+        tiles: [numpy.ndarray, TileChunks]
+            The tiles array of the level, which can be memory-mapped, or the chunks of a streamed level.
+        background: str
+            The background name.
+        logic_area: AxisAlignedBoundingBox, optional
+            The area over which the logic is performed.
+        logic_tile: bool, optional
+            Enables the collision detection with the tiles if set to True.
+        logic_entity: bool, optional
+            Enables the collision detection with the entities is set to True.
+        safe_mode: bool, optional
+            Enables the update function safe mode (preventing infinite loop) if set to True.
+        multi_threading: bool, optional
+            Enables the multi-threading mode if set to True.
+        entity_per_thread: int, optional
+            The minimal number of entities processed by each worker task.
+        node_capacity: int, optional
+            The object capacity of the leaf before it divides into smaller leaves.
+        max_depth: int, optional
+            The maximum depth of the tree.
+        entity_store: bool, optional
+            Stores the entities in a columnar EntityStore if set to True, which lets the idle entities fall asleep and
+            is required by WorldBatch. The bounding boxes and the speeds of the spawned entities then become views over
+            the store, hence they have to use an integer format. The entities are not stored by default, so that the
+            entities with non-integer bounding boxes can be spawned.
+        broadphase: int, optional
+            The spatial partitioning used to find the candidate collision pairs, either
+            WorldUpdater.BROADPHASE_QUAD_TREE, WorldUpdater.BROADPHASE_SWEEP_AND_PRUNE or
+            WorldUpdater.BROADPHASE_SPATIAL_HASH.
+        cell_tiles: int, optional
+            The size of the cells of the spatial hash expressed in tiles.
+        multi_processing: bool, optional
+            Runs the collision detection in worker processes if set to True.
+        sleep_ticks: int, optional
+            The number of idle ticks after which an entity falls asleep, the entities never sleep if set to None.
+        track_tiles: bool, optional
+            Detects the modifications done in place on the tiles array at each tick if set to True. Otherwise, which is
+            meant for large or streamed levels, the tiles have to be modified with set_tiles or reported with
+            invalidate_tiles.
+
+        Raises
+        ------
+        ValueError
+            If the level is streamed and no logic area is given.
         """
 
-        CollisionEvent.__init__(self, tick, entity, direction)
+        self._event_queue = event_queue
+        self._tile_manager = tile_manager
 
-        self.tile = tile
-        self.position = position
+        self._chunks = None
+        self._window = None
 
-    @staticmethod
-    def default_handler_collision_tile(event: "CollisionWithTileEvent") -> None:
-        """
-        The default collision handler.
+        self.streaming_areas = []
 
-        This handler is a default collision handler. It simply sets the speed of the entity to 0 along the event
-        direction.
+        if isinstance(tiles, TileChunks):
+            if logic_area is None:
+                raise ValueError("A logic area is required to stream a level from chunks.")
 
-        Parameters
-        ----------
-        event: CollisionWithTileEvent
-            The collision event fired.
-        """
+            self._chunks = tiles
 
-        direction = event.direction
+            # The first window is gathered once the updater exists
+            tiles = numpy.zeros((0, 0), dtype=tiles.dtype)
+
+        self.background = background
 
-        if direction == Direction.DIRECTION_EAST or direction == Direction.DIRECTION_WEST:
-            event.entity.speed[0] = 0
-        elif direction == Direction.DIRECTION_NORTH or direction == Direction.DIRECTION_SOUTH:
-            event.entity.speed[1] = 0
+        self._world_objects = WorldObjects()
 
-    def __str__(self) -> str:
-        """
-        Returns a description string of the object.
+        self.entity_store = EntityStore() if entity_store else None
 
-        Returns
-        -------
-        string: str
-            The string object description.
-        """
+        self._entities = None
+        self._pools = {}
 
-        return "CollisionWithTileEntityEvent[tick=" + str(self.tick) + ", entity=" + str(self.entity) + ", " + \
-               "direction=" + Direction.get_name(self.direction) + ", tile=" + str(self.tile) + ", " + \
-               "position=[" + str(self.position[0]) + " " + str(self.position[1]) + "]]"
+        self._updater = WorldUpdater(
+            tile_manager, tiles, logic_area, logic_tile, logic_entity, multi_threading, entity_per_thread,
+            node_capacity, max_depth, broadphase, cell_tiles, multi_processing, track_tiles
+        )
 
+        self._safe_mode = safe_mode
 
-class CollisionWithEntityEvent(CollisionEvent):
-    """
-    The type of CollisionEvent used for collisions between two entities.
+        self._sleep_ticks = sleep_ticks
+        self._tiles_version = self._updater.tiles_version
 
-    This kind of event is fired whenever two entities collide. Note that after being handled, the speed of the entities
-    who collided must have changed to avoid colliding again (or else you are likely to be stuck in an infinite loop).
-    This event can be reversed, meaning that both entities can swap their role.
+        if self._chunks is not None:
+            self._stream_tiles()
 
-    Attributes
-    ----------
-    tick: int
-        The tick at which the event got fired.
-    entity: Entity
-        The entity which collided.
-    other: entity
-        The other entity with which the collision happened.
-    direction: int
-        The direction of the collision relative to the first entity.
+    @property
+    def world_objects(self) -> WorldObjects:
+        """
+        The world objects property containing the world objects spawned.
+        """
 
-    Methods
-    -------
-    reverse()
-        Reverses the event by swapping the role of the entities.
-    default_handler_collision_entity(event)
-        The default collision handler.
-    """
+        return self._world_objects
 
-    def __init__(self, tick: int, entity: Entity, other: Entity, direction: int):
+    @world_objects.setter
+    def world_objects(self, world_objects: list) -> None:
         """
-        Initializes the CollisionWithEntityEvent.
+        Setter function for the world objects.
 
         Parameters
         ----------
-        tick: int
-            The tick at which the event got fired.
-        entity: Entity
-            The entity which collided.
-        other: entity
-            The other entity with which the collision happened.
-        direction: int
-            The direction of the collision relative to the first entity.
+        world_objects: list of WorldObject
+            The new world objects, in their order of spawn.
         """
 
-        CollisionEvent.__init__(self, tick, entity, direction)
-
-        self.other = other
+        self._world_objects.replace(list(world_objects))
 
-    def reverse(self) -> None:
+    @property
+    def tiles(self) -> numpy.ndarray:
         """
-        Reverses the event by swapping the role of the entities.
+        The tiles property containing the tiles indexes of the level.
         """
 
-        self.entity, self.other = self.other, self.entity
-        self.direction = Direction.opposite(self.direction)
+        return self._updater.tiles
 
-    @staticmethod
-    def default_handler_collision_entity(event: "CollisionWithEntityEvent") -> None:
+    @tiles.setter
+    def tiles(self, tiles: numpy.ndarray) -> None:
         """
-        The default collision handler.
-
-        This handler is a default collision handler. It simply sets the speed of both entities to 0 along the event
-        direction.
+        Setter function for the tiles array.
 
         Parameters
         ----------
-        event: CollisionWithEntityEvent
-            The collision event fired.
+        tiles: numpy.ndarray
+            The array of tile indexes of the level.
         """
 
-        direction = event.direction
-
-        axis = 0
+        self._updater.tiles = tiles
+        self._updater.refresh_tiles()
 
-        if direction == Direction.DIRECTION_NORTH or direction == Direction.DIRECTION_SOUTH:
-            axis = 1
+    @property
+    def tiles_origin(self) -> numpy.ndarray:
+        """
+        The tiles origin property containing the position of the first tile of the tiles array within the level.
+        """
 
-        if event.entity.speed[axis] * event.other.speed[axis] <= 0:
-            event.entity.speed[axis] = 0
-            event.other.speed[axis] = 0
-        elif abs(event.entity.speed[axis]) >= abs(event.other.speed[axis]):
-            event.entity.speed[axis] = 0
-        else:
-            event.other.speed[axis] = 0
+        return self._updater.tiles_origin
 
-    def __str__(self) -> str:
+    @property
+    def tiles_version(self) -> int:
+        """
+        The tiles version property containing a counter incremented each time a change of the tiles is detected.
         """
-        Returns a description string of the object.
 
-        Returns
-        -------
-        string: str
-            The string object description.
+        return self._updater.tiles_version
+
+    @property
+    def logic_area(self) -> AxisAlignedBoundingBox:
+        """
+        The logic area property specifying the area over which the logic is performed.
         """
 
-        return "CollisionWithEntityEvent[tick=" + str(self.tick) + ", entity=" + str(self.entity) + ", " + \
-               "other=" + str(self.other) + ", direction=" + Direction.get_name(self.direction) + "]"
+        return self._updater.logic_area
 
+    @logic_area.setter
+    def logic_area(self, logic_area: AxisAlignedBoundingBox) -> None:
+        """
+        Setter function for the logic area.
 
-class MovableSegment:
-    """
-    SAT util object used for 1D collisions.
+        Parameters
+        ----------
+        logic_area: AxisAlignedBoundingBox
+            The AABB over which the logic is performed.
+        """
 
-    This class is used to apply the Separating Axis Theorem. A moving AABB should have its bounds projected on both
-    plane axis as a movable segment. It allows to compute the time of impact or the time of separation of two objects.
+        self._updater.logic_area = logic_area
 
-    Attributes
-    ----------
-    low: float
-        The lowest position of the segment.
-    high: float
-        The highest position of the segment.
-    speed: float
-        The speed of the segment.
+    @property
+    def logic_tile(self) -> bool:
+        """
+        The logic tile property specifying whether or not the collision detection should be done with tiles.
+        """
 
-    Methods
-    -------
-    should_impact(other)
-        Returns whether or not the segments will impact.
-    should_separate(other)
-        Returns whether or not the segments will separate.
-    time_of_impact(other)
-        Computes the time at which the two segments will collide.
-    time_of_separation(other)
-        Computes the time at which the two segments will separate.
-    """
+        return self._updater.logic_tile
 
-    def __init__(self, low: float, high: float, speed: float = 0.0):
+    @logic_tile.setter
+    def logic_tile(self, logic_tile: bool) -> None:
         """
-        Initializes the MovableSegment.
+        Setter function for the logic tile flag.
 
         Parameters
         ----------
-        low: float
-            The lowest position of the segment.
-        high: float
-            The highest position of the segment.
-        speed: float, optional
-            The speed of the segment.
+        logic_tile: bool
+            Enables the collision detection with tiles if set to True.
         """
 
-        self.low = low
-        self.high = high
-        self.speed = speed
+        self._updater.logic_tile = logic_tile
 
-    def __contains__(self, other: "MovableSegment") -> bool:
+    @property
+    def logic_entity(self) -> bool:
+        """
+        The logic entity property specifying whether or not the collision detection should be done with entities.
         """
-        Returns the inner point test.
 
-        Tests if the specified segment is completely embedded in the main one.
+        return self._updater.logic_entity
+
+    @logic_entity.setter
+    def logic_entity(self, logic_entity: bool) -> None:
+        """
+        Setter function for the logic entity flag.
 
         Parameters
         ----------
-        other: MovableSegment
-            The other movable segment with which the test is performed.
-
-        Returns
-        -------
-        result: bool
-            True if the tested segment is in the main segment and False otherwise.
+        logic_entity: bool
+            Enables the collision detection with the entities if set to True.
         """
 
-        return self.high >= other.low and self.low <= other.high
+        self._updater.logic_entity = logic_entity
 
-    def __eq__(self, other: "MovableSegment") -> bool:
+    def update(self, tick: int) -> None:
         """
-        Returns the equality test.
+        Updates the world objects.
 
-        Tests if the specified segment is strictly equals to the main one in terms of position and size.
+        Fetches the collision and fires them using the world updater.
 
         Parameters
         ----------
-        other: MovableSegment
-            The other movable segment with which the test is performed.
+        tick: int
+            The current logic tick.
 
-        Returns
-        -------
-        result: bool
-            True if the tested segment is equal to the main segment and False otherwise.
+        Raises
+        ------
+        UnsolvedCollisionError
+            If a same event is fired twice in a single tick.
         """
 
-        return self.high == other.low or self.low == other.high
+        state = self._begin_update()
 
-    def should_impact(self, other: "MovableSegment") -> bool:
+        if state is None:
+            return
+
+        entities, rows, local_times = state[:3]
+
+        store = self.entity_store
+
+        collision_remaining = True
+
+        while collision_remaining:
+            if store is not None:
+                store.local_times[rows] = local_times
+
+                events = self._updater.fetch_next_store_events(store, rows)
+            else:
+                events = self._updater.fetch_next_events(entities, local_times)
+
+            collision_remaining = self._fire_events(tick, state, events)
+
+        self._end_update(state)
+
+    def _begin_update(self) -> tuple:
         """
-        Returns whether or not the segments will impact.
+        Prepares the update of a tick.
 
-        Parameters
-        ----------
-        other: MovableSegment
-            The other segment with which the test is performed.
+        Moves the window of a streamed level, updates the modified tiles, removes the world objects to destroy and
+        gathers the entities within the logic area.
 
         Returns
         -------
-        result: bool
-            True if the tested segment should impact with the main one and False otherwise.
+        state: tuple
+            The entities to update, their rows in the entity store, their local times, whether they were involved in a
+            collision event, their initial positions if they can fall asleep and the events already fired. None if
+            there is no entity to update.
         """
 
-        return self.high < other.low and self.speed > other.speed or self.low > other.high and self.speed < other.speed
+        if self._chunks is not None:
+            self._stream_tiles()
 
-    def should_separate(self, other: "MovableSegment") -> bool:
+        self._updater.detect_tiles()
+        self._updater.refresh_tiles()
+
+        store = self.entity_store
+
+        to_destroy = [world_object for world_object in self.world_objects if world_object.should_be_destroyed]
+
+        for world_object in to_destroy:
+            self.world_objects.remove(world_object)
+
+            if world_object._pooled:
+                # A pooled entity keeps its row, so that it is spawned again without binding new views
+                self._pools.setdefault(type(world_object), []).append(world_object)
+            elif store is not None and isinstance(world_object, Entity) and world_object._store is store:
+                store.remove(world_object)
+
+        if store is not None:
+            entities, rows = self._stored_entities()
+
+            inside = self._within_logic_area(store.positions[rows], store.bounds[rows])
+        else:
+            entities = [world_object for world_object in self.world_objects if isinstance(world_object, Entity)]
+            rows = None
+
+            positions = numpy.array([entity.bounding_box.position for entity in entities], dtype=numpy.float64)
+            bounds = numpy.array([entity.bounding_box.bounds for entity in entities], dtype=numpy.float64)
+
+            inside = self._within_logic_area(positions.reshape(-1, 2), bounds.reshape(-1, 2))
+
+        if not inside.all():
+            indexes = numpy.flatnonzero(inside)
+
+            entities = [entities[index] for index in indexes.tolist()]
+
+            if rows is not None:
+                rows = rows[indexes]
+
+        if len(entities) == 0:
+            return None
+
+        if rows is None:
+            rows = numpy.zeros(0, dtype=numpy.int64)
+
+        local_times = numpy.zeros(len(entities), dtype=numpy.float64)
+        involved = numpy.zeros(len(entities), dtype=bool)
+
+        if store is not None and self._sleep_ticks is not None:
+            initial_positions = store.positions[rows].copy()
+        else:
+            initial_positions = None
+
+        return entities, rows, local_times, involved, initial_positions, set()
+
+    def _stored_entities(self) -> (list, numpy.ndarray):
         """
-        Returns whether or not the segments will separate.
+        Returns the entities of the world and their rows in the entity store.
 
-        Parameters
-        ----------
-        other: MovableSegment
-            The other segment with which the test is performed.
+        The entities are given in their order of spawn and moved into the entity store of the world if needed. The list
+        is kept until an entity is inserted in or removed from the store, or until a world object is spawned or removed.
 
         Returns
         -------
-        result: bool
-            True if the tested segment should separate from the main one and False otherwise.
+        entities, rows: list of Entity, numpy.ndarray
+            The entities of the world and their rows in the entity store.
         """
 
-        return self.speed != other.speed
+        store = self.entity_store
 
-    def time_of_impact(self, other: "MovableSegment") -> float:
-        """
-        Computes the time at which the two segments will collide.
+        if self._entities is None or self._entities[0] != (store, store.version, self.world_objects.version):
+            entities = [world_object for world_object in self.world_objects if isinstance(world_object, Entity)]
 
-        This function should be called only if the segments will impact. It expresses the time of impact (TOI) between
-        the two segment in fraction of tick.
+            for entity in entities:
+                if entity._store is not store:
+                    self._store_entity(entity)
+
+            rows = numpy.array([entity._row for entity in entities], dtype=numpy.int64)
+
+            self._entities = ((store, store.version, self.world_objects.version), entities, rows)
+
+        return self._entities[1], self._entities[2]
+
+    def _within_logic_area(self, positions: numpy.ndarray, bounds: numpy.ndarray) -> numpy.ndarray:
+        """
+        Tells whether each bounding box is fully within the logic area.
 
         Parameters
         ----------
-        other: MovableSegment
-            The other segment.
+        positions: numpy.ndarray
+            The positions of the bottom-left corner of the bounding boxes.
+        bounds: numpy.ndarray
+            The widths and the heights of the bounding boxes.
 
         Returns
         -------
-        time_of_impact: float
-            The time of impact expressed in a fraction of tick.
+        inside: numpy.ndarray
+            True for each bounding box embedded in the logic area, as tested by AxisAlignedBoundingBox.__contains__.
         """
 
-        if self.speed == other.speed:
-            return -1
-
-        if self.high < other.low:
-            return (other.low - self.high) / (self.speed - other.speed)
+        area = self.logic_area
 
-        return (self.low - other.high) / (other.speed - self.speed)
+        return numpy.all((area.position <= positions) & (area.position + area.bounds >= positions + bounds), axis=1)
 
-    def time_of_separation(self, other: "MovableSegment") -> float:
+    def _fire_events(self, tick: int, state: tuple, events: list) -> bool:
         """
-        Computes the time at which the two segments will separate.
+        Fires a round of independent collision events.
 
-        This function should be called only if the segments will separate. It expresses the time of separation (TOS)
-        between the two segment in fraction of tick.
+        The entities of each event are moved to their position at the time of impact before the event is fired.
 
         Parameters
         ----------
-        other: MovableSegment
-            The other segment.
+        tick: int
+            The current logic tick.
+        state: tuple
+            The state of the tick, as returned by _begin_update.
+        events: list of CollisionPseudoEvent
+            The independent events to fire.
+
+        Raises
+        ------
+        UnsolvedCollisionError
+            If a same event is fired twice in a single tick.
 
         Returns
         -------
-        time_of_impact: float
-            The time of separation expressed in a fraction of tick.
+        fired: bool
+            True if any event was fired.
         """
 
-        if self.speed > other.speed:
-            return (other.high - self.low) / (self.speed - other.speed)
+        entities, _, local_times, involved, _, past_events = state
 
-        return (self.high - other.low) / (other.speed - self.speed)
+        for event in events:
+            if self._safe_mode and event in past_events:
+                raise UnsolvedCollisionError(event)
 
-    def __str__(self) -> str:
-        """
-        Returns a description string of the object.
+            if event.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
+                for collider in event.colliders:
+                    entity = entities[collider]
 
-        Returns
-        -------
-        string: str
-            The string object description.
-        """
+                    position = entity.position + entity.speed * (event.time_of_impact - local_times[collider])
+                    entity.position = numpy.floor(position)
 
-        return "MovableSegment[low=" + str(self.low) + ", high=" + str(self.high) + ", speed=" + str(self.speed) + "]"
+                    local_times[collider] = event.time_of_impact
+                    involved[collider] = True
 
+                self._event_queue.fire_event(CollisionWithEntityEvent(
+                        tick, entities[event.colliders[0]], entities[event.colliders[1]], event.collision_direction
+                ))
 
-class CollisionObject:
-    """
-    Standard collision object representation.
+            if event.collision_type == CollisionPseudoEvent.COLLISION_TILE:
+                entity = entities[event.colliders[0]]
 
-    This object is used to create an abstract and logic pure representation of an entity. It uses the float
-    representation of the bounding boxes for better precision when the local time is non-zero. It is useful when the
-    entity are overridden by the user with inadequate data such as ctypes that cannot be used for parallelization. It
-    also holds the index of the entity for simpler list usage.
+                position = entity.position + entity.speed * (event.time_of_impact - local_times[event.colliders[0]])
+                entity.position = numpy.floor(position)
 
-    Attributes
-    ----------
-    index: int
-        The index of the object corresponding to the entity from the world object list.
-    bounding_box: AxisAlignedBoundingBox
-        The AABB of the entity in float representation.
-    bounding_box_expanded: AxisAlignedBoundingBox
-        The minimal AABB covering the amount space in which the object moves.
-    speed: numpy.ndarray
-        The speed vector of the entity expressed in unit per tick.
-    entity_type: type
-        The type of the entity used as collider type.
-    collides_with_tiles: bool
-        Enables the collision detection with tiles.
-    local_time: float
-        The local time of the object within the current tick. This should be between 0 and 1.
+                local_times[event.colliders[0]] = event.time_of_impact
+                involved[event.colliders[0]] = True
 
-    Methods
-    -------
-    should_collide_with(other)
-        Returns whether or not the collision object should collide with the other.
-    """
+                tile_position = event.colliders[2:]
 
-    def __init__(self, index: int, entity: Entity, local_time: float):
+                self._event_queue.fire_event(CollisionWithTileEvent(
+                    tick, entities[event.colliders[0]], event.colliders[1], tile_position, event.collision_direction
+                ))
+
+            past_events.add(event)
+
+        return len(events) > 0
+
+    def _end_update(self, state: tuple) -> None:
         """
-        Initializes the CollisionObject.
+        Moves the entities until the end of the tick and updates their sleep state.
 
         Parameters
         ----------
-        index: int
-            The index of the object corresponding to the entity from the world object list.
-        entity: Entity
-            The entity from which the collision object representation is created.
-        local_time: float
-            The local time of the object within the current tick. This should be between 0 and 1.
+        state: tuple
+            The state of the tick, as returned by _begin_update.
         """
 
-        self.index = index
-
-        self.bounding_box = entity.bounding_box.as_type(numpy.float32)
-        self.bounding_box_expanded = self.bounding_box.expand(entity.speed * (1 - local_time))
-        self.speed = entity.speed
+        entities, rows, local_times, involved, initial_positions, _ = state
 
-        self.entity_type = type(entity)
-        self._colliders = entity.colliders
+        store = self.entity_store
 
-        self.collides_with_tiles = entity.collides_with_tiles
+        if store is not None:
+            # The sleeping entities have a zero speed, moving them leaves their position unchanged. The assignment
+            # truncates the positions into the int32 columns, as the bounding boxes bound to the store do
+            store.positions[rows] = store.positions[rows] + store.speeds[rows] * (1 - local_times)[:, numpy.newaxis]
+        else:
+            for index, entity in enumerate(entities):
+                entity.position = entity.bounding_box.position + entity.speed * (1 - local_times[index])
 
-        self.local_time = local_time
+        if initial_positions is not None:
+            self._update_sleep(rows, initial_positions, involved)
 
-    def should_collide_with(self, other: "CollisionObject") -> bool:
+    def _update_sleep(self, rows: numpy.ndarray, initial_positions: numpy.ndarray, involved: numpy.ndarray) -> None:
         """
-        Returns whether or not the collision object should collide with the other.
+        Updates the sleep state of the entities at the end of a tick.
 
         Parameters
         ----------
-        other: CollisionObject
-            The other collision object with which the test is performed.
-        Returns
-        -------
-        result: bool
-            True if the object should collide with the other and False otherwise.
+        rows: numpy.ndarray
+            The rows of the entities updated during the tick.
+        initial_positions: numpy.ndarray
+            The positions of the entities at the beginning of the tick.
+        involved: numpy.ndarray
+            Whether each entity was involved in a collision event during the tick.
         """
 
-        cls = other.entity_type
+        store = self.entity_store
 
-        for collider in self._colliders:
-            if issubclass(cls, collider):
-                return True
+        idle = ~numpy.any(store.speeds[rows], axis=1) & numpy.all(store.positions[rows] == initial_positions, axis=1)
+        idle &= ~involved
 
-        return False
+        if self._tiles_version != self._updater.tiles_version:
+            blocks = self._updater.changed_tiles(self._tiles_version)
 
-    def __str__(self) -> str:
-        """
-        Returns a description string of the object.
+            self._tiles_version = self._updater.tiles_version
 
-        Returns
-        -------
-        string: str
-            The string object description.
+            if blocks is None:
+                idle[:] = False
+            else:
+                idle &= ~self._updater.touches_tiles(store.positions[rows], store.bounds[rows], blocks)
+
+        idle_ticks = numpy.where(idle, store.idle_ticks[rows] + 1, 0)
+
+        store.idle_ticks[rows] = numpy.minimum(idle_ticks, self._sleep_ticks)
+        store.sleeping[rows] = idle_ticks >= self._sleep_ticks
+
+    def _stream_tiles(self) -> None:
         """
+        Moves the window of a streamed level over the logic area and the streaming areas.
 
-        return "CollisionObject[index=" + str(self.index) + ", bounding_box=" + str(self.bounding_box) + ", " + \
-               "bounding_box_expanded=" + str(self.bounding_box_expanded) + ", speed=" + str(self.speed) + ", " + \
-               "entity_type=" + str(self.entity_type) + ", " + \
-               "collides_with_tiles=" + str(self.collides_with_tiles) + ", colliders=" + str(self._colliders) + ", " + \
-               "local_time=" + str(self.local_time) + "]"
+        The window covers the chunks overlapped by the logic area or any streaming area and the margin chunks around
+        them. When it moves, the tiles of the previous window are written back into the chunks and the new window is
+        gathered, waiting for its chunks which are not loaded yet. The ring of chunks around the window is then loaded
+        in the background, while the chunks beyond the next ring are unloaded.
+        """
 
+        chunks = self._chunks
+        size = chunks.chunk_size * self._tile_manager.tile_size
 
-class QuadTree:
-    """
-    Spatial partitioning for collision detection optimization.
+        areas = [self.logic_area] + list(self.streaming_areas)
 
-    This class holds the current object of the world with associated to the amount of space they move in. This is based
-    on a structure of quad tree for 2D space partitioning adapted for AABBs, and speeds up the detection of potential
-    collision pairs.
+        lower = numpy.min([area.position for area in areas], axis=0)
+        upper = numpy.max([area.position + area.bounds for area in areas], axis=0)
 
-    Methods
-    -------
-    insert(collision_object)
-        Inserts a new collision object in the tree.
-    intersect(bounds, results=None, unique=None)
-        Returns the list of object intersecting with the bounds.
-    """
+        min_chunk = numpy.floor(lower / size).astype(numpy.int64) - chunks.margin
+        max_chunk = numpy.ceil(upper / size).astype(numpy.int64) - 1 + chunks.margin
 
-    DEFAULT_NODE_CAPACITY = 32
-    DEFAULT_MAX_DEPTH = 5
+        window = (tuple(min_chunk.tolist()), tuple(max_chunk.tolist()))
 
-    def __init__(self, bounds: AxisAlignedBoundingBox, node_capacity: int = DEFAULT_NODE_CAPACITY,
-                 max_depth: int = DEFAULT_MAX_DEPTH):
-        """
-        Initializes the QuadTree.
+        if window == self._window:
+            return
 
-        Parameters
-        ----------
-        bounds: AxisAlignedBoundingBox
-            The bounds of the leaf.
-        node_capacity: int, optional
-            The object capacity of the leaf before it divides into smaller leaves.
-        max_depth: int, optional
-            The maximum depth of the tree.
-        """
+        if self._window is not None:
+            chunks.store(self._window[0], self._updater.tiles)
 
-        self._nodes = []
-        self._children = []
+        self._updater.tiles = chunks.window(min_chunk, max_chunk)
+        self._updater.tiles_origin = min_chunk * chunks.chunk_size
 
-        self._bounds = bounds
-        self._center = self._bounds.position + self._bounds.bounds / 2
+        self._window = window
 
-        self._max_items = node_capacity
-        self._max_depth = max_depth
+        # The unloaded ring is wider than the loaded one, so that a logic area moving back and forth along a chunk
+        # border does not load and unload the same chunks again and again
+        chunks.request(min_chunk - 1, max_chunk + 1)
+        chunks.release(min_chunk - 2, max_chunk + 2)
 
-    def _split(self) -> None:
+    def spawn(self, world_object: WorldObject) -> int:
         """
-        Divides the leaf into four sub leaves.
+        Spawns a new world object.
 
-        The leaf is divided in four other leaves of the same size (one for each corner). Each object of the leaf is
-        placed into the sub leaves if it is possible.
-        """
+        Parameters
+        ----------
+        world_object: WorldObject
+            The world object to spawn.
 
-        width_low = self._bounds.bounds[0] // 2
-        width_high = self._bounds.bounds[0] - width_low
+        Raises
+        ------
+        ValueError
+            If the world object is already spawned in this world, or if it is an entity whose bounding box does not use
+            an integer format while the world uses an entity store.
 
-        height_low = self._bounds.bounds[1] // 2
-        height_high = self._bounds.bounds[1] - height_low
+        Returns
+        -------
+        handle: int
+            The handle of the world object, which can be resolved with world_objects.get until it is destroyed.
+        """
 
-        self._children.append(QuadTree(AxisAlignedBoundingBox(
-            self._bounds.position, (width_low, height_low)
-        ), node_capacity=self._max_items, max_depth=self._max_depth - 1))
+        stored = self.entity_store is not None and isinstance(world_object, Entity)
 
-        self._children.append(QuadTree(AxisAlignedBoundingBox(
-            self._bounds.position + (0, height_low), (width_low, height_high)
-        ), node_capacity=self._max_items, max_depth=self._max_depth - 1))
+        if stored:
+            EntityStore._check_bounding_box(world_object.bounding_box)
 
-        self._children.append(QuadTree(AxisAlignedBoundingBox(
-            self._bounds.position + (width_low, height_low), (width_high, height_high)
-        ), node_capacity=self._max_items, max_depth=self._max_depth - 1))
+        handle = self.world_objects.append(world_object)
 
-        self._children.append(QuadTree(AxisAlignedBoundingBox(
-            self._bounds.position + (width_low, 0), (width_high, height_low)
-        ), node_capacity=self._max_items, max_depth=self._max_depth - 1))
+        if stored:
+            self._store_entity(world_object)
 
-        nodes = self._nodes
+        return handle
 
-        self._nodes = []
+    def spawn_pooled(self, cls: type, *args, **kwargs) -> int:
+        """
+        Spawns a world object recycled from the destroyed ones of the same type.
 
-        for node in nodes:
-            self._insert_into_children(node)
+        A world object spawned this way is kept in the pool of its type once destroyed, instead of being released. The
+        next spawn of this type initializes it again with its reset function, which takes the same arguments as the
+        __init__ function but writes the given values into the arrays of the world object: the values of the given
+        bounding boxes are copied, so that the same bounding boxes can be given for each spawn. A pooled entity also
+        keeps its row in the entity store while it is destroyed, its bounding box and its speed staying views over this
+        row, hence spawning it again allocates no array. A new world object is only created when the pool is empty.
 
-    def _insert_into_children(self, collision_object: CollisionObject) -> None:
-        """
-        Inserts the node into one of the children.
+        The reset function only initializes the state known to the class defining it. A subclass which overrides the
+        __init__ function without overriding reset is initialized again by its __init__ function instead, so that none
+        of its state is kept from its previous life, but its arrays are then allocated again. A subclass overriding
+        reset has to initialize its own state there, its reset function taking the same arguments as its __init__
+        function. Note that the handles of the destroyed world objects do not resolve to their recycled instance.
 
         Parameters
         ----------
-        collision_object: CollisionObject
-            The object to insert in the tree.
+        cls: type
+            The type of the world object, such as Particle or a subclass of Entity.
+        *args
+            The positional arguments of the __init__ and reset functions of the type.
+        **kwargs
+            The keyword arguments of the __init__ and reset functions of the type.
+
+        Returns
+        -------
+        handle: int
+            The handle of the world object, which can be resolved with world_objects.get until it is destroyed.
         """
 
-        if collision_object.bounding_box_expanded.inner_point(self._center):
-            self._nodes.append(collision_object)
-        else:
-            if collision_object.bounding_box_expanded.position[0] <= self._center[0]:
-                if collision_object.bounding_box_expanded.position[1] <= self._center[1]:
-                    self._children[0].insert(collision_object)
-                if collision_object.bounding_box_expanded.position[1] + \
-                        collision_object.bounding_box_expanded.bounds[1] >= self._center[1]:
-                    self._children[1].insert(collision_object)
-            if collision_object.bounding_box_expanded.position[0] + \
-                    collision_object.bounding_box_expanded.bounds[0] > self._center[0]:
-                if collision_object.bounding_box_expanded.position[1] <= self._center[1]:
-                    self._children[2].insert(collision_object)
-                if collision_object.bounding_box_expanded.position[1] + \
-                        collision_object.bounding_box_expanded.bounds[1] >= self._center[1]:
-                    self._children[3].insert(collision_object)
+        pool = self._pools.get(cls)
+        world_object = None
 
-    def insert(self, collision_object: CollisionObject) -> None:
-        """
-        Inserts a new collision object in the tree.
+        while pool:
+            world_object = pool.pop()
 
-        Tries to insert a new collision object. If the leaf is already split, the object will be inserted in the sub
-        leaves if it is possible.
+            # A restored snapshot may have spawned a pooled world object again
+            if world_object not in self.world_objects:
+                break
 
-        Parameters
-        ----------
-        collision_object: CollisionObject
-            The object to insert in the tree.
-        """
+            world_object = None
 
-        if len(self._children) == 0:
-            self._nodes.append(collision_object)
+        if world_object is not None and World._resets(cls):
+            world_object.reset(*args, **kwargs)
 
-            if len(self._nodes) > self._max_items and self._max_depth > 0:
-                self._split()
+            if isinstance(world_object, Entity) and world_object._store is not None and \
+                    world_object._store is self.entity_store:
+                self.entity_store.reset(world_object)
         else:
-            self._insert_into_children(collision_object)
+            if world_object is None:
+                world_object = cls(*args, **kwargs)
+            else:
+                # The state added by the subclass is unknown to its reset function, the world object is initialized
+                # again from scratch, hence its new arrays have to be bound to a new row
+                if isinstance(world_object, Entity) and world_object._store is not None:
+                    world_object._store.remove(world_object)
 
-    def intersect(self, bounds: AxisAlignedBoundingBox, results: list = None, unique: set = None) -> list:
+                world_object.__init__(*args, **kwargs)
+
+            # The given bounding boxes may be given again for the next spawns, they are not kept
+            for name in ("bounding_box", "texture_bounds"):
+                if hasattr(world_object, name):
+                    setattr(world_object, name, getattr(world_object, name).copy())
+
+        world_object._pooled = True
+
+        return self.spawn(world_object)
+
+    @staticmethod
+    def _resets(cls: type) -> bool:
         """
-        Returns the list of object intersecting with the bounds.
+        Tells whether the reset function of a type initializes the whole state of its instances.
 
-        Parameters
-        ----------
-        bounds: AxisAlignedBoundingBox
-            The AABB of research.
-        results: list of CollisionObject, optional
-            The current result list. Leave it to None by default.
-        unique: set of indexes, optional
-            The current set of indexes of object in the result list.
+        This is the case unless the type, or one of its parents, overrides the __init__ function without overriding
+        reset as well.
+
+        Parameters
+        ----------
+        cls: type
+            The type of the world objects.
 
         Returns
         -------
-        results: list of CollisionObject
-            The list of collision objects intersecting with the AABB.
+        resets: bool
+            True if the instances of the type can be initialized again with reset.
         """
 
-        if results is None:
-            results = []
-            unique = set()
+        init = next(base for base in cls.__mro__ if "__init__" in vars(base))
+        reset = next((base for base in cls.__mro__ if "reset" in vars(base)), None)
 
-        if self._children:
-            if bounds.position[0] <= self._center[0]:
-                if bounds.position[1] <= self._center[1]:
-                    self._children[0].intersect(bounds, results, unique)
-                if bounds.position[1] + bounds.bounds[1] >= self._center[1]:
-                    self._children[1].intersect(bounds, results, unique)
-            if bounds.position[0] + bounds.bounds[0] >= self._center[0]:
-                if bounds.position[1] <= self._center[1]:
-                    self._children[2].intersect(bounds, results, unique)
-                if bounds.position[1] + bounds.bounds[1] >= self._center[1]:
-                    self._children[3].intersect(bounds, results, unique)
+        return reset is not None and issubclass(reset, init)
 
-        for node in self._nodes:
-            _id = node.index
+    def clear_pools(self) -> None:
+        """
+        Releases the destroyed world objects kept for recycling, as well as the rows of the pooled entities.
+        """
 
-            if _id not in unique and bounds.intersects(node.bounding_box_expanded):
-                results.append(node)
-                unique.add(_id)
+        for pool in self._pools.values():
+            for world_object in pool:
+                if isinstance(world_object, Entity) and world_object._store is not None and \
+                        world_object not in self.world_objects:
+                    world_object._store.remove(world_object)
 
-        return results
+        self._pools.clear()
 
-    def __str__(self) -> str:
+    def has_solid_tile(self, area: AxisAlignedBoundingBox, direction: int = Direction.DIRECTION_NONE) -> bool:
         """
-        Returns a description string of the object.
+        Tells whether there is a solid tile within an area.
+
+        Parameters
+        ----------
+        area: AxisAlignedBoundingBox
+            The area to check, expressed in distance units.
+        direction: int, optional
+            The direction in which the tiles have to be solid, any direction if set to Direction.DIRECTION_NONE.
 
         Returns
         -------
-        string: str
-            The string object description.
+        solid: bool
+            True if any tile overlapped by the area is solid in the direction.
         """
 
-        return "QuadTree[bounding_box=" + str(self._bounds) + "]"
+        return self._updater.has_solid_tile(area, direction)
 
+    def set_tiles(self, region: AxisAlignedBoundingBox, values: [int, numpy.ndarray]) -> None:
+        """
+        Modifies the tiles of a block.
 
-class CollisionPseudoEvent:
-    """
-    A generic object to represent the collision events.
+        The block is recorded as modified, so that the collision detection and the renderer only update this block.
 
-    Note that this object is not event, it merely serves as a placeholder. When multiple collision events occurs in the
-    same tick, the set of pseudo event can be reduced by order of importance and independence. Two event are independent
-    if their colliders set is disjoint. A event is more important than an other one if they are dependent and the time
-    of impact of the first event is lesser than the one of the latter. After being sorted and separated, the pseudo
-    events can be converted into standard collision event and being processed by the event queue.
+        Parameters
+        ----------
+        region: AxisAlignedBoundingBox
+            The block of tiles to modify, its position and its bounds being expressed in tiles within the level.
+        values: [int, numpy.ndarray]
+            The new tile indexes, either a single one or an array of the shape of the block.
 
-    Attributes
-    ----------
-    time_of_impact: float
-        The time of impact of the collision within the tick (between 0 and 1).
-    colliders: list of int
-        The indexes of the colliders, either the collision object index or the tile data.
-    collision_type: int
-        The type of collision, either collision vs tile or collision vs entity.
-    collision_direction: int
-        The direction of the collision relative to the first collider.
-    """
+        Raises
+        ------
+        ValueError
+            If the block is not fully within the tiles array.
+        """
 
-    COLLISION_NONE = 0
-    COLLISION_TILE = 1
-    COLLISION_ENTITY = 2
+        min_tile = numpy.array(region.position, dtype=numpy.int64) - self.tiles_origin
+        max_tile = min_tile + numpy.array(region.bounds, dtype=numpy.int64) - 1
 
-    def __init__(self, time_of_impact: float, colliders: tuple, collision_type: int, collision_direction: int):
+        if numpy.any(min_tile > max_tile):
+            return
+
+        if numpy.any(min_tile < 0) or numpy.any(max_tile >= self.tiles.shape):
+            raise ValueError("The region " + str(region) + " is out of the tiles array.")
+
+        self.tiles[min_tile[0]:max_tile[0] + 1, min_tile[1]:max_tile[1] + 1] = values
+
+        self.invalidate_tiles(min_tile, max_tile)
+
+    def invalidate_tiles(self, min_tile: tuple, max_tile: tuple) -> None:
         """
-        Initializes the CollisionPseudoEvent.
+        Reports that the tiles of a block were modified in place.
+
+        This is required unless the tiles are tracked (which is never the case of a memory-mapped tiles array), the
+        modifications of a tracked tiles array being detected by the world at each tick.
 
         Parameters
         ----------
-        time_of_impact: float
-            The time of impact of the collision within the tick (between 0 and 1).
-        colliders: tuple of int
-            The indexes of the colliders, either the collision object index or the tile data.
-        collision_type: int
-            The type of collision, either collision vs tile or collision vs entity.
-        collision_direction: int
-            The direction of the collision relative to the first collider.
+        min_tile: tuple of int
+            The position of the first tile of the block within the tiles array.
+        max_tile: tuple of int
+            The position of the last tile of the block within the tiles array (included).
         """
 
-        self.time_of_impact = time_of_impact
-        self.colliders = colliders
-        self.collision_type = collision_type
-        self.collision_direction = collision_direction
+        self._updater.invalidate_tiles(min_tile, max_tile)
+        self._updater.refresh_tiles()
 
-    def __contains__(self, other: "CollisionPseudoEvent") -> bool:
+    def changed_tiles(self, version: int) -> list:
         """
-        Returns if the other event is less important and dependent.
+        Returns the blocks of tiles modified since a version of the tiles.
 
-        Tests if the specified event is less important than the main while being dependent. It means that both events
-        have at least a common collider and that the time of impact of the tested event is greater than the one of the
-        latter.
+        The blocks modified with set_tiles or reported with invalidate_tiles are included right away, the ones modified
+        in place on a tracked tiles array once they are detected by the next update.
 
         Parameters
         ----------
-        other: CollisionPseudoEvent
-            The other event with which the test is performed.
+        version: int
+            The version of the tiles, as read from tiles_version.
 
         Returns
         -------
-        result: bool
-            True if the tested event is less important and dependent and False otherwise.
+        blocks: list of tuple
+            The positions of the first and the last tiles (included) of each modified block, within the tiles array.
+            None if the tiles have been fully rebuilt since the version, or if the version is too old.
         """
 
-        if self.time_of_impact < other.time_of_impact:
-            if self.collision_type == CollisionPseudoEvent.COLLISION_TILE:
-                if other.collision_type == CollisionPseudoEvent.COLLISION_TILE:
-                    if self.colliders[0] == other.colliders[0]:
-                        return True
-                elif other.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
-                    if self.colliders[0] in other.colliders:
-                        return True
-            elif self.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
-                if other.collision_type == CollisionPseudoEvent.COLLISION_TILE:
-                    if other.colliders[0] in self.colliders:
-                        return True
-                elif other.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
-                    if self.colliders[0] in other.colliders or self.colliders[1] in other.colliders:
-                        return True
+        return self._updater.changed_tiles(version)
 
-        return False
+    def settle_tiles(self) -> None:
+        """
+        Marks the changes of the tiles up to the current version as not waking the sleeping entities up.
 
-    def __eq__(self, other: "CollisionPseudoEvent") -> bool:
+        This is meant for the tiles written back along with the sleep state of the entities, for instance by restoring
+        a snapshot: the entities resting against these tiles are already in the right sleep state.
         """
-        Returns if the events are equally important.
 
-        Tests if the specified event is as important as the main one while being dependent. It means that both events
-        have at least one common collider and their times of impact are equal.
+        self._tiles_version = self.tiles_version
+
+    def _store_entity(self, entity: Entity) -> None:
+        """
+        Moves the entity into the entity store of the world.
 
         Parameters
         ----------
-        other: any
-            The other event with which the test is performed.
-
-        Returns
-        -------
-        result: bool
-            True if the tested event is as important and dependent and False otherwise.
+        entity: Entity
+            The entity to store.
         """
 
-        if self.time_of_impact == other.time_of_impact:
-            if self.collision_type == CollisionPseudoEvent.COLLISION_TILE:
-                if other.collision_type == CollisionPseudoEvent.COLLISION_TILE:
-                    if self.colliders[0] == other.colliders[0]:
-                        return True
-                elif other.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
-                    if self.colliders[0] in other.colliders:
-                        return True
-            elif self.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
-                if other.collision_type == CollisionPseudoEvent.COLLISION_TILE:
-                    if other.colliders[0] in self.colliders:
-                        return True
-                elif other.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
-                    if self.colliders[0] in other.colliders or self.colliders[1] in other.colliders:
-                        return True
+        if entity._store is self.entity_store:
+            return
 
-        return False
+        if entity._store is not None:
+            entity._store.remove(entity)
 
-    def __hash__(self) -> int:
+        self.entity_store.insert(entity)
+
+    def close(self) -> None:
         """
-        Returns the hash associated to the event.
+        Releases the worker threads, processes and the shared memory used by the collision detection.
 
-        Returns
-        -------
-        hash: int
-            The event hash.
+        The workers are owned by the world and kept alive between the ticks, this should be called once the world is
+        not played anymore. They are created again if the world is updated afterwards. The window of a streamed level is
+        written back into its chunks, which are then flushed.
         """
 
-        return hash(self.colliders + (self.time_of_impact, self.collision_type, self.collision_type))
+        self._updater.close()
+
+        if self._chunks is not None:
+            self._chunks.store(self._window[0], self._updater.tiles)
+            self._chunks.close()
 
     def __str__(self) -> str:
         """
@@ -2087,1016 +8095,998 @@ class CollisionPseudoEvent:
             The string object description.
         """
 
-        if self.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
-            return "CollisionPseudoEvent[time_of_impact=" + str(self.time_of_impact) + ", type=ENTITY, " + \
-                   "collider=" + str(self.colliders[0]) + ", collided=" + str(self.colliders[1]) + ", " + \
-                   "direction=" + Direction.get_name(self.collision_direction) + "]"
-        elif self.collision_type == CollisionPseudoEvent.COLLISION_TILE:
-            return "CollisionPseudoEvent[time_of_impact=" + str(self.time_of_impact) + ", type=TILE, " + \
-                   "collider=" + str(self.colliders[0]) + ", tile=" + str(self.colliders[1]) + ", " + \
-                   "position=[" + str(self.colliders[2]) + " " + str(self.colliders[3]) + "], " + \
-                   "direction=" + Direction.get_name(self.collision_direction) + "]"
+        return "World[logic_area=" + str(self.logic_area) + ", logic_tile=" + str(self.logic_tile) + ", " + \
+               "logic_entity=" + str(self.logic_entity) + ", background=" + self.background + "]"
 
 
-class WorldUpdater:
+class WorldSnapshot:
     """
-    The collision processing core.
+    Copy of the simulation state of a world.
 
-    The world logic is done here. It contains the necessary functions to find the next collision events within the
-    current tick. Theses functions can be paralleled for better performance.
+    A snapshot holds the columns of the entity store for the entities of the world, the attributes of these entities
+    (animation state, flags, colliders and the attributes added by the subclasses), the list of the world objects, the
+    tiles array and a tick. The columns and the tiles are copied into buffers owned by the snapshot, which are reused by
+    the next captures and only grow when needed. Only the blocks of tiles modified since the previous capture into the
+    same snapshot are copied, hence capturing the same world again and again mostly costs the copy of the entity data.
+
+    The attributes of the entities are copied shallowly: the attributes which are replaced are restored, while the
+    objects modified in place (such as a list attribute) are not. The state of the world objects which are not entities
+    (particles...) is not captured either, only whether they are spawned. The world has to use an entity store, and
+    its level cannot be streamed from chunks.
 
     Attributes
     ----------
-    tiles: numpy.ndarray
-        The tiles array of the level.
-    logic_area: AxisAlignedBoundingBox
-        The area over which the logic is performed.
-    logic_tile: bool
-        Enables the collision detection with tiles if set to True.
-    logic_entity: bool
-        Enables the collision detection with entities if set to True.
+    tick: int
+        The tick at which the snapshot was captured, None if it was not given.
 
     Methods
     -------
-    fetch_next_events(entities, local_times)
-        Returns the next collision events to fire.
+    capture(world, tick)
+        Captures the state of a world.
+    restore(world)
+        Restores the state of a world.
     """
 
-    DEFAULT_ENTITY_PER_THREAD = 32
+    def __init__(self):
+        """
+        Initializes the WorldSnapshot.
+        """
 
-    def __init__(self, tile_manager: TileManager, tiles: numpy.ndarray, logic_area: AxisAlignedBoundingBox = None,
-                 logic_tile: bool = True, logic_entity: bool = True, multi_threading: bool = True,
-                 entity_per_thread: int = DEFAULT_ENTITY_PER_THREAD,
-                 node_capacity: int = QuadTree.DEFAULT_NODE_CAPACITY, max_depth: int = QuadTree.DEFAULT_MAX_DEPTH):
+        self.tick = None
+
+        self._world = None
+        self._objects = []
+        self._objects_version = None
+        self._entities = []
+        self._attributes = []
+        self._store_version = None
+
+        self._rows = numpy.zeros(0, dtype=numpy.int64)
+        self._columns = {}
+
+        self._tiles = None
+        self._tiles_version = None
+
+    def capture(self, world: World, tick: int = None) -> None:
         """
-        Initializes the WorldUpdater.
+        Captures the state of a world.
 
         Parameters
         ----------
-        tile_manager: TileManager
-            The tile manager containing the tile data.
-        tiles: numpy.ndarray
-            The tiles array of the level.
-        logic_area: AxisAlignedBoundingBox, optional
-            The area over which the logic is performed.
-        logic_tile: bool, optional
-            Enables the collision detection with the tiles if set to True.
-        logic_entity: bool, optional
-            Enables the collision detection with the entities is set to True.
-        multi_threading: bool, optional
-            Enables the multi-threading mode if set to True.
-        entity_per_thread: int, optional
-            The number of entity in each thread.
-        node_capacity: int, optional
-            The object capacity of the leaf before it divides into smaller leaves.
-        max_depth: int, optional
-            The maximum depth of the tree.
+        world: World
+            The world to capture.
+        tick: int, optional
+            The tick at which the state is captured.
+
+        Raises
+        ------
+        ValueError
+            If the world does not use an entity store or if its level is streamed.
         """
 
-        self._tile_manager = tile_manager
-        self.tiles = tiles
+        store = world.entity_store
 
-        if logic_area is None:
-            logic_area = AxisAlignedBoundingBox((0, 0), numpy.array(tiles.shape) * tile_manager.tile_size)
+        if store is None:
+            raise ValueError("Only the worlds using an entity store can be captured.")
 
-        self.logic_area = logic_area
+        if world._chunks is not None:
+            raise ValueError("The worlds streaming their level cannot be captured.")
 
-        self.logic_tile = logic_tile
-        self.logic_entity = logic_entity
+        self._objects = list(world.world_objects)
+        self._objects_version = world.world_objects.version
+        self._entities = [world_object for world_object in self._objects if isinstance(world_object, Entity)]
 
-        self._multi_threading = multi_threading
-        self._entity_per_thread = entity_per_thread
+        self._attributes = [entity.__dict__.copy() for entity in self._entities]
+        self._store_version = store.version
 
-        self._node_capacity = node_capacity
-        self._max_depth = max_depth
+        size = len(self._entities)
 
-    def fetch_next_events(self, entities: list, local_times: list) -> list:
+        self._rows = numpy.fromiter((entity._row for entity in self._entities), dtype=numpy.int64, count=size)
+
+        for name in EntityStore.COLUMNS:
+            column = getattr(store, name)
+            buffer = self._columns.get(name)
+
+            if buffer is None or len(buffer) < size:
+                capacity = max(size, 2 * len(buffer)) if buffer is not None else size
+
+                buffer = self._columns[name] = numpy.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+
+            numpy.take(column, self._rows, axis=0, out=buffer[:size])
+
+        self._capture_tiles(world)
+
+        self._world = world
+        self.tick = tick
+
+    def _capture_tiles(self, world: World) -> None:
         """
-        Returns the next collision events to fire.
+        Copies the tiles of a world which changed since the previous capture.
 
-        Finds the next maximal independent events to fire. It means that multiple collision events can be solved in a
-        single tick as long as they are independent from each other. This functions uses multiple threads if the
-        multi-threading mode is enabled.
+        Parameters
+        ----------
+        world: World
+            The captured world.
+        """
+
+        version = world.tiles_version
+        tiles = world.tiles
+
+        blocks = world.changed_tiles(self._tiles_version) if self._world is world else None
+
+        if blocks is None or self._tiles is None or self._tiles.shape != tiles.shape or \
+                self._tiles.dtype != tiles.dtype:
+            if self._tiles is None or self._tiles.shape != tiles.shape or self._tiles.dtype != tiles.dtype:
+                self._tiles = numpy.empty(tiles.shape, dtype=tiles.dtype)
+
+            numpy.copyto(self._tiles, tiles)
+        else:
+            for min_tile, max_tile in blocks:
+                block = (slice(min_tile[0], max_tile[0] + 1), slice(min_tile[1], max_tile[1] + 1))
+
+                self._tiles[block] = tiles[block]
+
+        self._tiles_version = version
+
+    def restore(self, world: World) -> None:
+        """
+        Restores the state of a world.
+
+        The entities spawned since the capture are removed from the world, and the destroyed ones are spawned again.
+        Only the blocks of tiles modified since the capture are written back.
 
         Parameters
         ----------
-        entities: list of Entity
-            The list of entities of the world.
-        local_times: list of float
-            The corresponding of local time for each entities.
+        world: World
+            The world from which the snapshot was captured.
 
-        Returns
-        -------
-        events: list of CollisionPseudoEvent
-            The list of independent events to fire.
+        Raises
+        ------
+        ValueError
+            If the snapshot was captured from another world.
         """
 
-        collision_objects = []
+        if world is not self._world:
+            raise ValueError("The snapshot was not captured from this world.")
 
-        events = {}
+        store = world.entity_store
 
-        tree = QuadTree(self.logic_area, node_capacity=32, max_depth=5)
+        if store.version != self._store_version:
+            entities = set(self._entities)
 
-        for index in range(len(entities)):
-            collision_object = CollisionObject(index, entities[index], local_times[index])
+            for world_object in world.world_objects:
+                if isinstance(world_object, Entity) and world_object._store is store and world_object not in entities:
+                    store.remove(world_object)
 
-            tree.insert(collision_object)
-            collision_objects.append(collision_object)
+            rows = [entity._row if entity._store is store else -1 for entity in self._entities]
+
+            for entity, state in zip(self._entities, self._attributes):
+                entity.__dict__.update(state)
 
-            events[collision_object] = None
+            # The captured views may refer to a row since reused or to the columns before the store grew, the entities
+            # are bound again to their current row or inserted again if they were removed
+            for entity, row in zip(self._entities, rows):
+                if row == -1:
+                    entity._store = None
+                    entity._row = -1
 
-        if self._multi_threading:
-            splits = [collision_objects[x * self._entity_per_thread:self._entity_per_thread * (x + 1)]
-                      for x in range(len(collision_objects) // self._entity_per_thread +
-                                     (len(collision_objects) % self._entity_per_thread > 0))]
+                    store.insert(entity)
+                else:
+                    entity._store = store
+                    entity._row = row
 
-            with ThreadPool(processes=len(splits)) as pool:
-                results = pool.starmap(self._process_collision_events, zip(splits, repeat(tree)))
+                    store._bind_views(entity, row)
 
-            events = [y for x in results for y in x]
+            rows = numpy.fromiter(
+                (entity._row for entity in self._entities), dtype=numpy.int64, count=len(self._entities)
+            )
         else:
-            events = self._process_collision_events(collision_objects, tree)
+            # Nothing was inserted nor removed, the captured views are still over the rows of the entities
+            for entity, state in zip(self._entities, self._attributes):
+                entity.__dict__.update(state)
 
-        next_events = []
+            rows = self._rows
 
-        for event in events:
-            if event in next_events:
-                continue
+        if world.world_objects.version != self._objects_version:
+            world.world_objects.replace(self._objects)
 
-            for other in events:
-                if event != other and event in other:
-                    break
-            else:
-                next_events.append(event)
+            self._objects_version = world.world_objects.version
 
-        return next_events
+        size = len(self._entities)
 
-    def _process_collision_events(self, entities_colliding: list, tree: QuadTree) -> list:
-        """
-        Finds every next possible events.
+        for name in EntityStore.COLUMNS:
+            getattr(store, name)[rows] = self._columns[name][:size]
+
+        # The restored entities and the following captures start from the restored state
+        self._rows = rows
+        self._store_version = store.version
 
-        This function should be called on a subset of entities. Note that it returns every potential events, some may
-        not be independent and thus have to be sorted by size before being solved. For instance a single object can
-        issue several events with other objects, thus the order of resolution is important.
+        self._restore_tiles(world)
+
+    def _restore_tiles(self, world: World) -> None:
+        """
+        Writes back the tiles of a world which changed since the capture.
 
         Parameters
         ----------
-        entities_colliding: list of CollisionObject
-            The subset of collision objects over which the events will be searched.
-        tree: QuadTree
-            The quad tree spatial partition containing the other collision objects.
+        world: World
+            The restored world.
+        """
+
+        if world.tiles_version == self._tiles_version:
+            return
+
+        blocks = world.changed_tiles(self._tiles_version)
+        tiles = world.tiles
+
+        if blocks is None:
+            if tiles.shape != self._tiles.shape or tiles.dtype != self._tiles.dtype:
+                world.tiles = self._tiles.copy()
+            else:
+                numpy.copyto(tiles, self._tiles)
+
+                world.invalidate_tiles((0, 0), (tiles.shape[0] - 1, tiles.shape[1] - 1))
+        else:
+            for min_tile, max_tile in blocks:
+                block = (slice(min_tile[0], max_tile[0] + 1), slice(min_tile[1], max_tile[1] + 1))
+
+                tiles[block] = self._tiles[block]
+
+                world.invalidate_tiles(min_tile, max_tile)
+
+        self._tiles_version = world.tiles_version
+
+        # The entities resting against the restored tiles are in the captured sleep state
+        world.settle_tiles()
+
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
 
         Returns
         -------
-        events: list of CollisionPseudoEvent
-            The list of potential events to fire.
+        string: str
+            The string object description.
         """
 
-        events = []
-
-        for entity_colliding in entities_colliding:
-            time_of_impact = 1.0
+        return "WorldSnapshot[tick=" + str(self.tick) + ", entities=" + str(len(self._entities)) + ", " + \
+               "objects=" + str(len(self._objects)) + "]"
 
-            colliders = []
-            collision_type = CollisionPseudoEvent.COLLISION_NONE
-            collision_direction = Direction.DIRECTION_NONE
 
-            event_found = False
+class SnapshotRing:
+    """
+    Ring of the most recent snapshots of a world.
 
-            others = tree.intersect(entity_colliding.bounding_box_expanded)
+    The ring holds a fixed number of WorldSnapshot, each identified by the tick at which it was captured. Capturing a
+    new tick reuses the buffers of the oldest snapshot, while capturing a tick already held replaces its snapshot.
 
-            for collided in others:
-                if self.logic_entity and entity_colliding.index < collided.index and \
-                        entity_colliding.should_collide_with(collided) and \
-                        collided.should_collide_with(entity_colliding):
+    Attributes
+    ----------
+    capacity: int
+        The number of snapshots held by the ring.
 
-                    potential_time_of_impact, direction = WorldUpdater._apply_sat(entity_colliding, collided)
+    Methods
+    -------
+    capture(world, tick)
+        Captures the state of a world at a tick.
+    restore(world, tick)
+        Restores the state of a world captured at a tick.
+    latest(tick)
+        Returns the most recent snapshot captured at or before a tick.
+    ticks()
+        Returns the ticks of the held snapshots.
+    clear()
+        Forgets every snapshot.
+    """
 
-                    if direction != Direction.DIRECTION_NONE and potential_time_of_impact < time_of_impact:
-                        time_of_impact = potential_time_of_impact
-                        colliders = (entity_colliding.index, collided.index)
-                        collision_type = CollisionPseudoEvent.COLLISION_ENTITY
-                        collision_direction = direction
+    DEFAULT_CAPACITY = 16
 
-                        event_found = True
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initializes the SnapshotRing.
 
-            if self.logic_tile and entity_colliding.collides_with_tiles:
-                potential_time_of_impact, tile, x, y, direction = self._tile_collision_detection(entity_colliding)
+        Parameters
+        ----------
+        capacity: int, optional
+            The number of snapshots held by the ring.
 
-                if direction != Direction.DIRECTION_NONE and potential_time_of_impact < time_of_impact:
-                    time_of_impact = potential_time_of_impact
-                    colliders = (entity_colliding.index, tile, x, y)
-                    collision_type = CollisionPseudoEvent.COLLISION_TILE
-                    collision_direction = direction
+        Raises
+        ------
+        ValueError
+            If the capacity is not positive.
+        """
 
-                    event_found = True
+        if capacity < 1:
+            raise ValueError("The capacity of the ring has to be positive.")
 
-            if event_found:
-                events.append(CollisionPseudoEvent(time_of_impact, colliders, collision_type, collision_direction))
+        self.capacity = capacity
 
-        return events
+        self._snapshots = [WorldSnapshot() for _ in range(capacity)]
+        self._slots = {}
+        self._next = 0
 
-    @staticmethod
-    def _apply_sat(collider: CollisionObject, collided: CollisionObject) -> (float, int):
+    def capture(self, world: World, tick: int) -> WorldSnapshot:
         """
-        Applies the SAT to two collision objects.
-
-        Applies the Separation Axis Theorem to two collision objects and determines whether or not they will collide and
-        if so, it will compute the time of impact between both object within the current tick. It uses the float
-        representation of the AABBs for better precision.
+        Captures the state of a world at a tick.
 
         Parameters
         ----------
-        collider: CollisionObject
-            The collision object associated to the collider.
-        collided: CollisionObject
-            The collision object associated to the collided.
+        world: World
+            The world to capture.
+        tick: int
+            The tick at which the state is captured.
 
         Returns
         -------
-        time_of_impact, direction: float, int
-            The time of impact and the direction of the collision if there is any.
+        snapshot: WorldSnapshot
+            The snapshot holding the state.
         """
 
-        if collider.local_time < collided.local_time:
-            time_of_impact, direction = WorldUpdater._apply_sat(collided, collider)
-
-            return time_of_impact, Direction.opposite(direction)
+        slot = self._slots.get(tick)
 
-        collider_bounds = collider.bounding_box.copy()
-        collided_bounds = collided.bounding_box.copy()
+        if slot is None:
+            slot = self._next
+            self._next = (self._next + 1) % self.capacity
 
-        collided_bounds.position += collided.speed * (collider.local_time - collided.local_time)
+            previous = self._snapshots[slot].tick
 
-        maximum_time_of_impact = 0
-        minimum_time_of_separation = 1 - collider.local_time
+            if self._slots.get(previous) == slot:
+                del self._slots[previous]
 
-        collision_direction = Direction.DIRECTION_NONE
+            self._slots[tick] = slot
 
-        relative_speed = collider.speed - collided.speed
+        snapshot = self._snapshots[slot]
+        snapshot.capture(world, tick)
 
-        for axis in range(2):
-            collider_segment = MovableSegment(
-                collider_bounds.position[axis],
-                collider_bounds.position[axis] + collider_bounds.bounds[axis],
-                collider.speed[axis]
-            )
+        return snapshot
 
-            collided_segment = MovableSegment(
-                collided_bounds.position[axis],
-                collided_bounds.position[axis] + collided_bounds.bounds[axis],
-                collided.speed[axis]
-            )
+    def restore(self, world: World, tick: int) -> WorldSnapshot:
+        """
+        Restores the state of a world captured at a tick.
 
-            if collider_segment not in collided_segment:
-                if collider_segment.should_impact(collided_segment):
-                    time_of_impact = collider_segment.time_of_impact(collided_segment)
+        Parameters
+        ----------
+        world: World
+            The world to restore.
+        tick: int
+            The tick of the snapshot.
 
-                    if time_of_impact > maximum_time_of_impact:
-                        maximum_time_of_impact = time_of_impact
+        Raises
+        ------
+        KeyError
+            If no snapshot of the tick is held.
 
-                        if relative_speed[axis] > 0:
-                            collision_direction = Direction.DIRECTION_EAST
-                        elif relative_speed[axis] < 0:
-                            collision_direction = Direction.DIRECTION_WEST
-                        else:
-                            continue
+        Returns
+        -------
+        snapshot: WorldSnapshot
+            The restored snapshot.
+        """
 
-                        if axis != 0:
-                            collision_direction = Direction.next_left(collision_direction)
+        snapshot = self._snapshots[self._slots[tick]]
+        snapshot.restore(world)
 
-                    if collider_segment.should_separate(collided_segment):
-                        time_of_separation = collider_segment.time_of_separation(collided_segment)
+        return snapshot
 
-                        if time_of_separation < minimum_time_of_separation:
-                            minimum_time_of_separation = time_of_separation
+    def latest(self, tick: int) -> WorldSnapshot:
+        """
+        Returns the most recent snapshot captured at or before a tick.
 
-                else:
-                    return 1.0, Direction.DIRECTION_NONE
+        Parameters
+        ----------
+        tick: int
+            The latest tick.
 
-            if collider_segment == collided_segment:
-                if collider_segment.should_separate(collided_segment):
-                    if maximum_time_of_impact == 0:
-                        if relative_speed[axis] > 0:
-                            collision_direction = Direction.DIRECTION_EAST
-                        elif relative_speed[axis] < 0:
-                            collision_direction = Direction.DIRECTION_WEST
-                        else:
-                            continue
+        Returns
+        -------
+        snapshot: WorldSnapshot
+            The most recent snapshot, None if there is not any.
+        """
 
-                        if axis != 0:
-                            collision_direction = Direction.next_left(collision_direction)
+        ticks = [held for held in self._slots if held <= tick]
 
-                        time_of_separation = collider_segment.time_of_separation(collided_segment)
+        return self._snapshots[self._slots[max(ticks)]] if ticks else None
 
-                        if time_of_separation < minimum_time_of_separation:
-                            minimum_time_of_separation = time_of_separation
+    def ticks(self) -> list:
+        """
+        Returns the ticks of the held snapshots.
 
-        if minimum_time_of_separation > maximum_time_of_impact and maximum_time_of_impact < 1 - collider.local_time:
-            return collider.local_time + maximum_time_of_impact, collision_direction
+        Returns
+        -------
+        ticks: list of int
+            The sorted ticks.
+        """
 
-        return 1.0, Direction.DIRECTION_NONE
+        return sorted(self._slots)
 
-    def _tile_collision_detection(self, collider: CollisionObject) -> (float, int, int, int, int):
+    def clear(self) -> None:
+        """
+        Forgets every snapshot, their buffers are kept.
         """
-        Applies the SAT between a collision object and the tiles.
 
-        Applies a modified version of the Separation Axis Theorem for static objects. This determines whether or not the
-        collision object will collide with a tile from the terrain and if so, it will compute the time of impact between
-        the object and the tile within the current tick.
+        self._slots = {}
+
+    def __contains__(self, tick: int) -> bool:
+        """
+        Tells whether a snapshot of a tick is held.
 
         Parameters
         ----------
-        collider: CollisionObject
-            The collision object associated to the collider.
+        tick: int
+            The tick of the snapshot.
 
         Returns
         -------
-        time_of_impact, tile, direction: float, int, int, int, int
-            The time of impact, the tile index and its position and the direction of the collision if there is any.
+        result: bool
+            True if a snapshot of the tick is held.
         """
 
-        bounds = collider.bounding_box.copy()
-
-        speed = collider.speed
-        local_time = collider.local_time
-
-        pre_min = bounds.position.astype(numpy.int32)
-        pre_max = (bounds.position + bounds.bounds).astype(numpy.int32)
-        post_min = (pre_min + speed * (1 - local_time)).astype(numpy.int32)
-        post_max = (pre_max + speed * (1 - local_time)).astype(numpy.int32)
-
-        pre_min_tile = pre_min // self._tile_manager.tile_size
-        pre_max_tile = pre_max // self._tile_manager.tile_size
-        post_min_tile = post_min // self._tile_manager.tile_size
-        post_max_tile = post_max // self._tile_manager.tile_size
-
-        if pre_max[0] % self._tile_manager.tile_size == 0:
-            pre_max_tile[0] -= 1
+        return tick in self._slots
 
-        if pre_max[1] % self._tile_manager.tile_size == 0:
-            pre_max_tile[1] -= 1
+    def __str__(self) -> str:
+        """
+        Returns a description string of the object.
 
-        if post_max[0] % self._tile_manager.tile_size == 0:
-            post_max_tile[0] -= 1
+        Returns
+        -------
+        string: str
+            The string object description.
+        """
 
-        if post_max[1] % self._tile_manager.tile_size == 0:
-            post_max_tile[1] -= 1
+        return "SnapshotRing[capacity=" + str(self.capacity) + ", ticks=" + str(self.ticks()) + "]"
 
-        if pre_min_tile[0] == post_min_tile[0] and pre_min_tile[1] == post_min_tile[1] and \
-                pre_max_tile[0] == post_max_tile[0] and pre_max_tile[1] == post_max_tile[1]:
-            return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
 
-        if post_min_tile[1] == pre_min_tile[1] and post_max_tile[1] == pre_max_tile[1]:
-            if post_max_tile[0] > pre_max_tile[0]:
-                for x in range(pre_max_tile[0] + 1, post_max_tile[0] + 1):
-                    for y in range(pre_min_tile[1], pre_max_tile[1] + 1):
-                        tile = self._get_tile_at(x, y)
+class WorldBatch:
+    """
+    Group of independent worlds updated in lockstep.
 
-                        if tile > 0:
-                            collision_map = self._tile_manager.get_collision_map(tile)
+    This is meant for the headless simulations running many small worlds at once (training of agents, balancing...),
+    where updating each world on its own is dominated by the cost of the Python calls rather than by the collision
+    detection itself. The entities of every world are moved into a single EntityStore shared by the batch, and each
+    round of collision events is searched over all the worlds at once: the candidate pairs are found by a single sweep
+    over the expanded bounding boxes of every world, solved by a single batched SAT, and the entities whose swept tiles
+    are all empty are discarded from the summed solidity of each level before any tile is traversed. The events are
+    then fired by each world to its own event queue, the results being the same as updating the worlds one by one.
 
-                            if collision_map.collide_west:
-                                return (x * self._tile_manager.tile_size - pre_max[0]) / speed[0] + local_time, tile, \
-                                       x, y, Direction.DIRECTION_EAST
-                return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+    The worlds have to use an entity store and the same tile size, they are best created with the same TileManager so
+    that the tiles and the collision maps are registered once. A world stays usable on its own, and can be spawned into
+    as usual. The state of the entities can be read and written as stacked arrays, padded to the largest world.
 
-            elif post_min_tile[0] < pre_min_tile[0]:
-                for x in range(pre_min_tile[0] - 1, post_min_tile[0] - 1, -1):
-                    for y in range(pre_min_tile[1], pre_max_tile[1] + 1):
-                        tile = self._get_tile_at(x, y)
+    Attributes
+    ----------
+    worlds: list of World
+        The worlds of the batch.
+    entity_store: EntityStore
+        The columnar storage shared by the entities of every world.
 
-                        if tile > 0:
-                            collision_map = self._tile_manager.get_collision_map(tile)
+    Methods
+    -------
+    update(tick)
+        Updates every world of the batch.
+    rows()
+        Returns the rows of the entities of each world.
+    gather(column)
+        Returns a column of the entity store stacked by world.
+    scatter(column, values)
+        Writes a column of the entity store stacked by world.
+    close()
+        Releases the worlds of the batch.
+    """
 
-                            if collision_map.collide_east:
-                                return ((x + 1) * self._tile_manager.tile_size - pre_min[0]) / speed[0] + local_time, \
-                                       tile, x, y, Direction.DIRECTION_WEST
-                return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+    def __init__(self, worlds: list):
+        """
+        Initializes the WorldBatch.
 
-        elif post_min_tile[0] == pre_min_tile[0] and post_max_tile[0] == pre_max_tile[0]:
-            if post_max_tile[1] > pre_max_tile[1]:
-                for y in range(pre_max_tile[1] + 1, post_max_tile[1] + 1):
-                    for x in range(pre_min_tile[0], pre_max_tile[0] + 1):
-                        tile = self._get_tile_at(x, y)
+        Parameters
+        ----------
+        worlds: list of World
+            The worlds to update together.
 
-                        if tile > 0:
-                            collision_map = self._tile_manager.get_collision_map(tile)
+        Raises
+        ------
+        ValueError
+            If there is no world, if a world does not use an entity store or if the tile sizes differ.
+        """
 
-                            if collision_map.collide_south:
-                                return (y * self._tile_manager.tile_size - pre_max[1]) / speed[1] + local_time, tile, \
-                                       x, y, Direction.DIRECTION_NORTH
-                return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+        if len(worlds) == 0:
+            raise ValueError("A batch requires at least one world.")
 
-            elif post_min_tile[1] < pre_min_tile[1]:
-                for y in range(pre_min_tile[1] - 1, post_min_tile[1] - 1, -1):
-                    for x in range(pre_min_tile[0], pre_max_tile[0] + 1):
-                        tile = self._get_tile_at(x, y)
+        if any(world.entity_store is None for world in worlds):
+            raise ValueError("The worlds of a batch have to use an entity store.")
 
-                        if tile > 0:
-                            collision_map = self._tile_manager.get_collision_map(tile)
+        if len(set(world._tile_manager.tile_size for world in worlds)) > 1:
+            raise ValueError("The worlds of a batch have to use the same tile size.")
 
-                            if collision_map.collide_north:
-                                return ((y + 1) * self._tile_manager.tile_size - pre_min[1]) / speed[1] + local_time, \
-                                       tile, x, y, Direction.DIRECTION_SOUTH
-                return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+        self.worlds = list(worlds)
+        self.entity_store = EntityStore()
 
-        if speed[0] > 0:
-            if speed[1] > 0:
-                vertices = [(pre_min[0], pre_min[1]), (pre_max[0] + 1, pre_min[1]),
-                            (post_max[0] + 1, post_min[1]), (post_max[0] + 1, post_max[1] + 1),
-                            (post_min[0], post_max[1] + 1), (pre_min[0], pre_max[1] + 1)]
-            else:
-                vertices = [(pre_min[0], pre_max[1] + 1), (pre_min[0], pre_min[1]),
-                            (post_min[0], post_min[1]), (post_max[0] + 1, post_min[1]),
-                            (post_max[0] + 1, post_max[1] + 1), (pre_max[0] + 1, pre_max[1] + 1)]
+        for world in self.worlds:
+            world.entity_store = self.entity_store
 
-        else:
-            if speed[1] > 0:
-                vertices = [(pre_max[0] + 1, pre_min[1]), (pre_max[0] + 1, pre_max[1] + 1),
-                            (post_max[0] + 1, post_max[1] + 1), (post_min[0], post_max[1] + 1),
-                            (post_min[0], post_min[1]), (pre_min[0], pre_min[1])]
-            else:
-                vertices = [(pre_max[0] + 1, pre_max[1] + 1), (pre_min[0], pre_max[1] + 1),
-                            (post_min[0], post_max[1] + 1), (post_min[0], post_min[1]),
-                            (post_max[0] + 1, post_min[1]), (pre_max[0] + 1, pre_min[1])]
-
-        time_of_impact = 1 - local_time
-        collision_tile = 0
-        collision_tile_x = 0
-        collision_tile_y = 0
-        collision_direction = Direction.DIRECTION_NONE
+            for world_object in world.world_objects:
+                if isinstance(world_object, Entity):
+                    world._store_entity(world_object)
 
-        found_x = False
-        found_y = False
+        self._tile_size = self.worlds[0]._tile_manager.tile_size
 
-        min_tile = numpy.min((pre_min_tile, post_min_tile), axis=0)
-        max_tile = numpy.max((pre_max_tile, post_max_tile), axis=0)
+        self._frame = None
+        self._frame_rows = None
+        self._frame_version = None
 
-        raster = numpy.zeros(max_tile - min_tile + 1, dtype=bool)
+        self._sums = None
+        self._sums_key = None
 
-        indexes_x = list(range(0, self._tile_manager.tile_size, int(bounds.bounds[0])))
-        indexes_y = list(range(0, self._tile_manager.tile_size, int(bounds.bounds[1])))
+        self._rows = None
+        self._rows_version = None
 
-        if self._tile_manager.tile_size - 1 not in indexes_x:
-            indexes_x.append(self._tile_manager.tile_size - 1)
+    def update(self, tick: int) -> None:
+        """
+        Updates every world of the batch.
 
-        if self._tile_manager.tile_size - 1 not in indexes_y:
-            indexes_y.append(self._tile_manager.tile_size - 1)
+        Each world goes through the same steps as in World.update, the rounds of collision events being searched for
+        all the worlds which still have events to fire.
 
-        for x_tile in range(0, max_tile[0] - min_tile[0] + 1):
-            for y_tile in range(0, max_tile[1] - min_tile[1] + 1):
-                x = (x_tile + min_tile[0]) * self._tile_manager.tile_size
-                y = (y_tile + min_tile[1]) * self._tile_manager.tile_size
+        Parameters
+        ----------
+        tick: int
+            The current logic tick.
 
-                for offset in indexes_x:
-                    if WorldUpdater._inner_polygon_test(vertices, x + offset, y) or \
-                            WorldUpdater._inner_polygon_test(vertices, x + offset, y + self._tile_manager.tile_size):
-                        raster[x_tile, y_tile] = True
+        Raises
+        ------
+        UnsolvedCollisionError
+            If a same event is fired twice in a single tick of a world.
+        """
 
-                        break
-                else:
-                    for offset in indexes_y:
-                        if WorldUpdater._inner_polygon_test(vertices, x + self._tile_manager.tile_size, y + offset) or \
-                                WorldUpdater._inner_polygon_test(vertices, x, y + offset):
-                            raster[x_tile, y_tile] = True
-
-                            break
-
-        if speed[0] > 0:
-            if speed[1] > 0:
-                for x in range(pre_min_tile[0], post_max_tile[0] + 1):
-                    for y in range(pre_min_tile[1], post_max_tile[1] + 1):
-                        if pre_min_tile[0] <= x <= pre_max_tile[0] and pre_min_tile[1] <= y <= pre_max_tile[1] or \
-                                not raster[x - min_tile[0], y - min_tile[1]]:
-                            continue
+        worlds = []
+        states = []
 
-                        tile = self._get_tile_at(x, y)
+        for world in self.worlds:
+            state = world._begin_update()
 
-                        if tile > 0:
-                            collision_map = self._tile_manager.get_collision_map(tile)
+            if state is not None:
+                worlds.append(world)
+                states.append(state)
 
-                            times_of_impact = \
-                                (x * self._tile_manager.tile_size - pre_max[0]) / speed[0], \
-                                (y * self._tile_manager.tile_size - pre_max[1]) / speed[1]
+        if len(worlds) == 0:
+            return
 
-                            if times_of_impact[0] >= times_of_impact[1]:
-                                if collision_map.collide_west and times_of_impact[0] < time_of_impact:
-                                    time_of_impact = times_of_impact[0]
+        store = self.entity_store
 
-                                    if found_y:
-                                        return time_of_impact + local_time, tile, x, y, Direction.DIRECTION_EAST
+        sizes = numpy.array([len(state[1]) for state in states], dtype=numpy.int64)
+        offsets = numpy.concatenate(([0], numpy.cumsum(sizes)[:-1]))
 
-                                    collision_tile = tile
-                                    collision_tile_x = x
-                                    collision_tile_y = y
-                                    collision_direction = Direction.DIRECTION_EAST
+        rows = numpy.concatenate([state[1] for state in states])
+        owners = numpy.repeat(numpy.arange(len(worlds)), sizes)
 
-                                    found_x = True
-                            else:
-                                if collision_map.collide_south and times_of_impact[1] < time_of_impact:
-                                    time_of_impact = times_of_impact[1]
+        running = numpy.ones(len(worlds), dtype=bool)
 
-                                    if found_x:
-                                        return time_of_impact + local_time, tile, x, y, Direction.DIRECTION_NORTH
+        while running.any():
+            store.local_times[rows] = numpy.concatenate([state[2] for state in states])
 
-                                    collision_tile = tile
-                                    collision_tile_x = x
-                                    collision_tile_y = y
-                                    collision_direction = Direction.DIRECTION_NORTH
+            frame = self._fetch_frame(rows)
 
-                                    found_y = True
+            events = self._fetch_events(frame, [world._updater for world in worlds], owners, offsets, running)
 
-            else:
-                for x in range(pre_min_tile[0], post_max_tile[0] + 1):
-                    for y in range(pre_max_tile[1], post_min_tile[1] - 1, -1):
-                        if pre_min_tile[0] <= x <= pre_max_tile[0] and pre_min_tile[1] <= y <= pre_max_tile[1] or \
-                                not raster[x - min_tile[0], y - min_tile[1]]:
-                            continue
+            for index in numpy.flatnonzero(running):
+                running[index] = worlds[index]._fire_events(tick, states[index], events[index])
 
-                        tile = self._get_tile_at(x, y)
+        for world, state in zip(worlds, states):
+            world._end_update(state)
 
-                        if tile > 0:
-                            collision_map = self._tile_manager.get_collision_map(tile)
+    def _fetch_frame(self, rows: numpy.ndarray) -> CollisionFrame:
+        """
+        Returns the collision frame of the entities of every world.
 
-                            times_of_impact = \
-                                (x * self._tile_manager.tile_size - pre_max[0]) / speed[0], \
-                                ((y + 1) * self._tile_manager.tile_size - pre_min[1]) / speed[1]
+        The frame is kept between the calls, only the collision objects whose entity changed are updated as long as
+        the same rows of the store are used.
 
-                            if times_of_impact[0] >= times_of_impact[1]:
-                                if collision_map.collide_west and times_of_impact[0] < time_of_impact:
-                                    time_of_impact = times_of_impact[0]
+        Parameters
+        ----------
+        rows: numpy.ndarray
+            The rows of the entities of every world, world after world.
 
-                                    if found_y:
-                                        return time_of_impact + local_time, tile, x, y, Direction.DIRECTION_EAST
+        Returns
+        -------
+        frame: CollisionFrame
+            The collision frame of the entities.
+        """
 
-                                    collision_tile = tile
-                                    collision_tile_x = x
-                                    collision_tile_y = y
-                                    collision_direction = Direction.DIRECTION_EAST
+        store = self.entity_store
 
-                                    found_x = True
-                            else:
-                                if collision_map.collide_north and times_of_impact[1] < time_of_impact:
-                                    time_of_impact = times_of_impact[1]
+        if self._frame is None or self._frame_version != store.version or \
+                not numpy.array_equal(rows, self._frame_rows):
+            self._frame = CollisionFrame(store, rows)
+            self._frame_rows = rows.copy()
+            self._frame_version = store.version
+        else:
+            self._frame.update(store, rows, self._frame.changed(store, rows))
+            self._frame.classify()
 
-                                    if found_x:
-                                        return time_of_impact + local_time, tile, x, y, Direction.DIRECTION_SOUTH
+        return self._frame
 
-                                    collision_tile = tile
-                                    collision_tile_x = x
-                                    collision_tile_y = y
-                                    collision_direction = Direction.DIRECTION_SOUTH
+    def _fetch_events(self, frame: CollisionFrame, updaters: list, owners: numpy.ndarray, offsets: numpy.ndarray,
+                      running: numpy.ndarray) -> list:
+        """
+        Returns the next collision events to fire in each world.
 
-                                    found_y = True
+        Parameters
+        ----------
+        frame: CollisionFrame
+            The collision frame of the entities of every world.
+        updaters: list of WorldUpdater
+            The updater of each world.
+        owners: numpy.ndarray
+            The index of the world of each collision object.
+        offsets: numpy.ndarray
+            The index of the first collision object of each world.
+        running: numpy.ndarray
+            Whether the events of each world have to be searched.
 
-        else:
-            if speed[1] > 0:
-                for x in range(pre_max_tile[0], post_min_tile[0] - 1, -1):
-                    for y in range(pre_min_tile[1], post_max_tile[1] + 1):
-                        if pre_min_tile[0] <= x <= pre_max_tile[0] and pre_min_tile[1] <= y <= pre_max_tile[1] or \
-                                not raster[x - min_tile[0], y - min_tile[1]]:
-                            continue
+        Returns
+        -------
+        events: list of list
+            The independent events to fire in each world, the colliders being the positions of the entities within
+            their world. Empty for the worlds which are not running.
+        """
 
-                        tile = self._get_tile_at(x, y)
+        for index in numpy.flatnonzero(running):
+            updaters[index].refresh_tiles()
 
-                        if tile > 0:
-                            collision_map = self._tile_manager.get_collision_map(tile)
+        logic_entity = numpy.array([updater.logic_entity for updater in updaters], dtype=bool)
+        logic_tile = numpy.array([updater.logic_tile for updater in updaters], dtype=bool)
 
-                            times_of_impact = \
-                                ((x + 1) * self._tile_manager.tile_size - pre_min[0]) / speed[0], \
-                                (y * self._tile_manager.tile_size - pre_max[1]) / speed[1]
+        active = running[owners]
+        targets = active & ~frame.sleeping & ~frame.static
 
-                            if times_of_impact[0] >= times_of_impact[1]:
-                                if collision_map.collide_east and times_of_impact[0] < time_of_impact:
-                                    time_of_impact = times_of_impact[0]
+        colliders, collided = self._candidate_pairs(frame, owners, active & logic_entity[owners], targets)
 
-                                    if found_y:
-                                        return time_of_impact + local_time, tile, x, y, Direction.DIRECTION_WEST
+        valid = frame.should_collide(colliders, collided)
 
-                                    collision_tile = tile
-                                    collision_tile_x = x
-                                    collision_tile_y = y
-                                    collision_direction = Direction.DIRECTION_WEST
+        colliders = colliders[valid]
+        collided = collided[valid]
 
-                                    found_x = True
-                            else:
-                                if collision_map.collide_south and times_of_impact[1] < time_of_impact:
-                                    time_of_impact = times_of_impact[1]
+        # Each pair belongs to its lowest processed object, as in WorldUpdater._process_collision_events
+        pair_owners = numpy.where(targets[colliders], colliders, collided)
 
-                                    if found_x:
-                                        return time_of_impact + local_time, tile, x, y, Direction.DIRECTION_NORTH
+        best_times = numpy.full(len(frame), numpy.inf)
+        best_pairs = numpy.full(len(frame), -1, dtype=numpy.int64)
 
-                                    collision_tile = tile
-                                    collision_tile_x = x
-                                    collision_tile_y = y
-                                    collision_direction = Direction.DIRECTION_NORTH
+        if len(colliders) > 0:
+            times_of_impact, directions = WorldUpdater._apply_sat_batch(frame, colliders, collided)
 
-                                    found_y = True
+            times_of_impact = numpy.where(
+                (directions != Direction.DIRECTION_NONE) & (times_of_impact < 1.0), times_of_impact, numpy.inf
+            )
 
-            else:
-                for x in range(pre_max_tile[0], post_min_tile[0] - 1, -1):
-                    for y in range(pre_max_tile[1], post_min_tile[1] - 1, -1):
-                        if pre_min_tile[0] <= x <= pre_max_tile[0] and pre_min_tile[1] <= y <= pre_max_tile[1] or \
-                                not raster[x - min_tile[0], y - min_tile[1]]:
-                            continue
+            # Ties are broken as in WorldUpdater._process_collision_events
+            order = numpy.lexsort((collided, colliders, times_of_impact, pair_owners))
+            first = order[numpy.concatenate(([True], pair_owners[order][1:] != pair_owners[order][:-1]))]
+            first = first[times_of_impact[first] < numpy.inf]
 
-                        tile = self._get_tile_at(x, y)
+            best_times[pair_owners[first]] = times_of_impact[first]
+            best_pairs[pair_owners[first]] = first
 
-                        if tile > 0:
-                            collision_map = self._tile_manager.get_collision_map(tile)
+        swept = self._sweeps_solid_tiles(
+            frame, updaters, owners, targets & logic_tile[owners] & frame._collides_with_tiles
+        )
 
-                            times_of_impact = \
-                                ((x + 1) * self._tile_manager.tile_size - pre_min[0]) / speed[0], \
-                                ((y + 1) * self._tile_manager.tile_size - pre_min[1]) / speed[1]
+        events = [[] for _ in updaters]
 
-                            if times_of_impact[0] >= times_of_impact[1]:
-                                if collision_map.collide_east and times_of_impact[0] < time_of_impact:
-                                    time_of_impact = times_of_impact[0]
+        for index in numpy.flatnonzero((best_pairs != -1) | swept):
+            world = owners[index]
+            offset = int(offsets[world])
 
-                                    if found_y:
-                                        return time_of_impact + local_time, tile, x, y, Direction.DIRECTION_WEST
+            time_of_impact = 1.0
+            event = None
 
-                                    collision_tile = tile
-                                    collision_tile_x = x
-                                    collision_tile_y = y
-                                    collision_direction = Direction.DIRECTION_WEST
+            pair = best_pairs[index]
 
-                                    found_x = True
-                            else:
-                                if collision_map.collide_north and times_of_impact[1] < time_of_impact:
-                                    time_of_impact = times_of_impact[1]
+            if pair != -1:
+                time_of_impact = float(best_times[index])
 
-                                    if found_x:
-                                        return time_of_impact + local_time, tile, x, y, Direction.DIRECTION_SOUTH
+                event = CollisionPseudoEvent(
+                    time_of_impact, (int(colliders[pair]) - offset, int(collided[pair]) - offset),
+                    CollisionPseudoEvent.COLLISION_ENTITY, int(directions[pair])
+                )
 
-                                    collision_tile = tile
-                                    collision_tile_x = x
-                                    collision_tile_y = y
-                                    collision_direction = Direction.DIRECTION_SOUTH
+            if swept[index]:
+                potential_time_of_impact, tile, x, y, direction = updaters[world]._tile_collision_detection(
+                    frame.collision_objects[index]
+                )
 
-                                    found_y = True
+                if direction != Direction.DIRECTION_NONE and potential_time_of_impact < time_of_impact:
+                    event = CollisionPseudoEvent(
+                        potential_time_of_impact, (int(index) - offset, tile, x, y),
+                        CollisionPseudoEvent.COLLISION_TILE, direction
+                    )
 
-        if found_x or found_y:
-            return time_of_impact + local_time, collision_tile, collision_tile_x, collision_tile_y, collision_direction
+            if event is not None:
+                events[world].append(event)
 
-        return 1.0, -1, -1, -1, Direction.DIRECTION_NONE
+        return [WorldUpdater._select_independent_events(world_events) for world_events in events]
 
     @staticmethod
-    def _inner_polygon_test(vertices: list, x: int, y: int) -> bool:
+    def _candidate_pairs(frame: CollisionFrame, owners: numpy.ndarray, selected: numpy.ndarray,
+                         targets: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray):
         """
-        Returns the inner point test for a polygon.
+        Returns the pairs of collision objects of a same world whose expanded bounding boxes intersect.
 
-        This function is used to determine the tiles with which the object is likely to go through. This is used to
-        raster the tile space under the sweep of the object.
+        The objects of every world are swept at once along the first axis, the world of each object being added as an
+        offset larger than any world, hence the objects of different worlds never overlap.
 
         Parameters
         ----------
-        vertices: list
-            The list of vertices (couples of int) of the polygon to raster.
-        x: int
-            The x position of the point.
-        y: int
-            The y position of the point.
+        frame: CollisionFrame
+            The collision frame of the entities of every world.
+        owners: numpy.ndarray
+            The index of the world of each collision object.
+        selected: numpy.ndarray
+            Whether each collision object takes part to the search.
+        targets: numpy.ndarray
+            Whether each collision object is processed, the pairs of objects which are not processed are discarded.
 
         Returns
         -------
-        result: bool
-            True if the tested point is in the polygon and False otherwise.
+        colliders, collided: numpy.ndarray, numpy.ndarray
+            The lowest and the highest index of the collision objects of each pair.
         """
 
-        valid_positive = False
-        valid_negative = False
-
-        for vertex in range(len(vertices)):
-            if ((vertices[vertex][1] > y) != (vertices[vertex - 1][1] > y)) and (
-                    x < vertices[vertex][0] + (vertices[vertex - 1][0] - vertices[vertex][0]) * (
-                    y - vertices[vertex][1]) / (vertices[vertex - 1][1] - vertices[vertex][1])):
-                valid_positive = not valid_positive
+        indexes = numpy.flatnonzero(selected)
 
-            if ((vertices[vertex][1] < y + 1) != (vertices[vertex - 1][1] < y + 1)) and (
-                    - x - 1 < - vertices[vertex][0] + (vertices[vertex][0] - vertices[vertex - 1][0]) * (
-                    - y - 1 + vertices[vertex][1]) / (vertices[vertex][1] - vertices[vertex - 1][1])):
-                valid_negative = not valid_negative
+        if len(indexes) < 2:
+            return numpy.zeros(0, dtype=numpy.int64), numpy.zeros(0, dtype=numpy.int64)
 
-        return valid_positive or valid_negative
+        lower = frame.positions_expanded[indexes]
+        upper = lower + frame.bounds_expanded[indexes]
 
-    def _get_tile_at(self, position_x: int, position_y: int) -> int:
-        """
-        Returns the index of the tile at the given position.
+        # The keys are exact in double precision, so the sweep does not miss any pair
+        origin = float(lower[:, 0].min())
+        span = numpy.floor(float(upper[:, 0].max()) - origin) + 2
+        shift = owners[indexes] * span - origin
 
-        Parameters
-        ----------
-        position_x: int
-            The position of the tile along the x axis.
-        position_y: int
-            The position of the tile along the y axis.
+        keys_lower = lower[:, 0] + shift
+        keys_upper = upper[:, 0] + shift
 
-        Returns
-        -------
-        id_tile: int
-            The index of the tile.
-        """
+        order = numpy.argsort(keys_lower, kind="stable")
+        ends = numpy.searchsorted(keys_lower[order], keys_upper[order], side="left")
 
-        if 0 <= position_x < self.tiles.shape[0] and 0 <= position_y < self.tiles.shape[1]:
-            return self.tiles[position_x, position_y]
+        counts = numpy.maximum(ends - numpy.arange(len(order)) - 1, 0)
+        starts = numpy.cumsum(counts) - counts
 
-        return -1
+        first = numpy.repeat(numpy.arange(len(order)), counts)
+        second = first + 1 + numpy.arange(len(first)) - numpy.repeat(starts, counts)
 
-    def __str__(self) -> str:
-        """
-        Returns a description string of the object.
+        first = order[first]
+        second = order[second]
 
-        Returns
-        -------
-        string: str
-            The string object description.
-        """
+        overlapping = numpy.all((lower[first] < upper[second]) & (lower[second] < upper[first]), axis=1)
 
-        return "WorldUpdater[logic_area=" + str(self.logic_area) + ", logic_tile=" + str(self.logic_tile) + ", " + \
-               "logic_entity=" + str(self.logic_entity) + "]"
+        first = indexes[first[overlapping]]
+        second = indexes[second[overlapping]]
 
+        processed = targets[first] | targets[second]
 
-class UnsolvedCollisionError(Exception):
-    """
-    An error raised when a collision is not solved.
+        first = first[processed]
+        second = second[processed]
 
-    This kind of error is raised when a collision event is not solved, in other words when the same event occurs twice
-    in the loop. This means that the event will be reprocessed indefinitely by the handlers. Note that the event
-    handlers have to be deterministic regarding the update of the object, for instance, the speed vector of the
-    colliding object should always be modified in a way that it does not instantly collides with the same other object.
-    """
+        return numpy.minimum(first, second), numpy.maximum(first, second)
 
-    def __init__(self, event: CollisionPseudoEvent):
-        message = \
-            "The following event got fired twice in a single tick.\n\n\t" + str(event) + "\n\n" + \
-            "This probably means that this event will be reprocessed indefinitely by the handlers.\n" + \
-            "To avoid this kind of error, the collision event handlers should have to be deterministic regarding\n" + \
-            "the some properties of the speed vector; the colliding object should always be modified in a way it\n" + \
-            "does not instantly collide with the same object.\n" + \
-            "If you are sure of what you are doing and you think that this is error is not supposed to be raised,\n" + \
-            "you can disable the check of unsolved collision by setting the safe_mode to False."
+    def _sweeps_solid_tiles(self, frame: CollisionFrame, updaters: list, owners: numpy.ndarray,
+                            selected: numpy.ndarray) -> numpy.ndarray:
+        """
+        Tells which collision objects may collide with a tile during the rest of the tick.
 
-        Exception.__init__(self, message)
+        The tiles overlapped by the bounding box of an object before and after its move are computed as in
+        WorldUpdater._tile_collision_detection. An object may only collide with a tile if it enters new tiles and if the
+        block of tiles covering its whole move holds a solid tile, which is read from the summed solidity of its level.
 
+        Parameters
+        ----------
+        frame: CollisionFrame
+            The collision frame of the entities of every world.
+        updaters: list of WorldUpdater
+            The updater of each world.
+        owners: numpy.ndarray
+            The index of the world of each collision object.
+        selected: numpy.ndarray
+            Whether each collision object has to be checked.
 
-class World:
-    """
-    The main game data holder.
+        Returns
+        -------
+        swept: numpy.ndarray
+            Whether each collision object may collide with a tile.
+        """
 
-    This object contains the current played level with the tiles and the world objects. At each tick, the update
-    function should be called to move the entities and fire the collision events.
+        swept = numpy.zeros(len(frame), dtype=bool)
 
-    Attributes
-    ----------
-    tiles: numpy.ndarray
-        The tiles array of the level.
-    world_objects: list of WorldObject
-        The list of world object spawned.
-    background: str
-        The background name.
-    logic_area: AxisAlignedBoundingBox, optional
-        The area over which the logic is performed.
-    logic_tile: bool, optional
-        Enables the collision detection with the tiles if set to True.
-    logic_entity: bool, optional
-        Enables the collision detection with the entities is set to True.
+        indexes = numpy.flatnonzero(selected)
 
-    Methods
-    -------
-    update(tick)
-        Updates the world objects.
-    spawn(world_object)
-        Spawns a new world object.
-    """
+        if len(indexes) == 0:
+            return swept
 
-    def __init__(self, tile_manager: TileManager, event_queue: EventQueue, tiles: numpy.ndarray, background: str,
-                 logic_area: AxisAlignedBoundingBox = None, logic_tile: bool = True, logic_entity: bool = True,
-                 safe_mode: bool = True, multi_threading: bool = True,
-                 entity_per_thread: int = WorldUpdater.DEFAULT_ENTITY_PER_THREAD,
-                 node_capacity: int = QuadTree.DEFAULT_NODE_CAPACITY, max_depth: int = QuadTree.DEFAULT_MAX_DEPTH):
-        """
-        Initializes the World.
+        sums, bases, shapes, origins = self._summed_solidity(updaters)
 
-        Parameters
-        ----------
-        tile_manager: TileManager
-            The tile manager containing the tile data.
-        event_queue: EventQueue
-            The main event queue used to handle events.
-        tiles: numpy.ndarray
-            The tiles array of the level.
-        background: str
-            The background name.
-        logic_area: AxisAlignedBoundingBox, optional
-            The area over which the logic is performed.
-        logic_tile: bool, optional
-            Enables the collision detection with the tiles if set to True.
-        logic_entity: bool, optional
-            Enables the collision detection with the entities is set to True.
-        safe_mode: bool, optional
-            Enables the update function safe mode (preventing infinite loop) if set to True.
-        multi_threading: bool, optional
-            Enables the multi-threading mode if set to True.
-        entity_per_thread: int, optional
-            The number of entity in each thread.
-        node_capacity: int, optional
-            The object capacity of the leaf before it divides into smaller leaves.
-        max_depth: int, optional
-            The maximum depth of the tree.
-        """
+        tile_size = self._tile_size
+        worlds = owners[indexes]
 
-        self._event_queue = event_queue
+        displacements = frame.speeds[indexes] * (1 - frame.local_times[indexes])[:, None]
 
-        self.background = background
+        pre_min = frame.positions[indexes].astype(numpy.int32)
+        pre_max = (frame.positions[indexes] + frame.bounds[indexes]).astype(numpy.int32)
+        post_min = (pre_min + displacements).astype(numpy.int32)
+        post_max = (pre_max + displacements).astype(numpy.int32)
 
-        self.world_objects = []
+        offset = origins[worlds] * tile_size
 
-        self._updater = WorldUpdater(
-            tile_manager, tiles, logic_area, logic_tile, logic_entity, multi_threading, entity_per_thread,
-            node_capacity, max_depth
-        )
+        pre_min, pre_max, post_min, post_max = pre_min - offset, pre_max - offset, post_min - offset, post_max - offset
 
-        self._safe_mode = safe_mode
+        pre_min_tile = pre_min // tile_size
+        pre_max_tile = pre_max // tile_size - (pre_max % tile_size == 0)
+        post_min_tile = post_min // tile_size
+        post_max_tile = post_max // tile_size - (post_max % tile_size == 0)
 
-    @property
-    def tiles(self) -> numpy.ndarray:
-        """
-        The tiles property containing the tiles indexes of the level.
-        """
+        moving = numpy.any((pre_min_tile != post_min_tile) | (pre_max_tile != post_max_tile), axis=1)
 
-        return self._updater.tiles
+        shape = shapes[worlds]
 
-    @tiles.setter
-    def tiles(self, tiles: numpy.ndarray) -> None:
-        """
-        Setter function for the tiles array.
+        min_tile = numpy.maximum(numpy.minimum(pre_min_tile, post_min_tile), 0)
+        max_tile = numpy.minimum(numpy.maximum(pre_max_tile, post_max_tile), shape - 1)
 
-        Parameters
-        ----------
-        tiles: numpy.ndarray
-            The array of tile indexes of the level.
-        """
+        moving &= numpy.all(min_tile <= max_tile, axis=1)
 
-        self._updater.tiles = tiles
+        min_tile = numpy.where(moving[:, None], min_tile, 0)
+        max_tile = numpy.where(moving[:, None], max_tile, -1)
 
-    @property
-    def logic_area(self) -> AxisAlignedBoundingBox:
-        """
-        The logic area property specifying the area over which the logic is performed.
-        """
+        base = bases[worlds]
+        height = shape[:, 1] + 1
 
-        return self._updater.logic_area
+        low_x, low_y = min_tile[:, 0], min_tile[:, 1]
+        high_x, high_y = max_tile[:, 0] + 1, max_tile[:, 1] + 1
 
-    @logic_area.setter
-    def logic_area(self, logic_area: AxisAlignedBoundingBox) -> None:
-        """
-        Setter function for the logic area.
+        solid = sums[base + high_x * height + high_y] - sums[base + low_x * height + high_y] - \
+            sums[base + high_x * height + low_y] + sums[base + low_x * height + low_y]
 
-        Parameters
-        ----------
-        logic_area: AxisAlignedBoundingBox
-            The AABB over which the logic is performed.
-        """
+        swept[indexes] = moving & (solid > 0)
 
-        self._updater.logic_area = logic_area
+        return swept
 
-    @property
-    def logic_tile(self) -> bool:
-        """
-        The logic tile property specifying whether or not the collision detection should be done with tiles.
+    def _summed_solidity(self, updaters: list) -> (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray):
         """
+        Returns the summed solidity of the levels of the worlds.
 
-        return self._updater.logic_tile
-
-    @logic_tile.setter
-    def logic_tile(self, logic_tile: bool) -> None:
-        """
-        Setter function for the logic tile flag.
+        The summed solidity of a level gives, for each tile, the number of tiles solid in any direction in the block
+        between the first tile and this one (excluded). The tables of every level are flattened one after the other,
+        they are only computed again when the tiles of a world changed.
 
         Parameters
         ----------
-        logic_tile: bool
-            Enables the collision detection with tiles if set to True.
+        updaters: list of WorldUpdater
+            The updater of each world.
+
+        Returns
+        -------
+        sums, bases, shapes, origins: numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray
+            The flattened tables, the index of the table of each world, the shape of each tiles array and its origin.
         """
 
-        self._updater.logic_tile = logic_tile
+        key = [(updater, updater.tiles_version) for updater in updaters]
 
-    @property
-    def logic_entity(self) -> bool:
-        """
-        The logic entity property specifying whether or not the collision detection should be done with entities.
-        """
+        if key != self._sums_key:
+            tables = []
 
-        return self._updater.logic_entity
+            for updater in updaters:
+                table = numpy.zeros((updater.tiles.shape[0] + 1, updater.tiles.shape[1] + 1), dtype=numpy.int64)
+                table[1:, 1:] = updater._solidity.any(axis=0).cumsum(axis=0).cumsum(axis=1)
 
-    @logic_entity.setter
-    def logic_entity(self, logic_entity: bool) -> None:
-        """
-        Setter function for the logic entity flag.
+                tables.append(table.ravel())
 
-        Parameters
-        ----------
-        logic_entity: bool
-            Enables the collision detection with the entities if set to True.
-        """
+            sizes = numpy.array([len(table) for table in tables], dtype=numpy.int64)
 
-        self._updater.logic_entity = logic_entity
+            self._sums = (
+                numpy.concatenate(tables), numpy.concatenate(([0], numpy.cumsum(sizes)[:-1])),
+                numpy.array([updater.tiles.shape for updater in updaters], dtype=numpy.int64),
+                numpy.array([updater.tiles_origin for updater in updaters], dtype=numpy.int64)
+            )
+            self._sums_key = key
 
-    def update(self, tick: int) -> None:
-        """
-        Updates the world objects.
+        return self._sums
 
-        Fetches the collision and fires them using the world updater.
+    def rows(self) -> (numpy.ndarray, numpy.ndarray):
+        """
+        Returns the rows of the entities of each world.
 
-        Parameters
-        ----------
-        tick: int
-            The current logic tick.
+        The entities of each world are given in their order of spawn, including the ones outside of the logic area.
 
-        Raises
-        ------
-        UnsolvedCollisionError
-            If a same event is fired twice in a single tick.
+        Returns
+        -------
+        rows, mask: numpy.ndarray, numpy.ndarray
+            The rows of the entities of each world within the entity store, of shape (worlds, entities), padded with -1,
+            and whether each element is an entity.
         """
 
-        to_destroy = []
-        entities = []
-        local_times = []
+        store = self.entity_store
 
-        past_events = set()
+        # The destroyed pooled entities keep their row, the world objects have to be checked as well
+        version = (store.version,) + tuple(world.world_objects.version for world in self.worlds)
 
-        for world_object in self.world_objects:
-            if world_object.should_be_destroyed:
-                to_destroy.append(world_object)
-            else:
-                if isinstance(world_object, Entity) and world_object.bounding_box in self.logic_area:
-                    entities.append(world_object)
-                    local_times.append(0.0)
+        if self._rows is None or self._rows_version != version:
+            rows = [[world_object._row for world_object in world.world_objects
+                     if isinstance(world_object, Entity) and world_object._store is store] for world in self.worlds]
 
-        for world_object in to_destroy:
-            self.world_objects.remove(world_object)
+            padded = numpy.full((len(rows), max(len(world_rows) for world_rows in rows)), -1, dtype=numpy.int64)
 
-        if len(entities) == 0:
-            return
+            for index, world_rows in enumerate(rows):
+                padded[index, :len(world_rows)] = world_rows
 
-        collision_remaining = True
+            self._rows = (padded, padded != -1)
+            self._rows_version = version
 
-        while collision_remaining:
-            collision_remaining = False
+        return self._rows
 
-            events = self._updater.fetch_next_events(entities, local_times)
+    def gather(self, column: str) -> numpy.ndarray:
+        """
+        Returns a column of the entity store stacked by world.
 
-            for event in events:
-                if self._safe_mode and event in past_events:
-                    raise UnsolvedCollisionError(event)
+        Parameters
+        ----------
+        column: str
+            The name of the column of the store, such as "positions" or "speeds".
 
-                if event.collision_type == CollisionPseudoEvent.COLLISION_ENTITY:
-                    for collider in event.colliders:
-                        entity = entities[collider]
+        Returns
+        -------
+        values: numpy.ndarray
+            A copy of the values of the entities of each world, of shape (worlds, entities, ...), the padding elements
+            being zero.
+        """
 
-                        position = entity.position + entity.speed * (event.time_of_impact - local_times[collider])
-                        entity.position = numpy.floor(position)
+        rows, mask = self.rows()
+        values = getattr(self.entity_store, column)
 
-                        local_times[collider] = event.time_of_impact
+        stacked = numpy.zeros(rows.shape + values.shape[1:], dtype=values.dtype)
+        stacked[mask] = values[rows[mask]]
 
-                    self._event_queue.fire_event(CollisionWithEntityEvent(
-                            tick, entities[event.colliders[0]], entities[event.colliders[1]], event.collision_direction
-                    ))
+        return stacked
 
-                if event.collision_type == CollisionPseudoEvent.COLLISION_TILE:
-                    entity = entities[event.colliders[0]]
+    def scatter(self, column: str, values: numpy.ndarray) -> None:
+        """
+        Writes a column of the entity store stacked by world.
 
-                    position = entity.position + entity.speed * (event.time_of_impact - local_times[event.colliders[0]])
-                    entity.position = numpy.floor(position)
+        The entities being views over the store, this is the same as setting the values of each entity, for instance to
+        apply the speeds chosen by an agent in every world at once.
 
-                    local_times[event.colliders[0]] = event.time_of_impact
+        Parameters
+        ----------
+        column: str
+            The name of the column of the store, such as "positions" or "speeds".
+        values: numpy.ndarray
+            The values of the entities of each world, of shape (worlds, entities, ...), the padding elements being
+            ignored.
+        """
 
-                    tile_position = event.colliders[2:]
+        rows, mask = self.rows()
 
-                    self._event_queue.fire_event(CollisionWithTileEvent(
-                        tick, entities[event.colliders[0]], event.colliders[1], tile_position, event.collision_direction
-                    ))
+        getattr(self.entity_store, column)[rows[mask]] = numpy.asarray(values)[mask]
 
-                past_events.add(event)
+    def close(self) -> None:
+        """
+        Releases the worlds of the batch.
+        """
 
-                collision_remaining = True
+        for world in self.worlds:
+            world.close()
 
-        for entity, time in zip(entities, local_times):
-            updated_position = entity.bounding_box.position + entity.speed * (1 - time)
-            entity.position = updated_position
+        self._frame = None
 
-    def spawn(self, world_object: WorldObject) -> None:
+    def __len__(self) -> int:
         """
-        Spawns a new world object.
+        Returns the number of worlds in the batch.
 
-        Parameters
-        ----------
-        world_object: WorldObject
-            The world object to spawn.
+        Returns
+        -------
+        length: int
+            The number of worlds.
         """
 
-        self.world_objects.append(world_object)
+        return len(self.worlds)
 
     def __str__(self) -> str:
         """
@@ -3108,8 +9098,7 @@ class World:
             The string object description.
         """
 
-        return "World[logic_area=" + str(self.logic_area) + ", logic_tile=" + str(self.logic_tile) + ", " + \
-               "logic_entity=" + str(self.logic_entity) + ", background=" + self.background + "]"
+        return "WorldBatch[worlds=" + str(len(self.worlds)) + ", entity_store=" + str(self.entity_store) + "]"
 
 
 class LogicLoop:
@@ -3119,6 +9108,13 @@ class LogicLoop:
     This object is callable, hence is should be called as if it was a function. When called, the loop starts and run the
     logic function at each tick, at a specified tick rate.
 
+    Attributes
+    ----------
+    tick: int
+        The next logic tick to perform.
+    function_logic: callable
+        The logic function of the loop called each tick.
+
     Methods
     -------
     stop()
@@ -3195,6 +9191,48 @@ class LogicLoop:
 
             self._running = False
 
+    @property
+    def tick(self) -> int:
+        """
+        The tick property containing the next logic tick to perform.
+        """
+
+        return self._tick
+
+    @tick.setter
+    def tick(self, tick: int) -> None:
+        """
+        Setter function for the next logic tick, for instance to roll the loop back to a snapshot.
+
+        Parameters
+        ----------
+        tick: int
+            The next logic tick to perform.
+        """
+
+        self._tick = tick
+
+    @property
+    def function_logic(self) -> callable:
+        """
+        The function_logic property containing the logic function of the loop called each tick.
+        """
+
+        return self._function_logic
+
+    @function_logic.setter
+    def function_logic(self, function_logic: callable) -> None:
+        """
+        Setter function for the logic function of the loop, for instance to wrap the update of the game.
+
+        Parameters
+        ----------
+        function_logic: callable
+            The logic function of the loop called each tick.
+        """
+
+        self._function_logic = function_logic
+
     def _do_logic(self) -> None:
         """
         Calls the logic routine.
@@ -44,15 +44,22 @@ class WindowedGame(Game):
         Renders the world and the GUI.
     run()
         Runs the game logic loop.
+    set_logic(function_logic)
+        Replaces the logic function called each tick by the game logic loop.
     reset()
         Resets the game.
     close()
         Closes the game.
-    change_world(tiles, background, logic_area, logic_tile, logic_entity, entity_per_thread, node_capacity, max_depth)
+    change_world(tiles, background, logic_area, logic_tile, logic_entity, entity_per_thread, node_capacity, max_depth,
+                 entity_store, broadphase, cell_tiles, sleep_ticks, track_tiles)
         Creates a new world.
+    snapshot(snapshot)
+        Captures the state of the world and the tick of the logic loop.
+    restore(snapshot)
+        Restores the state of the world and the tick of the logic loop.
     fire_event(event)
         Handles a new fired Event.
-    register_event_handler(event_type, handler)
+    register_event_handler(event_type, handler, once)
         Registers a new event handler.
     register_collision_event_handler(handler)
         Registers a new CollisionEvent handler.
@@ -99,7 +106,8 @@ class WindowedGame(Game):
                  glsl_version: int = 330, shader_world: tuple = None, shader_sprite: tuple = None,
                  tick_per_second: float = 60, frame_per_second: float = 60, multi_threading: bool = True,
                  safe_mode: bool = True, default_tile_collision_handler: bool = True,
-                 default_entity_collision_handler: bool = True, default_gui_handler: bool = True):
+                 default_entity_collision_handler: bool = True, default_gui_handler: bool = True,
+                 multi_processing: bool = False):
         """
         Initializes the WindowedGame.
 
@@ -141,6 +149,8 @@ class WindowedGame(Game):
             Registers the default entity collision event handler if set to True.
         default_gui_handler: bool: optional
             Registers the default GUI event handler if set to True.
+        multi_processing: bool, optional
+            Runs the collision detection in worker processes if set to True.
         """
 
         local_window = Window(
@@ -162,7 +172,7 @@ class WindowedGame(Game):
             frame_per_second=frame_per_second, multi_threading=multi_threading, safe_mode=safe_mode,
             default_tile_collision_handler=default_tile_collision_handler,
             default_entity_collision_handler=default_entity_collision_handler,
-            default_gui_handler=default_gui_handler
+            default_gui_handler=default_gui_handler, multi_processing=multi_processing
         )
 
     def render(self, frame: int) -> None:
@@ -0,0 +1,80 @@
+"""
+Tests of the storage of the entities of a world in an entity store.
+"""
+
+from pytgf.logic import AxisAlignedBoundingBox, EventQueue, Entity, TileManager, World
+
+import numpy
+import pytest
+
+
+def create_world(entity_store: bool) -> World:
+    """
+    Creates an empty world with a single non-solid tile.
+
+    Parameters
+    ----------
+    entity_store: bool
+        Stores the entities of the world in an entity store if set to True.
+
+    Returns
+    -------
+    world: World
+        The created world.
+    """
+
+    tile_manager = TileManager(16)
+    tile_manager.register_collision_map(False, False, False, False)
+    tile_manager.register_tile(0, 0)
+
+    return World(
+        tile_manager, EventQueue(), numpy.zeros((16, 16), dtype=numpy.int32), None, multi_threading=False,
+        entity_store=entity_store
+    )
+
+
+def create_entity(position: tuple, speed: tuple) -> Entity:
+    """
+    Creates an entity whose bounding box uses the float64 format.
+
+    Parameters
+    ----------
+    position: tuple
+        The position of the bottom-left corner of the entity.
+    speed: tuple
+        The speed of the entity.
+
+    Returns
+    -------
+    entity: Entity
+        The created entity.
+    """
+
+    bounding_box = AxisAlignedBoundingBox(position, (8, 8), dtype=numpy.float64)
+
+    return Entity(bounding_box, speed, AxisAlignedBoundingBox((0, 0), (8, 8)), "sprite", 0)
+
+
+def test_default_world_moves_float_entities() -> None:
+    tile_manager = TileManager(16)
+    tile_manager.register_collision_map(False, False, False, False)
+    tile_manager.register_tile(0, 0)
+
+    world = World(tile_manager, EventQueue(), numpy.zeros((16, 16), dtype=numpy.int32), None, multi_threading=False)
+
+    entity = create_entity((32, 32), (1, 2))
+    world.spawn(entity)
+
+    for tick in range(4):
+        world.update(tick)
+
+    assert world.entity_store is None
+    assert entity.position.dtype == numpy.float64
+    assert numpy.array_equal(entity.position, (36, 40))
+
+
+def test_store_rejects_float_entities() -> None:
+    world = create_world(entity_store=True)
+
+    with pytest.raises(ValueError):
+        world.spawn(create_entity((32, 32), (0, 0)))
@@ -0,0 +1,181 @@
+"""
+Tests of the recycling of the world objects spawned with World.spawn_pooled.
+"""
+
+from pytgf.logic import AxisAlignedBoundingBox, EventQueue, Entity, Particle, TileManager, World
+
+import numpy
+
+
+def create_world() -> World:
+    """
+    Creates an empty world with a single non-solid tile, storing its entities in an entity store.
+
+    Returns
+    -------
+    world: World
+        The created world.
+    """
+
+    tile_manager = TileManager(16)
+    tile_manager.register_collision_map(False, False, False, False)
+    tile_manager.register_tile(0, 0)
+
+    return World(
+        tile_manager, EventQueue(), numpy.zeros((16, 16), dtype=numpy.int32), None, multi_threading=False,
+        entity_store=True
+    )
+
+
+def destroy(world: World, world_object: Entity, tick: int) -> None:
+    """
+    Destroys a world object by updating the world.
+
+    Parameters
+    ----------
+    world: World
+        The world holding the world object.
+    world_object: Entity
+        The world object to destroy.
+    tick: int
+        The current logic tick.
+    """
+
+    world_object.should_be_destroyed = True
+    world.update(tick)
+
+    assert world_object not in world.world_objects
+
+
+def test_recycled_entity_keeps_its_arrays() -> None:
+    world = create_world()
+
+    bounding_box = AxisAlignedBoundingBox((32, 32), (8, 8))
+    texture_bounds = AxisAlignedBoundingBox((0, 0), (8, 8))
+
+    entity = world.world_objects.get(world.spawn_pooled(Entity, bounding_box, (1, 0), texture_bounds, "sprite", 0))
+
+    speed = entity.speed
+    position = entity.bounding_box.position
+    bounds = entity.bounding_box.bounds
+    row = entity._row
+
+    destroy(world, entity, 0)
+
+    bounding_box.position = (64, 48)
+    bounding_box.bounds = (4, 6)
+
+    recycled = world.world_objects.get(world.spawn_pooled(Entity, bounding_box, (0, 2), texture_bounds, "sprite", 1))
+
+    assert recycled is entity
+    assert recycled.speed is speed
+    assert recycled.bounding_box.position is position
+    assert recycled.bounding_box.bounds is bounds
+    assert recycled._row == row
+
+    assert numpy.array_equal(world.entity_store.positions[row], (64, 48))
+    assert numpy.array_equal(world.entity_store.bounds[row], (4, 6))
+    assert numpy.array_equal(world.entity_store.speeds[row], (0, 2))
+    assert recycled.id_animation == 1
+    assert not recycled.should_be_destroyed
+
+
+def test_recycled_particle_keeps_its_arrays() -> None:
+    world = create_world()
+
+    bounding_box = AxisAlignedBoundingBox((32, 32), (8, 8))
+    texture_bounds = AxisAlignedBoundingBox((0, 0), (8, 8))
+
+    particle = world.world_objects.get(world.spawn_pooled(Particle, bounding_box, texture_bounds, "sprite", 0))
+
+    position = particle.bounding_box.position
+    texture_position = particle.texture_bounds.position
+
+    destroy(world, particle, 0)
+
+    bounding_box.position = (16, 24)
+
+    recycled = world.world_objects.get(world.spawn_pooled(Particle, bounding_box, texture_bounds, "sprite", 0))
+
+    assert recycled is particle
+    assert recycled.bounding_box.position is position
+    assert recycled.texture_bounds.position is texture_position
+    assert numpy.array_equal(recycled.position, (16, 24))
+
+
+class Enemy(Entity):
+    """
+    An entity whose hit points are only initialized by its __init__ function.
+    """
+
+    def __init__(self, bounding_box: AxisAlignedBoundingBox, speed: tuple, texture_bounds: AxisAlignedBoundingBox,
+                 sprite_set: str, id_animation: int):
+        """
+        Initializes the Enemy with full hit points.
+        """
+
+        Entity.__init__(self, bounding_box, speed, texture_bounds, sprite_set, id_animation)
+
+        self.hit_points = 3
+
+
+class Turret(Enemy):
+    """
+    An entity initializing its hit points again when it is recycled.
+    """
+
+    def reset(self, bounding_box: AxisAlignedBoundingBox, speed: tuple, texture_bounds: AxisAlignedBoundingBox,
+              sprite_set: str, id_animation: int) -> None:
+        """
+        Initializes the Turret again with full hit points.
+        """
+
+        Entity.reset(self, bounding_box, speed, texture_bounds, sprite_set, id_animation)
+
+        self.hit_points = 3
+
+
+def test_recycled_subclass_without_reset_is_initialized_again() -> None:
+    world = create_world()
+
+    bounding_box = AxisAlignedBoundingBox((32, 32), (8, 8))
+    texture_bounds = AxisAlignedBoundingBox((0, 0), (8, 8))
+
+    enemy = world.world_objects.get(world.spawn_pooled(Enemy, bounding_box, (1, 0), texture_bounds, "sprite", 0))
+    enemy.hit_points = 0
+
+    destroy(world, enemy, 0)
+
+    bounding_box.position = (64, 48)
+
+    recycled = world.world_objects.get(world.spawn_pooled(Enemy, bounding_box, (0, 2), texture_bounds, "sprite", 0))
+
+    assert recycled is enemy
+    assert recycled.hit_points == 3
+    assert recycled.bounding_box is not bounding_box
+    assert numpy.array_equal(world.entity_store.positions[recycled._row], (64, 48))
+    assert numpy.array_equal(world.entity_store.speeds[recycled._row], (0, 2))
+
+    world.update(1)
+
+    assert numpy.array_equal(recycled.position, (64, 50))
+
+
+def test_recycled_subclass_with_reset_keeps_its_arrays() -> None:
+    world = create_world()
+
+    bounding_box = AxisAlignedBoundingBox((32, 32), (8, 8))
+    texture_bounds = AxisAlignedBoundingBox((0, 0), (8, 8))
+
+    turret = world.world_objects.get(world.spawn_pooled(Turret, bounding_box, (0, 0), texture_bounds, "sprite", 0))
+    turret.hit_points = 0
+
+    speed = turret.speed
+
+    destroy(world, turret, 0)
+
+    recycled = world.world_objects.get(world.spawn_pooled(Turret, bounding_box, (0, 0), texture_bounds, "sprite", 0))
+
+    assert recycled is turret
+    assert recycled.hit_points == 3
+    assert recycled.speed is speed
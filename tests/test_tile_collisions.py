@@ -0,0 +1,136 @@
+"""
+Tests of the collision detection between the entities and the tiles.
+"""
+
+from pytgf.logic import AxisAlignedBoundingBox, EventQueue, Entity, TileManager, World
+from pytgf.logic.physics import CollisionWithEntityEvent, CollisionWithTileEvent, Direction
+
+import numpy
+
+
+def create_world(tiles: numpy.ndarray, events: list) -> World:
+    """
+    Creates a world whose tiles of ID 1 are solid in every direction.
+
+    Parameters
+    ----------
+    tiles: numpy.ndarray
+        The tiles of the world.
+    events: list
+        The list to which the position and the direction of the tile collisions are appended.
+
+    Returns
+    -------
+    world: World
+        The created world.
+    """
+
+    def handle_collision_tile(event: CollisionWithTileEvent) -> None:
+        events.append((tuple(int(value) for value in event.position), event.direction))
+
+        CollisionWithTileEvent.default_handler_collision_tile(event)
+
+    tile_manager = TileManager(16)
+    tile_manager.register_collision_map(True, True, True, True)
+    tile_manager.register_tile(0, 0)
+
+    event_queue = EventQueue()
+    event_queue.register_event_handler(CollisionWithTileEvent, handle_collision_tile)
+    event_queue.register_event_handler(
+        CollisionWithEntityEvent, CollisionWithEntityEvent.default_handler_collision_entity
+    )
+
+    return World(tile_manager, event_queue, tiles, None, multi_threading=False)
+
+
+def create_entity(position: tuple, bounds: tuple, speed: tuple) -> Entity:
+    """
+    Creates an entity.
+
+    Parameters
+    ----------
+    position: tuple
+        The position of the bottom-left corner of the entity.
+    bounds: tuple
+        The width and the height of the entity.
+    speed: tuple
+        The speed of the entity.
+
+    Returns
+    -------
+    entity: Entity
+        The created entity.
+    """
+
+    return Entity(AxisAlignedBoundingBox(position, bounds), speed, AxisAlignedBoundingBox((0, 0), bounds), "sprite", 0)
+
+
+def test_corner_landing_slides_on_the_floor() -> None:
+    tiles = numpy.zeros((32, 8), dtype=numpy.int32)
+    tiles[:, 0] = 1
+
+    events = []
+    world = create_world(tiles, events)
+
+    # The box reaches the next column and the floor at the same time, it only touches the corner of the tile (21, 0)
+    entity = create_entity((326, 18), (9, 7), (4, -8))
+    world.spawn(entity)
+
+    for tick in range(6):
+        world.update(tick)
+
+    assert events == [((20, 0), Direction.DIRECTION_SOUTH)]
+    assert numpy.array_equal(entity.position, (350, 16))
+    assert numpy.array_equal(entity.speed, (4, 0))
+
+
+def test_corner_landing_against_a_wall() -> None:
+    tiles = numpy.zeros((32, 8), dtype=numpy.int32)
+    tiles[:, 0] = 1
+    tiles[21, 1] = 1
+
+    events = []
+    world = create_world(tiles, events)
+
+    entity = create_entity((326, 18), (9, 7), (4, -8))
+    world.spawn(entity)
+
+    world.update(0)
+
+    assert events[0] == ((21, 1), Direction.DIRECTION_EAST)
+
+
+def test_tiles_modified_in_place_are_detected() -> None:
+    events = []
+    world = create_world(numpy.zeros((16, 16), dtype=numpy.int32), events)
+
+    entity = create_entity((40, 100), (8, 8), (4, 0))
+    world.spawn(entity)
+
+    world.update(0)
+
+    world.tiles[5, 6] = 1
+
+    for tick in range(1, 20):
+        world.update(tick)
+
+    assert events == [((5, 6), Direction.DIRECTION_EAST)]
+    assert numpy.array_equal(entity.position, (72, 100))
+
+
+def test_unregistered_tiles_do_not_collide() -> None:
+    tiles = numpy.zeros((16, 16), dtype=numpy.int32)
+    tiles[:, 0] = 1
+    tiles[10, 10] = 7
+
+    events = []
+    world = create_world(tiles, events)
+
+    entity = create_entity((40, 40), (8, 8), (0, -8))
+    world.spawn(entity)
+
+    for tick in range(4):
+        world.update(tick)
+
+    assert events == [((2, 0), Direction.DIRECTION_SOUTH)]
+    assert numpy.array_equal(entity.position, (40, 16))